@@ -5,32 +5,45 @@ Identifica archivos grandes que pueden necesitar refactorización
 """
 
 import os
+import sys
 import glob
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-def count_lines_in_file(filepath: str) -> Tuple[int, int, int]:
+sys.path.insert(0, str(Path(__file__).resolve().parent / 'tools'))
+from analysis_cache import AnalysisCache
+
+def _count_lines(content: str) -> List[int]:
+    """Cuenta [total, código, comentarios] sobre el contenido ya leído"""
+    lines = content.split('\n')
+    if lines[-1] == '':  # Igual que readlines(): sin línea vacía final
+        lines.pop()
+
+    total_lines = len(lines)
+    code_lines = 0
+    comment_lines = 0
+
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:  # Línea vacía
+            continue
+        elif stripped.startswith('#'):  # Comentario
+            comment_lines += 1
+        else:  # Código
+            code_lines += 1
+
+    return [total_lines, code_lines, comment_lines]
+
+def count_lines_in_file(filepath: str, cache: Optional[AnalysisCache] = None) -> Tuple[int, int, int]:
     """
     Cuenta líneas totales, líneas de código y líneas de comentarios
     Returns: (total_lines, code_lines, comment_lines)
     """
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-
-        total_lines = len(lines)
-        code_lines = 0
-        comment_lines = 0
-
-        for line in lines:
-            stripped = line.strip()
-            if not stripped:  # Línea vacía
-                continue
-            elif stripped.startswith('#'):  # Comentario
-                comment_lines += 1
-            else:  # Código
-                code_lines += 1
+    if cache is None:
+        cache = AnalysisCache(None)
 
+    try:
+        total_lines, code_lines, comment_lines = cache.get(filepath, 'line_counts', _count_lines)
         return total_lines, code_lines, comment_lines
     except Exception as e:
         print(f"Error leyendo {filepath}: {e}")
@@ -44,12 +57,13 @@ def analyze_gd_files(project_path: str):
     gd_files = glob.glob(pattern, recursive=True)
 
     file_stats = []
+    cache = AnalysisCache()
 
     print("🔍 Analizando archivos .gd del proyecto...")
     print("=" * 80)
 
     for filepath in gd_files:
-        total, code, comments = count_lines_in_file(filepath)
+        total, code, comments = count_lines_in_file(filepath, cache)
         rel_path = os.path.relpath(filepath, project_path)
 
         file_stats.append({
@@ -59,6 +73,8 @@ def analyze_gd_files(project_path: str):
             'comment_lines': comments
         })
 
+    cache.save()
+
     # Ordenar por líneas totales (descendente)
     file_stats.sort(key=lambda x: x['total_lines'], reverse=True)
 
@@ -8,7 +8,10 @@ signal upgrade_purchased(upgrade_id: String, cost: float)
 
 var game_data: GameData
 var production_manager: ProductionManager  # Referencia para acceder a definiciones de estaciones
-var customer_timer: Timer
+## Ciclo de clientes avanzado por TickManager (sistema "customers"), sin nodo Timer
+var customer_interval: float = 8.0
+var customer_elapsed: float = 0.0
+var customer_timer_active: bool = false  # Solo activo tras comprar el primer upgrade
 var customer_timer_progress: float = 0.0
 
 ## Sistema de múltiples clientes
@@ -51,27 +54,26 @@ var customer_upgrades: Array[Dictionary] = [
 		"required_key": "bulk_buyers"
 	}
 ]
+var _upgrade_index: Dictionary = {}  # {upgrade_id: posición en customer_upgrades}
 
 
 func _ready() -> void:
 	print("👥 CustomerManager inicializado")
-	_setup_customer_timer()
 
 
-func _process(_delta: float) -> void:
-	# Actualizar progreso del timer si está activo
-	if customer_timer and game_data and game_data.upgrades["auto_sell_enabled"]:
-		customer_timer_progress = 1.0 - (customer_timer.time_left / customer_timer.wait_time)
-		customer_timer_progress = clamp(customer_timer_progress, 0.0, 1.0)
+## Paso de simulación: avanzar el ciclo de clientes y atender al completarse
+func step_customers(delta: float) -> void:
+	if not customer_timer_active:
+		return
 
+	customer_elapsed += delta
+	if customer_elapsed >= customer_interval:
+		customer_elapsed -= customer_interval
+		_process_automatic_customer()
 
-## Configurar timer de clientes automáticos
-func _setup_customer_timer() -> void:
-	customer_timer = Timer.new()
-	customer_timer.wait_time = 8.0
-	customer_timer.autostart = false  # Solo activar cuando se compre el primer upgrade
-	customer_timer.timeout.connect(_process_automatic_customer)
-	add_child(customer_timer)
+	# Actualizar progreso del timer si está activo
+	if game_data and game_data.upgrades["auto_sell_enabled"]:
+		customer_timer_progress = clamp(customer_elapsed / customer_interval, 0.0, 1.0)
 
 
 ## Asignar datos del juego
@@ -89,12 +91,12 @@ func set_enabled(enabled: bool) -> void:
 	if enabled and game_data.customer_system_unlocked:
 		# Habilitar auto_sell_enabled para que funcionen los timers
 		game_data.upgrades["auto_sell_enabled"] = true
+		game_data.mark_dirty("upgrades", "auto_sell_enabled")
 		_update_timer_settings()
 		print("✅ CustomerManager habilitado - sistema activo")
 	else:
 		# Deshabilitar timers
-		if customer_timer:
-			customer_timer.stop()
+		customer_timer_active = false
 		print("🔒 CustomerManager deshabilitado")
 
 
@@ -106,7 +108,7 @@ func set_production_manager(manager: ProductionManager) -> void:
 
 ## T025: Actualizar configuración del timer con frecuencias optimizadas
 func _update_timer_settings() -> void:
-	if not game_data or not customer_timer:
+	if not game_data:
 		return
 
 	# T025: Nueva configuración de timing optimizada
@@ -125,15 +127,16 @@ func _update_timer_settings() -> void:
 	# T025: Minimum interval para prevenir spam
 	effective_interval = max(effective_interval, 2.0)  # Mínimo 2 segundos
 
-	customer_timer.wait_time = effective_interval
+	customer_interval = effective_interval
 
 	# Activar/desactivar timer según configuración
-	if game_data.upgrades["auto_sell_enabled"] and not customer_timer.is_stopped():
+	if game_data.upgrades["auto_sell_enabled"] and customer_timer_active:
 		pass  # Ya está corriendo
 	elif game_data.upgrades["auto_sell_enabled"]:
-		customer_timer.start()
+		customer_elapsed = 0.0
+		customer_timer_active = true
 	else:
-		customer_timer.stop()
+		customer_timer_active = false
 
 	# T025: Logging mejorado con rates esperados
 	var customers_per_minute = 60.0 / effective_interval
@@ -177,18 +180,16 @@ func _calculate_expected_tokens_per_customer() -> float:
 ## T025: Obtener estadísticas de economía de tokens
 func get_token_economy_stats() -> Dictionary:
 	"""Retornar estadísticas detalladas de la economía de tokens"""
-	if not game_data or not customer_timer:
+	if not game_data:
 		return {}
 
-	var customers_per_minute = (
-		60.0 / customer_timer.wait_time if customer_timer.wait_time > 0 else 0.0
-	)
+	var customers_per_minute = 60.0 / customer_interval if customer_interval > 0 else 0.0
 	var tokens_per_customer = _calculate_expected_tokens_per_customer()
 	var tokens_per_hour = customers_per_minute * 60.0 * tokens_per_customer
 
 	return {
 		"active_customers": active_customers,
-		"timer_interval": customer_timer.wait_time,
+		"timer_interval": customer_interval,
 		"customers_per_minute": customers_per_minute,
 		"tokens_per_customer_avg": tokens_per_customer,
 		"tokens_per_hour_estimated": tokens_per_hour,
@@ -375,8 +376,9 @@ func _process_automatic_customer() -> void:
 
 	# Actualizar estadísticas usando método de GameData (T013 - Prestigio)
 	game_data.add_money(total_earned)  # Trackea total_cash_earned automáticamente
-	game_data.statistics["products_sold"] += quantity
-	game_data.statistics["customers_served"] += 1
+	var stats = game_data.statistics
+	game_data.stat_triggers.set_value("products_sold", stats["products_sold"] + quantity)
+	game_data.stat_triggers.set_value("customers_served", stats["customers_served"] + 1)
 
 	print(
 		(
@@ -424,6 +426,7 @@ func purchase_upgrade(upgrade_id: String) -> bool:
 
 	# Procesar compra exitosa
 	game_data.upgrades[upgrade_def.required_key] = true
+	game_data.mark_dirty("upgrades", upgrade_def.required_key)
 	_apply_upgrade_effects(upgrade_id)
 	upgrade_purchased.emit(upgrade_id, cost)
 	print("✅ Upgrade comprado: %s por %d gems" % [upgrade_def.name, cost])
@@ -478,17 +481,22 @@ func get_timer_progress() -> float:
 
 ## Obtener tiempo restante del timer
 func get_timer_remaining() -> float:
-	if customer_timer:
-		return customer_timer.time_left
+	if customer_timer_active:
+		return customer_interval - customer_elapsed
 	return 0.0
 
 
-## Encontrar upgrade por ID
+## Encontrar upgrade por ID (índice id → posición, reconstruido si cambia la lista)
 func _find_upgrade_by_id(upgrade_id: String) -> Dictionary:
-	for upgrade_def in customer_upgrades:
-		if upgrade_def.id == upgrade_id:
-			return upgrade_def
-	return {}
+	if _upgrade_index.size() != customer_upgrades.size():
+		_upgrade_index.clear()
+		for i in customer_upgrades.size():
+			_upgrade_index[customer_upgrades[i].id] = i
+
+	var index = _upgrade_index.get(upgrade_id, -1)
+	if index < 0:
+		return {}
+	return customer_upgrades[index]
 
 
 ## Obtener estadísticas de clientes
@@ -499,7 +507,7 @@ func get_customer_stats() -> Dictionary:
 	var stats = {
 		"customers_served": game_data.statistics.get("customers_served", 0),
 		"autosell_earnings": game_data.statistics.get("total_money_earned", 0),
-		"frequency": customer_timer.wait_time if customer_timer else 8.0,
+		"frequency": customer_interval,
 		"auto_sell_enabled": game_data.upgrades.get("auto_sell_enabled", false)
 	}
 
@@ -0,0 +1,150 @@
+class_name GameConfigTables
+extends RefCounted
+## GameConfigTables - Tablas empaquetadas generadas desde GameConfig
+## Se construyen una sola vez al cargar la clase (_static_init): arrays indexados
+## por posición más un índice id → posición por tabla, para que el código por
+## tick use acceso por índice en vez de Dictionary anidados y búsquedas lineales.
+## Las recetas son matrices densas fila-por-item, columna-por-recurso.
+
+## === RECURSOS ===
+static var resource_ids: PackedStringArray = PackedStringArray()
+static var resource_index: Dictionary = {}
+static var resource_base_generation: PackedFloat64Array = PackedFloat64Array()
+static var resource_max_storage: PackedFloat64Array = PackedFloat64Array()
+
+## === PRODUCTOS ===
+static var product_ids: PackedStringArray = PackedStringArray()
+static var product_index: Dictionary = {}
+static var product_base_price: PackedFloat64Array = PackedFloat64Array()
+static var product_recipes: PackedFloat64Array = PackedFloat64Array()  # [producto][recurso]
+
+## === GENERADORES ===
+static var generator_ids: PackedStringArray = PackedStringArray()
+static var generator_names: PackedStringArray = PackedStringArray()
+static var generator_index: Dictionary = {}
+static var generator_base_price: PackedFloat64Array = PackedFloat64Array()
+static var generator_scale_factor: PackedFloat64Array = PackedFloat64Array()
+static var generator_production_rate: PackedFloat64Array = PackedFloat64Array()
+static var generator_resource: PackedInt32Array = PackedInt32Array()  # Índice en resource_ids
+
+## === ESTACIONES ===
+static var station_ids: PackedStringArray = PackedStringArray()
+static var station_index: Dictionary = {}
+static var station_base_price: PackedFloat64Array = PackedFloat64Array()
+static var station_scale_factor: PackedFloat64Array = PackedFloat64Array()
+static var station_recipes: PackedFloat64Array = PackedFloat64Array()  # [estación][recurso]
+static var station_product: PackedInt32Array = PackedInt32Array()  # Índice en product_ids
+
+
+static func _static_init() -> void:
+	build()
+
+
+## (Re)construir todas las tablas desde GameConfig
+static func build() -> void:
+	_build_resources()
+	_build_products()
+	_build_generators()
+	_build_stations()
+
+
+static func _build_resources() -> void:
+	resource_ids = PackedStringArray(GameConfig.RESOURCE_DATA.keys())
+	resource_index = _index_of(resource_ids)
+	resource_base_generation.resize(resource_ids.size())
+	resource_max_storage.resize(resource_ids.size())
+
+	for i in resource_ids.size():
+		var data = GameConfig.RESOURCE_DATA[resource_ids[i]]
+		resource_base_generation[i] = data.get("base_generation", 0.0)
+		resource_max_storage[i] = data.get("max_storage", 0.0)
+
+
+static func _build_products() -> void:
+	product_ids = PackedStringArray(GameConfig.PRODUCT_DATA.keys())
+	product_index = _index_of(product_ids)
+	product_base_price.resize(product_ids.size())
+
+	var recipes: Array = []
+	for i in product_ids.size():
+		var data = GameConfig.PRODUCT_DATA[product_ids[i]]
+		product_base_price[i] = data.get("base_price", 0.0)
+		recipes.append(data.get("recipe", {}))
+	product_recipes = _recipe_matrix(recipes)
+
+
+static func _build_generators() -> void:
+	generator_ids = PackedStringArray(GameConfig.GENERATOR_DATA.keys())
+	generator_index = _index_of(generator_ids)
+	generator_names.resize(generator_ids.size())
+	generator_base_price.resize(generator_ids.size())
+	generator_scale_factor.resize(generator_ids.size())
+	generator_production_rate.resize(generator_ids.size())
+	generator_resource.resize(generator_ids.size())
+
+	for i in generator_ids.size():
+		var data = GameConfig.GENERATOR_DATA[generator_ids[i]]
+		generator_names[i] = data.get("name", generator_ids[i])
+		generator_base_price[i] = data.get("base_price", 0.0)
+		generator_scale_factor[i] = data.get("scale_factor", GameConfig.GENERATOR_SCALE_FACTOR)
+		generator_production_rate[i] = data.get("production_rate", 1.0)
+		generator_resource[i] = resource_index.get(data.get("resource_type", ""), -1)
+
+
+static func _build_stations() -> void:
+	station_ids = PackedStringArray(GameConfig.STATION_DATA.keys())
+	station_index = _index_of(station_ids)
+	station_base_price.resize(station_ids.size())
+	station_scale_factor.resize(station_ids.size())
+	station_product.resize(station_ids.size())
+
+	var recipes: Array = []
+	for i in station_ids.size():
+		var data = GameConfig.STATION_DATA[station_ids[i]]
+		station_base_price[i] = data.get("base_price", 0.0)
+		station_scale_factor[i] = data.get("scale_factor", GameConfig.STATION_SCALE_FACTOR)
+		station_product[i] = product_index.get(data.get("produces", ""), -1)
+		recipes.append(data.get("recipe", {}))
+	station_recipes = _recipe_matrix(recipes)
+
+
+static func _index_of(ids: PackedStringArray) -> Dictionary:
+	var index = {}
+	for i in ids.size():
+		index[ids[i]] = i
+	return index
+
+
+## Recetas {recurso: cantidad} → matriz densa (filas × resource_ids.size())
+static func _recipe_matrix(recipes: Array) -> PackedFloat64Array:
+	var width = resource_ids.size()
+	var matrix = PackedFloat64Array()
+	matrix.resize(recipes.size() * width)
+	matrix.fill(0.0)
+
+	for row in recipes.size():
+		for resource_id in recipes[row]:
+			var column = resource_index.get(resource_id, -1)
+			if column < 0:
+				push_warning("GameConfigTables: recurso desconocido en receta: %s" % resource_id)
+				continue
+			matrix[row * width + column] = recipes[row][resource_id]
+	return matrix
+
+
+## === CONSULTAS ===
+
+
+## Cantidad de un recurso en una receta (matrix = product_recipes o station_recipes)
+static func recipe_amount(matrix: PackedFloat64Array, row: int, resource: int) -> float:
+	return matrix[row * resource_ids.size() + resource]
+
+
+## Fila de receta como Dictionary {recurso: cantidad} (solo cantidades > 0)
+static func recipe_row(matrix: PackedFloat64Array, row: int) -> Dictionary:
+	var recipe = {}
+	var offset = row * resource_ids.size()
+	for column in resource_ids.size():
+		if matrix[offset + column] > 0.0:
+			recipe[resource_ids[column]] = matrix[offset + column]
+	return recipe
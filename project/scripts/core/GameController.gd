@@ -15,7 +15,16 @@ const UNLOCK_PANEL_SCENE = preload("res://scenes/ui/UnlockPanel.tscn")  # T031
 const DEV_MODE_UNLOCK_ALL = true  # ⚠️ CAMBIAR A FALSE PARA PRODUCCIÓN ⚠️
 const DEV_MODE_DEBUG_UI = true    # Mostrar indicadores visuales de debug
 
-@onready var tab_navigator: Control = $TabNavigator
+# Refrescos de panel afectados por cada sección del dirty-set de GameData
+const DISPLAY_REFRESH_BY_SECTION = {
+	"currencies": ["currencies", "generators", "stations", "inventory", "customers"],
+	"resources": ["resources", "stations", "inventory"],
+	"products": ["products", "inventory", "customers"],
+	"generators": ["resources", "generators"],
+	"stations": ["stations", "customers"],
+	"offers": ["customers"],
+	"upgrades": ["customers"]
+}
 
 # Managers del juego
 var game_data: GameData
@@ -53,10 +62,13 @@ var gems_timer: Timer  # T014 - Diamond Bonus timer
 
 # Cache para sistema reactivo
 var cached_money: float = 0.0
+var _display_refresh_pending: bool = false  # Flush de UI ya programado para este frame
 
 # T023 - Control de progreso offline
 var _check_offline_progress_after_load: bool = false
 
+@onready var tab_navigator: Control = $TabNavigator
+
 
 func _ready() -> void:
 	print_rich("[color=yellow]🎮 GameController._ready() iniciado[/color]")
@@ -77,10 +89,7 @@ func _ready() -> void:
 	print_rich("[color=green]✅ GameController listo - Sistema modular activo[/color]")
 	debug_game_state()
 
-	# T023 - Verificar progreso offline después de la inicialización completa
-	if _check_offline_progress_after_load:
-		call_deferred("_process_offline_progress")
-		_check_offline_progress_after_load = false
+	# T023 - El progreso offline se verifica en _setup_deferred_managers (tras el primer frame)
 
 
 ## === INPUT HANDLING ===
@@ -174,8 +183,17 @@ func debug_pause_and_inspect(location: String, force: bool = false):
 func _setup_game_data() -> void:
 	game_data = GameData.new()
 
-	# Cargar datos guardados si existen
-	if SaveSystem:
+	# Guardado binario: cargar ya lo del primer frame; logros, misiones y desbloqueos se
+	# leen del guardado cuando algo accede a ellos (GameData.lazy_source)
+	var reader = SaveSystem.open_game_data(GameData.LAZY_SECTIONS) if SaveSystem else null
+	if reader:
+		game_data.from_dict(reader.game_data)
+		game_data.lazy_source = reader
+		print("💾 Datos cargados del sistema de guardado (carga diferida)")
+		_check_offline_progress_after_load = true
+
+	# Cargar datos guardados si existen (JSON antiguo, backups o partida nueva)
+	elif SaveSystem:
 		var loaded_data = SaveSystem.load_game_data()
 		if loaded_data and loaded_data.size() > 0:
 			game_data.from_dict(loaded_data)
@@ -291,8 +309,10 @@ func _setup_managers() -> void:
 	research_manager = ResearchManager.new()  # T035 - Sistema de Árbol de Investigación
 	contract_manager = ContractManager.new()  # T036 - Sistema de Contratos
 	# ELIMINADO: currency_manager - Refactor: currencies en GameData
+	tick_manager = TickManager.new()  # Bucle de simulación de paso fijo
 
 	# Agregar al árbol de nodos
+	add_child(tick_manager)
 	add_child(generator_manager)
 	add_child(production_manager)
 	add_child(sales_manager)
@@ -318,11 +338,11 @@ func _setup_managers() -> void:
 	customer_manager.set_game_data(game_data)
 	prestige_manager.set_game_data(game_data)  # T013 - Sistema de Prestigio
 	achievement_manager.set_game_data(game_data)  # T017 - Sistema de Logros
-	mission_manager.set_game_data(game_data)  # T018 - Sistema de Misiones Diarias
+	# T018 - Misiones: tras el primer frame (_setup_deferred_managers)
 	automation_manager.set_game_data(game_data)  # T020 - Sistema de Auto-Producción
 	offline_progress_manager.set_game_data(game_data)  # T023 - Progreso Offline
 	daily_reward_manager.set_game_data(game_data)  # T026 - Sistema de recompensas diarias
-	unlock_manager.game_data = game_data  # T031 - Sistema de Desbloqueos Progresivos
+	unlock_manager.set_game_data(game_data)  # T031 - Sistema de Desbloqueos Progresivos
 	audio_manager.set_game_data(game_data)  # T032 - Sistema de Audio Profesional
 	effects_manager.set_game_data(game_data)  # T033 - Sistema de Efectos Visuales
 	statistics_manager.set_game_data(game_data)  # T034 - Sistema de Dashboard de Estadísticas
@@ -349,6 +369,8 @@ func _setup_managers() -> void:
 	print("🌟 PrestigeManager datos cargados desde GameData")
 
 	# T029 - Cargar datos de achievements en el AchievementManager
+	# Antes del progreso offline y de cualquier guardado: _sync_managers_to_game_data los
+	# vuelca de vuelta y un logro sin cargar se desbloquearía (y pagaría) otra vez
 	if achievement_manager and game_data:
 		var achievement_data = {
 			"unlocked_achievements": game_data.unlocked_achievements,
@@ -358,6 +380,9 @@ func _setup_managers() -> void:
 		achievement_manager.load_achievement_data(achievement_data)
 		print("🏆 AchievementManager datos cargados desde GameData")
 
+	# Las misiones no se ven en el primer frame: se hidratan cuando ya está dibujado
+	RenderingServer.frame_post_draw.connect(_setup_deferred_managers, CONNECT_ONE_SHOT)
+
 	# T014 - Aplicar bonificaciones de prestige al cargar
 	if prestige_manager.active_star_bonuses.size() > 0:
 		prestige_manager._apply_all_star_bonuses()
@@ -381,18 +406,60 @@ func _setup_managers() -> void:
 	# Conectar señales de managers
 	_connect_manager_signals()
 
+	# Sistemas de economía en el scheduler de paso fijo (reemplaza Timers y _process)
+	_register_simulation_systems()
+
 	print("🏭 Managers configurados y conectados")
 
 
+## Registrar los sistemas de economía en TickManager, en orden de ejecución determinista
+func _register_simulation_systems() -> void:
+	var step = TickManager.SIMULATION_STEP
+	tick_manager.register_system(
+		"generators", generator_manager.step_generation, GeneratorManager.GENERATION_PERIOD, 0
+	)
+	tick_manager.register_system(
+		"auto_production",
+		automation_manager.step_auto_production,
+		automation_manager.production_check_interval,
+		10
+	)
+	tick_manager.register_system(
+		"auto_sell", automation_manager.step_auto_sell, automation_manager.sell_check_interval, 20
+	)
+	tick_manager.register_system("customers", customer_manager.step_customers, step, 30)
+	tick_manager.register_system(
+		"research", research_manager.step_research, ResearchManager.RESEARCH_TICK_INTERVAL, 40
+	)
+	tick_manager.register_system(
+		"contracts", contract_manager.step_contracts, ContractManager.CONTRACT_CHECK_INTERVAL, 50
+	)
+	tick_manager.register_system(
+		"statistics",
+		statistics_manager.step_statistics,
+		StatisticsManager.REALTIME_STATS_INTERVAL,
+		60
+	)
+	print("⏰ %d sistemas de simulación registrados" % tick_manager.simulation_systems.size())
+
+
+## Managers que leen secciones diferidas del guardado (misiones)
+func _setup_deferred_managers() -> void:
+	mission_manager.set_game_data(game_data)  # T018 - Sistema de Misiones Diarias
+
+	# T023 - El progreso offline notifica a las misiones: solo cuando ya están cargadas
+	if _check_offline_progress_after_load:
+		_check_offline_progress_after_load = false
+		_process_offline_progress()
+
+
 ## Configurar sistema de estado centralizado
 func _setup_state_manager() -> void:
 	"""Configura el GameStateManager para gestión reactiva de estado"""
 
 	# Conectar señales de cambio de estado
+	# Recursos, generadores y estaciones los refresca _flush_display_updates por sección
 	GameStateManager.money_changed.connect(_on_money_changed)
-	GameStateManager.resources_changed.connect(_on_resources_changed)
-	GameStateManager.generators_changed.connect(_on_generators_changed)
-	GameStateManager.stations_changed.connect(_on_stations_changed)
 
 	print("🔄 GameStateManager configurado - Sistema reactivo activo")
 
@@ -460,9 +527,6 @@ func _setup_ui_system() -> void:
 		}
 	)
 
-	# Inicializar estado en GameStateManager
-	GameStateManager.update_game_state(game_data.to_dict())
-
 	# Conectar señales del TabNavigator
 	tab_navigator.tab_changed.connect(_on_tab_changed)
 	tab_navigator.pause_pressed.connect(_on_pause_pressed)
@@ -475,7 +539,7 @@ func _setup_ui_system() -> void:
 	# Configurar paneles con datos iniciales
 	_setup_panels()
 
-	# Primera actualización de displays
+	# Primera actualización de displays (GameStateManager recibe el estado completo)
 	_update_all_displays()
 
 	print("📱 Sistema UI configurado")
@@ -561,7 +625,7 @@ func _setup_save_timer() -> void:
 	save_timer = Timer.new()
 	save_timer.wait_time = 10.0  # MEJORA: 30s → 10s para menor pérdida de progreso
 	save_timer.autostart = true
-	save_timer.timeout.connect(_save_game)
+	save_timer.timeout.connect(_autosave_game)
 	add_child(save_timer)
 
 	print("💾 Timer de guardado automático configurado (cada 10s)")
@@ -589,43 +653,81 @@ func _on_gems_timer_timeout() -> void:
 		# TODO: Mostrar notification en UI
 
 
-## Actualizar todas las interfaces
+## Actualizar todas las interfaces (carga, reset, prestigio: todo el estado cambió)
 func _update_all_displays() -> void:
-	var game_dict = game_data.to_dict()
+	game_data.mark_all_dirty()
+	_queue_display_refresh()
 
-	# NUEVO: Actualizar GameStateManager (sistema reactivo)
-	GameStateManager.update_game_state(game_dict)
-	cached_money = game_data.money
 
-	# Actualizar display de dinero (legacy)
-	tab_navigator.update_money_display(game_data.money)
+## Programar un único refresco de UI por frame con lo acumulado en el dirty-set
+func _queue_display_refresh() -> void:
+	if _display_refresh_pending:
+		return
+	_display_refresh_pending = true
+	call_deferred("_flush_display_updates")
 
-	# REFACTOR: Actualizar displays de triple currency directamente desde GameData
-	if tab_navigator.has_method("update_all_currencies"):
-		tab_navigator.update_all_currencies(int(game_data.money), game_data.tokens, game_data.gems)
 
-	# Actualizar paneles
-	if generation_panel.has_method("update_resource_displays"):
-		generation_panel.update_resource_displays(game_dict)
-		if generation_panel.has_method("update_generator_displays"):
-			generation_panel.update_generator_displays(game_dict)
+## Empujar a los paneles solo las secciones modificadas desde el último flush
+func _flush_display_updates() -> void:
+	_display_refresh_pending = false
+	if not game_data or not game_data.has_dirty_changes():
+		return
 
-	if production_panel.has_method("update_product_displays"):
-		production_panel.update_product_displays(game_dict)
-		if production_panel.has_method("update_station_displays"):
-			production_panel.update_station_displays(game_dict)
+	var dirty = game_data.consume_dirty()
+
+	# GameStateManager detecta cambios por versión de sección (sin to_dict ni comparación)
+	GameStateManager.sync_with(game_data)
+
+	var refreshes = {}
+	for section in dirty:
+		for refresh in DISPLAY_REFRESH_BY_SECTION.get(section, []):
+			refreshes[refresh] = true
+
+	# Vista por referencia de GameData: los paneles leen, nada se copia
+	var view = {
+		"money": game_data.money,
+		"tokens": game_data.tokens,
+		"gems": game_data.gems,
+		"resources": game_data.resources,
+		"products": game_data.products,
+		"generators": game_data.generators,
+		"stations": game_data.stations,
+		"offers": game_data.offers,
+		"upgrades": game_data.upgrades
+	}
+	_refresh_panels(refreshes, view)
+
+	# NOTA: check_unlock_stations() se llama desde otros lugares para evitar recursión infinita
 
-	if sales_panel.has_method("update_inventory_displays"):
-		sales_panel.update_inventory_displays(game_dict)
 
-	if customers_panel.has_method("update_customer_display"):
-		customers_panel.update_customer_display(game_dict, customer_manager.get_timer_progress())
+func _refresh_panels(refreshes: Dictionary, view: Dictionary) -> void:
+	if refreshes.has("currencies"):
+		cached_money = game_data.money
+		# REFACTOR: Actualizar displays de triple currency directamente desde GameData
+		if tab_navigator.has_method("update_all_currencies"):
+			tab_navigator.update_all_currencies(
+				int(game_data.money), game_data.tokens, game_data.gems
+			)
 
-	# Actualizar interfaces de ofertas en CustomersPanel
-	if customers_panel.has_method("update_offer_interfaces"):
-		customers_panel.update_offer_interfaces(game_dict)
+	if refreshes.has("resources") and generation_panel.has_method("update_resource_displays"):
+		generation_panel.update_resource_displays(view)
+	if refreshes.has("generators") and generation_panel.has_method("update_generator_displays"):
+		generation_panel.update_generator_displays(view)
 
-	# NOTA: check_unlock_stations() se llama desde otros lugares para evitar recursión infinita
+	if refreshes.has("products") and production_panel.has_method("update_product_displays"):
+		production_panel.update_product_displays(view)
+	if refreshes.has("stations") and production_panel.has_method("update_station_displays"):
+		production_panel.update_station_displays(view)
+
+	if refreshes.has("inventory") and sales_panel.has_method("update_inventory_displays"):
+		sales_panel.update_inventory_displays(view)
+
+	if refreshes.has("customers"):
+		if customers_panel.has_method("update_customer_display"):
+			customers_panel.update_customer_display(view, customer_manager.get_timer_progress())
+		# Actualizar interfaces de ofertas en CustomersPanel
+		if customers_panel.has_method("update_offer_interfaces"):
+			customers_panel.update_offer_interfaces(view)
 
 
 ## Actualizar solo el panel de generadores (para recursos generados)
@@ -643,7 +745,7 @@ func _update_generation_panel() -> void:
 
 func _on_generator_purchased(generator_id: String, quantity: int) -> void:
 	print("✅ Generador comprado: %dx %s" % [quantity, generator_id])
-	_update_all_displays()
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre compra de generadores
 	achievement_manager.notify_generator_purchased(generator_id, quantity)
@@ -656,9 +758,8 @@ func _on_resource_generated(resource_type: String, amount: int) -> void:
 	"""Maneja la generación de recursos en tiempo real"""
 	print("🔄 Recurso generado: %dx %s" % [amount, resource_type])
 
-	# La actualización real la maneja _on_stock_updated que se dispara desde StockManager
-	# Solo necesitamos actualizar el dinero por si hay ventas automáticas
-	tab_navigator.update_money_display(game_data.money)
+	# StockManager ya marcó el recurso en el dirty-set; el refresco sale en el flush del frame
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre recursos generados
 	achievement_manager.notify_resource_generated(resource_type, amount)
@@ -669,7 +770,7 @@ func _on_resource_generated(resource_type: String, amount: int) -> void:
 
 func _on_station_purchased(station_id: String) -> void:
 	print("✅ Estación comprada: %s" % station_id)
-	_update_all_displays()
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre compra de estaciones
 	achievement_manager.notify_station_purchased(station_id)
@@ -680,12 +781,12 @@ func _on_station_purchased(station_id: String) -> void:
 
 func _on_station_unlocked(station_id: String) -> void:
 	print("🔓 Estación desbloqueada: %s" % station_id)
-	_update_all_displays()
+	_queue_display_refresh()
 
 
 func _on_product_produced(product_type: String, amount: int) -> void:
 	print("🍺 Producido: %dx %s" % [amount, product_type])
-	_update_all_displays()
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre producción
 	achievement_manager.notify_product_produced(product_type, amount)
@@ -698,7 +799,7 @@ func _on_item_sold(
 	item_type: String, item_name: String, quantity: int, total_earned: float
 ) -> void:
 	print("💰 Vendido: %dx %s (%s) por $%.2f" % [quantity, item_name, item_type, total_earned])
-	_update_all_displays()
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre ventas
 	achievement_manager.notify_item_sold(item_type, quantity, total_earned)
@@ -718,7 +819,7 @@ func _on_customer_served(
 	print(
 		"👤 %s compró %d productos por $%.2f" % [customer_type, products_bought.size(), total_earned]
 	)
-	_update_all_displays()
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre clientes servidos
 	achievement_manager.notify_customer_served(customer_type, products_bought.size(), total_earned)
@@ -734,7 +835,7 @@ func _on_customer_served(
 
 func _on_customer_upgrade_purchased(upgrade_id: String, cost: float) -> void:
 	print("⬆️ Upgrade de cliente: %s por $%.0f" % [upgrade_id, cost])
-	_update_all_displays()
+	_queue_display_refresh()
 
 	# T017 - Notificar al Achievement Manager sobre upgrades comprados
 	achievement_manager.notify_upgrade_purchased(upgrade_id, cost)
@@ -781,7 +882,7 @@ func _on_achievement_unlocked(_achievement_id: String, achievement_data: Diction
 		game_data.add_gems(achievement_data.gem_reward)
 		print("💎 +%d gemas por logro" % achievement_data.gem_reward)
 
-	_update_all_displays()
+	_queue_display_refresh()
 	_save_game_immediate()  # Guardar progreso de logros
 	# TODO: Mostrar notification visual de logro desbloqueado
 
@@ -792,7 +893,7 @@ func _on_mission_completed(_mission_id: String, mission_data: Dictionary) -> voi
 	print("📋 Misión completada: %s - %s" % [mission_data.name, mission_data.description])
 
 	# La recompensa ya fue aplicada por el MissionManager
-	_update_all_displays()
+	_queue_display_refresh()
 	_save_game_immediate()  # Guardar progreso de misiones
 	# TODO: Mostrar notification visual de misión completada
 
@@ -800,7 +901,7 @@ func _on_mission_completed(_mission_id: String, mission_data: Dictionary) -> voi
 func _on_daily_missions_reset() -> void:
 	"""Manejar cuando se resetean las misiones diarias"""
 	print("📅 Misiones diarias reseteadas - Nuevas misiones disponibles")
-	_update_all_displays()
+	_queue_display_refresh()
 	# TODO: Mostrar notification de nuevas misiones disponibles
 
 
@@ -810,20 +911,20 @@ func _on_daily_missions_reset() -> void:
 func _on_auto_production_started(station_id: String, product_id: String, quantity: int) -> void:
 	"""Manejar cuando se inicia auto-producción"""
 	print("🤖 Auto-producción iniciada: %s produciendo %s x%d" % [station_id, product_id, quantity])
-	_update_all_displays()
+	_queue_display_refresh()
 
 
 func _on_auto_sell_triggered(product_id: String, quantity: int, earnings: float) -> void:
 	"""Manejar cuando se dispara auto-venta"""
 	print("💰 Auto-venta ejecutada: %s x%d por %.2f monedas" % [product_id, quantity, earnings])
-	_update_all_displays()
+	_queue_display_refresh()
 
 
 func _on_automation_config_changed(setting_type: String, enabled: bool) -> void:
 	"""Manejar cuando cambia configuración de automatización"""
 	print("⚙️ Automatización configurada: %s = %s" % [setting_type, enabled])
-	# Guardar configuración
-	_save_game()
+	# Guardar configuración (en WorkerThreadPool, sin bloquear el frame)
+	_save_game_immediate()
 
 
 ## === EVENTOS DE UI ===
@@ -837,7 +938,7 @@ func _on_ui_generator_purchase_requested(generator_id: String, quantity: int) ->
 	# Actualizar UI inmediatamente después de compra exitosa
 	if success:
 		print("🔄 Actualizando UI después de compra de generador")
-		_update_all_displays()
+		_queue_display_refresh()
 		_save_game_immediate()  # MEJORA: Guardar inmediatamente después de compra crítica
 	else:
 		print("❌ No se pudo completar la compra: %s x%d" % [generator_id, quantity])
@@ -1180,6 +1281,13 @@ func _save_game() -> void:
 		print("💾 Juego guardado automáticamente con encriptación")
 
 
+## Autoguardado periódico: solo las secciones modificadas van al journal de SaveSystem
+func _autosave_game() -> void:
+	if SaveSystem:
+		_sync_managers_to_game_data()  # Sincronizar datos antes de guardar
+		SaveSystem.autosave_game_data(game_data.to_dict())
+
+
 ## Guardado inmediato para eventos críticos
 func _save_game_immediate() -> void:
 	if SaveSystem:
@@ -1214,7 +1322,7 @@ func _notification(what: int) -> void:
 	if what == NOTIFICATION_WM_CLOSE_REQUEST:
 		# Actualizar el timestamp de last_close_time antes de guardar
 		game_data.gameplay_data["last_close_time"] = Time.get_unix_time_from_system()
-		_save_game()
+		_save_game()  # Instantánea completa: compacta el journal de autoguardado
 		get_tree().quit()
 
 
@@ -1345,6 +1453,7 @@ func _on_ui_offer_toggled(station_index: int, enabled: bool) -> void:
 		# Actualizar GameData
 		if game_data.offers.has(station_id):
 			game_data.offers[station_id]["enabled"] = enabled
+			game_data.mark_dirty("offers", station_id)
 			print(
 				"   - ✅ Oferta %s para %s" % ["ACTIVADA" if enabled else "DESACTIVADA", station_id]
 			)
@@ -1371,9 +1480,10 @@ func _on_ui_offer_price_requested(station_index: int) -> void:
 			1.2 if current_multiplier <= 1.0 else (0.8 if current_multiplier >= 1.5 else 1.0)
 		)
 		game_data.offers[station_id]["price_multiplier"] = new_multiplier
+		game_data.mark_dirty("offers", station_id)
 
 		print("   - ✅ Nuevo multiplicador: %.2f" % new_multiplier)
-		_update_all_displays()  # Actualizar UI para mostrar el cambio
+		_queue_display_refresh()  # Actualizar UI para mostrar el cambio
 
 
 ## === CALLBACKS PARA CUSTOMERSPANEL ===
@@ -1388,10 +1498,11 @@ func _on_ui_offer_toggled_customers(station_id: String, enabled: bool) -> void:
 	# Actualizar GameData
 	if game_data.offers.has(station_id):
 		game_data.offers[station_id]["enabled"] = enabled
+		game_data.mark_dirty("offers", station_id)
 		print("   - ✅ Oferta actualizada en GameData")
 
 		# Actualizar ambos paneles para mantener sincronización
-		_update_all_displays()
+		_queue_display_refresh()
 		print("   - ✅ Paneles sincronizados")
 	else:
 		print("   - ❌ ERROR: Estación no encontrada en ofertas")
@@ -1407,32 +1518,6 @@ func _on_money_changed(new_amount: float) -> void:
 		tab_navigator.update_money_display(new_amount)
 
 
-func _on_resources_changed(resources: Dictionary) -> void:
-	"""Reacciona a cambios de recursos"""
-	if generation_panel and generation_panel.has_method("update_resource_displays"):
-		generation_panel.update_resource_displays({"resources": resources})
-
-
-func _on_generators_changed(generators: Dictionary) -> void:
-	"""Reacciona a cambios de generadores"""
-	if generation_panel and generation_panel.has_method("update_generator_displays"):
-		generation_panel.update_generator_displays(
-			{"generators": generators, "money": cached_money}
-		)
-
-
-func _on_stations_changed(stations: Dictionary) -> void:
-	"""Reacciona a cambios de estaciones"""
-	if production_panel and production_panel.has_method("update_station_displays"):
-		production_panel.update_station_displays(
-			{
-				"stations": stations,
-				"money": cached_money,
-				"resources": game_data.resources if game_data else {}
-			}
-		)
-
-
 func _on_ui_offer_price_requested_customers(station_id: String) -> void:
 	"""Callback para cambio de precio desde CustomersPanel"""
 	print("💰 GameController - Cambio de precio desde CustomersPanel:")
@@ -1452,10 +1537,11 @@ func _on_ui_offer_price_requested_customers(station_id: String) -> void:
 			new_multiplier = 0.8  # Alto -> Bajo
 
 		game_data.offers[station_id]["price_multiplier"] = new_multiplier
+		game_data.mark_dirty("offers", station_id)
 		print("   - ✅ Nuevo multiplicador: %.2f" % new_multiplier)
 
 		# Actualizar ambos paneles para mantener sincronización
-		_update_all_displays()
+		_queue_display_refresh()
 		print("   - ✅ Paneles sincronizados")
 	else:
 		print("   - ❌ ERROR: Estación no encontrada en ofertas")
@@ -1468,29 +1554,14 @@ func _on_stock_updated(item_type: String, item_name: String, new_quantity: int)
 	"""Maneja actualizaciones de stock en tiempo real desde StockManager"""
 	print("📦 Stock actualizado: %s %s = %d" % [item_type, item_name, new_quantity])
 
-	# Actualizar solo la pestaña de generación si es un recurso/ingrediente
-	if item_type in ["ingredient", "resource"]:
-		if generation_panel and generation_panel.has_method("update_resource_displays"):
-			# Crear datos mínimos para la actualización
-			var minimal_data = {"resources": game_data.resources}
-			generation_panel.update_resource_displays(minimal_data)
-			print("✅ GenerationPanel actualizado con nuevo stock de %s" % item_name)
-
-	# Si es un producto, actualizar SalesPanel
-	elif item_type == "product":
-		if sales_panel and sales_panel.has_method("update_inventory_displays"):
-			var minimal_data = {
-				"products": game_data.products,
-				"resources": game_data.resources,
-				"money": game_data.money
-			}
-			sales_panel.update_inventory_displays(minimal_data)
-			print("✅ SalesPanelBasic actualizado con nuevo stock de %s" % item_name)
+	# StockManager marcó el item en el dirty-set: varios cambios del mismo frame
+	# (p. ej. consumo de receta + producto) se agrupan en un único refresco de paneles
+	_queue_display_refresh()
 
 
 ## === CALLBACKS ELIMINADOS ===
 ## CurrencyManager eliminado - currencies ahora en GameData directamente
-## Sin signals, sin callbacks, updates directos en _update_all_displays()
+## Sin signals, sin callbacks: setters de GameData marcan el dirty-set y se refresca en el flush
 
 # ═════════════════════════════════════════════════════════════════════════════════════
 # T026: ACCESO PÚBLICO PARA DAILY REWARD MANAGER
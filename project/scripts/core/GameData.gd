@@ -3,10 +3,28 @@ extends Resource
 ## GameData - Estructura centralizada de datos del juego
 ## Separar datos de lógica para mejor mantenibilidad
 
+## Secciones del dirty-set (ver mark_dirty)
+const DIRTY_SECTIONS = [
+	"currencies", "resources", "products", "generators", "stations", "offers", "upgrades"
+]
+const DIRTY_ALL_KEYS = "*"  # Sección completa (carga, reset, prestigio)
+## Secciones de SaveFormat que se hidratan bajo demanda desde lazy_source
+const LAZY_SECTIONS = ["achievements", "missions", "unlocks"]
+
 ## Datos económicos - Triple Moneda v2.0
-@export var money: float = 50.0
-@export var tokens: int = 0  # Tokens ganados por clientes automáticos y misiones
-@export var gems: int = 150  # T026: Diamantes premium - INICIAL MEJORADO (era 100)
+## Los setters marcan la sección "currencies" del dirty-set (refresco incremental de UI)
+@export var money: float = 50.0:
+	set(value):
+		money = value
+		mark_dirty("currencies", "money")
+@export var tokens: int = 0:  # Tokens ganados por clientes automáticos y misiones
+	set(value):
+		tokens = value
+		mark_dirty("currencies", "tokens")
+@export var gems: int = 150:  # T026: Diamantes premium - INICIAL MEJORADO (era 100)
+	set(value):
+		gems = value
+		mark_dirty("currencies", "gems")
 
 ## T013 - Sistema de Prestigio
 @export var prestige_stars: int = 0  # Estrellas de prestigio acumuladas
@@ -15,15 +33,59 @@ extends Resource
 @export var total_cash_earned: float = 0.0  # Cash total ganado (para cálculo de stars)
 
 # T017 - Sistema de Logros
-@export var unlocked_achievements: Array[String] = []  # IDs de logros desbloqueados
-@export var achievement_progress: Dictionary = {}  # Progreso de achievements
-@export var lifetime_stats: Dictionary = {}  # Estadísticas de por vida para achievements
+## Logros y misiones no hacen falta para el primer frame: con lazy_source se leen del
+## guardado al primer acceso (lectura o escritura) a cualquier propiedad de su sección
+@export var unlocked_achievements: Array[String] = []:  # IDs de logros desbloqueados
+	get:
+		_hydrate_section("achievements")
+		return unlocked_achievements
+	set(value):
+		_hydrate_section("achievements")
+		unlocked_achievements = value
+@export var achievement_progress: Dictionary = {}:  # Progreso de achievements
+	get:
+		_hydrate_section("achievements")
+		return achievement_progress
+	set(value):
+		_hydrate_section("achievements")
+		achievement_progress = value
+@export var lifetime_stats: Dictionary = {}:  # Estadísticas de por vida para achievements
+	get:
+		_hydrate_section("achievements")
+		return lifetime_stats
+	set(value):
+		_hydrate_section("achievements")
+		lifetime_stats = value
 
 # T018/T030 - Sistema de Misiones Diarias y Semanales
-@export var active_missions: Dictionary = {}  # Misiones diarias activas
-@export var active_weekly_missions: Dictionary = {}  # T030 - Misiones semanales activas
-@export var last_mission_reset: int = 0  # Timestamp del último reset diario
-@export var last_weekly_mission_reset: int = 0  # T030 - Timestamp del último reset semanal
+@export var active_missions: Dictionary = {}:  # Misiones diarias activas
+	get:
+		_hydrate_section("missions")
+		return active_missions
+	set(value):
+		_hydrate_section("missions")
+		active_missions = value
+@export var active_weekly_missions: Dictionary = {}:  # T030 - Misiones semanales activas
+	get:
+		_hydrate_section("missions")
+		return active_weekly_missions
+	set(value):
+		_hydrate_section("missions")
+		active_weekly_missions = value
+@export var last_mission_reset: int = 0:  # Timestamp del último reset diario
+	get:
+		_hydrate_section("missions")
+		return last_mission_reset
+	set(value):
+		_hydrate_section("missions")
+		last_mission_reset = value
+@export var last_weekly_mission_reset: int = 0:  # T030 - Timestamp del último reset semanal
+	get:
+		_hydrate_section("missions")
+		return last_weekly_mission_reset
+	set(value):
+		_hydrate_section("missions")
+		last_weekly_mission_reset = value
 
 ## Estado del tutorial y sistemas
 @export var tutorial_completed: bool = false
@@ -82,6 +144,25 @@ extends Resource
 	"stations_purchased": 0
 }
 
+## Índice de objetivos sobre `statistics` compartido por misiones, contratos y desbloqueos
+## Las estadísticas que observan se escriben con stat_triggers.set_value para despertarlos
+var stat_triggers: StatTriggerIndex = StatTriggerIndex.new(statistics)
+## Versión por sección (solo lectura fuera de GameData): crece en cada mark_dirty y no se
+## consume, así varios lectores detectan cambios comparando un entero
+var section_versions: Dictionary = {}
+## Guardado abierto por SaveSystem.open_game_data: las LAZY_SECTIONS quedan pendientes
+## hasta el primer acceso. from_dict lo descarta; se suelta al hidratar la última sección.
+var lazy_source: SaveSectionReader = null:
+	set(value):
+		lazy_source = value
+		_pending_sections.clear()
+		if value:
+			for section in LAZY_SECTIONS:
+				_pending_sections[section] = true
+## Dirty-set: {sección: {clave: true}} con lo modificado desde el último consume_dirty()
+var _dirty: Dictionary = {}
+var _pending_sections: Dictionary = {}  # Secciones de lazy_source aún sin leer
+
 
 ## Validar integridad de datos
 func validate() -> bool:
@@ -125,6 +206,7 @@ func to_dict() -> Dictionary:
 
 ## Cargar desde diccionario
 func from_dict(data: Dictionary) -> void:
+	lazy_source = null  # Los datos recibidos sustituyen a las secciones pendientes
 	money = data["money"] if data.has("money") else 50.0
 	tokens = data["tokens"] if data.has("tokens") else 0  # NUEVO - backward compatibility
 	gems = data["gems"] if data.has("gems") else 100  # NUEVO - backward compatibility
@@ -160,15 +242,25 @@ func from_dict(data: Dictionary) -> void:
 	upgrades = data["upgrades"] if data.has("upgrades") else upgrades
 	milestones = data["milestones"] if data.has("milestones") else milestones
 	statistics = data["statistics"] if data.has("statistics") else statistics
+	stat_triggers.rebind(statistics)
 
 	# T031 - Sistema de Desbloqueos Progresivos (carga diferida)
 	unlock_data = data["unlock_data"] if data.has("unlock_data") else {}
 
+	# Datos reemplazados por completo: toda la UI debe refrescarse
+	mark_all_dirty()
+
 
 ## === T031 - UNLOCK MANAGER INTEGRATION ===
 
 # Variable para almacenar los datos de unlock temporal
-var unlock_data: Dictionary = {}
+var unlock_data: Dictionary = {}:
+	get:
+		_hydrate_section("unlocks")
+		return unlock_data
+	set(value):
+		_hydrate_section("unlocks")
+		unlock_data = value
 
 
 func _get_unlock_manager_data() -> Dictionary:
@@ -183,6 +275,57 @@ func load_unlock_data_to_manager():
 	print("🔓 Datos de desbloqueos disponibles para cargar")
 
 
+## === CARGA DIFERIDA DE SECCIONES ===
+
+
+func _hydrate_section(section: String) -> void:
+	if not _pending_sections.has(section):
+		return
+	# Quitar antes de asignar: los setters de la sección vuelven a llamar aquí
+	_pending_sections.erase(section)
+
+	var values = lazy_source.read_section(section)
+	for key in values:
+		if not key in SaveFormat.SECTIONS[section]:
+			continue
+		if values[key] is Array:
+			get(key).assign(values[key])  # Conserva el tipo (Array[String])
+		else:
+			set(key, values[key])
+	print("📂 Sección '%s' cargada bajo demanda" % section)
+
+	if _pending_sections.is_empty():
+		lazy_source = null  # Libera los bytes del guardado
+
+
+## === DIRTY-SET PARA REFRESCO INCREMENTAL DE UI ===
+
+
+## Registrar un cambio (llamado por setters y por los managers que mutan los Dictionary)
+func mark_dirty(section: String, key: String = DIRTY_ALL_KEYS) -> void:
+	section_versions[section] = section_versions.get(section, 0) + 1
+	if not _dirty.has(section):
+		_dirty[section] = {}
+	_dirty[section][key] = true
+
+
+## Marcar todas las secciones como modificadas por completo
+func mark_all_dirty() -> void:
+	for section in DIRTY_SECTIONS:
+		mark_dirty(section)
+
+
+func has_dirty_changes() -> bool:
+	return not _dirty.is_empty()
+
+
+## Devolver el dirty-set acumulado y empezar uno nuevo
+func consume_dirty() -> Dictionary:
+	var dirty = _dirty
+	_dirty = {}
+	return dirty
+
+
 ## === CURRENCY METHODS - Refactorizado desde CurrencyManager ===
 
 
@@ -190,7 +333,9 @@ func load_unlock_data_to_manager():
 func add_money(amount: float) -> void:
 	money += amount
 	total_cash_earned += amount  # T013 - Para cálculo de prestige stars
-	statistics["total_money_earned"] += amount
+	stat_triggers.set_value(
+		"total_money_earned", statistics.get("total_money_earned", 0.0) + amount
+	)
 	print(
 		(
 			"💰 Cash añadido: $%.2f | Total: $%.2f | Histórico: $%.2f"
@@ -10,7 +10,10 @@ signal stations_changed(stations: Dictionary)
 signal products_changed(products: Dictionary)
 signal game_state_updated(full_state: Dictionary)
 
-# Cache del estado actual
+# Secciones de GameData observadas por versión (ver GameData.section_versions)
+const TRACKED_SECTIONS = ["currencies", "resources", "generators", "stations", "products"]
+
+# Cache del estado actual (referencias a las secciones de GameData, sin copias)
 var cached_game_state: Dictionary = {}
 var cached_money: float = 0.0
 var cached_resources: Dictionary = {}
@@ -25,6 +28,10 @@ var sales_panel: Control
 var customers_panel: Control
 var tab_navigator: Control
 
+# Instancia observada y última versión notificada por sección
+var _tracked_data: GameData
+var _seen_versions: Dictionary = {}
+
 
 func _ready() -> void:
 	print("🔄 GameStateManager inicializado - Sistema reactivo activo")
@@ -47,44 +54,52 @@ func setup_panel_references(panels: Dictionary) -> void:
 ## === GESTIÓN DE ESTADO CENTRALIZADA ===
 
 
-func update_game_state(new_state: Dictionary) -> void:
-	"""Actualiza el estado completo del juego y notifica cambios"""
-	var old_state = cached_game_state.duplicate()
-	cached_game_state = new_state.duplicate()
+func sync_with(data: GameData) -> void:
+	"""Notifica solo las secciones cuya versión cambió: una comparación de enteros por sección"""
+	if data != _tracked_data:
+		# Otra instancia (reset o carga): sus versiones no son comparables, notificar todo
+		_tracked_data = data
+		_seen_versions.clear()
 
-	_check_and_emit_changes(old_state, new_state)
+	var any_changed = false
+	for section in TRACKED_SECTIONS:
+		var version = data.section_versions.get(section, 0)
+		if _seen_versions.get(section, -1) == version:
+			continue
+		_seen_versions[section] = version
+		any_changed = true
+		_emit_section_changed(section, data)
 
 	# Emisión general de cambio de estado
-	game_state_updated.emit(new_state)
-
-
-func _check_and_emit_changes(old_state: Dictionary, new_state: Dictionary) -> void:
-	"""Detecta cambios específicos y emite señales correspondientes"""
-
-	# Verificar cambio de dinero
-	var new_money = new_state.get("money", 0.0)
-	if new_money != cached_money:
-		cached_money = new_money
-		money_changed.emit(new_money)
-		_update_affordability_states(new_money)
-
-	# Verificar cambio de recursos
-	var new_resources = new_state.get("resources", {})
-	if not _dictionaries_equal(new_resources, cached_resources):
-		cached_resources = new_resources.duplicate()
-		resources_changed.emit(new_resources)
-
-	# Verificar cambio de generadores
-	var new_generators = new_state.get("generators", {})
-	if not _dictionaries_equal(new_generators, cached_generators):
-		cached_generators = new_generators.duplicate()
-		generators_changed.emit(new_generators)
-
-	# Verificar cambio de estaciones
-	var new_stations = new_state.get("stations", {})
-	if not _dictionaries_equal(new_stations, cached_stations):
-		cached_stations = new_stations.duplicate()
-		stations_changed.emit(new_stations)
+	if any_changed:
+		game_state_updated.emit(cached_game_state)
+
+
+func _emit_section_changed(section: String, data: GameData) -> void:
+	"""Actualiza la referencia cacheada de la sección y emite su señal"""
+	match section:
+		"currencies":
+			cached_game_state["money"] = data.money
+			if data.money != cached_money:
+				cached_money = data.money
+				money_changed.emit(cached_money)
+				_update_affordability_states(cached_money)
+		"resources":
+			cached_resources = data.resources
+			cached_game_state["resources"] = cached_resources
+			resources_changed.emit(cached_resources)
+		"generators":
+			cached_generators = data.generators
+			cached_game_state["generators"] = cached_generators
+			generators_changed.emit(cached_generators)
+		"stations":
+			cached_stations = data.stations
+			cached_game_state["stations"] = cached_stations
+			stations_changed.emit(cached_stations)
+		"products":
+			cached_products = data.products
+			cached_game_state["products"] = cached_products
+			products_changed.emit(cached_products)
 
 
 func _update_affordability_states(money: float) -> void:
@@ -99,18 +114,6 @@ func _update_affordability_states(money: float) -> void:
 		production_panel.update_button_affordability(money)
 
 
-func _dictionaries_equal(dict1: Dictionary, dict2: Dictionary) -> bool:
-	"""Compara si dos diccionarios son iguales"""
-	if dict1.size() != dict2.size():
-		return false
-
-	for key in dict1.keys():
-		if not dict2.has(key) or dict1[key] != dict2[key]:
-			return false
-
-	return true
-
-
 ## === MÉTODOS DE CONVENIENCIA ===
 
 
@@ -2,6 +2,28 @@ extends Node
 ## GameUtils - Utilidades centralizadas del juego optimizadas
 ## Eliminar duplicación y centralizar funciones comunes
 
+## Curvas de costo por tipo de item: tramos [último nivel del tramo, multiplicador]
+## El costo del nivel L es base * multiplicador(L)^(L - 1)
+const NO_LEVEL_LIMIT = 9223372036854775807
+const DEFAULT_COST_CURVE = [[NO_LEVEL_LIMIT, 1.15]]
+const COST_CURVES = {
+	# Generadores: early suave (12%), mid acelerado (18%), late desafiante (25%)
+	"generator": [[10, 1.12], [25, 1.18], [NO_LEVEL_LIMIT, 1.25]],
+	# Estaciones de producción: inversión significativa
+	"station": [[NO_LEVEL_LIMIT, 1.20]],
+	# Upgrades: decisiones estratégicas
+	"upgrade": [[NO_LEVEL_LIMIT, 1.30]],
+	# Clientes: primeros levels accesibles, después más costosos
+	"customer": [[5, 1.15], [NO_LEVEL_LIMIT, 1.22]],
+	# Automation: premium features
+	"automation": [[NO_LEVEL_LIMIT, 1.35]],
+	# Prestige: beneficios permanentes
+	"prestige": [[NO_LEVEL_LIMIT, 2.0]],
+}
+
+## Motor de balance compartido (T027), creado en el primer uso
+var _balance_manager: MathematicalBalanceManager = null
+
 
 ## Validación robusta de referencias a managers (elimina duplicación)
 func is_manager_valid(manager_ref: Node) -> bool:
@@ -80,10 +102,10 @@ func get_item_emoji(item_type: String) -> String:
 func calculate_exponential_cost(
 	base_cost: float, owned: int, quantity: int, scale_factor: float = 1.15
 ) -> float:
-	var total_cost = 0.0
-	for i in range(quantity):
-		total_cost += base_cost * pow(scale_factor, owned + i)
-	return total_cost
+	if quantity <= 0:
+		return 0.0
+	# Serie geométrica: base * s^owned * (s^quantity - 1) / (s - 1)
+	return base_cost * pow(scale_factor, owned) * _geometric_sum(scale_factor, quantity)
 
 
 ## ═══════════════════════════════════════════════════════════════════════════════════
@@ -101,9 +123,17 @@ func get_scaled_cost_optimized(
 	- Mid game: Walls balanceadas cada 5-10 minutos
 	- Late game: Prestige timing perfecto
 	"""
-	# Usar el nuevo sistema matemático optimizado
-	var math_manager = MathematicalBalanceManager.new()
-	return math_manager.get_optimized_cost(base_cost, level, item_type, player_progress)
+	# Usar el nuevo sistema matemático optimizado (instancia compartida con memo de costos)
+	return get_balance_manager().get_optimized_cost(base_cost, level, item_type, player_progress)
+
+
+## Instancia compartida de MathematicalBalanceManager (hija de este autoload)
+func get_balance_manager() -> MathematicalBalanceManager:
+	if _balance_manager == null:
+		_balance_manager = MathematicalBalanceManager.new()
+		_balance_manager.name = "MathematicalBalanceManager"
+		add_child(_balance_manager)
+	return _balance_manager
 
 
 ## Obtener costo escalado con curvas específicas por tipo de item (LEGACY)
@@ -114,47 +144,8 @@ func get_scaled_cost(base_cost: float, level: int, item_type: String = "default"
 	- Mid game: Aceleración gradual
 	- Late game: Desafío exponencial
 	"""
-	var multiplier = 1.15  # Default fallback
-
-	match item_type.to_lower():
-		"generator":
-			# Generadores: Escalado variable por fase del juego
-			if level <= 10:
-				multiplier = 1.12  # Early game suave (12% por nivel)
-			elif level <= 25:
-				multiplier = 1.18  # Mid game acelerado (18% por nivel)
-			else:
-				multiplier = 1.25  # Late game desafiante (25% por nivel)
-
-		"station":
-			# Estaciones de producción: Más caras, inversión significativa
-			multiplier = 1.20
-
-		"upgrade":
-			# Upgrades: Mucho más caros, decisiones estratégicas
-			multiplier = 1.30
-
-		"customer":
-			# Upgrades de clientes: Balance tokens vs beneficio
-			if level <= 5:
-				multiplier = 1.15  # Primeros levels accesibles
-			else:
-				multiplier = 1.22  # Después más costosos
-
-		"automation":
-			# Automation upgrades: Premium features
-			multiplier = 1.35
-
-		"prestige":
-			# Prestige upgrades: Muy costosos, beneficios permanentes
-			multiplier = 2.0
-
-		_:
-			# Default para otros tipos
-			multiplier = 1.15
-
-	# Aplicar el escalado exponencial
-	return base_cost * pow(multiplier, level - 1)
+	var curve = get_cost_curve(item_type)
+	return base_cost * pow(_curve_multiplier(curve, level), level - 1)
 
 
 ## Calcular costo total para comprar múltiples niveles
@@ -162,13 +153,91 @@ func get_bulk_scaled_cost(
 	base_cost: float, current_level: int, quantity: int, item_type: String = "default"
 ) -> float:
 	"""Calcular costo total para comprar 'quantity' niveles desde 'current_level'"""
+	if quantity <= 0:
+		return 0.0
+	return _curve_range_cost(
+		get_cost_curve(item_type), base_cost, current_level + 1, current_level + quantity
+	)
+
+
+## Máxima cantidad de niveles comprables desde 'current_level' con 'currency_amount'
+func get_max_affordable_quantity(
+	currency_amount: float,
+	base_cost: float,
+	current_level: int,
+	item_type: String = "default",
+	max_quantity: int = 1000000
+) -> int:
+	"""Búsqueda exponencial + binaria sobre el costo acumulado (O(log n) evaluaciones O(1))"""
+	if max_quantity <= 0:
+		return 0
+	if base_cost <= 0.0:
+		return max_quantity
+	var curve = get_cost_curve(item_type)
+	var first_level = current_level + 1
+	if currency_amount < _curve_range_cost(curve, base_cost, first_level, first_level):
+		return 0
+
+	# Duplicar hasta pasarse del presupuesto (o llegar al tope)
+	var low = 1
+	var high = 2
+	while high <= max_quantity:
+		if _curve_range_cost(curve, base_cost, first_level, current_level + high) > currency_amount:
+			break
+		low = high
+		high *= 2
+	high = mini(high, max_quantity + 1)
+
+	# Invariante: low asequible, high no asequible (o fuera del tope)
+	while high - low > 1:
+		var middle = (low + high) >> 1
+		if (
+			_curve_range_cost(curve, base_cost, first_level, current_level + middle)
+			<= currency_amount
+		):
+			low = middle
+		else:
+			high = middle
+	return low
+
+
+## Curva de costo de un tipo de item (tramos [último nivel, multiplicador])
+func get_cost_curve(item_type: String) -> Array:
+	return COST_CURVES.get(item_type.to_lower(), DEFAULT_COST_CURVE)
+
+
+func _curve_multiplier(curve: Array, level: int) -> float:
+	for segment in curve:
+		if level <= segment[0]:
+			return segment[1]
+	return curve[-1][1]
+
+
+## Suma de los costos de los niveles first..last: una serie geométrica por tramo
+func _curve_range_cost(curve: Array, base_cost: float, first_level: int, last_level: int) -> float:
 	var total_cost = 0.0
+	var segment_start = first_level
+	for segment in curve:
+		if segment_start > last_level:
+			break
+		var segment_end = mini(segment[0], last_level)
+		if segment_end < segment_start:
+			continue
+		var multiplier: float = segment[1]
+		total_cost += (
+			base_cost
+			* pow(multiplier, segment_start - 1)
+			* _geometric_sum(multiplier, segment_end - segment_start + 1)
+		)
+		segment_start = segment_end + 1
+	return total_cost
 
-	for i in range(quantity):
-		var level_to_buy = current_level + i + 1
-		total_cost += get_scaled_cost(base_cost, level_to_buy, item_type)
 
-	return total_cost
+## 1 + r + r^2 + ... + r^(count - 1)
+func _geometric_sum(ratio: float, count: int) -> float:
+	if is_equal_approx(ratio, 1.0):
+		return float(count)
+	return (pow(ratio, count) - 1.0) / (ratio - 1.0)
 
 
 ## Verificar si el jugador puede permitirse un upgrade
@@ -6,64 +6,48 @@ class_name GeneratorManager
 signal generator_purchased(generator_id: String, quantity: int)
 signal resource_generated(resource_type: String, amount: int)
 
+## Periodo de generación en segundos simulados (sistema "generators" de TickManager)
+const GENERATION_PERIOD: float = 3.0
+
 ## Usar GameConfig como única fuente de definiciones de generadores
 var generator_definitions: Array[Dictionary] = []
 
 var game_data: GameData
-var generation_timer: Timer
 
 
 func _ready() -> void:
 	_initialize_generator_definitions()
-	_setup_generation_timer()
 
 
 ## Inicializar definiciones de generadores desde GameConfig
 func _initialize_generator_definitions() -> void:
 	generator_definitions.clear()
 
-	for generator_id in GameConfig.GENERATOR_DATA.keys():
+	# Mismo orden que GameConfigTables: la posición en el array es el índice de la tabla
+	for i in GameConfigTables.generator_ids.size():
+		var generator_id = GameConfigTables.generator_ids[i]
 		var config_data = GameConfig.GENERATOR_DATA[generator_id]
 		var definition = {
 			"id": generator_id,
 			"name": config_data.name,
-			"base_price": config_data.base_price,  # Usar base_price consistentemente
+			"base_price": GameConfigTables.generator_base_price[i],
 			"produces": config_data.resource_type,  # Mapear resource_type a produces
-			"production_rate": 1.0,  # Valor por defecto ya que no está en GameConfig
-			"scale_factor": GameConfig.GENERATOR_SCALE_FACTOR,
+			"production_rate": GameConfigTables.generator_production_rate[i],
+			"scale_factor": GameConfigTables.generator_scale_factor[i],
 			"description": config_data.get("description", "Generador de recursos")
 		}
 		generator_definitions.append(definition)
 
 
-## Configurar timer de generación de recursos
-func _setup_generation_timer() -> void:
-	generation_timer = Timer.new()
-	generation_timer.wait_time = 3.0
-	generation_timer.autostart = true
-	generation_timer.timeout.connect(_generate_resources)
-	add_child(generation_timer)
-
-
 ## Asignar datos del juego
 func set_game_data(data: GameData) -> void:
 	game_data = data
 	print("🏭 GeneratorManager: GameData asignado")
 
-	# CRÍTICO: Verificar que el timer esté funcionando
-	_verify_generation_timer()
 
-
-func _verify_generation_timer() -> void:
-	"""Verifica y reinicia el timer de generación si es necesario"""
-	if not generation_timer:
-		print("❌ Timer de generación perdido, recreando...")
-		_setup_generation_timer()
-	elif generation_timer.is_stopped():
-		print("⚠️ Timer de generación detenido, reiniciando...")
-		generation_timer.start()
-	else:
-		print("✅ Timer de generación funcionando correctamente")
+## Paso de simulación (TickManager lo llama cada GENERATION_PERIOD segundos simulados)
+func step_generation(_delta: float) -> void:
+	_generate_resources()
 
 
 ## Procesar generación automática de recursos
@@ -79,22 +63,24 @@ func _generate_resources() -> void:
 	print("🔄 GeneratorManager: Ejecutando ciclo de generación...")
 	var total_generated = 0
 
-	for generator_def in generator_definitions:
-		var owned_count = (
-			game_data.generators[generator_def.id]
-			if game_data.generators.has(generator_def.id)
-			else 0
-		)
-		if owned_count > 0:
-			var resource_type = generator_def.produces
-			var amount = int(generator_def.production_rate * owned_count)
-
-			# T014 - Aplicar Speed Boost de prestigio
-			var prestige_speed_multiplier = (
-				game_data["prestige_speed_multiplier"]
-				if game_data.has("prestige_speed_multiplier")
-				else 1.0
-			)
+	# T014 - Speed Boost de prestigio (constante durante el ciclo)
+	var prestige_speed_multiplier = (
+		game_data["prestige_speed_multiplier"]
+		if game_data.has("prestige_speed_multiplier")
+		else 1.0
+	)
+
+	# Tablas empaquetadas de GameConfig: acceso por índice, sin Dictionary por generador
+	var generator_ids = GameConfigTables.generator_ids
+	var production_rates = GameConfigTables.generator_production_rate
+	var produced_resources = GameConfigTables.generator_resource
+
+	for i in generator_ids.size():
+		var owned_count = game_data.generators.get(generator_ids[i], 0)
+		if owned_count > 0 and produced_resources[i] >= 0:
+			var resource_type = GameConfigTables.resource_ids[produced_resources[i]]
+			var amount = int(production_rates[i] * owned_count)
+
 			if prestige_speed_multiplier > 1.0:
 				amount = int(amount * prestige_speed_multiplier)
 				# Solo imprimir ocasionalmente para evitar spam
@@ -120,10 +106,12 @@ func _generate_resources() -> void:
 
 			# Usar StockManager en lugar de acceso directo
 			StockManager.add_stock("ingredient", resource_type, actual_amount)
-			game_data.statistics["resources_generated"] += actual_amount
+			game_data.stat_triggers.set_value(
+				"resources_generated", game_data.statistics["resources_generated"] + actual_amount
+			)
 			total_generated += actual_amount
 
-			resource_generated.emit(resource_type, actual_amount)
+			_emit_resource_generated(resource_type, actual_amount)
 
 			if actual_amount < amount:
 				print(
@@ -136,7 +124,12 @@ func _generate_resources() -> void:
 				print(
 					(
 						"  ✅ Generado: %dx %s (de %d %s)"
-						% [actual_amount, resource_type, owned_count, generator_def.name]
+						% [
+							actual_amount,
+							resource_type,
+							owned_count,
+							GameConfigTables.generator_names[i]
+						]
 					)
 				)
 
@@ -146,6 +139,20 @@ func _generate_resources() -> void:
 		print("💤 No hay generadores activos para generar recursos")
 
 
+## resource_generated (propia y de GameEvents) sumada por recurso: un ciclo con
+## varios generadores del mismo recurso emite una sola vez por frame
+func _emit_resource_generated(resource_type: String, amount: int) -> void:
+	if not is_instance_valid(TickManager.instance):
+		resource_generated.emit(resource_type, amount)
+		GameEvents.resource_generated.emit(resource_type, amount)
+		return
+
+	for signal_owner in [self, GameEvents]:
+		TickManager.instance.queue_signal(
+			signal_owner, "resource_generated", [resource_type, amount], TickManager.MERGE_SUM, 1
+		)
+
+
 ## Comprar generador por cantidad
 func purchase_generator(generator_id: String, quantity: int) -> bool:
 	print("🛒 GeneratorManager: Intentando comprar %dx %s" % [quantity, generator_id])
@@ -170,6 +177,7 @@ func purchase_generator(generator_id: String, quantity: int) -> bool:
 	var owned = game_data.generators.get(generator_id, 0)
 	game_data.money -= total_cost
 	game_data.generators[generator_id] = owned + quantity
+	game_data.mark_dirty("generators", generator_id)
 
 	print("✅ Compra exitosa: %dx %s (nuevo total: %d)" % [quantity, generator_id, owned + quantity])
 
@@ -184,27 +192,38 @@ func purchase_generator(generator_id: String, quantity: int) -> bool:
 
 ## Obtener costo de compra de generador (precio escalado)
 func get_generator_cost(generator_id: String, quantity: int = 1) -> float:
-	var generator_def = _find_generator_by_id(generator_id)
-	if not generator_def:
+	var index = GameConfigTables.generator_index.get(generator_id, -1)
+	if index < 0:
 		return 0.0
 
+	var base_price = GameConfigTables.generator_base_price[index]
 	var owned = game_data.generators.get(generator_id, 0)
 
 	# T024: Usar nuevo sistema de escalado para generadores
 	if quantity == 1:
-		return GameUtils.get_scaled_cost(generator_def.base_price, owned + 1, "generator")
+		return GameUtils.get_scaled_cost(base_price, owned + 1, "generator")
 	else:
-		return GameUtils.get_bulk_scaled_cost(
-			generator_def.base_price, owned, quantity, "generator"
-		)
+		return GameUtils.get_bulk_scaled_cost(base_price, owned, quantity, "generator")
+
+
+## Máxima cantidad comprable con el dinero actual (botón "Comprar máx", sin bucles)
+func get_max_affordable_generators(generator_id: String) -> int:
+	var index = GameConfigTables.generator_index.get(generator_id, -1)
+	if index < 0:
+		return 0
+
+	var owned = game_data.generators.get(generator_id, 0)
+	return GameUtils.get_max_affordable_quantity(
+		game_data.money, GameConfigTables.generator_base_price[index], owned, "generator"
+	)
 
 
-## Obtener definición de generador por ID
+## Obtener definición de generador por ID (índice de GameConfigTables, sin recorrido lineal)
 func _find_generator_by_id(generator_id: String) -> Dictionary:
-	for generator_def in generator_definitions:
-		if generator_def.id == generator_id:
-			return generator_def
-	return {}
+	var index = GameConfigTables.generator_index.get(generator_id, -1)
+	if index < 0 or index >= generator_definitions.size():
+		return {}
+	return generator_definitions[index]
 
 
 ## Obtener todas las definiciones
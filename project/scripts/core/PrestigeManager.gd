@@ -614,6 +614,9 @@ func _update_prestige_data_in_game_data():
 	game_data.set("prestige_stars", prestige_stars)
 	game_data.set("prestige_count", prestige_count)
 	game_data.set("active_star_bonuses", active_star_bonuses.duplicate())
+	# Como estadísticas, para los objetivos que las observan (desbloqueos, misiones)
+	game_data.stat_triggers.set_value("prestige_stars", prestige_stars)
+	game_data.stat_triggers.set_value("prestige_count", prestige_count)
 
 
 func load_prestige_data_from_game_data():
@@ -8,6 +8,7 @@ signal product_produced(product_type: String, amount: int)
 signal station_unlocked(station_id: String)
 
 var game_data: GameData
+var _station_definitions: Array[Dictionary] = []  # Mismo orden que GameConfigTables.station_ids
 
 
 func _ready() -> void:
@@ -56,6 +57,7 @@ func purchase_station(station_id: String) -> bool:
 
 	game_data.money -= cost
 	game_data.stations[station_id] = owned + 1
+	game_data.mark_dirty("stations", station_id)
 
 	station_purchased.emit(station_id)
 	return true
@@ -94,7 +96,9 @@ func manual_production(station_id: String, quantity: int) -> int:
 			break
 
 	if successful_productions > 0:
-		game_data.statistics["products_crafted"] += successful_productions
+		game_data.stat_triggers.set_value(
+			"products_crafted", game_data.statistics["products_crafted"] + successful_productions
+		)
 		product_produced.emit(station_def.produces, successful_productions)
 
 	return successful_productions
@@ -102,8 +106,8 @@ func manual_production(station_id: String, quantity: int) -> int:
 
 ## Obtener costo de desbloqueo de estación (escalado)
 func get_unlock_cost(station_id: String) -> float:
-	var config_data = GameConfig.STATION_DATA.get(station_id, {})
-	var base_cost = config_data.get("base_price", 0.0)
+	var index = GameConfigTables.station_index.get(station_id, -1)
+	var base_cost = GameConfigTables.station_base_price[index] if index >= 0 else 0.0
 
 	# T024: Para desbloqueo de estaciones, usar escalado simple
 	if not game_data:
@@ -140,19 +144,32 @@ func can_produce(station_id: String, quantity: int = 1) -> bool:
 
 ## Obtener definición de estación por ID desde GameConfig
 func _find_station_by_id(station_id: String) -> Dictionary:
-	var station_data = GameConfig.STATION_DATA.get(station_id, {})
-	if station_data.is_empty():
+	var index = GameConfigTables.station_index.get(station_id, -1)
+	if index < 0:
 		return {}
 
-	# Convertir formato GameConfig a formato esperado
-	return {
-		"id": station_id,
-		"name": station_data.name,
-		"base_cost": station_data.base_price,
-		"recipe": station_data.recipe,
-		"produces": station_data.produces,
-		"description": station_data.description
-	}
+	# Definiciones convertidas una sola vez, no un Dictionary nuevo por consulta
+	if _station_definitions.is_empty():
+		_build_station_definitions()
+	return _station_definitions[index]
+
+
+## Convertir formato GameConfig a formato esperado
+func _build_station_definitions() -> void:
+	_station_definitions.clear()
+	for i in GameConfigTables.station_ids.size():
+		var station_id = GameConfigTables.station_ids[i]
+		var station_data = GameConfig.STATION_DATA[station_id]
+		_station_definitions.append(
+			{
+				"id": station_id,
+				"name": station_data.name,
+				"base_cost": GameConfigTables.station_base_price[i],
+				"recipe": station_data.recipe,
+				"produces": station_data.produces,
+				"description": station_data.description
+			}
+		)
 
 
 ## Obtener todas las definiciones desde GameConfig
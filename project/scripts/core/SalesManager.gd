@@ -68,7 +68,9 @@ func sell_item(item_type: String, item_name: String, quantity: int) -> bool:
 	game_data.add_money(total_earned)  # Trackea total_cash_earned automáticamente
 
 	if item_type == "product":
-		game_data.statistics["products_sold"] += actual_quantity
+		game_data.stat_triggers.set_value(
+			"products_sold", game_data.statistics["products_sold"] + actual_quantity
+		)
 
 	print("   - ✅ Venta completada. Dinero: $%.2f" % game_data.money)
 
@@ -0,0 +1,188 @@
+class_name SaveFormat
+extends RefCounted
+
+## Formato binario de guardado por secciones
+## El diccionario de GameData.to_dict() se reparte en secciones; cada una se serializa una
+## sola vez con var_to_bytes, se comprime y lleva su CRC32, así se puede validar (y leer)
+## una sección sin tocar las demás.
+##
+## Estructura (little-endian, StreamPeerBuffer):
+##   "BSAV" | u16 versión de formato | u16 compresión | u64 timestamp | utf8 versión del juego
+##   u32 secciones | por sección: utf8 nombre, u32 offset, u32 tamaño, u32 tamaño sin comprimir,
+##   u32 crc32 del bloque comprimido | bloques comprimidos (offset relativo al fin de la tabla)
+
+const MAGIC = "BSAV"
+const FORMAT_VERSION: int = 1
+const COMPRESSION: int = FileAccess.COMPRESSION_ZSTD
+
+## Claves de GameData.to_dict() agrupadas por sección; las que no aparecen van a EXTRA_SECTION
+const SECTIONS = {
+	"currencies": ["money", "tokens", "gems", "customer_system_unlocked"],
+	"prestige": ["prestige_stars", "prestige_count", "active_star_bonuses", "total_cash_earned"],
+	"achievements": ["unlocked_achievements", "achievement_progress", "lifetime_stats"],
+	"missions":
+	[
+		"active_missions",
+		"active_weekly_missions",
+		"last_mission_reset",
+		"last_weekly_mission_reset"
+	],
+	"resources": ["resources", "resource_limits"],
+	"products": ["products"],
+	"generators": ["generators"],
+	"stations": ["stations"],
+	"offers": ["offers"],
+	"upgrades": ["upgrades"],
+	"milestones": ["milestones"],
+	"statistics": ["statistics"],
+	"unlocks": ["unlock_data"]
+}
+const EXTRA_SECTION = "extra"
+
+static var _crc_table: PackedInt64Array = _build_crc_table()
+
+
+## Sección a la que pertenece una clave de GameData.to_dict()
+static func section_of(key: String) -> String:
+	for section in SECTIONS:
+		if key in SECTIONS[section]:
+			return section
+	return EXTRA_SECTION
+
+
+## Repartir los datos del juego en {sección: {clave: valor}} (solo secciones con datos)
+static func split_sections(game_data: Dictionary) -> Dictionary:
+	var sections = {}
+	for key in game_data:
+		var section = section_of(key)
+		if not sections.has(section):
+			sections[section] = {}
+		sections[section][key] = game_data[key]
+	return sections
+
+
+## Serializar los datos del juego en un único paso por sección
+## `raw_sections` recibe {sección: var_to_bytes sin comprimir} (base del journal de guardado)
+static func encode(
+	game_data: Dictionary, game_version: String, timestamp: int, raw_sections: Dictionary = {}
+) -> PackedByteArray:
+	var sections = split_sections(game_data)
+	var header = StreamPeerBuffer.new()
+	header.put_data(MAGIC.to_ascii_buffer())
+	header.put_u16(FORMAT_VERSION)
+	header.put_u16(COMPRESSION)
+	header.put_u64(timestamp)
+	header.put_utf8_string(game_version)
+	header.put_u32(sections.size())
+
+	var body = PackedByteArray()
+	for section in sections:
+		var raw = var_to_bytes(sections[section])
+		raw_sections[section] = raw
+		var stored = raw.compress(COMPRESSION)
+		header.put_utf8_string(section)
+		header.put_u32(body.size())
+		header.put_u32(stored.size())
+		header.put_u32(raw.size())
+		header.put_u32(crc32(stored))
+		body.append_array(stored)
+
+	var bytes = header.data_array
+	bytes.append_array(body)
+	return bytes
+
+
+## ¿Empieza por la firma del formato binario? (si no, es un guardado JSON antiguo)
+static func is_save_format(bytes: PackedByteArray) -> bool:
+	return (
+		bytes.size() >= MAGIC.length() and bytes.slice(0, MAGIC.length()) == MAGIC.to_ascii_buffer()
+	)
+
+
+## Leer cabecera y tabla de secciones sin descomprimir nada ({} si no es válida)
+static func read_header(bytes: PackedByteArray) -> Dictionary:
+	if not is_save_format(bytes):
+		return {}
+
+	var stream = StreamPeerBuffer.new()
+	stream.data_array = bytes
+	stream.seek(MAGIC.length())
+	var header = {
+		"format_version": stream.get_u16(),
+		"compression": stream.get_u16(),
+		"timestamp": stream.get_u64(),
+		"version": stream.get_utf8_string(),
+		"sections": {}
+	}
+	if header.format_version > FORMAT_VERSION:
+		print("⚠️ Guardado con formato %d más nuevo que el soportado" % header.format_version)
+		return {}
+
+	var section_count = stream.get_u32()
+	for i in section_count:
+		var section = stream.get_utf8_string()
+		header.sections[section] = {
+			"offset": stream.get_u32(),
+			"size": stream.get_u32(),
+			"raw_size": stream.get_u32(),
+			"crc": stream.get_u32()
+		}
+	header["data_start"] = stream.get_position()
+
+	for entry in header.sections.values():
+		if header.data_start + entry.offset + entry.size > bytes.size():
+			return {}  # Archivo truncado
+	return header
+
+
+## Decodificar una sección validando su CRC32 (null si falta o está corrupta)
+static func decode_section(bytes: PackedByteArray, header: Dictionary, section: String) -> Variant:
+	if not header.get("sections", {}).has(section):
+		return null
+
+	var entry = header.sections[section]
+	var start = header.data_start + entry.offset
+	var stored = bytes.slice(start, start + entry.size)
+	if stored.size() != entry.size or crc32(stored) != entry.crc:
+		print("⚠️ Sección '%s' corrupta (CRC32)" % section)
+		return null
+
+	var raw = stored.decompress(entry.raw_size, header.compression)
+	if raw.size() != entry.raw_size:
+		return null
+	return bytes_to_var(raw)
+
+
+## Decodificar el guardado completo en {version, timestamp, game_data} ({} si hay corrupción)
+static func decode(bytes: PackedByteArray) -> Dictionary:
+	var header = read_header(bytes)
+	if header.is_empty():
+		return {}
+
+	var game_data = {}
+	for section in header.sections:
+		var values = decode_section(bytes, header, section)
+		if typeof(values) != TYPE_DICTIONARY:
+			return {}
+		game_data.merge(values, true)
+
+	return {"version": header.version, "timestamp": header.timestamp, "game_data": game_data}
+
+
+## CRC32 (IEEE 802.3, el de zip/png)
+static func crc32(bytes: PackedByteArray) -> int:
+	var crc = 0xFFFFFFFF
+	for byte in bytes:
+		crc = _crc_table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+	return crc ^ 0xFFFFFFFF
+
+
+static func _build_crc_table() -> PackedInt64Array:
+	var table = PackedInt64Array()
+	table.resize(256)
+	for i in 256:
+		var crc = i
+		for bit in 8:
+			crc = (crc >> 1) ^ 0xEDB88320 if crc & 1 else crc >> 1
+		table[i] = crc
+	return table
@@ -0,0 +1,143 @@
+class_name SaveJournal
+extends RefCounted
+
+## Journal de guardado incremental (append-only)
+## Tras cada instantánea completa (SaveFormat) el autoguardado solo añade las secciones
+## cuyo var_to_bytes cambió desde la última escritura, así el I/O es proporcional a lo que
+## cambió. Al cargar se reproduce sobre la instantánea de la que partió.
+##
+## Estructura (little-endian):
+##   "BJNL" | u32 id de la instantánea base
+##   registros: u32 tamaño comprimido | u32 tamaño sin comprimir | u32 crc32 | bloque
+##   bloque sin comprimir: u32 secciones | por sección: utf8 nombre, u32 tamaño, var_to_bytes
+
+const MAGIC = "BJNL"
+const RECORD_HEADER_SIZE = 12
+
+var path: String
+var entry_count: int = 0  # Registros desde la última instantánea
+var size: int = 0  # Bytes del archivo
+
+var _base_id: int = -1  # -1 = ninguna instantánea escrita en esta sesión
+var _last_sections: Dictionary = {}  # sección → var_to_bytes ya persistido
+
+
+func _init(journal_path: String) -> void:
+	path = journal_path
+
+
+## Id de una instantánea (el journal solo se aplica sobre la instantánea de la que partió)
+static func snapshot_id(snapshot_bytes: PackedByteArray) -> int:
+	return hash(snapshot_bytes) & 0xFFFFFFFF
+
+
+## ¿Hay una instantánea de esta sesión sobre la que añadir registros?
+func is_active() -> bool:
+	return _base_id >= 0
+
+
+## Empezar un journal vacío sobre la instantánea recién escrita (compactación)
+func reset(base_id: int, raw_sections: Dictionary) -> bool:
+	var file = FileAccess.open(path, FileAccess.WRITE)
+	if not file:
+		_base_id = -1
+		return false
+
+	file.store_buffer(MAGIC.to_ascii_buffer())
+	file.store_32(base_id)
+	file.close()
+
+	_base_id = base_id
+	_last_sections = raw_sections.duplicate()
+	entry_count = 0
+	size = MAGIC.length() + 4
+	return true
+
+
+## Añadir las secciones modificadas. Devuelve los bytes escritos (0 si nada cambió, -1 si falla)
+func append(game_data: Dictionary) -> int:
+	if not is_active():
+		return -1
+
+	var sections = SaveFormat.split_sections(game_data)
+	var changed = {}
+	for section in sections:
+		var raw = var_to_bytes(sections[section])
+		if not _last_sections.has(section) or _last_sections[section] != raw:
+			changed[section] = raw
+	if changed.is_empty():
+		return 0
+
+	var record = StreamPeerBuffer.new()
+	record.put_u32(changed.size())
+	for section in changed:
+		record.put_utf8_string(section)
+		record.put_u32(changed[section].size())
+		record.put_data(changed[section])
+	var raw_record = record.data_array
+	var stored = raw_record.compress(SaveFormat.COMPRESSION)
+
+	var file = FileAccess.open(path, FileAccess.READ_WRITE)
+	if not file:
+		return -1
+	file.seek_end()
+	file.store_32(stored.size())
+	file.store_32(raw_record.size())
+	file.store_32(SaveFormat.crc32(stored))
+	file.store_buffer(stored)
+	# close() vuelca el buffer; un registro a medio escribir se descarta por tamaño/CRC
+	file.close()
+
+	_last_sections.merge(changed, true)
+	entry_count += 1
+	size += RECORD_HEADER_SIZE + stored.size()
+	return RECORD_HEADER_SIZE + stored.size()
+
+
+## Reproducir el journal sobre `game_data` (datos de la instantánea `base_id`)
+## Se detiene en el primer registro incompleto o corrupto. Devuelve los registros aplicados.
+static func replay(journal_path: String, base_id: int, game_data: Dictionary) -> int:
+	var bytes = FileAccess.get_file_as_bytes(journal_path)
+	var header_size = MAGIC.length() + 4
+	if bytes.size() < header_size or bytes.slice(0, MAGIC.length()) != MAGIC.to_ascii_buffer():
+		return 0
+
+	var stream = StreamPeerBuffer.new()
+	stream.data_array = bytes
+	stream.seek(MAGIC.length())
+	if stream.get_u32() != base_id:
+		print("📓 Journal de otra instantánea, se ignora")
+		return 0
+
+	var applied = 0
+	while stream.get_available_bytes() >= RECORD_HEADER_SIZE:
+		var stored_size = stream.get_u32()
+		var raw_size = stream.get_u32()
+		var crc = stream.get_u32()
+		if stream.get_available_bytes() < stored_size:
+			break  # Registro a medio escribir (cierre inesperado)
+
+		var start = stream.get_position()
+		var stored = bytes.slice(start, start + stored_size)
+		stream.seek(start + stored_size)
+		if SaveFormat.crc32(stored) != crc:
+			break
+		var raw = stored.decompress(raw_size, SaveFormat.COMPRESSION)
+		if raw.size() != raw_size:
+			break
+
+		_apply_record(raw, game_data)
+		applied += 1
+
+	return applied
+
+
+static func _apply_record(raw: PackedByteArray, game_data: Dictionary) -> void:
+	var record = StreamPeerBuffer.new()
+	record.data_array = raw
+	var section_count = record.get_u32()
+	for i in section_count:
+		record.get_utf8_string()  # Nombre de sección: las claves ya van dentro de los valores
+		var values = bytes_to_var(record.get_data(record.get_u32())[1])
+		if typeof(values) == TYPE_DICTIONARY:
+			game_data.merge(values, true)
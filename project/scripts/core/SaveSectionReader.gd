@@ -0,0 +1,82 @@
+class_name SaveSectionReader
+extends RefCounted
+
+## Lectura diferida por secciones de un guardado binario (SaveFormat)
+## Al abrir se decodifican solo las secciones que necesita el primer frame (read_eager); el
+## resto se valida (CRC32), descomprime y decodifica la primera vez que se pide, con los
+## autoguardados del journal aplicados encima. Una sección diferida corrupta se lee de los
+## backups; si tampoco está allí se devuelve vacía (GameData conserva sus valores por defecto).
+
+var version: String
+var timestamp: int
+var game_data: Dictionary = {}  # Secciones decodificadas por read_eager
+
+var _bytes: PackedByteArray
+var _header: Dictionary
+var _overlay: Dictionary = {}  # {sección: {clave: valor}} reproducido del journal
+var _fallback_paths: Array = []
+
+
+func _init(
+	bytes: PackedByteArray, header: Dictionary, journal_data: Dictionary, fallback_paths: Array = []
+) -> void:
+	_bytes = bytes
+	_header = header
+	_overlay = SaveFormat.split_sections(journal_data)
+	_fallback_paths = fallback_paths
+	version = header.version
+	timestamp = header.timestamp
+
+
+## Decodificar todas las secciones salvo `lazy_sections` ({} si alguna está corrupta)
+func read_eager(lazy_sections: Array) -> Dictionary:
+	var sections = _header.sections.keys()
+	for section in _overlay:
+		if not section in sections:
+			sections.append(section)
+
+	game_data = {}
+	for section in sections:
+		if section in lazy_sections:
+			continue
+		var values = _decode(_bytes, _header, section)
+		if values == null:
+			game_data = {}
+			return game_data
+		game_data.merge(values, true)
+		game_data.merge(_overlay.get(section, {}), true)
+	return game_data
+
+
+## Leer una sección ({clave: valor}); vacía si no está en el guardado ni en los backups
+func read_section(section: String) -> Dictionary:
+	var values = _decode(_bytes, _header, section)
+	if values == null:
+		values = _read_fallback(section)
+	values.merge(_overlay.get(section, {}), true)
+	return values
+
+
+## Sección decodificada, {} si el guardado no la tiene y null si está corrupta
+static func _decode(bytes: PackedByteArray, header: Dictionary, section: String) -> Variant:
+	if not header.sections.has(section):
+		return {}
+	var values = SaveFormat.decode_section(bytes, header, section)
+	return values if typeof(values) == TYPE_DICTIONARY else null
+
+
+func _read_fallback(section: String) -> Dictionary:
+	for path in _fallback_paths:
+		if not FileAccess.file_exists(path):
+			continue
+		var bytes = FileAccess.get_file_as_bytes(path)
+		var header = SaveFormat.read_header(bytes)
+		if header.is_empty() or not header.sections.has(section):
+			continue
+		var values = _decode(bytes, header, section)
+		if values != null:
+			print("🔄 Sección '%s' recuperada de %s" % [section, path])
+			return values
+
+	print("⚠️ Sección '%s' irrecuperable, se usan valores por defecto" % section)
+	return {}
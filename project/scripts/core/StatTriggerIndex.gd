@@ -0,0 +1,125 @@
+class_name StatTriggerIndex
+extends RefCounted
+## Índice reactivo de objetivos por estadística
+## Cada clave de estadística guarda los umbrales de los objetivos que la observan
+## (logros, misiones, contratos, desbloqueos) ordenados. Al cambiar una estadística solo
+## se despiertan sus observadores y los umbrales cruzados se ubican con búsqueda binaria:
+## el coste crece con los cambios y los objetivos cumplidos, no con el total de objetivos.
+## Los valores viven en un Dictionary ajeno (GameData.statistics) que el índice escribe.
+
+signal value_changed(stat_key: String, value)
+
+## Valores de las estadísticas (referencia, no copia)
+var values: Dictionary
+
+## Umbrales por clave guardados negados: orden ascendente de la clave = descendente del
+## umbral, así los cruzados quedan al final y se quitan con resize()
+var _keys: Dictionary = {}  # stat → Array[float] (-umbral, ascendente)
+var _handles: Dictionary = {}  # stat → Array[int] paralelo a _keys
+var _entries: Dictionary = {}  # handle → {stat, threshold, callback}
+var _next_handle: int = 1
+
+
+func _init(stat_values: Dictionary = {}) -> void:
+	values = stat_values
+
+
+## Observar `stat_key` hasta que alcance `threshold`: `callback(stat_key, value)` se llama
+## una sola vez. Si el valor actual ya lo alcanza, se llama ahora y devuelve 0.
+func watch(stat_key: String, threshold: float, callback: Callable) -> int:
+	var value = get_value(stat_key)
+	if value >= threshold:
+		callback.call(stat_key, value)
+		return 0
+
+	if not _keys.has(stat_key):
+		_keys[stat_key] = []
+		_handles[stat_key] = []
+	var handle = _next_handle
+	_next_handle += 1
+	# Mismo umbral: el más antiguo queda más cerca del final y se dispara primero
+	var position = _keys[stat_key].bsearch(-threshold, true)
+	_keys[stat_key].insert(position, -threshold)
+	_handles[stat_key].insert(position, handle)
+	_entries[handle] = {"stat": stat_key, "threshold": threshold, "callback": callback}
+	return handle
+
+
+## Dejar de observar (handle devuelto por watch; 0 o ya disparado no hace nada)
+func unwatch(handle: int) -> void:
+	if not _entries.has(handle):
+		return
+	var entry = _entries[handle]
+	var keys: Array = _keys[entry.stat]
+	var handles: Array = _handles[entry.stat]
+	var position = keys.bsearch(-entry.threshold, true)
+	while handles[position] != handle:
+		position += 1
+	keys.remove_at(position)
+	handles.remove_at(position)
+	_entries.erase(handle)
+
+
+## Escribir `stat_key` y disparar los objetivos cuyo umbral alcanzó
+func set_value(stat_key: String, value) -> void:
+	values[stat_key] = value
+	_fire_crossed(stat_key, float(value))
+	value_changed.emit(stat_key, value)
+
+
+## Valor actual de `stat_key` (0 si no existe o no es numérico)
+func get_value(stat_key: String) -> float:
+	var value = values.get(stat_key, 0.0)
+	if typeof(value) == TYPE_INT or typeof(value) == TYPE_FLOAT:
+		return float(value)
+	return 0.0
+
+
+## Cambiar el Dictionary de valores (p. ej. tras cargar partida) y disparar lo ya cruzado
+func rebind(stat_values: Dictionary) -> void:
+	values = stat_values
+	for stat_key in _keys.keys():
+		_fire_crossed(stat_key, get_value(stat_key))
+
+
+## Umbral pendiente más cercano de `stat_key` (INF si nadie la observa)
+func get_next_threshold(stat_key: String) -> float:
+	var keys: Array = _keys.get(stat_key, [])
+	return -keys.back() if not keys.is_empty() else INF
+
+
+func get_watch_count(stat_key: String = "") -> int:
+	if stat_key.is_empty():
+		return _entries.size()
+	return _keys.get(stat_key, []).size()
+
+
+func clear() -> void:
+	_keys.clear()
+	_handles.clear()
+	_entries.clear()
+
+
+## Sacar del índice los umbrales <= value y llamar a sus callbacks en orden ascendente
+func _fire_crossed(stat_key: String, value: float) -> int:
+	if not _keys.has(stat_key):
+		return 0
+
+	var keys: Array = _keys[stat_key]
+	var handles: Array = _handles[stat_key]
+	var first_crossed = keys.bsearch(-value, true)
+	if first_crossed >= keys.size():
+		return 0
+
+	var fired = handles.slice(first_crossed)
+	keys.resize(first_crossed)
+	handles.resize(first_crossed)
+	fired.reverse()
+
+	# Las entradas ya salieron del índice: los callbacks pueden volver a observar
+	for handle in fired:
+		var callback: Callable = _entries[handle].callback
+		_entries.erase(handle)
+		if callback.is_valid():
+			callback.call(stat_key, value)
+	return fired.size()
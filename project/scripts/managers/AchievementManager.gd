@@ -22,6 +22,22 @@ signal achievement_unlocked(achievement_id: String, achievement_data: Dictionary
 signal achievement_progress_updated(achievement_id: String, current: float, required: float)
 signal achievement_notification(achievement_data: Dictionary)
 
+# 🎯 ACHIEVEMENTS POR ESTADÍSTICA (lifetime_stats → logros que se cumplen con ella)
+const ACHIEVEMENT_STATS = {
+	"beers_produced": [
+		"first_batch", "hundred_beers", "thousand_beers", "mass_production",
+		"industrial", "mega_brewery", "beer_empire"
+	],
+	"beers_sold": ["first_sale"],
+	"total_revenue": [
+		"small_business", "successful_bar", "millionaire", "multi_millionaire", "billionaire"
+	],
+	"prestige_count": ["first_prestige", "veteran", "master", "legend"],
+	"stars_earned": ["star_gazer"],
+	"automation_time": ["auto_pilot", "automation_master", "ai_overlord"],
+	"achievements_unlocked": ["achievement_hunter", "completionist", "achievement_master"]
+}
+
 
 # 🏅 ACHIEVEMENT CLASS
 class Achievement:
@@ -72,6 +88,10 @@ var lifetime_stats: Dictionary = {}
 var total_gems_earned: int = 0
 var total_tokens_earned: int = 0
 
+# Umbrales pendientes sobre lifetime_stats: cada cambio solo despierta los logros cruzados
+var _triggers: StatTriggerIndex
+var _achievement_stats: Dictionary = {}  # achievement_id → clave de lifetime_stats
+
 # 🔗 REFERENCIAS A MANAGERS
 @onready var game_controller = get_node_or_null("/root/GameController")
 @onready var customer_manager = get_node_or_null("/root/CustomerManager")
@@ -83,6 +103,7 @@ var total_tokens_earned: int = 0
 func _ready():
 	_initialize_achievements()
 	_initialize_stats()
+	_watch_achievements()
 	_connect_signals()
 	_start_progress_tracking()
 
@@ -107,10 +128,26 @@ func _initialize_stats():
 		"stars_earned": 0,
 		"automation_time": 0.0,
 		"session_count": 0,
-		"total_playtime": 0.0
+		"total_playtime": 0.0,
+		"achievements_unlocked": 0
 	}
 
 
+func _watch_achievements():
+	# Reconstruir el índice con los logros aún bloqueados
+	_triggers = StatTriggerIndex.new(lifetime_stats)
+	_achievement_stats.clear()
+	for stat_key in ACHIEVEMENT_STATS:
+		for achievement_id in ACHIEVEMENT_STATS[stat_key]:
+			_achievement_stats[achievement_id] = stat_key
+			if achievements.has(achievement_id) and not achievements[achievement_id].is_unlocked:
+				_triggers.watch(
+					stat_key,
+					achievements[achievement_id].required_value,
+					_on_achievement_stat_reached.bind(achievement_id)
+				)
+
+
 # 🍺 PRODUCTION ACHIEVEMENTS (7 achievements)
 func _create_production_achievements():
 	achievements["first_batch"] = Achievement.new(
@@ -572,42 +609,31 @@ func _start_progress_tracking():
 
 # 📈 EVENT HANDLERS
 func _on_beer_produced(amount: int):
-	lifetime_stats["beers_produced"] += amount
-	_check_progress("first_batch", lifetime_stats["beers_produced"])
-	_check_progress("hundred_beers", lifetime_stats["beers_produced"])
-	_check_progress("thousand_beers", lifetime_stats["beers_produced"])
-	_check_progress("mass_production", lifetime_stats["beers_produced"])
-	_check_progress("industrial", lifetime_stats["beers_produced"])
-	_check_progress("mega_brewery", lifetime_stats["beers_produced"])
-	_check_progress("beer_empire", lifetime_stats["beers_produced"])
+	_add_lifetime_stat("beers_produced", amount)
 
 
 func _on_beer_sold(amount: int):
-	lifetime_stats["beers_sold"] += amount
-	_check_progress("first_sale", lifetime_stats["beers_sold"])
+	_add_lifetime_stat("beers_sold", amount)
 
 
 func _on_revenue_earned(amount: float):
-	lifetime_stats["total_revenue"] += amount
-	_check_progress("first_sale", 1 if lifetime_stats["total_revenue"] > 0 else 0)
-	_check_progress("small_business", lifetime_stats["total_revenue"])
-	_check_progress("successful_bar", lifetime_stats["total_revenue"])
-	_check_progress("millionaire", lifetime_stats["total_revenue"])
-	_check_progress("multi_millionaire", lifetime_stats["total_revenue"])
-	_check_progress("billionaire", lifetime_stats["total_revenue"])
+	_add_lifetime_stat("total_revenue", amount)
 
 
 func _on_prestige_performed():
-	lifetime_stats["prestige_count"] += 1
-	_check_progress("first_prestige", lifetime_stats["prestige_count"])
-	_check_progress("veteran", lifetime_stats["prestige_count"])
-	_check_progress("master", lifetime_stats["prestige_count"])
-	_check_progress("legend", lifetime_stats["prestige_count"])
+	_add_lifetime_stat("prestige_count", 1)
 
 
 func _on_stars_earned(amount: int):
-	lifetime_stats["stars_earned"] += amount
-	_check_progress("star_gazer", lifetime_stats["stars_earned"])
+	_add_lifetime_stat("stars_earned", amount)
+
+
+func _add_lifetime_stat(stat_key: String, amount: float):
+	_triggers.set_value(stat_key, lifetime_stats.get(stat_key, 0) + amount)
+
+
+func _on_achievement_stat_reached(_stat_key: String, value: float, achievement_id: String):
+	_check_progress(achievement_id, value)
 
 
 func _on_automation_enabled():
@@ -620,16 +646,7 @@ func _update_progress_tracking():
 	# Automation time tracking
 	if automation_manager and automation_manager.has_method("is_active"):
 		if automation_manager.is_active:
-			lifetime_stats["automation_time"] += 5.0  # 5 segundos por update
-			_check_progress("auto_pilot", lifetime_stats["automation_time"])
-			_check_progress("automation_master", lifetime_stats["automation_time"])
-			_check_progress("ai_overlord", lifetime_stats["automation_time"])
-
-	# Collection achievements
-	var unlocked_count = unlocked_achievements.size()
-	_check_progress("achievement_hunter", unlocked_count)
-	_check_progress("completionist", unlocked_count)
-	_check_progress("achievement_master", unlocked_count)
+			_add_lifetime_stat("automation_time", 5.0)  # 5 segundos por update
 
 	# Time-based achievements
 	var current_hour = Time.get_datetime_dict_from_system()["hour"]
@@ -674,6 +691,7 @@ func unlock_achievement(achievement_id: String):
 
 	achievement.is_unlocked = true
 	unlocked_achievements.append(achievement_id)
+	_triggers.set_value("achievements_unlocked", unlocked_achievements.size())  # Collection
 
 	# Give rewards
 	_give_achievement_rewards(achievement)
@@ -711,7 +729,7 @@ func _achievement_to_dict(achievement: Achievement) -> Dictionary:
 		"title": achievement.title,
 		"description": achievement.description,
 		"icon": achievement.icon,
-		"progress": achievement.current_progress,
+		"progress": _get_current_progress(achievement),
 		"required": achievement.required_value,
 		"unlocked": achievement.is_unlocked,
 		"hidden": achievement.is_hidden,
@@ -721,6 +739,13 @@ func _achievement_to_dict(achievement: Achievement) -> Dictionary:
 	}
 
 
+func _get_current_progress(achievement: Achievement) -> float:
+	# Los logros por estadística no se actualizan en cada evento: leer su valor actual
+	if achievement.is_unlocked or not _achievement_stats.has(achievement.id):
+		return achievement.current_progress
+	return minf(_triggers.get_value(_achievement_stats[achievement.id]), achievement.required_value)
+
+
 func get_achievements_by_category(category: AchievementCategory) -> Array:
 	var filtered = []
 	for achievement_id in achievements:
@@ -799,6 +824,9 @@ func load_save_data(data: Dictionary):
 	if data.has("tokens_earned"):
 		total_tokens_earned = data.tokens_earned
 
+	lifetime_stats["achievements_unlocked"] = unlocked_achievements.size()
+	_watch_achievements()
+
 
 # 🔍 DEBUG FUNCTIONS
 func debug_unlock_achievement(achievement_id: String):
@@ -812,6 +840,8 @@ func debug_reset_achievements():
 		achievements[achievement_id].current_progress = 0.0
 	unlocked_achievements.clear()
 	achievement_progress.clear()
+	lifetime_stats["achievements_unlocked"] = 0
+	_watch_achievements()
 
 
 func debug_print_stats():
@@ -20,9 +20,7 @@ var auto_sell_enabled: Dictionary = {}  # Por producto
 var smart_production_priority: bool = true  # Producir lo más rentable primero
 var auto_sell_threshold: float = 0.8  # Vender cuando storage > 80%
 
-# Cache para optimización
-var last_production_check: float = 0.0
-var last_sell_check: float = 0.0
+# Periodos de los sistemas "auto_production" y "auto_sell" de TickManager
 var production_check_interval: float = 2.0  # Verificar cada 2 segundos
 var sell_check_interval: float = 1.0  # Verificar cada segundo
 
@@ -62,19 +60,14 @@ func _init_default_settings():
 	print("🤖 Configuraciones de automatización inicializadas")
 
 
-func _process(delta):
-	"""Proceso principal de automatización"""
-	var current_time = Time.get_ticks_msec() / 1000.0
+func step_auto_production(_delta: float) -> void:
+	"""Paso de simulación: verificar auto-producción cada production_check_interval"""
+	_process_auto_production()
 
-	# Verificar auto-producción
-	if current_time - last_production_check > production_check_interval:
-		_process_auto_production()
-		last_production_check = current_time
 
-	# Verificar auto-venta
-	if current_time - last_sell_check > sell_check_interval:
-		_process_auto_sell()
-		last_sell_check = current_time
+func step_auto_sell(_delta: float) -> void:
+	"""Paso de simulación: verificar auto-venta cada sell_check_interval"""
+	_process_auto_sell()
 
 
 # =============================================================================
@@ -398,6 +391,7 @@ func set_smart_pricing_enabled(enabled: bool):
 	# Guardar en game_data como upgrade
 	if game_data:
 		game_data.upgrades["smart_pricing"] = enabled
+		game_data.mark_dirty("upgrades", "smart_pricing")
 
 	automation_config_changed.emit("smart_pricing", enabled)
 	print("🧠 Smart Pricing %s" % ["activado" if enabled else "desactivado"])
@@ -12,6 +12,14 @@ signal contract_completed(contract_id: String, rewards: Dictionary)
 signal contract_expired(contract_id: String)
 signal contract_failed(contract_id: String)
 
+const CONTRACT_CHECK_INTERVAL = 60.0  # Periodo del sistema "contracts" de TickManager
+## Contratos (por nombre, como en _calculate_contract_progress) → estadística que los cumple
+const STAT_CONTRACTS = {
+	"Fiebre de Producción": "products_produced",
+	"Velocidad Extrema": "products_produced",
+	"Objetivo de Ventas": "total_money_earned"
+}
+
 # Referencias
 var game_data: GameData
 var statistics_manager: StatisticsManager
@@ -23,7 +31,6 @@ var completed_contracts: Array = []
 var contract_templates: Dictionary = {}
 
 # Sistema de generación
-var contract_generation_timer: Timer
 var next_contract_time: int = 0
 
 # Constantes
@@ -32,6 +39,9 @@ const MAX_CONTRACTS_AVAILABLE = 4
 const CONTRACT_GENERATION_INTERVAL = 3600  # 1 hora
 const CONTRACT_DURATION_BASE = 1800  # 30 minutos base
 
+# Contratos con objetivo en game_data.statistics: se completan por trigger, no por sondeo
+var _contract_triggers: Dictionary = {}  # contract_id → handle en game_data.stat_triggers
+
 
 func _ready():
 	print("📋 ContractManager inicializado (T036)")
@@ -173,12 +183,6 @@ func _initialize_contract_templates():
 
 func _setup_contract_generation():
 	"""Configura el sistema de generación de contratos"""
-	contract_generation_timer = Timer.new()
-	contract_generation_timer.wait_time = 60.0  # Revisar cada minuto
-	contract_generation_timer.timeout.connect(_check_contract_generation)
-	contract_generation_timer.autostart = true
-	add_child(contract_generation_timer)
-
 	# Establecer próximo tiempo de generación
 	next_contract_time = Time.get_unix_time_from_system() + CONTRACT_GENERATION_INTERVAL
 
@@ -189,6 +193,11 @@ func _generate_initial_contracts():
 		_generate_new_contract()
 
 
+func step_contracts(_delta: float):
+	"""Paso de simulación: revisar generación de contratos cada CONTRACT_CHECK_INTERVAL"""
+	_check_contract_generation()
+
+
 func _check_contract_generation():
 	"""Verifica si es tiempo de generar nuevos contratos"""
 	var current_time = Time.get_unix_time_from_system()
@@ -312,6 +321,12 @@ func accept_contract(contract_id: String) -> bool:
 	)
 	active_contracts[contract_id]["progress"] = 0.0
 	active_contracts[contract_id]["initial_stats"] = _capture_current_stats(contract["type"])
+	if game_data and STAT_CONTRACTS.has(contract["name"]):
+		var stat_key = STAT_CONTRACTS[contract["name"]]
+		active_contracts[contract_id]["initial_stats"]["stat_start"] = (
+			game_data.stat_triggers.get_value(stat_key)
+		)
+		_watch_contract(contract_id)
 
 	contract_accepted.emit(contract_id)
 	print("✅ Contrato aceptado: %s" % contract["name"])
@@ -327,16 +342,10 @@ func _capture_current_stats(contract_type: String) -> Dictionary:
 
 	match contract_type:
 		"production":
-			stats["beers_produced"] = statistics_manager.production_stats.get(
-				"total_beers_brewed", 0
-			)
 			stats["quality_excellent"] = (
 				statistics_manager.production_stats.get("quality_metrics", {}).get("excellent", 0)
 			)
 		"economic":
-			stats["money_earned"] = statistics_manager.economic_stats.get(
-				"money_earned_lifetime", 0.0
-			)
 			stats["premium_customers"] = 0  # Esto requeriría tracking específico
 		"efficiency":
 			stats["waste_generated"] = statistics_manager.production_stats.get("waste_generated", 0)
@@ -350,6 +359,34 @@ func _capture_current_stats(contract_type: String) -> Dictionary:
 	return stats
 
 
+func _watch_contract(contract_id: String):
+	"""Observar la estadística del contrato hasta valor al aceptar + objetivo"""
+	var contract = active_contracts[contract_id]
+	var stat_key = STAT_CONTRACTS[contract["name"]]
+	var threshold = contract["initial_stats"].get("stat_start", 0.0) + contract["target"]
+	var handle = game_data.stat_triggers.watch(
+		stat_key, threshold, _on_contract_goal_reached.bind(contract_id)
+	)
+	if handle != 0:
+		_contract_triggers[contract_id] = handle
+
+
+func _unwatch_contract(contract_id: String):
+	if _contract_triggers.has(contract_id):
+		game_data.stat_triggers.unwatch(_contract_triggers[contract_id])
+		_contract_triggers.erase(contract_id)
+
+
+func _on_contract_goal_reached(_stat_key: String, _value: float, contract_id: String):
+	"""La estadística alcanzó el objetivo: completar sin esperar al siguiente paso"""
+	_contract_triggers.erase(contract_id)
+	if not active_contracts.has(contract_id):
+		return
+	active_contracts[contract_id]["progress"] = 1.0
+	contract_progress_updated.emit(contract_id, 1.0)
+	_complete_contract(contract_id)
+
+
 func _update_active_contracts_progress():
 	"""Actualiza el progreso de todos los contratos activos"""
 	for contract_id in active_contracts.keys():
@@ -379,11 +416,16 @@ func _update_contract_progress(contract_id: String):
 
 func _calculate_contract_progress(contract: Dictionary) -> float:
 	"""Calcula el progreso actual de un contrato"""
+	var initial_stats = contract.get("initial_stats", {})
+	if game_data and STAT_CONTRACTS.has(contract["name"]):
+		var current = game_data.stat_triggers.get_value(STAT_CONTRACTS[contract["name"]])
+		var done = current - initial_stats.get("stat_start", current)
+		return min(done / float(contract["target"]), 1.0)
+
 	if not statistics_manager:
 		return 0.0
 
 	var progress = 0.0
-	var initial_stats = contract.get("initial_stats", {})
 
 	match contract["type"]:
 		"production":
@@ -397,21 +439,9 @@ func _calculate_contract_progress(contract: Dictionary) -> float:
 				var initial_excellent = initial_stats.get("quality_excellent", 0)
 				var produced_excellent = current_excellent - initial_excellent
 				progress = float(produced_excellent) / float(contract["target"])
-			else:  # Production rush o speed brewing
-				var current_beers = statistics_manager.production_stats.get("total_beers_brewed", 0)
-				var initial_beers = initial_stats.get("beers_produced", 0)
-				var produced_beers = current_beers - initial_beers
-				progress = float(produced_beers) / float(contract["target"])
 
 		"economic":
-			if contract["name"] == "Objetivo de Ventas":
-				var current_money = statistics_manager.economic_stats.get(
-					"money_earned_lifetime", 0.0
-				)
-				var initial_money = initial_stats.get("money_earned", 0.0)
-				var earned_money = current_money - initial_money
-				progress = earned_money / float(contract["target"])
-			elif contract["name"] == "Clientela VIP":
+			if contract["name"] == "Clientela VIP":
 				# Esto requeriría tracking específico de clientes premium
 				progress = 0.5  # Simulado por ahora
 
@@ -440,8 +470,13 @@ func _complete_contract(contract_id: String):
 	_grant_contract_rewards(contract["rewards"])
 
 	# Mover a completados
+	_unwatch_contract(contract_id)
 	active_contracts.erase(contract_id)
 	completed_contracts.append(contract_id)
+	if game_data:
+		game_data.stat_triggers.set_value(
+			"contracts_completed", game_data.statistics.get("contracts_completed", 0) + 1
+		)
 
 	contract_completed.emit(contract_id, contract["rewards"])
 	print("🎉 ¡Contrato completado! %s" % contract["name"])
@@ -452,6 +487,7 @@ func _complete_contract(contract_id: String):
 func _expire_contract(contract_id: String):
 	"""Expira un contrato por tiempo límite"""
 	var contract = active_contracts[contract_id]
+	_unwatch_contract(contract_id)
 	active_contracts.erase(contract_id)
 
 	contract_expired.emit(contract_id)
@@ -541,6 +577,17 @@ func load_contract_data():
 	if data.has("next_contract_time"):
 		next_contract_time = data["next_contract_time"]
 
+	# Volver a observar los contratos activos con objetivo por estadística
+	for contract_id in _contract_triggers.keys():
+		_unwatch_contract(contract_id)
+	for contract_id in active_contracts.keys():
+		var initial_stats = active_contracts[contract_id].get("initial_stats", {})
+		if (
+			initial_stats.has("stat_start")
+			and STAT_CONTRACTS.has(active_contracts[contract_id]["name"])
+		):
+			_watch_contract(contract_id)
+
 	print("📋 Datos de contratos cargados")
 
 
@@ -596,6 +643,9 @@ func force_generate_contract():
 
 func set_game_data(data: GameData):
 	"""Conectar con GameData"""
+	if game_data:
+		for contract_id in _contract_triggers.keys():
+			_unwatch_contract(contract_id)
 	game_data = data
 	load_contract_data()
 
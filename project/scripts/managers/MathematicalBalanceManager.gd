@@ -40,6 +40,24 @@ const PRESTIGE_MULTIPLIER_BASE: float = 0.05  # 5% per star
 const SOFT_CAP_THRESHOLD: float = 0.8  # Reducir eficiencia al 80% del cap
 const SOFT_CAP_REDUCTION: float = 0.6  # 40% de reducción después del soft cap
 
+# Cost Memo - dos generaciones de COST_CACHE_GENERATION_SIZE entradas (LRU aproximado)
+const COST_CACHE_GENERATION_SIZE: int = 2048
+const PRESTIGE_SPEEDUP_MAX_COUNT: int = 6  # A partir de 6 prestiges el descuento es fijo (30%)
+const PRESTIGE_ITEM_MONEY_SCALING: float = 100000.0  # Costo de prestige ligado al dinero
+
+# ═══════════════════════════════════════════════════════════════════════════════════
+# COST MEMO STATE
+# ═══════════════════════════════════════════════════════════════════════════════════
+
+var cost_cache_hits: int = 0
+var cost_cache_misses: int = 0
+var _cost_cache_hot: Dictionary = {}  # {clave: costo} usadas en la generación actual
+var _cost_cache_cold: Dictionary = {}  # Generación anterior; se descarta en bloque
+var _cost_cache_phase_key: int = -1
+var _cost_series_ids: Dictionary = {}  # {item_type: {base_cost: id}}
+var _cost_series_count: int = 0
+var _item_keys: Dictionary = {}  # {item_type: item_type.to_lower()}
+
 # ═══════════════════════════════════════════════════════════════════════════════════
 # CORE MATHEMATICAL FUNCTIONS
 # ═══════════════════════════════════════════════════════════════════════════════════
@@ -54,8 +72,87 @@ func get_optimized_cost(
 	- Early game: Gratificación cada 30-60 segundos
 	- Mid game: Walls balanceadas cada 5-10 minutos
 	- Late game: Prestige timing perfecto
+	Memoizado por (item_type, base_cost, level) dentro de la fase actual del
+	jugador: si player_progress cruza un límite de fase la tabla se invalida.
 	"""
 
+	var phase_key = _get_progress_phase_key(player_progress)
+	if phase_key != _cost_cache_phase_key:
+		invalidate_cost_cache()
+		_cost_cache_phase_key = phase_key
+
+	var item_key = _item_keys.get(item_type)
+	if item_key == null:
+		item_key = item_type.to_lower()
+		_item_keys[item_type] = item_key
+
+	# Los items de prestige escalan con el dinero exacto: no se pueden memoizar
+	if item_key == "prestige" and player_progress.get("money", 0.0) > PRESTIGE_ITEM_MONEY_SCALING:
+		return _compute_optimized_cost(base_cost, level, item_type, player_progress)
+
+	var key = (_get_cost_series_id(item_type, base_cost) << 32) | (level & 0xFFFFFFFF)
+	var cost = _cost_cache_hot.get(key)
+	if cost != null:
+		cost_cache_hits += 1
+		return cost
+
+	cost = _cost_cache_cold.get(key)
+	if cost != null:
+		cost_cache_hits += 1
+	else:
+		cost_cache_misses += 1
+		cost = _compute_optimized_cost(base_cost, level, item_type, player_progress)
+
+	# Al llenarse la generación actual pasa a ser la antigua (y la antigua se descarta)
+	if _cost_cache_hot.size() >= COST_CACHE_GENERATION_SIZE:
+		_cost_cache_cold = _cost_cache_hot
+		_cost_cache_hot = {}
+	_cost_cache_hot[key] = cost
+	return cost
+
+
+## Vaciar la tabla de costos memoizados
+func invalidate_cost_cache() -> void:
+	_cost_cache_hot.clear()
+	_cost_cache_cold.clear()
+
+
+## Clave de fase: todo lo de player_progress que afecta a get_optimized_cost
+func _get_progress_phase_key(player_progress: Dictionary) -> int:
+	"""Bit 0: fase early posible, bit 1: fase late forzada, resto: prestiges (saturados)"""
+	var total_money = player_progress.get("money", 0.0)
+	var prestige_count = int(player_progress.get("prestige_count", 0))
+	var max_generator_level = player_progress.get("max_generator_level", 0)
+
+	var early = prestige_count == 0 and total_money < 10000
+	var late = prestige_count > 0 or total_money > 500000 or max_generator_level > 40
+	var key = clampi(prestige_count, 0, PRESTIGE_SPEEDUP_MAX_COUNT) << 2
+	if early:
+		key |= 1
+	if late:
+		key |= 2
+	return key
+
+
+## Id entero de la serie (item_type, base_cost) para claves sin strings
+func _get_cost_series_id(item_type: String, base_cost: float) -> int:
+	var series = _cost_series_ids.get(item_type)
+	if series == null:
+		series = {}
+		_cost_series_ids[item_type] = series
+
+	var series_id = series.get(base_cost)
+	if series_id == null:
+		series_id = _cost_series_count
+		_cost_series_count += 1
+		series[base_cost] = series_id
+	return series_id
+
+
+## Cálculo sin memo de get_optimized_cost
+func _compute_optimized_cost(
+	base_cost: float, level: int, item_type: String, player_progress: Dictionary
+) -> float:
 	var multiplier = _get_growth_multiplier(level, item_type, player_progress)
 	var base_cost_adjusted = _apply_context_adjustments(base_cost, item_type, player_progress)
 
@@ -28,6 +28,10 @@ var total_missions_completed: int = 0
 var daily_streak: int = 0
 var weekly_streak: int = 0
 
+# Observadores en game_data.stat_triggers: la estadística de cada misión la despierta
+var _mission_triggers: Dictionary = {}  # mission_id → handle
+var _missions_by_stat: Dictionary = {}  # track_stat → [mission_id] (progreso para la UI)
+
 # Constantes
 const MISSIONS_PER_DAY = 3
 const WEEKLY_MISSIONS_PER_WEEK = 2
@@ -50,7 +54,11 @@ func _ready():
 
 func set_game_data(data: GameData) -> void:
 	"""Asignar referencia a GameData"""
+	if game_data:
+		_unwatch_missions()
+		game_data.stat_triggers.value_changed.disconnect(_on_stat_changed)
 	game_data = data
+	game_data.stat_triggers.value_changed.connect(_on_stat_changed)
 	print("📅 MissionManager conectado con GameData")
 
 	# Cargar misiones guardadas o generar nuevas
@@ -242,6 +250,7 @@ func _load_or_generate_missions():
 
 	# Verificar progreso en las misiones activas
 	_update_all_mission_progress()
+	_watch_active_missions()
 
 
 func _should_reset_missions(current_time: int) -> bool:
@@ -320,6 +329,7 @@ func _generate_daily_missions():
 
 	# Guardar en GameData
 	game_data.active_missions = active_missions.duplicate(true)
+	_watch_active_missions()
 	daily_missions_reset.emit()
 
 
@@ -427,6 +437,7 @@ func _load_or_generate_weekly_missions():
 		active_weekly_missions = game_data.active_weekly_missions.duplicate(true)
 
 	_update_all_weekly_mission_progress()
+	_watch_active_missions()
 
 
 func _should_reset_weekly_missions(current_time: int) -> bool:
@@ -498,6 +509,7 @@ func _generate_weekly_missions():
 	if not game_data.has("active_weekly_missions"):
 		game_data.active_weekly_missions = {}
 	game_data.active_weekly_missions = active_weekly_missions.duplicate(true)
+	_watch_active_missions()
 	weekly_missions_reset.emit()
 	missions_refreshed.emit("weekly")
 
@@ -595,61 +607,145 @@ func _check_weekly_reset():
 		game_data.last_mission_reset = current_time
 
 
+# ============================================================================
+# 🎯 TRIGGERS POR ESTADÍSTICA
+# ============================================================================
+
+
+func _watch_active_missions():
+	"""Observar la estadística de cada misión pendiente con umbral start_value + target"""
+	_unwatch_missions()
+
+	for missions in [active_missions, active_weekly_missions]:
+		for mission_id in missions:
+			var mission = missions[mission_id]
+			if mission.completed:
+				continue
+
+			if not _missions_by_stat.has(mission.track_stat):
+				_missions_by_stat[mission.track_stat] = []
+			_missions_by_stat[mission.track_stat].append(mission_id)
+			var handle = game_data.stat_triggers.watch(
+				mission.track_stat,
+				mission.start_value + mission.target,
+				_on_mission_target_reached.bind(mission_id)
+			)
+			if handle != 0:
+				_mission_triggers[mission_id] = handle
+
+
+func _unwatch_missions():
+	"""Quitar los observadores de misiones de game_data.stat_triggers"""
+	for handle in _mission_triggers.values():
+		game_data.stat_triggers.unwatch(handle)
+	_mission_triggers.clear()
+	_missions_by_stat.clear()
+
+
+func _on_stat_changed(stat_key: String, _value):
+	"""Actualizar el progreso (UI) solo de las misiones que siguen esta estadística"""
+	for mission_id in _missions_by_stat.get(stat_key, []):
+		var is_weekly = active_weekly_missions.has(mission_id)
+		var mission = (
+			active_weekly_missions[mission_id] if is_weekly else active_missions[mission_id]
+		)
+		if mission.completed:
+			continue
+
+		var old_progress = mission.progress
+		if is_weekly:
+			_update_weekly_mission_progress(mission_id)
+		else:
+			_update_mission_progress(mission_id)
+		if mission.progress != old_progress:
+			mission_progress_updated.emit(mission_id, mission.progress, mission.target)
+
+
+func _on_mission_target_reached(_stat_key: String, _value: float, mission_id: String):
+	"""La estadística cruzó start_value + target: completar la misión"""
+	_mission_triggers.erase(mission_id)
+	var is_weekly = active_weekly_missions.has(mission_id)
+	var missions = active_weekly_missions if is_weekly else active_missions
+	var mission = missions.get(mission_id)
+	if not mission or mission.completed:
+		return
+
+	_missions_by_stat.get(mission.track_stat, []).erase(mission_id)
+	mission.progress = mission.target
+	mission_progress_updated.emit(mission_id, mission.progress, mission.target)
+
+	if is_weekly:
+		_complete_weekly_mission(mission_id)
+		game_data.active_weekly_missions = active_weekly_missions.duplicate(true)
+	else:
+		_complete_mission(mission_id)
+		game_data.active_missions = active_missions.duplicate(true)
+
+
 # Funciones para notificar eventos del juego
+# Escriben vía stat_triggers: solo se despiertan las misiones que siguen esa estadística
 func notify_customer_served():
 	"""Notificar que se sirvió un cliente"""
 	if game_data and game_data.statistics.has("customers_served"):
-		game_data.statistics.customers_served += 1
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"customers_served", game_data.statistics.customers_served + 1
+		)
 
 
 func notify_resource_generated(resource_type: String, amount: int):
 	"""Notificar generación de recursos"""
 	if game_data and game_data.statistics.has("total_resources_generated"):
-		game_data.statistics.total_resources_generated += amount
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"total_resources_generated", game_data.statistics.total_resources_generated + amount
+		)
 
 
 func notify_manual_sale(amount: float):
 	"""Notificar venta manual"""
 	if game_data and game_data.statistics.has("manual_sales_money"):
-		game_data.statistics.manual_sales_money += amount
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"manual_sales_money", game_data.statistics.manual_sales_money + amount
+		)
 
 
 func notify_offer_activated():
 	"""Notificar activación de oferta"""
 	if game_data and game_data.statistics.has("offers_activated"):
-		game_data.statistics.offers_activated += 1
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"offers_activated", game_data.statistics.offers_activated + 1
+		)
 
 
 func notify_product_produced(amount: int):
 	"""Notificar producción de productos"""
 	if game_data and game_data.statistics.has("products_produced"):
-		game_data.statistics.products_produced += amount
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"products_produced", game_data.statistics.products_produced + amount
+		)
 
 
 func notify_generator_purchased(amount: int):
 	"""Notificar compra de generadores"""
 	if game_data and game_data.statistics.has("generators_purchased"):
-		game_data.statistics.generators_purchased += amount
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"generators_purchased", game_data.statistics.generators_purchased + amount
+		)
 
 
 func notify_money_earned(amount: float):
 	"""Notificar dinero ganado"""
 	if game_data and game_data.statistics.has("total_money_earned"):
-		game_data.statistics.total_money_earned += amount
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"total_money_earned", game_data.statistics.total_money_earned + amount
+		)
 
 
 func notify_station_purchased():
 	"""Notificar compra de estación"""
 	if game_data and game_data.statistics.has("stations_purchased"):
-		game_data.statistics.stations_purchased += 1
-	_update_all_mission_progress()
+		game_data.stat_triggers.set_value(
+			"stations_purchased", game_data.statistics.stations_purchased + 1
+		)
 
 
 # Funciones de utilidad para UI
@@ -715,6 +811,7 @@ func load_mission_data(data: Dictionary):
 		last_reset_time = data.last_reset_time
 
 	_update_all_mission_progress()
+	_watch_active_missions()
 
 
 # ============================================================================
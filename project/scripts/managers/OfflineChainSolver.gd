@@ -0,0 +1,277 @@
+class_name OfflineChainSolver
+extends RefCounted
+
+## Solver analítico de la cadena generador → estación → venta para progreso offline
+## Las tasas son constantes entre eventos de almacenamiento (un recurso se vacía o
+## se llena, un producto llega a su nivel de retención o de auto-venta): cada segmento
+## se resuelve en forma cerrada y el coste no depende de las horas ausente.
+##
+## Formato de la cadena (tasas en unidades por segundo):
+##   resources: {id: {stock, cap, inflow}}
+##   stations:  [{id, rate, recipe: {recurso: cantidad}, product}]  (orden de prioridad)
+##   products:  {id: {stock, hold, sell_level, on_offer}}  (hold/sell_level = INF si no aplica)
+##   customers: {rate: clientes/s, units: unidades por cliente}
+
+const MAX_SEGMENTS: int = 64  # Cota de eventos; tras ella se cierra con las últimas tasas
+const EPSILON: float = 1e-6
+
+
+## Resolver `seconds` segundos de la cadena. No modifica `chain`.
+static func solve(chain: Dictionary, seconds: float) -> Dictionary:
+	var state = {
+		"seconds": seconds,
+		"segments": 0,
+		"resources": {},
+		"products": {},
+		"generated": {},
+		"wasted": {},
+		"produced": {},
+		"sold": {},
+		"auto_sold": {},
+		"customers_served": 0.0
+	}
+
+	var resources: Dictionary = chain.get("resources", {})
+	var products: Dictionary = chain.get("products", {})
+	for resource_id in resources:
+		state.resources[resource_id] = float(resources[resource_id].stock)
+		state.generated[resource_id] = 0.0
+		state.wasted[resource_id] = 0.0
+	for product_id in products:
+		var product = products[product_id]
+		state.products[product_id] = float(product.stock)
+		state.produced[product_id] = 0.0
+		state.sold[product_id] = 0.0
+		state.auto_sold[product_id] = 0.0
+		# Stock por encima del nivel de auto-venta se vende en los primeros ticks
+		if product.stock > product.sell_level:
+			state.auto_sold[product_id] = product.stock - product.sell_level
+			state.products[product_id] = float(product.sell_level)
+
+	var remaining = seconds
+	while remaining > EPSILON:
+		var flows = _segment_flows(chain, state)
+		var dt = remaining
+		if state.segments + 1 < MAX_SEGMENTS:
+			dt = minf(remaining, _time_to_next_event(chain, state, flows))
+		_advance(chain, state, flows, dt)
+		remaining -= dt
+		state.segments += 1
+
+	return state
+
+
+## Tasas netas de un segmento a partir del estado actual de los stocks
+static func _segment_flows(chain: Dictionary, state: Dictionary) -> Dictionary:
+	var resources: Dictionary = chain.get("resources", {})
+	var products: Dictionary = chain.get("products", {})
+
+	var rates = _station_rates(chain, state, {})
+	var inflows = _product_inflows(chain, rates)
+	var demand = _customer_demand(chain, state, inflows)
+
+	# Productos en su nivel de retención: las estaciones solo reponen lo que se vende
+	var allowances = {}
+	for product_id in products:
+		if _is_held(products[product_id], state.products[product_id]):
+			allowances[product_id] = demand[product_id]
+	if not allowances.is_empty():
+		rates = _station_rates(chain, state, allowances)
+		inflows = _product_inflows(chain, rates)
+
+	var flows = {
+		"resources": {},
+		"generated": {},
+		"wasted": {},
+		"products": {},
+		"produced": inflows,
+		"sold": {},
+		"auto_sold": {},
+		"customers": 0.0
+	}
+
+	var consumption = {}
+	var stations: Array = chain.get("stations", [])
+	for i in stations.size():
+		for resource_id in stations[i].recipe:
+			consumption[resource_id] = (
+				consumption.get(resource_id, 0.0) + rates[i] * stations[i].recipe[resource_id]
+			)
+
+	for resource_id in resources:
+		var resource = resources[resource_id]
+		var stock = state.resources[resource_id]
+		var net = resource.inflow - consumption.get(resource_id, 0.0)
+		var wasted = 0.0
+		if net > 0.0 and stock >= resource.cap - _tolerance(resource.cap):
+			wasted = net
+			net = 0.0
+		elif net < 0.0 and stock <= EPSILON:
+			net = 0.0
+		flows.resources[resource_id] = net
+		flows.wasted[resource_id] = wasted
+		flows.generated[resource_id] = resource.inflow - wasted
+
+	var units_per_customer = maxf(1.0, chain.get("customers", {}).get("units", 1.0))
+	for product_id in products:
+		var product = products[product_id]
+		var stock = state.products[product_id]
+		var sold = demand[product_id]
+		if stock <= EPSILON:
+			sold = minf(sold, inflows[product_id])  # Agotado: solo se vende lo que entra
+		var net = inflows[product_id] - sold
+		var auto_sold = 0.0
+		var level = minf(product.hold, product.sell_level)
+		if net > 0.0 and stock >= level - _tolerance(level):
+			# En auto-venta el excedente se vende; en retención no hay excedente
+			if product.sell_level <= product.hold:
+				auto_sold = net
+			net = 0.0
+		flows.products[product_id] = net
+		flows.sold[product_id] = sold
+		flows.auto_sold[product_id] = auto_sold
+		flows.customers += sold / units_per_customer
+
+	return flows
+
+
+## Producción por estación en orden de prioridad. Un recurso vacío solo reparte lo
+## que entra; `allowances` limita la producción de productos retenidos.
+static func _station_rates(chain: Dictionary, state: Dictionary, allowances: Dictionary) -> Array:
+	var resources: Dictionary = chain.get("resources", {})
+	var empty_inflow = {}
+	for resource_id in resources:
+		if state.resources[resource_id] <= EPSILON:
+			empty_inflow[resource_id] = resources[resource_id].inflow
+	var remaining_allowance = allowances.duplicate()
+
+	var rates = []
+	for station in chain.get("stations", []):
+		var rate: float = station.rate
+		for resource_id in station.recipe:
+			var amount: float = station.recipe[resource_id]
+			if amount <= 0.0:
+				continue
+			if not resources.has(resource_id):
+				rate = 0.0
+			elif empty_inflow.has(resource_id):
+				rate = minf(rate, empty_inflow[resource_id] / amount)
+		if remaining_allowance.has(station.product):
+			rate = minf(rate, remaining_allowance[station.product])
+		rate = maxf(rate, 0.0)
+
+		for resource_id in station.recipe:
+			if empty_inflow.has(resource_id):
+				empty_inflow[resource_id] -= rate * station.recipe[resource_id]
+		if remaining_allowance.has(station.product):
+			remaining_allowance[station.product] -= rate
+		rates.append(rate)
+	return rates
+
+
+static func _product_inflows(chain: Dictionary, rates: Array) -> Dictionary:
+	var inflows = {}
+	for product_id in chain.get("products", {}):
+		inflows[product_id] = 0.0
+	var stations: Array = chain.get("stations", [])
+	for i in stations.size():
+		if inflows.has(stations[i].product):
+			inflows[stations[i].product] += rates[i]
+	return inflows
+
+
+## Demanda de clientes en unidades/s: los clientes eligen al azar entre los productos
+## en oferta con stock, así que se reparte a partes iguales (water-filling) y un
+## producto agotado solo absorbe lo que se produce.
+static func _customer_demand(
+	chain: Dictionary, state: Dictionary, inflows: Dictionary
+) -> Dictionary:
+	var products: Dictionary = chain.get("products", {})
+	var customers: Dictionary = chain.get("customers", {})
+	var demand = {}
+	var candidates = []
+	for product_id in products:
+		demand[product_id] = 0.0
+		var stocked = state.products[product_id] > EPSILON or inflows[product_id] > EPSILON
+		if products[product_id].on_offer and stocked:
+			candidates.append(product_id)
+
+	var capacity = customers.get("rate", 0.0) * customers.get("units", 1.0)
+	while not candidates.is_empty() and capacity > EPSILON:
+		var share = capacity / candidates.size()
+		var starved = candidates.filter(
+			func(product_id):
+				return state.products[product_id] <= EPSILON and inflows[product_id] < share
+		)
+		if starved.is_empty():
+			for product_id in candidates:
+				demand[product_id] = share
+			break
+		for product_id in starved:
+			demand[product_id] = inflows[product_id]
+			capacity -= inflows[product_id]
+			candidates.erase(product_id)
+	return demand
+
+
+## Segundos hasta que algún stock se vacía o alcanza su límite con las tasas actuales
+static func _time_to_next_event(chain: Dictionary, state: Dictionary, flows: Dictionary) -> float:
+	var dt = INF
+	var resources: Dictionary = chain.get("resources", {})
+	for resource_id in resources:
+		var net = flows.resources[resource_id]
+		var stock = state.resources[resource_id]
+		if net < 0.0:
+			dt = minf(dt, stock / -net)
+		elif net > 0.0:
+			dt = minf(dt, (resources[resource_id].cap - stock) / net)
+
+	var products: Dictionary = chain.get("products", {})
+	for product_id in products:
+		var net = flows.products[product_id]
+		var stock = state.products[product_id]
+		var level = minf(products[product_id].hold, products[product_id].sell_level)
+		if net < 0.0:
+			dt = minf(dt, stock / -net)
+		elif net > 0.0 and level < INF:
+			dt = minf(dt, (level - stock) / net)
+	return maxf(dt, 0.0)
+
+
+static func _advance(chain: Dictionary, state: Dictionary, flows: Dictionary, dt: float) -> void:
+	var resources: Dictionary = chain.get("resources", {})
+	for resource_id in resources:
+		var cap = resources[resource_id].cap
+		var net = flows.resources[resource_id]
+		state.resources[resource_id] = _step_stock(state.resources[resource_id], net, dt, cap)
+		state.generated[resource_id] += flows.generated[resource_id] * dt
+		state.wasted[resource_id] += flows.wasted[resource_id] * dt
+
+	var products: Dictionary = chain.get("products", {})
+	for product_id in products:
+		var level = minf(products[product_id].hold, products[product_id].sell_level)
+		var net = flows.products[product_id]
+		state.products[product_id] = _step_stock(state.products[product_id], net, dt, level)
+		state.produced[product_id] += flows.produced[product_id] * dt
+		state.sold[product_id] += flows.sold[product_id] * dt
+		state.auto_sold[product_id] += flows.auto_sold[product_id] * dt
+
+	state.customers_served += flows.customers * dt
+
+
+## Avanzar un stock y fijarlo exactamente en 0 o en su límite al llegar al evento
+static func _step_stock(stock: float, net: float, dt: float, level: float) -> float:
+	var next = stock + net * dt
+	if net > 0.0 and next >= level - _tolerance(level):
+		return level
+	if next <= EPSILON:
+		return 0.0
+	return next
+
+
+static func _is_held(product: Dictionary, stock: float) -> bool:
+	return product.hold < product.sell_level and stock >= product.hold - _tolerance(product.hold)
+
+
+static func _tolerance(level: float) -> float:
+	return EPSILON * maxf(1.0, absf(level)) if level < INF else 0.0
@@ -97,6 +97,8 @@ func _apply_surprise_bonus(progress_data: Dictionary, bonus_amount: float):
 	for resource_id in progress_data.resources_generated:
 		var extra_resource = progress_data.resources_generated[resource_id] * bonus_amount
 		progress_data.resources_generated[resource_id] += extra_resource
+		var resource_changes = progress_data.stock_changes.resources
+		resource_changes[resource_id] = resource_changes.get(resource_id, 0) + int(extra_resource)
 		bonus_types.append("%s: +%.0f" % [resource_id, extra_resource])
 		offline_bonus_earned.emit("resource_" + resource_id, extra_resource)
 
@@ -249,27 +251,14 @@ func calculate_offline_progress(offline_seconds: float) -> Dictionary:
 		"tokens_earned": 0,
 		"customers_served": 0,
 		"catch_up_bonus": 0,
+		"cash_earned": 0.0,
+		"stock_changes": {"resources": {}, "products": {}},
 		"bonuses_earned": {}
 	}
 
-	# 1. Calcular generación de recursos offline con bonuses
-	progress_data.resources_generated = _calculate_offline_resources(
-		offline_seconds, total_efficiency
-	)
-
-	# 2. Calcular producción offline (si auto-production activada)
-	progress_data.products_produced = _calculate_offline_production(
-		offline_seconds, total_efficiency
-	)
-
-	# 3. Calcular ventas automáticas offline
-	var sell_results = _calculate_offline_auto_sell(offline_seconds, total_efficiency)
-	progress_data.products_sold = sell_results.products_sold
-
-	# 4. Calcular clientes automáticos offline
-	var customer_results = _calculate_offline_customers(offline_seconds, total_efficiency)
-	progress_data.customers_served = customer_results.customers_served
-	progress_data.tokens_earned = customer_results.tokens_earned
+	# 1-4. Cadena generador → estación → venta resuelta por segmentos entre eventos
+	# de almacenamiento; la eficiencia escala el tiempo simulado
+	_simulate_offline_chain(offline_seconds * total_efficiency, progress_data)
 
 	# 5. Calcular catch-up bonus mejorado
 	progress_data.catch_up_bonus = _calculate_catch_up_bonus(offline_seconds) * loyalty_bonus
@@ -289,193 +278,178 @@ func calculate_offline_progress(offline_seconds: float) -> Dictionary:
 # =============================================================================
 
 
-func _calculate_offline_resources(offline_seconds: float, efficiency: float) -> Dictionary:
-	"""Calcular recursos generados offline"""
-	var resources_generated = {}
-
-	if not generator_manager or not game_data:
-		return resources_generated
-
-	# Para cada tipo de generador activo
-	for generator_id in ["water", "barley", "hops", "fruits"]:
-		var generator_level = game_data.generators.get(generator_id, 0)
-		if generator_level <= 0:
-			continue
-
-		# Rate base del generador por segundo
-		var base_rate = _get_generator_base_rate(generator_id)
-		var level_multiplier = generator_level
-
-		# Calcular generación total offline
-		var total_generated = base_rate * level_multiplier * offline_seconds * efficiency
-
-		# Aplicar límites de almacenamiento
-		var current_stock = StockManager.get_stock("resource", generator_id)
-		var max_storage = StockManager.get_max_stock("resource", generator_id)
-		var available_space = max_storage - current_stock
-
-		total_generated = min(total_generated, available_space)
-		resources_generated[generator_id] = int(total_generated)
-
-	print("📴 Recursos offline calculados: %s" % str(resources_generated))
-	return resources_generated
-
-
-func _calculate_offline_production(offline_seconds: float, efficiency: float) -> Dictionary:
-	"""Calcular productos creados offline via auto-production"""
-	var products_produced = {}
-
-	if not automation_manager or not automation_manager.smart_production_priority:
-		return products_produced
-
-	# Solo calcular si auto-production está habilitada
-	var production_enabled = false
-	for station_id in ["brewery", "bar_station", "distillery"]:
-		if automation_manager.is_auto_production_enabled(station_id):
-			production_enabled = true
-			break
-
-	if not production_enabled:
-		return products_produced
-
-	# Simular producción cada 10 segundos (intervalo de auto-production offline)
-	var production_cycles = int(offline_seconds / 10.0)
-
-	for cycle in range(production_cycles):
-		# Obtener cola de producción prioritaria
-		var production_queue = _get_offline_production_queue()
-
-		for production_item in production_queue:
-			var station_id = production_item.station_id
-			var product = production_item.product
-
-			# Verificar recursos suficientes
-			if not _has_offline_resources_for_production(station_id):
-				continue
-
-			# Verificar espacio en inventario
-			var current_stock = StockManager.get_stock("product", product)
-			var max_stock = automation_manager._get_max_product_storage(product)
-			if current_stock >= max_stock * 0.8:  # Límite de auto-production
-				continue
-
-			# Producir 1 unidad
-			_consume_offline_resources_for_production(station_id)
-
-			if not products_produced.has(product):
-				products_produced[product] = 0
-			products_produced[product] += 1
-
-			# Solo 1 producto por ciclo offline (menos agresivo)
-			break
-
-	# Aplicar eficiencia offline
-	for product in products_produced:
-		products_produced[product] = int(products_produced[product] * efficiency)
-
-	print("📴 Productos offline producidos: %s" % str(products_produced))
-	return products_produced
-
-
-func _calculate_offline_auto_sell(offline_seconds: float, efficiency: float) -> Dictionary:
-	"""Calcular ventas automáticas offline"""
-	var sell_results = {"products_sold": {}, "cash_earned": 0.0}
-
-	if not automation_manager:
-		return sell_results
-
-	# Verificar si hay productos con auto-sell habilitado
-	var auto_sell_enabled = false
-	for product in ["beer", "cocktail", "whiskey"]:
-		if automation_manager.is_auto_sell_enabled(product):
-			auto_sell_enabled = true
-			break
-
-	if not auto_sell_enabled:
-		return sell_results
-
-	# Simular auto-sell cada 5 segundos offline
-	var sell_cycles = int(offline_seconds / 5.0)
-
-	for cycle in range(sell_cycles):
-		for product in ["beer", "cocktail", "whiskey"]:
-			if not automation_manager.is_auto_sell_enabled(product):
-				continue
-
-			# Verificar si debería vender offline (criterios relajados)
-			var current_stock = StockManager.get_stock("product", product)
-			var max_stock = automation_manager._get_max_product_storage(product)
-			var stock_ratio = float(current_stock) / max(1.0, float(max_stock))
-
-			# Offline: vender si >70% lleno (más conservador)
-			if stock_ratio < 0.7:
-				continue
-
-			# Calcular cantidad a vender (conservador offline)
-			var amount_to_sell = min(3, max(1, int(current_stock * 0.1)))  # 10% o máximo 3
-
-			# Simular venta
-			var base_price = automation_manager._get_base_product_price(product)
-			var offer_multiplier = 1.2  # Asumir oferta modesta offline
-			var earnings = base_price * offer_multiplier * amount_to_sell
-
-			# Registrar venta
-			if not sell_results.products_sold.has(product):
-				sell_results.products_sold[product] = 0
-			sell_results.products_sold[product] += amount_to_sell
-			sell_results.cash_earned += earnings
-
-			# Reducir stock simulado
-			StockManager.remove_stock("product", product, amount_to_sell)
-
-	# Aplicar eficiencia offline
-	sell_results.cash_earned *= efficiency
-	for product in sell_results.products_sold:
-		sell_results.products_sold[product] = int(sell_results.products_sold[product] * efficiency)
+func _simulate_offline_chain(simulated_seconds: float, progress_data: Dictionary) -> void:
+	"""Resolver la cadena de producción offline y volcar el resultado en progress_data"""
+	if not game_data:
+		return
+
+	var chain = _build_offline_chain()
+	var start_usec = Time.get_ticks_usec()
+	var result = OfflineChainSolver.solve(chain, simulated_seconds)
+	var solve_usec = Time.get_ticks_usec() - start_usec
+
+	for resource_id in chain.resources:
+		var generated = int(result.generated[resource_id])
+		if generated > 0:
+			progress_data.resources_generated[resource_id] = generated
+		var change = int(result.resources[resource_id]) - int(chain.resources[resource_id].stock)
+		if change != 0:
+			progress_data.stock_changes.resources[resource_id] = change
+
+	var customer_prices = chain.customer_prices
+	var units_per_customer = chain.customers.units
+	var tokens = 0.0
+	for product_id in chain.products:
+		var produced = int(result.produced[product_id])
+		if produced > 0:
+			progress_data.products_produced[product_id] = produced
+		var sold = int(result.sold[product_id] + result.auto_sold[product_id])
+		if sold > 0:
+			progress_data.products_sold[product_id] = sold
+		var change = int(result.products[product_id]) - int(chain.products[product_id].stock)
+		if change != 0:
+			progress_data.stock_changes.products[product_id] = change
+
+		var price = customer_prices.get(product_id, 0.0)
+		progress_data.cash_earned += result.sold[product_id] * price
+		progress_data.cash_earned += result.auto_sold[product_id] * chain.sell_prices[product_id]
+		var product_customers = result.sold[product_id] / units_per_customer
+		tokens += product_customers * _get_tokens_per_customer(price, units_per_customer)
+
+	progress_data.customers_served = int(result.customers_served)
+	progress_data.tokens_earned = int(tokens)
+	progress_data["simulation"] = {
+		"simulated_seconds": simulated_seconds,
+		"segments": result.segments,
+		"solve_usec": solve_usec
+	}
 
 	print(
 		(
-			"📴 Ventas offline: %s por $%.2f"
-			% [str(sell_results.products_sold), sell_results.cash_earned]
+			"📴 Cadena offline: %d segmentos en %d µs - %s producidos, %d clientes, $%.2f"
+			% [
+				result.segments,
+				solve_usec,
+				str(progress_data.products_produced),
+				progress_data.customers_served,
+				progress_data.cash_earned
+			]
 		)
 	)
-	return sell_results
-
-
-func _calculate_offline_customers(offline_seconds: float, efficiency: float) -> Dictionary:
-	"""Calcular clientes automáticos offline"""
-	var customer_results = {"customers_served": 0, "tokens_earned": 0}
 
-	if not customer_manager or not game_data.customer_system_unlocked:
-		return customer_results
 
-	# Obtener datos de clientes
-	var active_customers = customer_manager.active_customers
-	if active_customers <= 0:
-		return customer_results
-
-	# Calcular intervalo de clientes offline
-	var base_interval = 8.0  # Segundos base
-	var customer_interval = base_interval / float(active_customers)
-
-	# Calcular clientes servidos
-	var customers_served = int(offline_seconds / customer_interval)
-	customers_served = int(customers_served * efficiency)
+func _build_offline_chain() -> Dictionary:
+	"""Traducir el estado actual y las reglas online a tasas para OfflineChainSolver"""
+	var chain = {
+		"resources": {},
+		"stations": [],
+		"products": {},
+		"customers": {"rate": 0.0, "units": 1.0},
+		"customer_prices": {},
+		"sell_prices": {}
+	}
 
-	# Calcular tokens ganados (conservador)
-	var base_tokens_per_customer = 1.5  # Promedio conservador
+	# Recursos: generación por ciclo de GeneratorManager repartida en su periodo
+	for resource_id in GameConfigTables.resource_ids:
+		chain.resources[resource_id] = {
+			"stock": StockManager.get_stock("resource", resource_id),
+			"cap": float(StockManager.get_max_stock("resource", resource_id)),
+			"inflow": 0.0
+		}
+
+	var prestige_speed = game_data.get("prestige_speed_multiplier")
+	for i in GameConfigTables.generator_ids.size():
+		var owned = game_data.generators.get(GameConfigTables.generator_ids[i], 0)
+		var resource = GameConfigTables.generator_resource[i]
+		if owned <= 0 or resource < 0:
+			continue
+		var amount = int(GameConfigTables.generator_production_rate[i] * owned)
+		if prestige_speed != null and prestige_speed > 1.0:
+			amount = int(amount * prestige_speed)
+		var resource_id = GameConfigTables.resource_ids[resource]
+		chain.resources[resource_id].inflow += amount / GeneratorManager.GENERATION_PERIOD
+
+	# Productos: retención de auto-producción y nivel de auto-venta
+	for product_id in GameConfigTables.product_ids:
+		chain.products[product_id] = {
+			"stock": StockManager.get_stock("product", product_id),
+			"hold": INF,
+			"sell_level": INF,
+			"on_offer": false
+		}
+		chain.sell_prices[product_id] = 0.0
+		if automation_manager and _offline_auto_sell_active(product_id):
+			var max_storage = automation_manager._get_max_product_storage(product_id)
+			chain.products[product_id].sell_level = (
+				automation_manager._get_smart_sell_threshold(product_id) * max_storage
+			)
+			chain.sell_prices[product_id] = (
+				automation_manager._get_base_product_price(product_id)
+				* automation_manager._get_offer_multiplier(product_id)
+			)
 
-	# Aplicar bonificaciones si están activas
+	# Estaciones: una unidad por verificación de auto-producción, en orden de prioridad
+	if automation_manager:
+		var production_rate = 1.0 / automation_manager.production_check_interval
+		for production_item in automation_manager._get_production_queue():
+			var row = GameConfigTables.station_index.get(production_item.station_id, -1)
+			if row < 0 or GameConfigTables.station_product[row] < 0:
+				continue
+			var product_id = GameConfigTables.product_ids[GameConfigTables.station_product[row]]
+			chain.stations.append(
+				{
+					"id": production_item.station_id,
+					"rate": production_rate,
+					"recipe": GameConfigTables.recipe_row(GameConfigTables.station_recipes, row),
+					"product": product_id
+				}
+			)
+			var max_storage = automation_manager._get_max_product_storage(product_id)
+			chain.products[product_id].hold = max_storage * automation_manager.auto_sell_threshold
+
+	# Clientes: solo compran productos cuya estación tiene la oferta activa
+	if customer_manager and customer_manager.customer_timer_active:
+		chain.customers.rate = 1.0 / customer_manager.customer_interval
+		if game_data.upgrades.get("bulk_buyers", false):
+			chain.customers.units = 2.0  # randi_range(1, 3) en promedio
+
+		for i in GameConfigTables.station_ids.size():
+			var offer = game_data.offers.get(GameConfigTables.station_ids[i], {})
+			var product = GameConfigTables.station_product[i]
+			if product < 0 or not offer.get("enabled", false):
+				continue
+			var product_id = GameConfigTables.product_ids[product]
+			chain.products[product_id].on_offer = true
+			var price = GameUtils.get_product_price(product_id) * offer.get("price_multiplier", 1.0)
+			if game_data.upgrades.get("premium_customers", false):
+				price *= GameConfig.PREMIUM_CUSTOMER_MULTIPLIER
+			chain.customer_prices[product_id] = price
+
+	return chain
+
+
+func _offline_auto_sell_active(product_id: String) -> bool:
+	"""Criterios de auto-venta de AutomationManager que no dependen del stock"""
+	if not automation_manager.is_auto_sell_enabled(product_id):
+		return false
+	if automation_manager._calculate_price_attractiveness(product_id) < 1.2:
+		return false
+	return automation_manager._has_profitable_offer(product_id)
+
+
+func _get_tokens_per_customer(price: float, quantity: float) -> float:
+	"""Tokens por cliente con las reglas de CustomerManager._process_automatic_customer"""
+	var tokens = max(1, int(price * quantity / 5.0))
+	if game_data.upgrades.get("bulk_buyers", false) and quantity > 1:
+		tokens += int(quantity) - 1
 	if game_data.upgrades.get("premium_customers", false):
-		base_tokens_per_customer *= 1.5
-
-	var tokens_earned = int(customers_served * base_tokens_per_customer)
-
-	customer_results.customers_served = customers_served
-	customer_results.tokens_earned = tokens_earned
-
-	print("📴 Clientes offline: %d servidos, %d tokens" % [customers_served, tokens_earned])
-	return customer_results
+		tokens = int(tokens * 1.6)
+	if customer_manager.active_customers > 1:
+		tokens = int(tokens * (1.0 + (customer_manager.active_customers - 1) * 0.1))
+	var prestige_tokens = game_data.get("prestige_customer_token_multiplier")
+	if prestige_tokens != null and prestige_tokens > 1.0:
+		tokens = int(tokens * prestige_tokens)
+	return float(tokens)
 
 
 func _calculate_catch_up_bonus(offline_seconds: float) -> int:
@@ -504,17 +478,17 @@ func _calculate_catch_up_bonus(offline_seconds: float) -> int:
 func _apply_offline_progress(progress_data: Dictionary):
 	"""Aplicar el progreso offline calculado al juego"""
 
-	# Aplicar recursos generados
-	for resource_id in progress_data.resources_generated:
-		var amount = progress_data.resources_generated[resource_id]
-		StockManager.add_stock("resource", resource_id, amount)
-		print("📴 +%d %s" % [amount, resource_id])
-
-	# Aplicar productos producidos
-	for product_id in progress_data.products_produced:
-		var amount = progress_data.products_produced[product_id]
-		StockManager.add_stock("product", product_id, amount)
-		print("📴 +%d %s producidos" % [amount, product_id])
+	# Aplicar cambios netos de stock (generado menos consumido por la producción)
+	var stock_changes = progress_data.stock_changes
+	for item_type in ["resource", "product"]:
+		var changes = stock_changes.resources if item_type == "resource" else stock_changes.products
+		for item_id in changes:
+			var amount = changes[item_id]
+			if amount > 0:
+				StockManager.add_stock(item_type, item_id, amount)
+			else:
+				StockManager.remove_stock(item_type, item_id, -amount)
+			print("📴 %+d %s" % [amount, item_id])
 
 	# Aplicar cash de ventas
 	if progress_data.has("cash_earned"):
@@ -548,62 +522,7 @@ func _has_offline_premium() -> bool:
 
 func _get_optimized_offline_efficiency(offline_seconds: float, has_premium: bool) -> float:
 	"""T027: Curva de eficiencia offline optimizada científicamente"""
-	var math_manager = MathematicalBalanceManager.new()
-	return math_manager.get_idle_efficiency(offline_seconds, has_premium)
-
-
-func _get_generator_base_rate(generator_id: String) -> float:
-	"""Obtener rate base por segundo de un generador"""
-	match generator_id:
-		"water":
-			return 1.2
-		"barley":
-			return 0.8
-		"hops":
-			return 0.4
-		"fruits":
-			return 0.3
-		_:
-			return 0.5
-
-
-func _get_offline_production_queue() -> Array:
-	"""Obtener cola de producción para offline (simplificada)"""
-	var queue = []
-
-	# Prioridad simple: más rentable primero
-	if automation_manager.is_auto_production_enabled("distillery"):
-		queue.append({"station_id": "distillery", "product": "whiskey", "priority": 100})
-
-	if automation_manager.is_auto_production_enabled("bar_station"):
-		queue.append({"station_id": "bar_station", "product": "cocktail", "priority": 80})
-
-	if automation_manager.is_auto_production_enabled("brewery"):
-		queue.append({"station_id": "brewery", "product": "beer", "priority": 60})
-
-	return queue
-
-
-func _has_offline_resources_for_production(station_id: String) -> bool:
-	"""Verificar recursos offline para producción"""
-	var recipe = automation_manager._get_station_recipe(station_id)
-
-	for resource_id in recipe:
-		var required = recipe[resource_id]
-		var current = StockManager.get_stock("resource", resource_id)
-		if current < required:
-			return false
-
-	return true
-
-
-func _consume_offline_resources_for_production(station_id: String):
-	"""Consumir recursos para producción offline"""
-	var recipe = automation_manager._get_station_recipe(station_id)
-
-	for resource_id in recipe:
-		var required = recipe[resource_id]
-		StockManager.remove_stock("resource", resource_id, required)
+	return GameUtils.get_balance_manager().get_idle_efficiency(offline_seconds, has_premium)
 
 
 # =============================================================================
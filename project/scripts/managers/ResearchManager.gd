@@ -10,6 +10,8 @@ signal research_unlocked(research_id: String)
 signal research_progress_updated(research_id: String, progress: float)
 signal tech_bonus_applied(bonus_type: String, bonus_value: float)
 
+const RESEARCH_TICK_INTERVAL = 1.0  # Periodo del sistema "research" de TickManager
+
 # Referencias
 var game_data: GameData
 var statistics_manager: StatisticsManager
@@ -24,9 +26,6 @@ var available_researches: Array = []
 var research_points: int = 0
 var research_speed_multiplier: float = 1.0
 
-# Timer para progreso de investigación
-var research_timer: Timer
-
 # Constantes
 const BASE_RESEARCH_TIME = 300  # 5 minutos base
 const RESEARCH_POINT_GENERATION_RATE = 1.0  # Por segundo cuando es elegible
@@ -35,7 +34,6 @@ const RESEARCH_POINT_GENERATION_RATE = 1.0  # Por segundo cuando es elegible
 func _ready():
 	print("🔬 ResearchManager inicializado (T035)")
 	_initialize_research_tree()
-	_setup_research_timer()
 	_calculate_available_researches()
 
 
@@ -315,13 +313,9 @@ func _add_missing_researches():
 		research_tree[research_id] = missing_researches[research_id]
 
 
-func _setup_research_timer():
-	"""Configura el timer para progreso de investigación"""
-	research_timer = Timer.new()
-	research_timer.wait_time = 1.0  # Tick cada segundo
-	research_timer.timeout.connect(_process_research_progress)
-	research_timer.autostart = true
-	add_child(research_timer)
+func step_research(_delta: float):
+	"""Paso de simulación: progreso de investigación cada RESEARCH_TICK_INTERVAL"""
+	_process_research_progress()
 
 
 ## === GESTIÓN DE INVESTIGACIÓN ===
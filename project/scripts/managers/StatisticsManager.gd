@@ -9,6 +9,8 @@ signal stat_updated(category: String, stat_name: String, value: float)
 signal milestone_reached(category: String, milestone_name: String, value: float)
 signal report_generated(report_type: String, data: Dictionary)
 
+const REALTIME_STATS_INTERVAL = 10.0  # Actualizar cada 10 segundos
+
 # Referencias
 var game_data: GameData
 
@@ -21,6 +23,7 @@ var efficiency_stats: Dictionary = {}
 # Tracking temporal
 var session_start_time: int = 0
 var last_stats_save: int = 0
+var _stats_save_elapsed: float = 0.0
 
 # Constantes
 const STATS_SAVE_INTERVAL = 60  # Guardar stats cada minuto
@@ -30,7 +33,6 @@ func _ready():
 	print("📊 StatisticsManager inicializado (T034)")
 	session_start_time = Time.get_unix_time_from_system()
 	_initialize_stats_structure()
-	_setup_periodic_updates()
 
 
 func _initialize_stats_structure():
@@ -87,19 +89,15 @@ func _initialize_stats_structure():
 	}
 
 
-func _setup_periodic_updates():
-	"""Configura actualizaciones periódicas de estadísticas"""
-	var stats_timer = Timer.new()
-	stats_timer.wait_time = 10.0  # Actualizar cada 10 segundos
-	stats_timer.timeout.connect(_update_realtime_stats)
-	stats_timer.autostart = true
-	add_child(stats_timer)
+## Paso de simulación (sistema "statistics" de TickManager, cada REALTIME_STATS_INTERVAL)
+func step_statistics(delta: float):
+	"""Actualizar estadísticas en tiempo real y guardarlas cada STATS_SAVE_INTERVAL"""
+	_update_realtime_stats()
 
-	var save_timer = Timer.new()
-	save_timer.wait_time = STATS_SAVE_INTERVAL
-	save_timer.timeout.connect(_save_stats_to_game_data)
-	save_timer.autostart = true
-	add_child(save_timer)
+	_stats_save_elapsed += delta
+	if _stats_save_elapsed >= STATS_SAVE_INTERVAL:
+		_stats_save_elapsed = 0.0
+		_save_stats_to_game_data()
 
 
 ## === PRODUCTION STATISTICS ===
@@ -365,9 +363,10 @@ func _save_stats_to_game_data():
 		return
 
 	# Actualizar estadísticas principales en GameData
-	game_data.statistics["total_beers_produced"] = production_stats["total_beers_brewed"]
-	game_data.statistics["total_money_earned"] = economic_stats["money_earned_lifetime"]
-	game_data.statistics["sessions_played"] = meta_stats["sessions_count"]
+	var stat_triggers = game_data.stat_triggers
+	stat_triggers.set_value("total_beers_produced", production_stats["total_beers_brewed"])
+	stat_triggers.set_value("total_money_earned", economic_stats["money_earned_lifetime"])
+	stat_triggers.set_value("sessions_played", meta_stats["sessions_count"])
 	game_data.statistics["detailed_stats"] = {
 		"production": production_stats,
 		"economic": economic_stats,
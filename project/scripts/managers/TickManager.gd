@@ -14,6 +14,20 @@ const FAST_TICK_INTERVAL: float = 1.0 / 60.0  # 60 FPS - UI updates
 const NORMAL_TICK_INTERVAL: float = 1.0 / 30.0  # 30 FPS - Game logic
 const SLOW_TICK_INTERVAL: float = 1.0 / 10.0  # 10 FPS - Background tasks
 const VERY_SLOW_TICK_INTERVAL: float = 1.0  # 1 FPS - Periodic tasks
+const SIGNAL_BATCH_INTERVAL: float = 1.0 / 30.0  # 30 FPS batching
+
+# Fixed-step economy simulation
+const SIMULATION_STEP: float = 0.1  # Simulated seconds per step (10 Hz)
+const MAX_CATCH_UP_STEPS: int = 10  # Steps per frame before dropping time (no spiral of death)
+
+# Callback profiling
+const CALLBACK_SAMPLE_WINDOW: int = 128  # Recent timings kept per callback for p50/p95
+const SLOWEST_CALLBACKS_REPORTED: int = 5
+
+# Signal batching merge policies (applied to the last argument of a coalesced emission)
+const MERGE_LAST_WINS: String = "last_wins"  # Keep only the newest arguments
+const MERGE_SUM: String = "sum"  # Add amounts together
+const MERGE_APPEND: String = "append"  # Concatenate Array values
 
 # Tick callback arrays
 var fast_tick_callbacks: Array[Callable] = []
@@ -21,11 +35,24 @@ var normal_tick_callbacks: Array[Callable] = []
 var slow_tick_callbacks: Array[Callable] = []
 var very_slow_tick_callbacks: Array[Callable] = []
 
-# Tick timers
-var fast_tick_timer: Timer
-var normal_tick_timer: Timer
-var slow_tick_timer: Timer
-var very_slow_tick_timer: Timer
+# Tick intervals, driven from _process (no Timer nodes)
+var tick_intervals: Dictionary = {
+	"fast": FAST_TICK_INTERVAL,
+	"normal": NORMAL_TICK_INTERVAL,
+	"slow": SLOW_TICK_INTERVAL,
+	"very_slow": VERY_SLOW_TICK_INTERVAL
+}
+var ticks_paused: bool = false
+
+# Per-tick time budget (microseconds); callbacks past it wait for the next tick
+var tick_budgets_usec: Dictionary = {"fast": 2000, "normal": 4000, "slow": 4000, "very_slow": 8000}
+
+# Simulation systems sorted by order:
+# {name, step, order, period_steps, countdown, runs, total_usec, last_usec, max_usec}
+var simulation_systems: Array[Dictionary] = []
+var simulation_step_count: int = 0
+var simulation_accumulator: float = 0.0
+var dropped_simulation_time: float = 0.0
 
 # Tick statistics
 var tick_stats: Dictionary = {
@@ -33,15 +60,26 @@ var tick_stats: Dictionary = {
 	"normal_tick_count": 0,
 	"slow_tick_count": 0,
 	"very_slow_tick_count": 0,
-	"total_callbacks": 0
+	"total_callbacks": 0,
+	"budget_overruns": 0,
+	"deferred_callbacks": 0,
+	"coalesced_signals": 0,
+	"emitted_signals": 0
 }
 
 # Singleton reference
 static var instance: TickManager
 
-# Signal batching system
+# Signal batching system, in first-queued order:
+# {key: {owner, signal, args, merge, queued_time, merged}}
 var batched_signals: Dictionary = {}
-var signal_batch_timer: Timer
+
+var _tick_accumulators: Dictionary = {"fast": 0.0, "normal": 0.0, "slow": 0.0, "very_slow": 0.0}
+# Round-robin start per tick rate: where the last over-budget tick stopped
+var _tick_cursors: Dictionary = {"fast": 0, "normal": 0, "slow": 0, "very_slow": 0}
+# {callback: {name, tick_type, samples, next_sample, calls, total_usec, max_usec}}
+var _callback_profiles: Dictionary = {}
+var _signal_batch_accumulator: float = 0.0
 
 # ═══════════════════════════════════════════════════════════════════════════════════
 # INITIALIZATION
@@ -50,49 +88,25 @@ var signal_batch_timer: Timer
 
 func _ready():
 	instance = self
-	_setup_tick_timers()
-	_setup_signal_batching()
-	print("⏰ TickManager initialized with 4 tick rates")
-
-
-func _setup_tick_timers():
-	"""Setup all tick timers"""
-	# Fast tick timer (60 FPS)
-	fast_tick_timer = Timer.new()
-	fast_tick_timer.wait_time = FAST_TICK_INTERVAL
-	fast_tick_timer.timeout.connect(_on_fast_tick)
-	fast_tick_timer.autostart = true
-	add_child(fast_tick_timer)
-
-	# Normal tick timer (30 FPS)
-	normal_tick_timer = Timer.new()
-	normal_tick_timer.wait_time = NORMAL_TICK_INTERVAL
-	normal_tick_timer.timeout.connect(_on_normal_tick)
-	normal_tick_timer.autostart = true
-	add_child(normal_tick_timer)
-
-	# Slow tick timer (10 FPS)
-	slow_tick_timer = Timer.new()
-	slow_tick_timer.wait_time = SLOW_TICK_INTERVAL
-	slow_tick_timer.timeout.connect(_on_slow_tick)
-	slow_tick_timer.autostart = true
-	add_child(slow_tick_timer)
-
-	# Very slow tick timer (1 FPS)
-	very_slow_tick_timer = Timer.new()
-	very_slow_tick_timer.wait_time = VERY_SLOW_TICK_INTERVAL
-	very_slow_tick_timer.timeout.connect(_on_very_slow_tick)
-	very_slow_tick_timer.autostart = true
-	add_child(very_slow_tick_timer)
-
-
-func _setup_signal_batching():
-	"""Setup signal batching system"""
-	signal_batch_timer = Timer.new()
-	signal_batch_timer.wait_time = 1.0 / 30.0  # 30 FPS batching
-	signal_batch_timer.timeout.connect(_process_signal_batch)
-	signal_batch_timer.autostart = true
-	add_child(signal_batch_timer)
+	print("⏰ TickManager initialized with 4 tick rates and fixed-step simulation")
+
+
+func _exit_tree() -> void:
+	if instance == self:
+		instance = null
+
+
+func _process(delta: float) -> void:
+	if ticks_paused:
+		return
+
+	advance_simulation(delta)
+	_advance_tick_rates(delta)
+
+	_signal_batch_accumulator += delta
+	if _signal_batch_accumulator >= SIGNAL_BATCH_INTERVAL:
+		_signal_batch_accumulator = 0.0
+		_process_signal_batch()
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════
@@ -139,6 +153,7 @@ func unregister_callback(callback: Callable) -> void:
 	normal_tick_callbacks.erase(callback)
 	slow_tick_callbacks.erase(callback)
 	very_slow_tick_callbacks.erase(callback)
+	_callback_profiles.erase(callback)
 	_update_total_callbacks()
 
 
@@ -157,6 +172,26 @@ func _update_total_callbacks():
 # ═══════════════════════════════════════════════════════════════════════════════════
 
 
+func _advance_tick_rates(delta: float) -> void:
+	"""Fire each tick rate at most once per frame, like the Timers it replaces"""
+	for tick_type in _tick_accumulators:
+		_tick_accumulators[tick_type] += delta
+		if _tick_accumulators[tick_type] < tick_intervals[tick_type]:
+			continue
+		_tick_accumulators[tick_type] = fmod(
+			_tick_accumulators[tick_type], tick_intervals[tick_type]
+		)
+		match tick_type:
+			"fast":
+				_on_fast_tick()
+			"normal":
+				_on_normal_tick()
+			"slow":
+				_on_slow_tick()
+			"very_slow":
+				_on_very_slow_tick()
+
+
 func _on_fast_tick():
 	"""Execute all fast tick callbacks (60 FPS)"""
 	_execute_callbacks(fast_tick_callbacks, "fast")
@@ -182,32 +217,232 @@ func _on_very_slow_tick():
 
 
 func _execute_callbacks(callbacks: Array[Callable], tick_type: String):
-	"""Execute a list of callbacks safely"""
-	var executed_count = 0
-	var failed_count = 0
+	"""Execute callbacks round-robin within the tick budget, timing each one"""
+	var count = callbacks.size()
+	if count == 0:
+		return
 
-	# Execute callbacks with error handling
-	for callback in callbacks.duplicate():  # Duplicate to avoid modification during iteration
-		if callback.is_valid():
-			# Call callback with error handling
-			var success = false
-			if callback.get_object() and is_instance_valid(callback.get_object()):
-				callback.call()
-				executed_count += 1
-				success = true
-
-			if not success:
-				print("⚠️ Tick callback failed (%s): %s" % [tick_type, str(callback)])
-				callbacks.erase(callback)
-				failed_count += 1
-		else:
-			# Remove invalid callbacks
-			callbacks.erase(callback)
-			failed_count += 1
+	var budget_usec = tick_budgets_usec.get(tick_type, 0)
+	var start = _tick_cursors[tick_type] % count
+	var tick_start_usec = Time.get_ticks_usec()
+	var executed_count = 0
+	var failed: Array[Callable] = []
+
+	# No duplicate(): failed callbacks are removed after the loop
+	var offset = 0
+	while offset < count:
+		if callbacks.size() != count:
+			break  # A callback (un)registered callbacks: resume next tick
+		var callback = callbacks[(start + offset) % count]
+		offset += 1
+
+		if not callback.is_valid() or not is_instance_valid(callback.get_object()):
+			failed.append(callback)
+			continue
+
+		var call_start_usec = Time.get_ticks_usec()
+		callback.call()
+		_record_callback_time(callback, tick_type, Time.get_ticks_usec() - call_start_usec)
+		executed_count += 1
+
+		# Over budget: the rest runs first on the next tick of this rate
+		if budget_usec > 0 and Time.get_ticks_usec() - tick_start_usec > budget_usec:
+			break
+
+	var deferred_count = count - offset
+	_tick_cursors[tick_type] = (start + offset) % count
+	if deferred_count > 0:
+		tick_stats.budget_overruns += 1
+		tick_stats.deferred_callbacks += deferred_count
+
+	# Remove invalid callbacks
+	for callback in failed:
+		print("⚠️ Tick callback failed (%s): %s" % [tick_type, str(callback)])
+		callbacks.erase(callback)
+		_callback_profiles.erase(callback)
 
 	# Log performance issues
-	if failed_count > 0:
-		print("⚠️ %s tick: %d executed, %d failed" % [tick_type, executed_count, failed_count])
+	if not failed.is_empty():
+		print("⚠️ %s tick: %d executed, %d failed" % [tick_type, executed_count, failed.size()])
+		_update_total_callbacks()
+
+
+func _record_callback_time(callback: Callable, tick_type: String, elapsed_usec: int) -> void:
+	"""Store a timing sample in the callback's ring buffer"""
+	var profile = _callback_profiles.get(callback)
+	if profile == null:
+		var samples = PackedInt32Array()
+		samples.resize(CALLBACK_SAMPLE_WINDOW)
+		profile = {
+			"name": _callback_name(callback),
+			"tick_type": tick_type,
+			"samples": samples,
+			"next_sample": 0,
+			"calls": 0,
+			"total_usec": 0,
+			"max_usec": 0
+		}
+		_callback_profiles[callback] = profile
+
+	profile.samples[profile.next_sample] = elapsed_usec
+	profile.next_sample = (profile.next_sample + 1) % CALLBACK_SAMPLE_WINDOW
+	profile.calls += 1
+	profile.total_usec += elapsed_usec
+	profile.max_usec = maxi(profile.max_usec, elapsed_usec)
+
+
+func _callback_name(callback: Callable) -> String:
+	"""Readable callback name: Owner.method (node name or class)"""
+	var owner = callback.get_object()
+	var owner_name = owner.name if owner is Node else owner.get_class()
+	return "%s.%s" % [owner_name, callback.get_method()]
+
+
+func _get_callback_profile(callback: Callable) -> Dictionary:
+	"""Get p50/p95/max timings of one callback (microseconds, recent window)"""
+	var profile = _callback_profiles.get(callback)
+	if profile == null:
+		return {}
+
+	var window = mini(profile.calls, CALLBACK_SAMPLE_WINDOW)
+	var recent = Array(profile.samples.slice(0, window))
+	recent.sort()
+
+	return {
+		"name": profile.name,
+		"tick_type": profile.tick_type,
+		"calls": profile.calls,
+		"p50_usec": recent[int((window - 1) * 0.5)],
+		"p95_usec": recent[int((window - 1) * 0.95)],
+		"max_usec": profile.max_usec,
+		"avg_usec": profile.total_usec / profile.calls
+	}
+
+
+# ═══════════════════════════════════════════════════════════════════════════════════
+# FIXED-STEP SIMULATION
+# ═══════════════════════════════════════════════════════════════════════════════════
+
+
+## Register an economy system in the fixed-step simulation
+func register_system(system_name: String, step: Callable, period: float, order: int = 0) -> void:
+	"""Run step(delta) every `period` simulated seconds; lower `order` runs first"""
+	unregister_system(system_name)
+
+	var period_steps = maxi(1, roundi(period / SIMULATION_STEP))
+	var system = {
+		"name": system_name,
+		"step": step,
+		"order": order,
+		"period_steps": period_steps,
+		"countdown": period_steps,
+		"runs": 0,
+		"total_usec": 0,
+		"last_usec": 0,
+		"max_usec": 0
+	}
+
+	# Stable insertion: same order keeps registration order
+	var index = simulation_systems.size()
+	for i in simulation_systems.size():
+		if simulation_systems[i].order > order:
+			index = i
+			break
+	simulation_systems.insert(index, system)
+
+
+## Remove a system from the simulation
+func unregister_system(system_name: String) -> void:
+	for i in simulation_systems.size():
+		if simulation_systems[i].name == system_name:
+			simulation_systems.remove_at(i)
+			return
+
+
+## Advance the simulation by real frame time
+func advance_simulation(delta: float) -> int:
+	"""Accumulator loop: runs whole steps, at most MAX_CATCH_UP_STEPS per frame"""
+	simulation_accumulator += delta
+
+	var steps = 0
+	while simulation_accumulator >= SIMULATION_STEP and steps < MAX_CATCH_UP_STEPS:
+		simulation_accumulator -= SIMULATION_STEP
+		_run_simulation_step()
+		steps += 1
+
+	# Too far behind (hitch, breakpoint): drop the backlog, offline progress covers long gaps
+	if simulation_accumulator >= SIMULATION_STEP:
+		var kept = fmod(simulation_accumulator, SIMULATION_STEP)
+		dropped_simulation_time += simulation_accumulator - kept
+		simulation_accumulator = kept
+
+	return steps
+
+
+## Run simulation steps immediately, without frame time (tests and offline simulation)
+func step_simulation(steps: int = 1) -> void:
+	for i in steps:
+		_run_simulation_step()
+
+
+## Simulated time since start, in seconds
+func get_simulation_time() -> float:
+	return simulation_step_count * SIMULATION_STEP
+
+
+func _run_simulation_step() -> void:
+	"""Run every system whose period elapsed this step, in order"""
+	simulation_step_count += 1
+
+	var i = 0
+	while i < simulation_systems.size():
+		var system = simulation_systems[i]
+		system.countdown -= 1
+		if system.countdown > 0:
+			i += 1
+			continue
+		system.countdown = system.period_steps
+
+		if not system.step.is_valid():
+			print("⚠️ Simulation system removed (invalid step): %s" % system.name)
+			simulation_systems.remove_at(i)
+			continue
+
+		var start_usec = Time.get_ticks_usec()
+		system.step.call(system.period_steps * SIMULATION_STEP)
+		var elapsed_usec = Time.get_ticks_usec() - start_usec
+
+		system.runs += 1
+		system.total_usec += elapsed_usec
+		system.last_usec = elapsed_usec
+		system.max_usec = maxi(system.max_usec, elapsed_usec)
+		i += 1
+
+
+## Per-system timing of the simulation
+func get_simulation_stats() -> Dictionary:
+	"""Get simulation clock and per-system timing (microseconds)"""
+	var systems = []
+	for system in simulation_systems:
+		systems.append(
+			{
+				"name": system.name,
+				"order": system.order,
+				"period": system.period_steps * SIMULATION_STEP,
+				"runs": system.runs,
+				"avg_usec": system.total_usec / system.runs if system.runs > 0 else 0,
+				"last_usec": system.last_usec,
+				"max_usec": system.max_usec
+			}
+		)
+
+	return {
+		"step": SIMULATION_STEP,
+		"steps": simulation_step_count,
+		"simulated_seconds": get_simulation_time(),
+		"dropped_seconds": dropped_simulation_time,
+		"systems": systems
+	}
 
 
 # ═══════════════════════════════════════════════════════════════════════════════════
@@ -216,61 +451,76 @@ func _execute_callbacks(callbacks: Array[Callable], tick_type: String):
 
 
 ## Queue a signal to be emitted in the next batch
-func queue_signal(signal_owner: Object, signal_name: String, args: Array = []):
-	"""Queue a signal to be emitted in batch to reduce cascading updates"""
+func queue_signal(
+	signal_owner: Object,
+	signal_name: String,
+	args: Array = [],
+	merge: String = MERGE_LAST_WINS,
+	key_args: int = 0
+):
+	"""Queue a signal to be emitted in batch to reduce cascading updates.
+
+	Emissions sharing owner, signal and their first `key_args` arguments coalesce
+	into one; `merge` decides how the last argument of each emission combines."""
 	if not is_instance_valid(signal_owner):
 		return
 
 	var signal_key = "%s::%s" % [signal_owner.get_instance_id(), signal_name]
-	batched_signals[signal_key] = {
-		"owner": signal_owner,
-		"signal": signal_name,
-		"args": args,
-		"queued_time": Time.get_ticks_msec()
-	}
+	for i in mini(key_args, args.size()):
+		signal_key += "::%s" % str(args[i])
+
+	if not batched_signals.has(signal_key):
+		batched_signals[signal_key] = {
+			"owner": signal_owner,
+			"signal": signal_name,
+			"args": args.duplicate(),
+			"merge": merge,
+			"queued_time": Time.get_ticks_msec(),
+			"merged": 0
+		}
+		return
+
+	var queued = batched_signals[signal_key]
+	queued.merged += 1
+	tick_stats.coalesced_signals += 1
+	if merge == MERGE_LAST_WINS or args.is_empty() or queued.args.size() != args.size():
+		queued.args = args.duplicate()
+		return
+
+	var value_index = args.size() - 1
+	match merge:
+		MERGE_SUM:
+			queued.args[value_index] += args[value_index]
+		MERGE_APPEND:
+			queued.args[value_index] = queued.args[value_index] + args[value_index]
+		_:
+			queued.args = args.duplicate()
 
 
 func _process_signal_batch():
-	"""Process all batched signals"""
+	"""Emit every coalesced signal once, with any number of arguments"""
 	if batched_signals.is_empty():
 		return
 
+	# Swap first: handlers may queue new signals for the next batch
+	var batch = batched_signals
+	batched_signals = {}
+
 	var processed_count = 0
 	var failed_count = 0
 
-	for signal_key in batched_signals.keys():
-		var signal_data = batched_signals[signal_key]
-
-		if is_instance_valid(signal_data.owner):
-			# Emit signal with error handling
-			var success = false
-			if signal_data.owner.has_signal(signal_data.signal):
-				if signal_data.args.is_empty():
-					signal_data.owner.emit_signal(signal_data.signal)
-				else:
-					var args = signal_data.args
-					# Handle different argument counts
-					match args.size():
-						0:
-							signal_data.owner.emit_signal(signal_data.signal)
-						1:
-							signal_data.owner.emit_signal(signal_data.signal, args[0])
-						2:
-							signal_data.owner.emit_signal(signal_data.signal, args[0], args[1])
-						_:
-							# For more than 2 args, use callv
-							pass
-				processed_count += 1
-				success = true
-
-			if not success:
-				print("⚠️ Batched signal failed: %s::%s" % [signal_data.owner, signal_data.signal])
-				failed_count += 1
+	for signal_data in batch.values():
+		if (
+			is_instance_valid(signal_data.owner)
+			and signal_data.owner.has_signal(signal_data.signal)
+		):
+			signal_data.owner.callv("emit_signal", [signal_data.signal] + signal_data.args)
+			processed_count += 1
 		else:
+			print("⚠️ Batched signal failed: %s::%s" % [signal_data.owner, signal_data.signal])
 			failed_count += 1
 
-	# Clear processed signals
-	batched_signals.clear()
+	tick_stats.emitted_signals += processed_count
 
 	# Log if there were issues
 	if failed_count > 0:
@@ -318,23 +568,15 @@ func create_throttled_callback(original_callback: Callable, interval: float) ->
 
 ## Pause all ticks (useful for pause menu)
 func pause_all_ticks():
-	"""Pause all tick timers"""
-	fast_tick_timer.paused = true
-	normal_tick_timer.paused = true
-	slow_tick_timer.paused = true
-	very_slow_tick_timer.paused = true
-	signal_batch_timer.paused = true
+	"""Pause all tick rates, the simulation and signal batching"""
+	ticks_paused = true
 	print("⏸️ All ticks paused")
 
 
 ## Resume all ticks
 func resume_all_ticks():
-	"""Resume all tick timers"""
-	fast_tick_timer.paused = false
-	normal_tick_timer.paused = false
-	slow_tick_timer.paused = false
-	very_slow_tick_timer.paused = false
-	signal_batch_timer.paused = false
+	"""Resume all tick rates, the simulation and signal batching"""
+	ticks_paused = false
 	print("▶️ All ticks resumed")
 
 
@@ -359,6 +601,17 @@ func get_tick_stats() -> Dictionary:
 	# Add batched signal info
 	stats["batched_signals"] = batched_signals.size()
 
+	# Add simulation clock and per-system timing
+	stats["simulation"] = get_simulation_stats()
+
+	# Add budgets and the callbacks eating them (by p95)
+	stats["budgets_usec"] = tick_budgets_usec.duplicate()
+	var profiles = []
+	for callback in _callback_profiles:
+		profiles.append(_get_callback_profile(callback))
+	profiles.sort_custom(func(a, b): return a.p95_usec > b.p95_usec)
+	stats["slowest_callbacks"] = profiles.slice(0, SLOWEST_CALLBACKS_REPORTED)
+
 	# Calculate efficiency metrics
 	var uptime_seconds = Time.get_ticks_msec() / 1000.0
 	if uptime_seconds > 0:
@@ -432,23 +685,23 @@ func optimize_for_performance_mode(mode: String):
 
 func _set_normal_tick_rates():
 	"""Set normal tick rates for good performance"""
-	fast_tick_timer.wait_time = FAST_TICK_INTERVAL
-	normal_tick_timer.wait_time = NORMAL_TICK_INTERVAL
-	slow_tick_timer.wait_time = SLOW_TICK_INTERVAL
-	very_slow_tick_timer.wait_time = VERY_SLOW_TICK_INTERVAL
+	tick_intervals.fast = FAST_TICK_INTERVAL
+	tick_intervals.normal = NORMAL_TICK_INTERVAL
+	tick_intervals.slow = SLOW_TICK_INTERVAL
+	tick_intervals.very_slow = VERY_SLOW_TICK_INTERVAL
 
 
 func _set_optimized_tick_rates():
 	"""Set optimized tick rates for medium performance"""
-	fast_tick_timer.wait_time = FAST_TICK_INTERVAL * 1.5  # 40 FPS
-	normal_tick_timer.wait_time = NORMAL_TICK_INTERVAL * 1.2  # 25 FPS
-	slow_tick_timer.wait_time = SLOW_TICK_INTERVAL  # Keep 10 FPS
-	very_slow_tick_timer.wait_time = VERY_SLOW_TICK_INTERVAL  # Keep 1 FPS
+	tick_intervals.fast = FAST_TICK_INTERVAL * 1.5  # 40 FPS
+	tick_intervals.normal = NORMAL_TICK_INTERVAL * 1.2  # 25 FPS
+	tick_intervals.slow = SLOW_TICK_INTERVAL  # Keep 10 FPS
+	tick_intervals.very_slow = VERY_SLOW_TICK_INTERVAL  # Keep 1 FPS
 
 
 func _set_emergency_tick_rates():
 	"""Set emergency tick rates for poor performance"""
-	fast_tick_timer.wait_time = FAST_TICK_INTERVAL * 2  # 30 FPS
-	normal_tick_timer.wait_time = NORMAL_TICK_INTERVAL * 2  # 15 FPS
-	slow_tick_timer.wait_time = SLOW_TICK_INTERVAL * 2  # 5 FPS
-	very_slow_tick_timer.wait_time = VERY_SLOW_TICK_INTERVAL * 2  # 0.5 FPS
+	tick_intervals.fast = FAST_TICK_INTERVAL * 2  # 30 FPS
+	tick_intervals.normal = NORMAL_TICK_INTERVAL * 2  # 15 FPS
+	tick_intervals.slow = SLOW_TICK_INTERVAL * 2  # 5 FPS
+	tick_intervals.very_slow = VERY_SLOW_TICK_INTERVAL * 2  # 0.5 FPS
@@ -10,6 +10,25 @@ signal unlock_notification(unlock_data: Dictionary)
 signal unlock_conditions_met(feature_id: String, conditions: Dictionary)
 signal progress_towards_unlock(feature_id: String, progress: Dictionary)
 
+## Condición numérica → [estadística en game_data.stat_triggers, unidades por unidad requerida]
+## Las condiciones "<feature>_unlocked" no son estadísticas: las resuelve _dependents
+const CONDITION_STATS = {
+	"total_money_earned": ["total_money_earned", 1.0],
+	"beers_produced": ["total_beers_produced", 1.0],
+	"upgrades_purchased": ["upgrades_purchased", 1.0],
+	"playtime_minutes": ["total_playtime", 60.0],
+	"total_playtime_hours": ["total_playtime", 3600.0],
+	"prestige_completed": ["prestige_count", 1.0],
+	"prestige_stars": ["prestige_stars", 1.0],
+	"tokens_earned": ["total_tokens_earned", 1.0],
+	"achievements_completed": ["achievements_completed", 1.0],
+	"gems_earned": ["total_gems_earned", 1.0],
+	"gems_spent": ["total_gems_spent", 1.0],
+	"contracts_completed": ["contracts_completed", 1.0]
+}
+## Umbrales de _update_game_phase (mismos valores que sus comparaciones)
+const PHASE_THRESHOLDS = {"total_playtime": [1800.0, 7200.0], "prestige_count": [1.0, 3.0, 10.0]}
+
 # Referencia a GameData
 var game_data: GameData
 
@@ -26,18 +45,25 @@ enum GamePhase { EARLY, MID, LATE, ENDGAME }  # 0-30 minutos  # 30-120 minutos
 
 var current_phase: GamePhase = GamePhase.EARLY
 
+# Observadores en game_data.stat_triggers: una condición cumplida despierta solo a su feature
+var _unlock_triggers: Dictionary = {}  # feature_id → {condición: handle}
+var _phase_triggers: Array = []
+var _dependents: Dictionary = {}  # feature_id → features con la condición "<feature_id>_unlocked"
+
 
 func _ready():
 	print("🔓 UnlockManager inicializado (T031 - Progressive Unlocks)")
 	_init_unlock_definitions()
 	_init_default_unlocks()
+	_index_dependents()
+
 
-	# Timer para verificar condiciones de desbloqueo
-	var check_timer = Timer.new()
-	check_timer.wait_time = 5.0  # Verificar cada 5 segundos
-	check_timer.timeout.connect(_check_unlock_conditions)
-	check_timer.autostart = true
-	add_child(check_timer)
+func set_game_data(data: GameData) -> void:
+	"""Asignar GameData y observar las estadísticas de las condiciones pendientes"""
+	if game_data:
+		_unwatch_unlock_conditions()
+	game_data = data
+	_watch_unlock_conditions()
 
 
 func _init_unlock_definitions():
@@ -208,31 +234,97 @@ func _init_default_unlocks():
 	unlocked_features["settings"] = true
 
 
-func _check_unlock_conditions():
-	"""Verifica continuamente las condiciones de desbloqueo"""
-	if not game_data:
-		return
+func _index_dependents():
+	"""Features que esperan a otra (condición "<feature>_unlocked")"""
+	_dependents.clear()
+	for feature_id in unlock_definitions:
+		for condition_key in unlock_definitions[feature_id]["conditions"]:
+			if condition_key.ends_with("_unlocked"):
+				var required_feature = condition_key.trim_suffix("_unlocked")
+				if not _dependents.has(required_feature):
+					_dependents[required_feature] = []
+				_dependents[required_feature].append(feature_id)
 
-	for feature_id in unlock_definitions.keys():
-		if not is_unlocked(feature_id):
-			var definition = unlock_definitions[feature_id]
-			var conditions = definition["conditions"]
-			var progress = _evaluate_conditions(conditions)
 
-			# Actualizar progreso
-			feature_progress[feature_id] = progress
+func _watch_unlock_conditions():
+	"""Observar las condiciones de todas las features bloqueadas y los umbrales de fase"""
+	_unwatch_unlock_conditions()
+
+	for feature_id in unlock_definitions.keys():
+		_try_unlock(feature_id)
+
+	for stat_key in PHASE_THRESHOLDS:
+		for threshold in PHASE_THRESHOLDS[stat_key]:
+			var handle = game_data.stat_triggers.watch(
+				stat_key, threshold, _on_phase_threshold_reached
+			)
+			if handle != 0:
+				_phase_triggers.append(handle)
+	_update_game_phase()
 
-			# Verificar si se cumplieron todas las condiciones
-			if _all_conditions_met(progress):
-				_unlock_feature(feature_id)
-			else:
-				# Emitir progreso hacia desbloqueo
-				progress_towards_unlock.emit(feature_id, progress)
 
-	# Actualizar fase del juego
+func _unwatch_unlock_conditions():
+	"""Quitar los observadores de game_data.stat_triggers"""
+	for feature_triggers in _unlock_triggers.values():
+		for handle in feature_triggers.values():
+			game_data.stat_triggers.unwatch(handle)
+	for handle in _phase_triggers:
+		game_data.stat_triggers.unwatch(handle)
+	_unlock_triggers.clear()
+	_phase_triggers.clear()
+
+
+func _watch_missing_conditions(feature_id: String, progress: Dictionary):
+	"""Observar cada condición numérica no cumplida en `progress` que aún no tenga observador"""
+	if not _unlock_triggers.has(feature_id):
+		_unlock_triggers[feature_id] = {}
+	var feature_triggers = _unlock_triggers[feature_id]
+	var conditions = unlock_definitions[feature_id]["conditions"]
+
+	for condition_key in conditions:
+		if feature_triggers.has(condition_key) or not CONDITION_STATS.has(condition_key):
+			continue
+		# Una condición cumplida dispararía ya su callback y volvería a _try_unlock
+		if progress.get(condition_key, {}).get("met", false):
+			continue
+		var stat = CONDITION_STATS[condition_key]
+		var threshold = float(conditions[condition_key]) * stat[1]
+		var callback = _on_unlock_condition_reached.bind(feature_id, condition_key)
+		var handle = game_data.stat_triggers.watch(stat[0], threshold, callback)
+		if handle != 0:
+			feature_triggers[condition_key] = handle
+		if is_unlocked(feature_id):
+			return  # El callback inmediato ya la desbloqueó
+
+
+func _on_unlock_condition_reached(
+	_stat_key: String, _value: float, feature_id: String, condition_key: String
+):
+	"""Una condición alcanzó su umbral: evaluar solo esta feature"""
+	_unlock_triggers.get(feature_id, {}).erase(condition_key)
+	_try_unlock(feature_id)
+
+
+func _on_phase_threshold_reached(_stat_key: String, _value: float):
 	_update_game_phase()
 
 
+func _try_unlock(feature_id: String):
+	"""Evaluar las condiciones de una feature y desbloquearla si se cumplen todas"""
+	if is_unlocked(feature_id) or not game_data:
+		return
+
+	var progress = _evaluate_conditions(unlock_definitions[feature_id]["conditions"])
+	feature_progress[feature_id] = progress
+
+	if _all_conditions_met(progress):
+		_unlock_feature(feature_id)
+	else:
+		# Emitir progreso hacia desbloqueo y volver a observar lo que retrocedió
+		progress_towards_unlock.emit(feature_id, progress)
+		_watch_missing_conditions(feature_id, progress)
+
+
 func _evaluate_conditions(conditions: Dictionary) -> Dictionary:
 	"""Evalúa el progreso hacia cumplir las condiciones"""
 	var progress = {}
@@ -345,9 +437,16 @@ func _unlock_feature(feature_id: String):
 	)
 
 	# Actualizar estadísticas
-	if not game_data.statistics.has("features_unlocked"):
-		game_data.statistics["features_unlocked"] = 0
-	game_data.statistics["features_unlocked"] += 1
+	game_data.stat_triggers.set_value(
+		"features_unlocked", game_data.statistics.get("features_unlocked", 0) + 1
+	)
+
+	# Ya no hay nada que observar para esta feature; las que la esperaban se reevalúan
+	for handle in _unlock_triggers.get(feature_id, {}).values():
+		game_data.stat_triggers.unwatch(handle)
+	_unlock_triggers.erase(feature_id)
+	for dependent_id in _dependents.get(feature_id, []):
+		_try_unlock(dependent_id)
 
 
 func _update_game_phase():
@@ -379,7 +478,11 @@ func is_unlocked(feature_id: String) -> bool:
 
 
 func get_unlock_progress(feature_id: String) -> Dictionary:
-	"""Obtiene el progreso hacia desbloquear una característica"""
+	"""Obtiene el progreso hacia desbloquear una característica (evaluado al pedirlo)"""
+	if game_data and unlock_definitions.has(feature_id) and not is_unlocked(feature_id):
+		feature_progress[feature_id] = _evaluate_conditions(
+			unlock_definitions[feature_id]["conditions"]
+		)
 	return feature_progress.get(feature_id, {})
 
 
@@ -456,6 +559,8 @@ func from_dict(data: Dictionary) -> void:
 
 	# Asegurar desbloqueos por defecto
 	_init_default_unlocks()
+	if game_data:
+		_watch_unlock_conditions()
 
 
 ## === UTILIDADES DE DEBUG ===
@@ -1,14 +1,32 @@
 extends Node
 ## SaveSystem - Sistema de guardado y carga para BAR-SIK
 ## Maneja la persistencia de datos del juego de forma centralizada
+## Los guardados usan el formato binario de SaveFormat; los JSON antiguos (Base64 con
+## prefijo "BARSIK_ENC:" o JSON plano) se siguen leyendo y se reescriben al guardar.
+## El autoguardado añade deltas por sección al journal (SaveJournal) y solo reescribe la
+## instantánea completa cada JOURNAL_COMPACT_ENTRIES registros o en un guardado explícito.
+## Autoguardado y guardados por evento copian los datos en el hilo principal y codifican y
+## escriben en WorkerThreadPool (una tarea a la vez; las peticiones intermedias se agrupan).
 
+signal save_completed(success: bool)
+
+const SAVE_VERSION = "0.4.0"
 const SAVE_FILE_PATH = "user://barsik_save.dat"
+const SAVE_TEMP_FILE_PATH = "user://barsik_save.dat.tmp"  # Escritura atómica: tmp → rename
 const BACKUP_FILE_PATH = "user://barsik_save_backup.dat"
 const BACKUP_FILE_PATH_2 = "user://barsik_save_backup_2.dat"
 const BACKUP_FILE_PATH_3 = "user://barsik_save_backup_3.dat"
+const JOURNAL_FILE_PATH = "user://barsik_save.journal"
+const JOURNAL_COMPACT_ENTRIES = 30  # Autoguardados entre instantáneas completas
+const JOURNAL_COMPACT_BYTES = 256 * 1024
 
 var current_save_data: Dictionary = {}
 
+var _journal: SaveJournal = SaveJournal.new(JOURNAL_FILE_PATH)
+var _save_task_id: int = -1  # Tarea de WorkerThreadPool en curso (-1 = ninguna)
+var _save_serial: int = 0  # Número de la última tarea lanzada
+var _pending_save: Dictionary = {}  # Última petición llegada durante la tarea: {data, incremental}
+
 
 func _ready() -> void:
 	print("💾 SaveSystem inicializado")
@@ -22,41 +40,135 @@ func _connect_to_events() -> void:
 		GameEvents.save_data_requested.connect(_on_save_requested)
 
 
-## Guardar datos del juego inmediatamente (para eventos críticos)
+## Guardar datos del juego inmediatamente (para eventos críticos) sin bloquear el frame
 func save_game_data_immediate() -> bool:
 	var game_controller = get_tree().get_first_node_in_group("game_controller")
 	if game_controller and game_controller.game_data:
-		return save_game_data_with_encryption(game_controller.game_data.to_dict())
+		save_game_data_async(game_controller.game_data.to_dict())
+		return true
 	return false
 
 
-## Guardar datos del juego con encriptación básica
+## Guardar datos del juego en formato binario (una pasada de var_to_bytes por sección,
+## comprimida y con CRC32). Conserva el nombre histórico: el guardado ya no usa Base64.
+## Síncrono (cierre, reset): espera a la tarea en curso y descarta la petición pendiente.
 func save_game_data_with_encryption(data: Dictionary) -> bool:
-	var save_data = {
-		"version": "0.2.1",
-		"timestamp": Time.get_unix_time_from_system(),
-		"checksum": _calculate_checksum(data),
-		"game_data": data
+	_wait_for_save_task()
+	_pending_save = {}
+	var result = _write_save(data, false)
+	_finish_save(result)
+	return result.success
+
+
+## Autoguardado incremental: solo las secciones modificadas van al journal
+func autosave_game_data(data: Dictionary) -> void:
+	save_game_data_async(data, true)
+
+
+## Copiar los datos en el hilo principal y codificar/escribir en WorkerThreadPool
+## Si ya hay una tarea en curso, la petición sustituye a la pendiente y se lanza al terminar.
+func save_game_data_async(data: Dictionary, incremental: bool = false) -> void:
+	var snapshot = data.duplicate(true)
+	if _save_task_id != -1:
+		# Un guardado completo pendiente no se degrada a incremental
+		var pending_incremental = _pending_save.get("incremental", true) and incremental
+		_pending_save = {"data": snapshot, "incremental": pending_incremental}
+		return
+	_start_save_task(snapshot, incremental)
+
+
+func is_saving() -> bool:
+	return _save_task_id != -1
+
+
+func _start_save_task(snapshot: Dictionary, incremental: bool) -> void:
+	_save_serial += 1
+	_save_task_id = WorkerThreadPool.add_task(
+		_run_save_task.bind(snapshot, incremental, _save_serial), false, "SaveSystem"
+	)
+
+
+## Cuerpo de la tarea (hilo de WorkerThreadPool): sin acceso al árbol ni a señales
+func _run_save_task(snapshot: Dictionary, incremental: bool, serial: int) -> void:
+	var result = _write_save(snapshot, incremental)
+	call_deferred("_on_save_task_finished", result, serial)
+
+
+func _on_save_task_finished(result: Dictionary, serial: int) -> void:
+	if _save_task_id == -1 or serial != _save_serial:
+		# Un guardado síncrono ya esperó a esta tarea y escribió datos más nuevos
+		save_completed.emit(result.success)
+		return
+
+	WorkerThreadPool.wait_for_task_completion(_save_task_id)
+	_save_task_id = -1
+	_finish_save(result)
+
+	if not _pending_save.is_empty():
+		var pending = _pending_save
+		_pending_save = {}
+		_start_save_task(pending.data, pending.incremental)
+
+
+## Esperar a la tarea en curso (guardados síncronos, cierre)
+func _wait_for_save_task() -> void:
+	if _save_task_id != -1:
+		WorkerThreadPool.wait_for_task_completion(_save_task_id)
+		_save_task_id = -1
+
+
+## Codificar y escribir (seguro fuera del hilo principal: solo toca archivos y el journal,
+## y nunca hay dos escrituras a la vez)
+func _write_save(data: Dictionary, incremental: bool) -> Dictionary:
+	var compact = (
+		_journal.entry_count >= JOURNAL_COMPACT_ENTRIES or _journal.size >= JOURNAL_COMPACT_BYTES
+	)
+	if incremental and _journal.is_active() and not compact:
+		var written = _journal.append(data)
+		if written >= 0:
+			return {"success": true, "incremental": true, "bytes": written}
+		print("⚠️ Error al escribir journal, guardando instantánea completa")
+
+	var timestamp = int(Time.get_unix_time_from_system())
+	var raw_sections = {}
+	var bytes = SaveFormat.encode(data, SAVE_VERSION, timestamp, raw_sections)
+	if not _write_atomic(bytes):
+		return {"success": false}
+
+	# La instantánea contiene todo: el journal vuelve a empezar sobre ella
+	_journal.reset(SaveJournal.snapshot_id(bytes), raw_sections)
+	return {
+		"success": true,
+		"incremental": false,
+		"bytes": bytes.size(),
+		"save_data": {"version": SAVE_VERSION, "timestamp": timestamp, "game_data": data}
 	}
 
-	# Rotar backups antes de guardar
+
+## Escribir en el temporal y renombrar: el principal nunca queda a medio escribir
+func _write_atomic(bytes: PackedByteArray) -> bool:
+	var save_file = FileAccess.open(SAVE_TEMP_FILE_PATH, FileAccess.WRITE)
+	if not save_file:
+		return false
+	save_file.store_buffer(bytes)
+	save_file.close()
+
+	# Rotar backups antes de reemplazar el principal
 	_rotate_backups()
+	return DirAccess.rename_absolute(SAVE_TEMP_FILE_PATH, SAVE_FILE_PATH) == OK
 
-	# Encriptar datos
-	var json_string = JSON.stringify(save_data)
-	var encrypted_data = _encrypt_data(json_string)
-
-	# Guardar archivo principal
-	var save_file = FileAccess.open(SAVE_FILE_PATH, FileAccess.WRITE)
-	if save_file:
-		save_file.store_string(encrypted_data)
-		save_file.close()
-		current_save_data = save_data
-		print("💾 Juego guardado con encriptación - checksum: %s" % save_data.checksum)
-		return true
 
-	print("❌ Error al guardar archivo")
-	return false
+## Resultado de un guardado (hilo principal)
+func _finish_save(result: Dictionary) -> void:
+	if not result.success:
+		print("❌ Error al guardar archivo")
+	elif result.incremental:
+		if result.bytes > 0:
+			print("📓 Autoguardado incremental: %d bytes" % result.bytes)
+	else:
+		current_save_data = result.save_data
+		print("💾 Juego guardado (binario, %d bytes)" % result.bytes)
+	save_completed.emit(result.success)
 
 
 ## Guardar datos del juego (método original, ahora usa encriptación)
@@ -67,36 +179,29 @@ func save_game_data(data: Dictionary) -> bool:
 ## Cargar datos del juego con soporte para encriptación
 func load_game_data() -> Dictionary:
 	if not FileAccess.file_exists(SAVE_FILE_PATH):
+		# Cierre entre la rotación de backups y el rename del temporal
+		if FileAccess.file_exists(SAVE_TEMP_FILE_PATH) or FileAccess.file_exists(BACKUP_FILE_PATH):
+			print("⚠️ Falta el guardado principal, intentando temporal y backups...")
+			return _try_load_backup()
 		print("📁 No existe archivo de guardado, devolviendo datos por defecto")
 		return get_default_save_data()
 
-	var save_file = FileAccess.open(SAVE_FILE_PATH, FileAccess.READ)
-	if not save_file:
-		print("❌ Error al abrir archivo de guardado")
-		return get_default_save_data()
-
-	var file_content = save_file.get_as_text()
-	save_file.close()
-
-	# Intentar cargar como archivo encriptado primero
-	var save_data = _try_load_encrypted(file_content)
-	if save_data.is_empty():
-		# Si falla, intentar como JSON plano (compatibilidad)
-		save_data = _try_load_plain_json(file_content)
-
+	var bytes = FileAccess.get_file_as_bytes(SAVE_FILE_PATH)
+	var save_data = _parse_save_bytes(bytes)
 	if save_data.is_empty():
 		print("⚠️ Error al cargar guardado, intentando backups...")
 		return _try_load_backup()
 
-	# Validar integridad con checksum si existe
-	if save_data.has("checksum"):
-		var calculated_checksum = _calculate_checksum(save_data.get("game_data", {}))
-		if save_data.checksum != calculated_checksum:
-			print("⚠️ Checksum no coincide, archivo modificado, intentando backup...")
-			return _try_load_backup()
+	# Recuperar los autoguardados posteriores a la instantánea
+	if SaveFormat.is_save_format(bytes):
+		var replayed = SaveJournal.replay(
+			JOURNAL_FILE_PATH, SaveJournal.snapshot_id(bytes), save_data.game_data
+		)
+		if replayed > 0:
+			print("📓 %d autoguardados recuperados del journal" % replayed)
 
 	current_save_data = save_data
-	print("📁 Datos cargados exitosamente - checksum válido")
+	print("📁 Datos cargados exitosamente - integridad válida")
 
 	# GameEvents puede no estar disponible aún durante la inicialización
 	if has_node("/root/GameEvents"):
@@ -105,6 +210,47 @@ func load_game_data() -> Dictionary:
 	return save_data.get("game_data", _get_default_game_data())
 
 
+## Abrir el guardado para carga diferida: decodifica ya todo salvo `lazy_sections`, que se
+## leen del SaveSectionReader devuelto cuando se piden (GameData.lazy_source).
+## null si no hay guardado binario válido (falta, JSON antiguo o corrupto): usar load_game_data
+func open_game_data(lazy_sections: Array) -> SaveSectionReader:
+	if not FileAccess.file_exists(SAVE_FILE_PATH):
+		return null
+
+	var bytes = FileAccess.get_file_as_bytes(SAVE_FILE_PATH)
+	var header = SaveFormat.read_header(bytes)
+	if header.is_empty():
+		return null
+
+	var journal_data = {}
+	var replayed = SaveJournal.replay(
+		JOURNAL_FILE_PATH, SaveJournal.snapshot_id(bytes), journal_data
+	)
+	if replayed > 0:
+		print("📓 %d autoguardados recuperados del journal" % replayed)
+
+	var reader = SaveSectionReader.new(
+		bytes, header, journal_data, [BACKUP_FILE_PATH, BACKUP_FILE_PATH_2, BACKUP_FILE_PATH_3]
+	)
+	var save_data = {
+		"version": reader.version,
+		"timestamp": reader.timestamp,
+		"game_data": reader.read_eager(lazy_sections)
+	}
+	# Solo se validan las secciones ya leídas; las diferidas pasan su CRC32 al pedirse
+	if not _validate_save_data(save_data):
+		print("⚠️ Guardado no válido para carga diferida, se carga completo")
+		return null
+
+	current_save_data = save_data
+	print("📁 Datos cargados (secciones diferidas: %s)" % ", ".join(lazy_sections))
+
+	if has_node("/root/GameEvents"):
+		GameEvents.data_loaded.emit()
+
+	return reader
+
+
 ## Obtener solo los datos de juego por defecto (sin metadatos)
 func _get_default_game_data() -> Dictionary:
 	return {
@@ -158,8 +304,10 @@ func _create_backup() -> bool:
 func _try_load_backup() -> Dictionary:
 	print("🔄 Intentando cargar backups...")
 
-	# Intentar backup 1, 2, 3 en orden
-	var backup_paths = [BACKUP_FILE_PATH, BACKUP_FILE_PATH_2, BACKUP_FILE_PATH_3]
+	# Intentar el temporal (solo queda si el rename no llegó a hacerse) y backup 1, 2, 3 en orden
+	var backup_paths = [
+		SAVE_TEMP_FILE_PATH, BACKUP_FILE_PATH, BACKUP_FILE_PATH_2, BACKUP_FILE_PATH_3
+	]
 
 	for i in range(backup_paths.size()):
 		var backup_path = backup_paths[i]
@@ -168,20 +316,8 @@ func _try_load_backup() -> Dictionary:
 		if not FileAccess.file_exists(backup_path):
 			continue
 
-		var backup_file = FileAccess.open(backup_path, FileAccess.READ)
-		if not backup_file:
-			continue
-
-		var file_content = backup_file.get_as_text()
-		backup_file.close()
-
-		# Intentar cargar como encriptado primero
-		var save_data = _try_load_encrypted(file_content)
-		if save_data.is_empty():
-			# Si falla, intentar como JSON plano
-			save_data = _try_load_plain_json(file_content)
-
-		if not save_data.is_empty() and _validate_save_data(save_data):
+		var save_data = _read_save_file(backup_path)
+		if not save_data.is_empty():
 			print("✅ Backup %d cargado exitosamente" % [i + 1])
 			return save_data.get("game_data", _get_default_game_data())
 
@@ -189,6 +325,42 @@ func _try_load_backup() -> Dictionary:
 	return get_default_save_data()
 
 
+## Leer un archivo de guardado binario o JSON antiguo ({} si falta, está corrupto o no valida)
+func _read_save_file(path: String) -> Dictionary:
+	return _parse_save_bytes(FileAccess.get_file_as_bytes(path))
+
+
+func _parse_save_bytes(bytes: PackedByteArray) -> Dictionary:
+	if bytes.is_empty():
+		return {}
+
+	if SaveFormat.is_save_format(bytes):
+		var save_data = SaveFormat.decode(bytes)
+		return save_data if not save_data.is_empty() and _validate_save_data(save_data) else {}
+
+	return _import_json_save(bytes.get_string_from_utf8())
+
+
+## Importar un guardado JSON antiguo (encriptado o plano); se reescribe en binario al guardar
+func _import_json_save(content: String) -> Dictionary:
+	# Intentar cargar como archivo encriptado primero
+	var save_data = _try_load_encrypted(content)
+	if save_data.is_empty():
+		# Si falla, intentar como JSON plano (compatibilidad)
+		save_data = _try_load_plain_json(content)
+
+	# Validar integridad con checksum si existe
+	if save_data.has("checksum"):
+		var calculated_checksum = _calculate_checksum(save_data.get("game_data", {}))
+		if save_data.checksum != calculated_checksum:
+			print("⚠️ Checksum no coincide, archivo modificado")
+			return {}
+
+	if not save_data.is_empty():
+		print("📥 Guardado JSON antiguo importado")
+	return save_data
+
+
 ## Validar estructura del archivo de guardado
 func _validate_save_data(data: Dictionary) -> bool:
 	if not data.has("version"):
@@ -231,13 +403,7 @@ func _on_save_requested() -> void:
 	save_game_data_immediate()
 
 
-## Funciones de encriptación y seguridad
-func _encrypt_data(data: String) -> String:
-	# Encriptación muy simple: solo Base64 con prefijo para identificar archivos encriptados
-	var prefixed_data = "BARSIK_ENC:" + data
-	return Marshalls.utf8_to_base64(prefixed_data)
-
-
+## Lectura de guardados JSON antiguos (Base64 con prefijo "BARSIK_ENC:")
 func _decrypt_data(encrypted_data: String) -> String:
 	# Decodificar base64
 	var decoded = Marshalls.base64_to_utf8(encrypted_data)
@@ -279,20 +445,25 @@ func _try_load_plain_json(content: String) -> Dictionary:
 
 
 func _rotate_backups() -> void:
-	# Rotar: 2→3, 1→2, principal→1
+	# Rotar: 2→3, 1→2, principal→1 renombrando (sin copiar): el principal se reescribe después
 	if FileAccess.file_exists(BACKUP_FILE_PATH_2):
-		DirAccess.copy_absolute(BACKUP_FILE_PATH_2, BACKUP_FILE_PATH_3)
+		DirAccess.rename_absolute(BACKUP_FILE_PATH_2, BACKUP_FILE_PATH_3)
 	if FileAccess.file_exists(BACKUP_FILE_PATH):
-		DirAccess.copy_absolute(BACKUP_FILE_PATH, BACKUP_FILE_PATH_2)
+		DirAccess.rename_absolute(BACKUP_FILE_PATH, BACKUP_FILE_PATH_2)
 	if FileAccess.file_exists(SAVE_FILE_PATH):
-		DirAccess.copy_absolute(SAVE_FILE_PATH, BACKUP_FILE_PATH)
+		DirAccess.rename_absolute(SAVE_FILE_PATH, BACKUP_FILE_PATH)
 
 
 ## Guardar al salir del juego
 func _notification(what: int) -> void:
 	if what == NOTIFICATION_WM_CLOSE_REQUEST:
 		print("💾 Guardando al cerrar aplicación...")
-		# El GameManager debería manejar el guardado real
+		# El GameManager debería manejar el guardado real; no dejar una escritura a medias
+		_wait_for_save_task()
+
+
+func _exit_tree() -> void:
+	_wait_for_save_task()
 
 
 ## GESTIÓN DE SLOTS Y RESET
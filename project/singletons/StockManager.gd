@@ -5,6 +5,9 @@ extends Node
 signal stock_updated(item_type: String, item_name: String, new_quantity: int)
 signal stock_depleted(item_type: String, item_name: String)
 
+## Límite por defecto para items sin capacidad configurada
+const UNLIMITED_STOCK: int = 999999
+
 var game_data: GameData
 
 
@@ -36,6 +39,19 @@ func get_stock(item_type: String, item_name: String) -> int:
 			return 0
 
 
+## Capacidad máxima de un item (mismo límite que aplica GeneratorManager al generar)
+## Los productos no tienen límite de almacenamiento propio
+func get_max_stock(item_type: String, item_name: String) -> int:
+	if not game_data:
+		return 0
+
+	match item_type:
+		"ingredient", "resource":
+			return int(game_data.resource_limits.get(item_name, UNLIMITED_STOCK))
+		_:
+			return UNLIMITED_STOCK
+
+
 ## Obtener todo el stock de un tipo
 func get_all_stock(item_type: String) -> Dictionary:
 	if not game_data:
@@ -94,12 +110,14 @@ func add_stock(item_type: String, item_name: String, quantity: int) -> bool:
 	match item_type:
 		"ingredient", "resource":
 			game_data.resources[item_name] = new_quantity
+			game_data.mark_dirty("resources", item_name)
 		"product":
 			game_data.products[item_name] = new_quantity
+			game_data.mark_dirty("products", item_name)
 		_:
 			return false
 
-	stock_updated.emit(item_type, item_name, new_quantity)
+	_emit_stock_updated(item_type, item_name, new_quantity)
 	return true
 
 
@@ -123,12 +141,14 @@ func remove_stock(item_type: String, item_name: String, quantity: int) -> bool:
 	match item_type:
 		"ingredient", "resource":
 			game_data.resources[item_name] = new_quantity
+			game_data.mark_dirty("resources", item_name)
 		"product":
 			game_data.products[item_name] = new_quantity
+			game_data.mark_dirty("products", item_name)
 		_:
 			return false
 
-	stock_updated.emit(item_type, item_name, new_quantity)
+	_emit_stock_updated(item_type, item_name, new_quantity)
 
 	if new_quantity == 0:
 		stock_depleted.emit(item_type, item_name)
@@ -225,3 +245,21 @@ func consume_recipe(recipe: Dictionary, quantity: int = 1) -> bool:
 			return false
 
 	return true
+
+
+## === SEÑALES ===
+
+
+## stock_updated agrupado por item: varios cambios del mismo item en un frame
+## llegan como una sola emisión con la cantidad final
+func _emit_stock_updated(item_type: String, item_name: String, new_quantity: int) -> void:
+	if is_instance_valid(TickManager.instance):
+		TickManager.instance.queue_signal(
+			self,
+			"stock_updated",
+			[item_type, item_name, new_quantity],
+			TickManager.MERGE_LAST_WINS,
+			2
+		)
+	else:
+		stock_updated.emit(item_type, item_name, new_quantity)
@@ -3,38 +3,22 @@
 Test para verificar la configuración de estaciones y recetas
 """
 
+import sys
+from pathlib import Path
+
+PROJECT_PATH = Path(__file__).resolve().parents[2]
+GAME_CONFIG_PATH = PROJECT_PATH / "scripts" / "core" / "GameConfig.gd"
+sys.path.insert(0, str(PROJECT_PATH.parent / "tools"))
+
+from gdscript_parser import constant_values  # noqa: E402
+
 def test_station_recipes():
     """Simular el funcionamiento de _format_recipe_with_availability"""
 
-    # Simular GameConfig.STATION_DATA
-    STATION_DATA = {
-        "brewery": {
-            "name": "Cervecería",
-            "description": "Produce cerveza",
-            "emoji": "🏭",
-            "base_price": 50.0,
-            "recipe": {"barley": 2, "hops": 1, "water": 3},
-            "produces": "basic_beer",
-            "products": ["basic_beer", "premium_beer"]
-        },
-        "bar_station": {
-            "name": "Estación de Bar",
-            "description": "Prepara cócteles",
-            "emoji": "🍸",
-            "base_price": 75.0,
-            "recipe": {"water": 1, "yeast": 1},
-            "produces": "cocktail",
-            "products": ["cocktail"]
-        }
-    }
-
-    # Simular GameConfig.RESOURCE_DATA
-    RESOURCE_DATA = {
-        "barley": {"name": "Cebada", "emoji": "🌾"},
-        "hops": {"name": "Lúpulo", "emoji": "🌱"},
-        "water": {"name": "Agua", "emoji": "🧃"},
-        "yeast": {"name": "Levadura", "emoji": "🍞"}
-    }
+    # Datos reales de GameConfig.gd (mismo parser que las herramientas de tools/)
+    config = constant_values(GAME_CONFIG_PATH.read_text(encoding='utf-8'))
+    STATION_DATA = config["STATION_DATA"]
+    RESOURCE_DATA = config["RESOURCE_DATA"]
 
     # Simular recursos disponibles (estado actual del juego)
     current_resources = {
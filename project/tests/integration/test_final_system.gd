@@ -93,18 +93,13 @@ func _test_realtime_generation(game_controller) -> void:
 	var gen_manager = game_controller.generator_manager
 	var game_data = game_controller.game_data
 
-	# Verificar estado del timer
-	if gen_manager.generation_timer:
-		var is_active = not gen_manager.generation_timer.is_stopped()
-		print("✅ Timer existe - Activo: %s" % is_active)
-		print(
-			(
-				"⏰ Tiempo restante: %.1fs de %.1fs"
-				% [gen_manager.generation_timer.time_left, gen_manager.generation_timer.wait_time]
-			)
-		)
+	# Verificar estado del sistema de generación en el scheduler
+	var generation_system = _find_simulation_system(game_controller, "generators")
+	if not generation_system.is_empty():
+		print("✅ Sistema de generación registrado - Ejecuciones: %d" % generation_system.runs)
+		print("⏰ Periodo: %.1fs (%s)" % [generation_system.period, gen_manager.name])
 	else:
-		print("❌ Timer no existe")
+		print("❌ Sistema de generación no registrado")
 
 	# Mostrar generadores que pueden generar
 	print("🏭 Generadores que pueden generar:")
@@ -120,3 +115,12 @@ func _test_realtime_generation(game_controller) -> void:
 	print("✅ GenerationPanel usa cálculos consistentes - IMPLEMENTADO")
 	print("🔍 Pendiente: Verificar que UI actualiza precios después de compra")
 	print("🔍 Pendiente: Confirmar persistencia después de reset manual")
+
+
+func _find_simulation_system(game_controller, system_name: String) -> Dictionary:
+	if not game_controller.tick_manager:
+		return {}
+	for system in game_controller.tick_manager.get_simulation_stats().systems:
+		if system.name == system_name:
+			return system
+	return {}
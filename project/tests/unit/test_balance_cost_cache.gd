@@ -0,0 +1,63 @@
+extends "res://addons/gut/test.gd"
+
+## Tests del memo de costos de MathematicalBalanceManager
+## Mismo resultado que el cálculo directo, invalidación por fase y tamaño acotado
+
+const EARLY_PROGRESS = {"money": 1000, "prestige_count": 0, "max_generator_level": 5}
+const MID_PROGRESS = {"money": 50000, "prestige_count": 0, "max_generator_level": 25}
+const LATE_PROGRESS = {"money": 1000000, "prestige_count": 2, "max_generator_level": 60}
+
+var math_manager: MathematicalBalanceManager
+
+
+func before_each():
+	math_manager = MathematicalBalanceManager.new()
+
+
+func after_each():
+	if math_manager:
+		math_manager.free()
+
+
+func test_cached_cost_matches_direct_computation():
+	"""Test: El memo devuelve lo mismo que el cálculo sin memo en todas las fases"""
+	for progress in [EARLY_PROGRESS, MID_PROGRESS, LATE_PROGRESS]:
+		for item_type in ["generator", "station", "upgrade", "automation", "prestige"]:
+			for level in [1, 10, 16, 45, 51, 80]:
+				var expected = math_manager._compute_optimized_cost(
+					100.0, level, item_type, progress
+				)
+				# Dos veces: la segunda sale del memo
+				assert_eq(
+					math_manager.get_optimized_cost(100.0, level, item_type, progress), expected
+				)
+				assert_eq(
+					math_manager.get_optimized_cost(100.0, level, item_type, progress), expected
+				)
+
+
+func test_repeated_queries_hit_cache():
+	"""Test: Repetir consultas en la misma fase no recalcula"""
+	math_manager.get_optimized_cost(100.0, 5, "generator", EARLY_PROGRESS)
+	var misses = math_manager.cost_cache_misses
+	for i in range(10):
+		math_manager.get_optimized_cost(100.0, 5, "generator", EARLY_PROGRESS)
+	assert_eq(math_manager.cost_cache_misses, misses, "Consultas repetidas recalcularon el costo")
+	assert_eq(math_manager.cost_cache_hits, 10)
+
+
+func test_phase_change_invalidates_cache():
+	"""Test: Cruzar un límite de fase recalcula con la curva nueva"""
+	var early_cost = math_manager.get_optimized_cost(100.0, 5, "generator", EARLY_PROGRESS)
+	var mid_cost = math_manager.get_optimized_cost(100.0, 5, "generator", MID_PROGRESS)
+	assert_ne(early_cost, mid_cost, "El costo no cambió al pasar a mid game")
+	assert_eq(math_manager.cost_cache_misses, 2)
+
+
+func test_cache_size_is_bounded():
+	"""Test: La tabla nunca supera dos generaciones"""
+	var limit = MathematicalBalanceManager.COST_CACHE_GENERATION_SIZE
+	for level in range(limit * 3):
+		math_manager.get_optimized_cost(100.0, level, "generator", EARLY_PROGRESS)
+	var size = math_manager._cost_cache_hot.size() + math_manager._cost_cache_cold.size()
+	assert_true(size <= limit * 2, "Memo sin acotar: %d entradas" % size)
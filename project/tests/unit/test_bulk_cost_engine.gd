@@ -0,0 +1,79 @@
+extends "res://addons/gut/test.gd"
+
+## Tests del motor de costos en bloque de GameUtils
+## Series geométricas por tramo y búsqueda de la máxima cantidad asequible
+
+
+func _loop_bulk_cost(
+	base_cost: float, current_level: int, quantity: int, item_type: String
+) -> float:
+	"""Referencia: sumar nivel a nivel"""
+	var total_cost = 0.0
+	for i in range(quantity):
+		total_cost += GameUtils.get_scaled_cost(base_cost, current_level + i + 1, item_type)
+	return total_cost
+
+
+## === TESTS DE COSTO EN BLOQUE ===
+
+
+func test_bulk_cost_matches_loop_across_generator_tiers():
+	"""Test: La fórmula cerrada coincide con la suma en los tramos 1.12/1.18/1.25"""
+	for current_level in [0, 5, 9, 10, 24, 25, 40]:
+		for quantity in [1, 2, 7, 20, 35]:
+			var expected = _loop_bulk_cost(100.0, current_level, quantity, "generator")
+			var actual = GameUtils.get_bulk_scaled_cost(100.0, current_level, quantity, "generator")
+			assert_almost_eq(
+				actual, expected, expected * 1e-9, "Costo en bloque distinto a la suma"
+			)
+
+
+func test_bulk_cost_other_item_types():
+	"""Test: Curvas de un tramo y de dos tramos (clientes)"""
+	for item_type in ["station", "upgrade", "customer", "automation", "default"]:
+		var expected = _loop_bulk_cost(25.0, 3, 12, item_type)
+		var actual = GameUtils.get_bulk_scaled_cost(25.0, 3, 12, item_type)
+		assert_almost_eq(actual, expected, expected * 1e-9, "Curva %s incorrecta" % item_type)
+
+
+func test_bulk_cost_zero_quantity():
+	"""Test: Comprar 0 unidades no cuesta nada"""
+	assert_eq(GameUtils.get_bulk_scaled_cost(100.0, 5, 0, "generator"), 0.0)
+	assert_eq(GameUtils.calculate_exponential_cost(100.0, 5, 0), 0.0)
+
+
+func test_exponential_cost_closed_form():
+	"""Test: calculate_exponential_cost mantiene el resultado de la suma"""
+	var expected = 0.0
+	for i in range(15):
+		expected += 10.0 * pow(1.15, 3 + i)
+	assert_almost_eq(GameUtils.calculate_exponential_cost(10.0, 3, 15), expected, expected * 1e-9)
+
+
+## === TESTS DE MÁXIMO ASEQUIBLE ===
+
+
+func test_max_affordable_is_largest_affordable_quantity():
+	"""Test: n es asequible y n + 1 no"""
+	for money in [50.0, 100.0, 1234.5, 1e5, 1e9]:
+		for current_level in [0, 8, 22, 30]:
+			var n = GameUtils.get_max_affordable_quantity(money, 100.0, current_level, "generator")
+			if n > 0:
+				assert_true(
+					GameUtils.get_bulk_scaled_cost(100.0, current_level, n, "generator") <= money,
+					"La cantidad devuelta no es asequible"
+				)
+			assert_true(
+				GameUtils.get_bulk_scaled_cost(100.0, current_level, n + 1, "generator") > money,
+				"Se podía comprar una unidad más"
+			)
+
+
+func test_max_affordable_without_money():
+	"""Test: Sin dinero suficiente para una unidad devuelve 0"""
+	assert_eq(GameUtils.get_max_affordable_quantity(99.0, 100.0, 0, "generator"), 0)
+
+
+func test_max_affordable_respects_cap():
+	"""Test: El resultado nunca supera max_quantity"""
+	assert_eq(GameUtils.get_max_affordable_quantity(1e12, 1.0, 0, "station", 25), 25)
@@ -0,0 +1,64 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de GameConfigTables
+## Las tablas empaquetadas deben reflejar exactamente los Dictionary de GameConfig
+
+
+func test_index_maps_match_ids():
+	"""Test: id → índice → id es la identidad en todas las tablas"""
+	for pair in [
+		[GameConfigTables.resource_ids, GameConfigTables.resource_index],
+		[GameConfigTables.product_ids, GameConfigTables.product_index],
+		[GameConfigTables.generator_ids, GameConfigTables.generator_index],
+		[GameConfigTables.station_ids, GameConfigTables.station_index]
+	]:
+		var ids: PackedStringArray = pair[0]
+		var index: Dictionary = pair[1]
+		assert_eq(ids.size(), index.size(), "Índice con tamaño distinto a la tabla")
+		for i in ids.size():
+			assert_eq(index[ids[i]], i, "Índice incorrecto para %s" % ids[i])
+
+
+func test_generator_tables_match_config():
+	"""Test: Precios y recurso producido de cada generador"""
+	assert_eq(GameConfigTables.generator_ids.size(), GameConfig.GENERATOR_DATA.size())
+	for generator_id in GameConfig.GENERATOR_DATA:
+		var data = GameConfig.GENERATOR_DATA[generator_id]
+		var i = GameConfigTables.generator_index[generator_id]
+		assert_eq(GameConfigTables.generator_base_price[i], data.base_price)
+		var resource = GameConfigTables.generator_resource[i]
+		assert_eq(GameConfigTables.resource_ids[resource], data.resource_type)
+
+
+func test_recipe_matrices_match_config():
+	"""Test: Cada fila de receta reproduce el Dictionary original"""
+	for product_id in GameConfig.PRODUCT_DATA:
+		var row = GameConfigTables.product_index[product_id]
+		var recipe = GameConfigTables.recipe_row(GameConfigTables.product_recipes, row)
+		assert_eq(recipe.size(), GameConfig.PRODUCT_DATA[product_id].recipe.size())
+		for resource_id in GameConfig.PRODUCT_DATA[product_id].recipe:
+			assert_eq(
+				recipe[resource_id], float(GameConfig.PRODUCT_DATA[product_id].recipe[resource_id])
+			)
+
+	for station_id in GameConfig.STATION_DATA:
+		var row = GameConfigTables.station_index[station_id]
+		var data = GameConfig.STATION_DATA[station_id]
+		for resource_id in data.recipe:
+			var column = GameConfigTables.resource_index[resource_id]
+			assert_eq(
+				GameConfigTables.recipe_amount(GameConfigTables.station_recipes, row, column),
+				float(data.recipe[resource_id])
+			)
+		var product = GameConfigTables.station_product[row]
+		assert_eq(GameConfigTables.product_ids[product], data.produces)
+
+
+func test_managers_find_definitions_by_index():
+	"""Test: Las búsquedas por id de los managers usan las tablas"""
+	var production_manager = ProductionManager.new()
+	var station_def = production_manager._find_station_by_id("brewery")
+	assert_eq(station_def.id, "brewery")
+	assert_eq(station_def.base_cost, GameConfig.STATION_DATA.brewery.base_price)
+	assert_true(production_manager._find_station_by_id("no_existe").is_empty())
+	production_manager.free()
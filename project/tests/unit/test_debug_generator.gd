@@ -45,21 +45,17 @@ func _debug_check_generation() -> void:
 	var gen_manager = game_controller.generator_manager
 	if gen_manager:
 		print("✅ GeneratorManager existe")
-		if gen_manager.generation_timer:
-			print(
-				"✅ Timer de generación existe - Activo: %s" % gen_manager.generation_timer.autostart
-			)
+		var tick_manager = game_controller.tick_manager
+		if tick_manager:
+			print("✅ Scheduler de simulación existe")
 			print(
 				(
-					"⏰ Timer: %.1fs restantes de %.1fs"
-					% [
-						gen_manager.generation_timer.time_left,
-						gen_manager.generation_timer.wait_time
-					]
+					"⏰ Generación cada %.1fs | tiempo simulado: %.1fs"
+					% [gen_manager.GENERATION_PERIOD, tick_manager.get_simulation_time()]
 				)
 			)
 		else:
-			print("❌ Timer de generación NO existe")
+			print("❌ Scheduler de simulación NO existe")
 	else:
 		print("❌ GeneratorManager NO existe")
 
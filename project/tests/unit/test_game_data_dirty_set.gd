@@ -0,0 +1,60 @@
+extends "res://addons/gut/test.gd"
+
+## Tests del dirty-set de GameData
+## Los mutadores registran qué cambió para que la UI refresque solo esas secciones
+
+var game_data: GameData
+
+
+func before_each():
+	game_data = GameData.new()
+	game_data.consume_dirty()
+
+
+func test_new_data_starts_clean():
+	"""Test: Tras consumir, no quedan cambios pendientes"""
+	assert_false(game_data.has_dirty_changes())
+	assert_eq(game_data.consume_dirty(), {})
+
+
+func test_currency_setters_mark_currencies():
+	"""Test: money, tokens y gems marcan la sección currencies"""
+	game_data.money += 10.0
+	game_data.add_tokens(3)
+	game_data.spend_gems(1)
+
+	var dirty = game_data.consume_dirty()
+	assert_eq(dirty.keys(), ["currencies"])
+	assert_true(dirty.currencies.has("money"))
+	assert_true(dirty.currencies.has("tokens"))
+	assert_true(dirty.currencies.has("gems"))
+
+
+func test_consume_resets_dirty_set():
+	"""Test: consume_dirty devuelve lo acumulado y empieza de cero"""
+	game_data.mark_dirty("generators", "barley_farm")
+	assert_true(game_data.has_dirty_changes())
+	assert_eq(game_data.consume_dirty(), {"generators": {"barley_farm": true}})
+	assert_false(game_data.has_dirty_changes())
+
+
+func test_from_dict_marks_every_section():
+	"""Test: Cargar datos marca todas las secciones completas"""
+	game_data.from_dict({"money": 75.0})
+	var dirty = game_data.consume_dirty()
+	for section in GameData.DIRTY_SECTIONS:
+		assert_true(dirty.has(section), "Sección sin marcar: %s" % section)
+		assert_true(dirty[section].has(GameData.DIRTY_ALL_KEYS))
+
+
+func test_stock_manager_marks_changed_items():
+	"""Test: StockManager marca solo el item modificado"""
+	var previous_data = StockManager.game_data
+	StockManager.set_game_data(game_data)
+
+	StockManager.add_stock("ingredient", "barley", 5)
+	StockManager.remove_stock("ingredient", "barley", 2)
+	var dirty = game_data.consume_dirty()
+
+	StockManager.game_data = previous_data
+	assert_eq(dirty, {"resources": {"barley": true}})
@@ -0,0 +1,65 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de detección de cambios por versión en GameStateManager
+## Solo se notifican las secciones cuya versión avanzó desde la última sincronización
+
+const GAME_STATE_MANAGER_SCRIPT = preload("res://scripts/core/GameStateManager.gd")
+
+var state_manager: Node
+var game_data: GameData
+
+
+func before_each():
+	state_manager = GAME_STATE_MANAGER_SCRIPT.new()
+	game_data = GameData.new()
+
+
+func after_each():
+	state_manager.free()
+
+
+func test_mutators_bump_section_versions():
+	"""Test: Setters y mark_dirty incrementan solo la sección afectada"""
+	var money_version = game_data.section_versions.get("currencies", 0)
+	game_data.add_money(10.0)
+	assert_eq(game_data.section_versions.currencies, money_version + 1)
+	assert_false(game_data.section_versions.has("resources"))
+
+	game_data.mark_dirty("resources", "barley")
+	assert_eq(game_data.section_versions.resources, 1)
+
+
+func test_first_sync_notifies_every_section():
+	"""Test: La primera sincronización con una instancia emite todas las señales"""
+	watch_signals(state_manager)
+	state_manager.sync_with(game_data)
+	assert_signal_emit_count(state_manager, "money_changed", 1)
+	assert_signal_emit_count(state_manager, "resources_changed", 1)
+	assert_signal_emit_count(state_manager, "generators_changed", 1)
+	assert_signal_emit_count(state_manager, "stations_changed", 1)
+	assert_signal_emit_count(state_manager, "products_changed", 1)
+
+
+func test_only_changed_sections_are_notified():
+	"""Test: Sin cambios no hay señales; un cambio de recurso emite solo resources_changed"""
+	state_manager.sync_with(game_data)
+	watch_signals(state_manager)
+
+	state_manager.sync_with(game_data)
+	assert_signal_not_emitted(state_manager, "game_state_updated")
+
+	game_data.resources["barley"] = 7
+	game_data.mark_dirty("resources", "barley")
+	state_manager.sync_with(game_data)
+	assert_signal_emit_count(state_manager, "resources_changed", 1)
+	assert_signal_not_emitted(state_manager, "generators_changed")
+	assert_signal_not_emitted(state_manager, "money_changed")
+	assert_eq(state_manager.get_current_resources().barley, 7)
+
+
+func test_new_instance_resets_versions():
+	"""Test: Reemplazar GameData (reset) vuelve a notificar todo"""
+	state_manager.sync_with(game_data)
+	watch_signals(state_manager)
+	state_manager.sync_with(GameData.new())
+	assert_signal_emit_count(state_manager, "stations_changed", 1)
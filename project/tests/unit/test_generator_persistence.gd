@@ -100,11 +100,15 @@ func _test_reset_and_verify(game_controller) -> void:
 	print("🏭 Generadores antes: %s" % before_generators)
 	print("🏭 Generadores después: %s" % game_controller.game_data.generators)
 
-	# Verificar que el timer siga funcionando
-	var gen_manager = game_controller.generator_manager
-	if gen_manager.generation_timer and not gen_manager.generation_timer.is_stopped():
-		print("✅ Timer de generación sigue activo después del reset")
+	# Verificar que la generación siga registrada en el scheduler
+	var tick_manager = game_controller.tick_manager
+	var system_names = []
+	if tick_manager:
+		for system in tick_manager.get_simulation_stats().systems:
+			system_names.append(system.name)
+	if "generators" in system_names:
+		print("✅ Sistema de generación sigue activo después del reset")
 	else:
-		print("❌ Timer de generación roto después del reset")
+		print("❌ Sistema de generación roto después del reset")
 
 	print("🧪 === FIN DEL TEST ===\n")
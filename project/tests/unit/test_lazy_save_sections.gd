@@ -0,0 +1,124 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de carga diferida por secciones
+## Logros, misiones y desbloqueos se leen del guardado al primer acceso desde GameData
+
+const BACKUP_PATH = "user://test_lazy_save_sections_backup.dat"
+
+var saved: Dictionary
+
+
+func before_each():
+	var source = GameData.new()
+	source.money = 777.0
+	source.unlocked_achievements.assign(["first_beer", "first_sale"])
+	source.active_missions = {"serve_customers": {"target": 10, "progress": 4}}
+	source.last_mission_reset = 1700000000
+	source.unlock_data = {"features_unlocked": ["customers"]}
+	saved = source.to_dict()
+
+
+func after_each():
+	DirAccess.remove_absolute(BACKUP_PATH)
+
+
+func _open(bytes: PackedByteArray, fallback_paths: Array = []) -> SaveSectionReader:
+	return SaveSectionReader.new(bytes, SaveFormat.read_header(bytes), {}, fallback_paths)
+
+
+func _load_lazy(reader: SaveSectionReader) -> GameData:
+	var data = GameData.new()
+	data.from_dict(reader.read_eager(GameData.LAZY_SECTIONS))
+	data.lazy_source = reader
+	return data
+
+
+func test_eager_read_skips_lazy_sections():
+	"""Test: read_eager trae monedas y recursos pero no logros, misiones ni desbloqueos"""
+	var reader = _open(SaveFormat.encode(saved, "0.4.0", 0))
+	var eager = reader.read_eager(GameData.LAZY_SECTIONS)
+
+	assert_eq(eager.money, 777.0)
+	assert_true(eager.has("resources"))
+	assert_false(eager.has("active_missions"))
+	assert_false(eager.has("unlocked_achievements"))
+	assert_false(eager.has("unlock_data"))
+
+
+func test_lazy_properties_hydrate_on_first_access():
+	"""Test: Leer una propiedad diferida carga su sección desde el guardado"""
+	var data = _load_lazy(_open(SaveFormat.encode(saved, "0.4.0", 0)))
+
+	assert_eq(data.active_missions, saved.active_missions)
+	assert_eq(data.last_mission_reset, 1700000000)
+	assert_eq(data.unlocked_achievements, ["first_beer", "first_sale"])
+	assert_eq(data.unlock_data, {"features_unlocked": ["customers"]})
+	assert_null(data.lazy_source, "Hidratadas todas las secciones se suelta el guardado")
+
+
+func test_write_before_read_keeps_rest_of_section():
+	"""Test: Escribir una clave diferida hidrata antes su sección y no pierde las demás"""
+	var data = _load_lazy(_open(SaveFormat.encode(saved, "0.4.0", 0)))
+
+	data.last_mission_reset = 1800000000
+
+	assert_eq(data.last_mission_reset, 1800000000)
+	assert_eq(data.active_missions, saved.active_missions)
+
+
+func test_to_dict_includes_pending_sections():
+	"""Test: Guardar con secciones pendientes escribe los datos del guardado, no los vacíos"""
+	var data = _load_lazy(_open(SaveFormat.encode(saved, "0.4.0", 0)))
+
+	var dict = data.to_dict()
+
+	assert_eq(dict.active_missions, saved.active_missions)
+	assert_eq(dict.unlocked_achievements, saved.unlocked_achievements)
+
+
+func test_journal_overlay_applies_to_lazy_sections():
+	"""Test: Los autoguardados del journal se aplican también a las secciones diferidas"""
+	var bytes = SaveFormat.encode(saved, "0.4.0", 0)
+	var journal = {"last_mission_reset": 1900000000, "active_missions": {}}
+	var reader = SaveSectionReader.new(bytes, SaveFormat.read_header(bytes), journal)
+	var data = _load_lazy(reader)
+
+	assert_eq(data.last_mission_reset, 1900000000)
+	assert_eq(data.active_missions, {})
+
+
+func test_corrupt_lazy_section_is_read_from_backup():
+	"""Test: Una sección diferida corrupta se recupera del backup"""
+	var backup = FileAccess.open(BACKUP_PATH, FileAccess.WRITE)
+	backup.store_buffer(SaveFormat.encode(saved, "0.4.0", 0))
+	backup.close()
+
+	var bytes = SaveFormat.encode(saved, "0.4.0", 0)
+	var header = SaveFormat.read_header(bytes)
+	bytes[header.data_start + header.sections["missions"].offset] ^= 0xFF
+	var data = _load_lazy(_open(bytes, [BACKUP_PATH]))
+
+	assert_eq(data.money, 777.0, "Las secciones sanas se leen del guardado principal")
+	assert_eq(data.active_missions, saved.active_missions)
+
+
+func test_from_dict_discards_pending_sections():
+	"""Test: Cargar datos nuevos descarta las secciones pendientes del guardado anterior"""
+	var data = _load_lazy(_open(SaveFormat.encode(saved, "0.4.0", 0)))
+
+	data.from_dict({"money": 5.0})
+
+	assert_null(data.lazy_source)
+	assert_eq(data.active_missions, {})
+
+
+func test_save_system_opens_binary_save_lazily():
+	"""Test: SaveSystem.open_game_data devuelve el lector y solo las secciones del primer frame"""
+	assert_true(SaveSystem.save_game_data_with_encryption(saved))
+
+	var reader = SaveSystem.open_game_data(GameData.LAZY_SECTIONS)
+
+	assert_not_null(reader)
+	assert_eq(reader.game_data.money, 777.0)
+	assert_false(reader.game_data.has("active_missions"))
+	assert_eq(reader.read_section("missions").last_mission_reset, 1700000000)
@@ -0,0 +1,87 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de OfflineChainSolver
+## Cadena generador → estación → venta resuelta por segmentos entre eventos de almacenamiento
+
+
+func _chain(resource_inflow: float, customers_rate: float = 0.0) -> Dictionary:
+	return {
+		"resources": {"barley": {"stock": 0.0, "cap": 100.0, "inflow": resource_inflow}},
+		"stations":
+		[{"id": "brewery", "rate": 0.5, "recipe": {"barley": 2.0}, "product": "basic_beer"}],
+		"products":
+		{"basic_beer": {"stock": 0.0, "hold": 160.0, "sell_level": INF, "on_offer": true}},
+		"customers": {"rate": customers_rate, "units": 1.0}
+	}
+
+
+func test_resources_stop_at_storage_cap():
+	"""Test: Sin estaciones, el recurso se llena y el resto se desperdicia"""
+	var chain = _chain(1.0)
+	chain.stations = []
+	var result = OfflineChainSolver.solve(chain, 3600.0)
+
+	assert_eq(result.resources.barley, 100.0)
+	assert_almost_eq(result.generated.barley, 100.0, 0.001)
+	assert_almost_eq(result.wasted.barley, 3500.0, 0.001)
+
+
+func test_production_is_limited_by_resource_inflow():
+	"""Test: Con el recurso agotado, la estación produce al ritmo de la generación"""
+	var result = OfflineChainSolver.solve(_chain(0.5, 1.0), 3600.0)
+
+	# 0.5 cebada/s con receta de 2 → 0.25 cervezas/s, todas vendidas
+	assert_almost_eq(result.produced.basic_beer, 900.0, 0.01)
+	assert_almost_eq(result.sold.basic_beer, 900.0, 0.01)
+	assert_almost_eq(result.customers_served, 900.0, 0.01)
+	assert_eq(result.resources.barley, 0.0)
+
+
+func test_production_holds_at_product_level():
+	"""Test: Sin clientes, la producción se detiene en el nivel de retención"""
+	var result = OfflineChainSolver.solve(_chain(5.0), 72 * 3600.0)
+
+	assert_eq(result.products.basic_beer, 160.0)
+	assert_almost_eq(result.produced.basic_beer, 160.0, 0.001)
+	assert_eq(result.resources.barley, 100.0)
+
+
+func test_auto_sell_takes_excess_above_sell_level():
+	"""Test: Con auto-venta por debajo de la retención, el excedente se vende"""
+	var chain = _chain(5.0)
+	chain.products.basic_beer.sell_level = 140.0
+	chain.products.basic_beer.stock = 150.0
+	var result = OfflineChainSolver.solve(chain, 3600.0)
+
+	assert_eq(result.products.basic_beer, 140.0)
+	# 10 de stock inicial por encima de 140 + 1800 producidas
+	assert_almost_eq(result.auto_sold.basic_beer, 1810.0, 0.01)
+
+
+func test_priority_station_gets_scarce_resources_first():
+	"""Test: Con un recurso escaso, la primera estación de la cola se abastece primero"""
+	var chain = _chain(1.0)
+	chain.stations.append(
+		{"id": "bar_station", "rate": 0.5, "recipe": {"barley": 2.0}, "product": "cocktail"}
+	)
+	chain.products["cocktail"] = {"stock": 0.0, "hold": 160.0, "sell_level": INF, "on_offer": false}
+	var result = OfflineChainSolver.solve(chain, 300.0)
+	assert_almost_eq(result.produced.basic_beer, 150.0, 0.01)
+	assert_eq(result.produced.cocktail, 0.0)
+
+	# Al retener la cerveza (160), la cebada pasa a la segunda estación
+	result = OfflineChainSolver.solve(chain, 600.0)
+	assert_eq(result.products.basic_beer, 160.0)
+	assert_almost_eq(result.produced.cocktail, 140.0, 0.01)
+
+
+func test_long_absences_cost_the_same():
+	"""Test: 72 h se resuelven en pocos segmentos y en menos de 5 ms"""
+	var chain = _chain(2.0, 0.1)
+	var start_usec = Time.get_ticks_usec()
+	var result = OfflineChainSolver.solve(chain, 72 * 3600.0)
+	var elapsed_usec = Time.get_ticks_usec() - start_usec
+
+	assert_lt(result.segments, OfflineChainSolver.MAX_SEGMENTS)
+	assert_lt(elapsed_usec, 5000)
+	assert_almost_eq(result.sold.basic_beer, 0.1 * 72 * 3600.0, 1.0)
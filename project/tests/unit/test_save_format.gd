@@ -0,0 +1,80 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de SaveFormat
+## Guardado binario por secciones: var_to_bytes + compresión + CRC32 por sección
+
+var game_data: Dictionary
+
+
+func before_each():
+	game_data = GameData.new().to_dict()
+	game_data["money"] = 1234.5
+	game_data["tokens"] = 42
+	game_data["generators"] = {"barley_farm": 3, "water_collector": 1}
+	game_data["future_field"] = {"nested": [1, 2, 3]}
+
+
+func test_crc32_matches_reference_value():
+	"""Test: CRC32 IEEE de "123456789" es 0xCBF43926"""
+	assert_eq(SaveFormat.crc32("123456789".to_ascii_buffer()), 0xCBF43926)
+	assert_eq(SaveFormat.crc32(PackedByteArray()), 0)
+
+
+func test_round_trip_keeps_all_keys_and_types():
+	"""Test: encode → decode devuelve los mismos datos, con enteros intactos"""
+	var bytes = SaveFormat.encode(game_data, "0.4.0", 1700000000)
+	var save_data = SaveFormat.decode(bytes)
+
+	assert_eq(save_data.version, "0.4.0")
+	assert_eq(save_data.timestamp, 1700000000)
+	assert_eq(save_data.game_data.size(), game_data.size())
+	assert_eq(save_data.game_data.money, 1234.5)
+	assert_eq(typeof(save_data.game_data.tokens), TYPE_INT)
+	assert_eq(save_data.game_data.generators, game_data.generators)
+	assert_eq(save_data.game_data.future_field, {"nested": [1, 2, 3]})
+
+
+func test_keys_are_grouped_into_sections():
+	"""Test: Cada clave va a su sección; las desconocidas a la sección extra"""
+	var header = SaveFormat.read_header(SaveFormat.encode(game_data, "0.4.0", 0))
+
+	for section in ["currencies", "resources", "generators", "missions", "statistics"]:
+		assert_true(header.sections.has(section), section)
+	assert_eq(SaveFormat.section_of("money"), "currencies")
+	assert_eq(SaveFormat.section_of("future_field"), SaveFormat.EXTRA_SECTION)
+
+
+func test_single_section_can_be_decoded_alone():
+	"""Test: Una sección se lee desde la tabla sin decodificar las demás"""
+	var bytes = SaveFormat.encode(game_data, "0.4.0", 0)
+	var header = SaveFormat.read_header(bytes)
+
+	var currencies = SaveFormat.decode_section(bytes, header, "currencies")
+	assert_eq(currencies.money, 1234.5)
+	assert_false(currencies.has("generators"))
+	assert_null(SaveFormat.decode_section(bytes, header, "missing_section"))
+
+
+func test_corrupted_byte_fails_crc():
+	"""Test: Un byte alterado en una sección invalida el guardado completo"""
+	var bytes = SaveFormat.encode(game_data, "0.4.0", 0)
+	var header = SaveFormat.read_header(bytes)
+	var entry = header.sections["generators"]
+	bytes[header.data_start + entry.offset] ^= 0xFF
+
+	assert_null(SaveFormat.decode_section(bytes, header, "generators"))
+	assert_eq(SaveFormat.decode(bytes), {})
+
+
+func test_truncated_file_is_rejected():
+	"""Test: Un archivo cortado no pasa la lectura de cabecera"""
+	var bytes = SaveFormat.encode(game_data, "0.4.0", 0)
+	assert_eq(SaveFormat.read_header(bytes.slice(0, bytes.size() - 1)), {})
+
+
+func test_legacy_json_saves_are_not_binary():
+	"""Test: Los guardados JSON/Base64 antiguos se distinguen por la firma"""
+	var legacy = Marshalls.utf8_to_base64("BARSIK_ENC:{}").to_utf8_buffer()
+	assert_false(SaveFormat.is_save_format(legacy))
+	assert_false(SaveFormat.is_save_format(JSON.stringify(game_data).to_utf8_buffer()))
+	assert_true(SaveFormat.is_save_format(SaveFormat.encode({}, "0.4.0", 0)))
@@ -0,0 +1,93 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de SaveJournal
+## Autoguardado incremental: deltas por sección sobre la última instantánea
+
+const JOURNAL_PATH = "user://test_save_journal.journal"
+
+var journal: SaveJournal
+var game_data: Dictionary
+var base_id: int
+
+
+func before_each():
+	game_data = GameData.new().to_dict()
+	var raw_sections = {}
+	var snapshot = SaveFormat.encode(game_data, "0.4.0", 0, raw_sections)
+	base_id = SaveJournal.snapshot_id(snapshot)
+	journal = SaveJournal.new(JOURNAL_PATH)
+	journal.reset(base_id, raw_sections)
+
+
+func after_each():
+	DirAccess.remove_absolute(JOURNAL_PATH)
+
+
+func test_unchanged_data_writes_nothing():
+	"""Test: Sin cambios desde la instantánea no se añade ningún registro"""
+	assert_eq(journal.append(game_data.duplicate(true)), 0)
+	assert_eq(journal.entry_count, 0)
+
+
+func test_append_writes_only_changed_sections():
+	"""Test: Cambiar el dinero escribe un registro mucho menor que la instantánea"""
+	var snapshot_size = SaveFormat.encode(game_data, "0.4.0", 0).size()
+	game_data["money"] = 999.0
+
+	var written = journal.append(game_data)
+
+	assert_gt(written, 0)
+	assert_lt(written, snapshot_size / 2)
+	assert_eq(journal.entry_count, 1)
+	assert_eq(journal.append(game_data), 0, "El mismo estado no se vuelve a escribir")
+
+
+func test_replay_applies_records_in_order():
+	"""Test: Reproducir el journal deja el último valor de cada sección"""
+	var loaded = game_data.duplicate(true)
+	game_data["money"] = 100.0
+	journal.append(game_data)
+	game_data["money"] = 250.0
+	game_data["generators"] = {"barley_farm": 4}
+	journal.append(game_data)
+
+	var applied = SaveJournal.replay(JOURNAL_PATH, base_id, loaded)
+
+	assert_eq(applied, 2)
+	assert_eq(loaded.money, 250.0)
+	assert_eq(loaded.generators, {"barley_farm": 4})
+
+
+func test_journal_of_another_snapshot_is_ignored():
+	"""Test: Un journal que partió de otra instantánea no se aplica"""
+	var loaded = game_data.duplicate(true)
+	var snapshot_money = loaded.money
+	game_data["money"] = 100.0
+	journal.append(game_data)
+
+	assert_eq(SaveJournal.replay(JOURNAL_PATH, base_id + 1, loaded), 0)
+	assert_eq(loaded.money, snapshot_money)
+
+
+func test_torn_record_is_discarded():
+	"""Test: Un registro cortado por un cierre inesperado se descarta; los previos se aplican"""
+	var loaded = game_data.duplicate(true)
+	game_data["money"] = 100.0
+	journal.append(game_data)
+	game_data["money"] = 200.0
+	journal.append(game_data)
+
+	var bytes = FileAccess.get_file_as_bytes(JOURNAL_PATH)
+	var file = FileAccess.open(JOURNAL_PATH, FileAccess.WRITE)
+	file.store_buffer(bytes.slice(0, bytes.size() - 3))
+	file.close()
+
+	assert_eq(SaveJournal.replay(JOURNAL_PATH, base_id, loaded), 1)
+	assert_eq(loaded.money, 100.0)
+
+
+func test_append_requires_a_snapshot():
+	"""Test: Sin instantánea en esta sesión el journal no acepta registros"""
+	var inactive = SaveJournal.new(JOURNAL_PATH)
+	assert_false(inactive.is_active())
+	assert_eq(inactive.append(game_data), -1)
@@ -0,0 +1,76 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de guardado en WorkerThreadPool
+## La codificación y escritura salen del hilo principal; las peticiones solapadas se agrupan
+
+var completions: Array
+
+
+func before_each():
+	completions = []
+	SaveSystem.save_completed.connect(_on_save_completed)
+
+
+func after_each():
+	SaveSystem.save_completed.disconnect(_on_save_completed)
+
+
+func _on_save_completed(success: bool):
+	completions.append(success)
+
+
+func _game_data(money: float) -> Dictionary:
+	var data = GameData.new().to_dict()
+	data["money"] = money
+	return data
+
+
+func test_async_save_does_not_block_and_completes():
+	"""Test: El guardado vuelve enseguida y avisa con save_completed al terminar"""
+	SaveSystem.save_game_data_async(_game_data(321.0))
+	assert_true(SaveSystem.is_saving())
+
+	await wait_for_signal(SaveSystem.save_completed, 5.0)
+
+	assert_eq(completions, [true])
+	assert_false(SaveSystem.is_saving())
+	assert_eq(SaveSystem.load_game_data().money, 321.0)
+
+
+func test_overlapping_requests_are_coalesced():
+	"""Test: Tres peticiones durante una tarea → dos escrituras, la última con los datos finales"""
+	SaveSystem.save_game_data_async(_game_data(1.0))
+	SaveSystem.save_game_data_async(_game_data(2.0))
+	SaveSystem.save_game_data_async(_game_data(3.0))
+
+	await wait_for_signal(SaveSystem.save_completed, 5.0)
+	await wait_for_signal(SaveSystem.save_completed, 5.0)
+
+	assert_eq(completions.size(), 2)
+	assert_false(SaveSystem.is_saving())
+	assert_eq(SaveSystem.load_game_data().money, 3.0)
+
+
+func test_snapshot_is_isolated_from_later_changes():
+	"""Test: Cambiar los datos tras pedir el guardado no altera lo que se escribe"""
+	var data = _game_data(10.0)
+	SaveSystem.save_game_data_async(data)
+	data["money"] = 99999.0
+	data["generators"]["barley_farm"] = 50
+
+	await wait_for_signal(SaveSystem.save_completed, 5.0)
+
+	var loaded = SaveSystem.load_game_data()
+	assert_eq(loaded.money, 10.0)
+	assert_ne(loaded.generators.get("barley_farm"), 50)
+
+
+func test_sync_save_waits_for_running_task():
+	"""Test: Un guardado síncrono (cierre) espera a la tarea y descarta la pendiente"""
+	SaveSystem.save_game_data_async(_game_data(5.0))
+	SaveSystem.save_game_data_async(_game_data(6.0))
+
+	assert_true(SaveSystem.save_game_data_with_encryption(_game_data(7.0)))
+
+	assert_false(SaveSystem.is_saving())
+	assert_eq(SaveSystem.load_game_data().money, 7.0)
@@ -0,0 +1,81 @@
+extends "res://addons/gut/test.gd"
+
+## Tests del batcher de señales de TickManager
+## Emisiones agrupadas por clave, políticas de mezcla y cualquier número de argumentos
+
+signal amount_changed(item: String, amount: int)
+signal items_added(items: Array)
+signal wide_signal(a: int, b: int, c: int, d: int)
+
+var tick_manager: TickManager
+var received: Array = []
+
+
+func before_each():
+	tick_manager = TickManager.new()
+	received = []
+
+
+func after_each():
+	tick_manager.free()
+
+
+func _record(a = null, b = null, c = null, d = null) -> void:
+	received.append([a, b, c, d].filter(func(arg): return arg != null))
+
+
+func test_signals_with_many_arguments_are_emitted():
+	"""Test: Señales de más de 2 argumentos se emiten completas (callv)"""
+	wide_signal.connect(_record)
+	tick_manager.queue_signal(self, "wide_signal", [1, 2, 3, 4])
+	tick_manager._process_signal_batch()
+
+	assert_eq(received, [[1, 2, 3, 4]])
+	wide_signal.disconnect(_record)
+
+
+func test_last_wins_keeps_one_emission_per_key():
+	"""Test: last_wins agrupa por los primeros argumentos y conserva el valor final"""
+	amount_changed.connect(_record)
+	tick_manager.queue_signal(self, "amount_changed", ["barley", 1], TickManager.MERGE_LAST_WINS, 1)
+	tick_manager.queue_signal(self, "amount_changed", ["hops", 5], TickManager.MERGE_LAST_WINS, 1)
+	tick_manager.queue_signal(self, "amount_changed", ["barley", 3], TickManager.MERGE_LAST_WINS, 1)
+	tick_manager._process_signal_batch()
+
+	assert_eq(received, [["barley", 3], ["hops", 5]])
+	assert_eq(tick_manager.tick_stats.coalesced_signals, 1)
+	amount_changed.disconnect(_record)
+
+
+func test_sum_adds_amounts():
+	"""Test: sum acumula las cantidades del mismo recurso"""
+	amount_changed.connect(_record)
+	for i in range(4):
+		tick_manager.queue_signal(self, "amount_changed", ["barley", 2], TickManager.MERGE_SUM, 1)
+	tick_manager._process_signal_batch()
+
+	assert_eq(received, [["barley", 8]])
+	amount_changed.disconnect(_record)
+
+
+func test_append_concatenates_lists():
+	"""Test: append concatena los Array de cada emisión"""
+	items_added.connect(_record)
+	tick_manager.queue_signal(self, "items_added", [["a"]], TickManager.MERGE_APPEND)
+	tick_manager.queue_signal(self, "items_added", [["b", "c"]], TickManager.MERGE_APPEND)
+	tick_manager._process_signal_batch()
+
+	assert_eq(received, [[["a", "b", "c"]]])
+	items_added.disconnect(_record)
+
+
+func test_batch_is_cleared_after_emitting():
+	"""Test: Un segundo procesado no repite emisiones"""
+	amount_changed.connect(_record)
+	tick_manager.queue_signal(self, "amount_changed", ["barley", 1])
+	tick_manager._process_signal_batch()
+	tick_manager._process_signal_batch()
+
+	assert_eq(received.size(), 1)
+	assert_eq(tick_manager.batched_signals.size(), 0)
+	amount_changed.disconnect(_record)
@@ -0,0 +1,79 @@
+extends "res://addons/gut/test.gd"
+
+## Tests del scheduler de simulación de paso fijo de TickManager
+## Periodos en pasos enteros, orden determinista y límite de catch-up
+
+var tick_manager: TickManager
+var calls: Array = []
+
+
+func before_each():
+	tick_manager = TickManager.new()
+	calls = []
+
+
+func after_each():
+	tick_manager.free()
+
+
+func _record(delta: float, system_name: String) -> void:
+	calls.append([system_name, delta])
+
+
+func test_systems_run_at_their_period():
+	"""Test: Un sistema de 1s corre cada 10 pasos y recibe su periodo como delta"""
+	tick_manager.register_system("research", _record.bind("research"), 1.0)
+	tick_manager.step_simulation(9)
+	assert_eq(calls.size(), 0, "El sistema corrió antes de su periodo")
+
+	tick_manager.step_simulation(1)
+	assert_eq(calls, [["research", 1.0]])
+
+	tick_manager.step_simulation(20)
+	assert_eq(calls.size(), 3)
+
+
+func test_systems_run_in_order():
+	"""Test: En el mismo paso, menor order corre primero (empates por registro)"""
+	tick_manager.register_system("stats", _record.bind("stats"), 0.1, 60)
+	tick_manager.register_system("generators", _record.bind("generators"), 0.1, 0)
+	tick_manager.register_system("customers", _record.bind("customers"), 0.1, 30)
+	tick_manager.register_system("auto_sell", _record.bind("auto_sell"), 0.1, 30)
+	tick_manager.step_simulation(1)
+
+	var names = calls.map(func(call): return call[0])
+	assert_eq(names, ["generators", "customers", "auto_sell", "stats"])
+
+
+func test_catch_up_is_limited():
+	"""Test: Un frame largo ejecuta como máximo MAX_CATCH_UP_STEPS y descarta el resto"""
+	tick_manager.register_system("customers", _record.bind("customers"), 0.1)
+	var steps = tick_manager.advance_simulation(5.0)
+
+	assert_eq(steps, TickManager.MAX_CATCH_UP_STEPS)
+	assert_eq(calls.size(), TickManager.MAX_CATCH_UP_STEPS)
+	assert_true(tick_manager.simulation_accumulator < TickManager.SIMULATION_STEP)
+	assert_gt(tick_manager.dropped_simulation_time, 0.0)
+
+
+func test_frame_time_accumulates():
+	"""Test: Frames cortos se acumulan hasta completar un paso"""
+	tick_manager.register_system("customers", _record.bind("customers"), 0.1)
+	assert_eq(tick_manager.advance_simulation(0.06), 0)
+	assert_eq(tick_manager.advance_simulation(0.06), 1)
+	assert_eq(calls.size(), 1)
+
+
+func test_generator_manager_is_stepable():
+	"""Test: La generación corre desde el scheduler sin nodos Timer"""
+	var generator_manager = GeneratorManager.new()
+	assert_eq(generator_manager.get_child_count(), 0)
+
+	tick_manager.register_system(
+		"generators", generator_manager.step_generation, GeneratorManager.GENERATION_PERIOD
+	)
+	tick_manager.step_simulation(roundi(GeneratorManager.GENERATION_PERIOD / 0.1))
+
+	var stats = tick_manager.get_simulation_stats()
+	assert_eq(stats.systems[0].runs, 1)
+	generator_manager.free()
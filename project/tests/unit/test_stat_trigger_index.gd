@@ -0,0 +1,107 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de StatTriggerIndex
+## Umbrales por estadística: solo se despiertan los objetivos cruzados, en orden
+
+var stats: Dictionary
+var index: StatTriggerIndex
+var fired: Array
+
+
+func before_each():
+	stats = {"products_sold": 0}
+	index = StatTriggerIndex.new(stats)
+	fired = []
+
+
+func _record(stat_key: String, value: float, label: String):
+	fired.append([label, stat_key, value])
+
+
+func test_watch_fires_once_when_threshold_is_crossed():
+	"""Test: El callback se llama al alcanzar el umbral y una sola vez"""
+	index.watch("products_sold", 10, _record.bind("ten"))
+
+	index.set_value("products_sold", 9)
+	assert_eq(fired.size(), 0)
+
+	index.set_value("products_sold", 12)
+	index.set_value("products_sold", 20)
+	assert_eq(fired, [["ten", "products_sold", 12.0]])
+	assert_eq(stats.products_sold, 20, "set_value escribe en el Dictionary observado")
+	assert_eq(index.get_watch_count(), 0)
+
+
+func test_crossed_thresholds_fire_in_ascending_order():
+	"""Test: Un salto grande dispara todos los umbrales cruzados de menor a mayor"""
+	index.watch("products_sold", 100, _record.bind("hundred"))
+	index.watch("products_sold", 1, _record.bind("one"))
+	index.watch("products_sold", 1000, _record.bind("thousand"))
+	index.watch("products_sold", 10, _record.bind("ten"))
+
+	index.set_value("products_sold", 150)
+
+	var labels = fired.map(func(entry): return entry[0])
+	assert_eq(labels, ["one", "ten", "hundred"])
+	assert_eq(index.get_next_threshold("products_sold"), 1000.0)
+
+
+func test_other_stats_do_not_wake_watchers():
+	"""Test: Cambiar otra estadística no dispara ni recorre los umbrales ajenos"""
+	index.watch("products_sold", 5, _record.bind("sold"))
+
+	index.set_value("customers_served", 50)
+
+	assert_eq(fired.size(), 0)
+	assert_eq(index.get_watch_count("products_sold"), 1)
+
+
+func test_unwatch_removes_only_that_handle():
+	"""Test: unwatch quita un observador aunque comparta umbral con otro"""
+	var first = index.watch("products_sold", 10, _record.bind("first"))
+	index.watch("products_sold", 10, _record.bind("second"))
+
+	index.unwatch(first)
+	index.unwatch(first)  # Repetir no hace nada
+	index.set_value("products_sold", 10)
+
+	assert_eq(fired.map(func(entry): return entry[0]), ["second"])
+
+
+func test_already_reached_threshold_fires_immediately():
+	"""Test: Observar un umbral ya alcanzado llama al callback y devuelve 0"""
+	stats.products_sold = 50
+
+	var handle = index.watch("products_sold", 25, _record.bind("late"))
+
+	assert_eq(handle, 0)
+	assert_eq(fired, [["late", "products_sold", 50.0]])
+	assert_eq(index.get_watch_count(), 0)
+
+
+func test_rebind_fires_thresholds_reached_by_loaded_values():
+	"""Test: Al cargar otra partida se disparan los umbrales que ya cumple"""
+	index.watch("products_sold", 10, _record.bind("ten"))
+	index.watch("products_sold", 500, _record.bind("five_hundred"))
+
+	var loaded = {"products_sold": 42}
+	index.rebind(loaded)
+	index.set_value("products_sold", 43)
+
+	assert_eq(fired.map(func(entry): return entry[0]), ["ten"])
+	assert_eq(loaded.products_sold, 43)
+	assert_eq(stats.products_sold, 0, "El Dictionary anterior ya no se escribe")
+
+
+func test_callback_can_watch_again_while_firing():
+	"""Test: Un callback puede registrar el siguiente objetivo de la misma estadística"""
+	var chain = func(stat_key: String, value: float):
+		fired.append(["chain", stat_key, value])
+		index.watch(stat_key, value + 10, _record.bind("next"))
+
+	index.watch("products_sold", 5, chain)
+	index.set_value("products_sold", 5)
+	assert_eq(index.get_next_threshold("products_sold"), 15.0)
+
+	index.set_value("products_sold", 15)
+	assert_eq(fired.map(func(entry): return entry[0]), ["chain", "next"])
@@ -0,0 +1,63 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de profiling y presupuesto por tick de TickManager
+## Tiempos por callback, diferido round-robin y ranking de callbacks lentos
+
+var tick_manager: TickManager
+var calls: Array = []
+
+
+func before_each():
+	tick_manager = TickManager.new()
+	calls = []
+
+
+func after_each():
+	tick_manager.free()
+
+
+func _slow_callback() -> void:
+	calls.append("slow")
+	OS.delay_usec(3000)
+
+
+func _fast_callback() -> void:
+	calls.append("fast")
+
+
+func test_callbacks_are_timed():
+	"""Test: Cada ejecución registra su tiempo en el perfil del callback"""
+	tick_manager.register_slow_tick(_fast_callback)
+	for i in range(5):
+		tick_manager._on_slow_tick()
+
+	var profile = tick_manager._get_callback_profile(_fast_callback)
+	assert_eq(profile.calls, 5)
+	assert_eq(profile.tick_type, "slow")
+	assert_true(profile.p50_usec <= profile.p95_usec)
+	assert_true(profile.p95_usec <= profile.max_usec)
+
+
+func test_over_budget_callbacks_are_deferred_round_robin():
+	"""Test: Tras pasar el presupuesto, el resto corre primero en el siguiente tick"""
+	tick_manager.tick_budgets_usec.fast = 1000
+	tick_manager.register_fast_tick(_slow_callback)
+	tick_manager.register_fast_tick(_fast_callback)
+
+	tick_manager._on_fast_tick()
+	assert_eq(calls, ["slow"], "El callback rápido no se difirió")
+	assert_eq(tick_manager.tick_stats.deferred_callbacks, 1)
+
+	tick_manager._on_fast_tick()
+	assert_eq(calls, ["slow", "fast", "slow"])
+
+
+func test_stats_name_slowest_callbacks():
+	"""Test: get_tick_stats ordena los callbacks por p95 descendente"""
+	tick_manager.register_very_slow_tick(_fast_callback)
+	tick_manager.register_very_slow_tick(_slow_callback)
+	tick_manager._on_very_slow_tick()
+
+	var slowest = tick_manager.get_tick_stats().slowest_callbacks
+	assert_eq(slowest.size(), 2)
+	assert_string_contains(slowest[0].name, "_slow_callback")
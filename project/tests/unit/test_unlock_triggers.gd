@@ -0,0 +1,42 @@
+extends "res://addons/gut/test.gd"
+
+## Tests de desbloqueos por StatTriggerIndex
+## Una feature con condiciones cumplidas y pendientes solo observa las pendientes
+
+var unlock_manager: UnlockManager
+var game_data: GameData
+
+
+func before_each():
+	game_data = GameData.new()
+	unlock_manager = UnlockManager.new()
+	add_child_autofree(unlock_manager)
+
+
+func test_met_condition_is_not_watched_again():
+	"""Test: Cumplir una de dos condiciones no re-observa la cumplida (sin recursión)"""
+	unlock_manager.set_game_data(game_data)
+
+	game_data.stat_triggers.set_value("total_money_earned", 150.0)
+
+	assert_false(unlock_manager.is_unlocked("customers"))
+	var watched = unlock_manager._unlock_triggers["customers"]
+	assert_false(watched.has("total_money_earned"))
+	assert_true(watched.has("beers_produced"))
+
+	game_data.stat_triggers.set_value("total_beers_produced", 50)
+
+	assert_true(unlock_manager.is_unlocked("customers"))
+
+
+func test_partially_met_feature_on_load():
+	"""Test: Al cargar con una condición ya cumplida solo se observa la pendiente"""
+	game_data.statistics["total_money_earned"] = 150.0
+	unlock_manager.set_game_data(game_data)
+
+	assert_false(unlock_manager.is_unlocked("customers"))
+	assert_eq(unlock_manager._unlock_triggers["customers"].keys(), ["beers_produced"])
+
+	game_data.stat_triggers.set_value("total_beers_produced", 50)
+
+	assert_true(unlock_manager.is_unlocked("customers"))
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Analysis Cache
+Caché incremental en disco compartida por los analizadores de tools/, indexada por ruta y hash de contenido
+"""
+
+import os
+import json
+import hashlib
+from pathlib import Path
+
+CACHE_VERSION = 2
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent / ".analysis_cache" / "gdscript_cache.json"
+
+
+class AnalysisCache:
+    """Resultados por archivo (funciones, líneas, patrones, dependencias...).
+
+    Cada archivo guarda su hash de contenido, su mtime/tamaño y un diccionario
+    de namespaces con lo que cada analizador extrajo. Si el mtime y el tamaño
+    no cambian se confía en la entrada sin leer el archivo; si cambian, se
+    relee y solo se recalcula cuando el hash de contenido es distinto.
+
+    Con `cache_path=None` la caché vive solo en memoria (no se lee ni se guarda).
+    """
+
+    def __init__(self, cache_path=DEFAULT_CACHE_PATH):
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.files = {}
+        self.memos = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+        self._used_memos = {}
+        self._load()
+
+    def _load(self):
+        if not self.cache_path or not self.cache_path.exists():
+            return
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return  # Caché corrupta: se reconstruye desde cero
+
+        if data.get('version') != CACHE_VERSION:
+            return
+
+        self.files = data.get('files', {})
+        self.memos = data.get('memos', {})
+
+    def _entry(self, file_path, errors):
+        """Entrada vigente del archivo y su contenido (None si no hizo falta leerlo)"""
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        entry = self.files.get(key)
+
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry, None
+
+        with open(key, 'rb') as f:
+            raw = f.read()
+        content = _decode(raw, errors)
+        digest = hashlib.sha1(raw).hexdigest()
+
+        if not entry or entry['hash'] != digest:
+            entry = {'hash': digest, 'data': {}}
+            self.files[key] = entry
+        entry['mtime_ns'] = stat.st_mtime_ns
+        entry['size'] = stat.st_size
+        self._dirty = True
+
+        return entry, content
+
+    def get(self, file_path, namespace, compute, errors='strict'):
+        """Resultado de `compute(content)` para el archivo, reutilizando la caché.
+
+        `compute` debe devolver datos serializables a JSON y no depender de la
+        ruta del archivo (el llamador añade la ruta al fusionar resultados).
+        """
+        entry, content = self._entry(file_path, errors)
+        if namespace in entry['data']:
+            self.hits += 1
+            return entry['data'][namespace]
+
+        if content is None:
+            with open(file_path, 'r', encoding='utf-8', errors=errors) as f:
+                content = f.read()
+
+        self.misses += 1
+        value = compute(content)
+        entry['data'][namespace] = value
+        self._dirty = True
+        return value
+
+    def get_many(self, file_paths, namespaces, compute, executor=None, errors='strict'):
+        """Datos de varios archivos en una sola lectura por archivo.
+
+        `compute(content)` debe devolver un diccionario con todos los
+        `namespaces`; se guarda cada uno por separado. Los archivos ya vigentes
+        salen de la caché; el resto se leen, hashean y calculan en `executor`
+        (p.ej. un ProcessPoolExecutor, así que `compute` debe ser picklable) o
+        en serie si no se indica. Devuelve {ruta: datos} en el orden de
+        entrada y {ruta: error} para los archivos que no se pudieron procesar.
+        """
+        results = {}
+        errors_by_file = {}
+        pending = []
+
+        for file_path in file_paths:
+            key = os.path.abspath(file_path)
+            entry = self.files.get(key)
+            try:
+                stat = os.stat(key)
+            except OSError as e:
+                errors_by_file[file_path] = e
+                continue
+
+            fresh = entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size
+            if fresh and all(namespace in entry['data'] for namespace in namespaces):
+                self.hits += 1
+                results[file_path] = {namespace: entry['data'][namespace] for namespace in namespaces}
+            else:
+                known_hash = entry['hash'] if entry and all(namespace in entry['data'] for namespace in namespaces) else None
+                pending.append((file_path, known_hash))
+
+        jobs = [(file_path, known_hash, compute, errors) for file_path, known_hash in pending]
+        if executor is not None and len(jobs) > 1:
+            outputs = executor.map(_read_and_compute, jobs, chunksize=4)
+        else:
+            outputs = map(_read_and_compute, jobs)
+
+        for (file_path, _), (digest, stat, data, error) in zip(pending, outputs):
+            if error is not None:
+                errors_by_file[file_path] = error
+                continue
+
+            key = os.path.abspath(file_path)
+            entry = self.files.get(key)
+            if data is None:  # Mismo contenido: solo cambió el mtime
+                self.hits += 1
+            else:
+                self.misses += 1
+                if not entry or entry['hash'] != digest:
+                    entry = {'hash': digest, 'data': {}}
+                    self.files[key] = entry
+                entry['data'].update(data)
+            entry['mtime_ns'], entry['size'] = stat
+            self._dirty = True
+            results[file_path] = {namespace: entry['data'][namespace] for namespace in namespaces}
+
+        ordered = {file_path: results[file_path] for file_path in file_paths if file_path in results}
+        return ordered, errors_by_file
+
+    def content_hash(self, file_path):
+        """Hash de contenido del archivo (leyéndolo solo si cambió)"""
+        entry, _ = self._entry(file_path, 'ignore')
+        return entry['hash']
+
+    def memo(self, section, key, compute):
+        """Memoización de resultados entre archivos (p.ej. pares de funciones)"""
+        values = self.memos.setdefault(section, {})
+        self._used_memos.setdefault(section, set()).add(key)
+
+        if key in values:
+            self.hits += 1
+            return values[key]
+
+        self.misses += 1
+        values[key] = compute()
+        self._dirty = True
+        return values[key]
+
+    def save(self):
+        """Guardar la caché en disco (escritura atómica)"""
+        # Olvidar archivos borrados y memos que esta ejecución ya no necesitó
+        for key in [key for key in self.files if not os.path.exists(key)]:
+            del self.files[key]
+            self._dirty = True
+        for section, used in self._used_memos.items():
+            values = self.memos.get(section, {})
+            if len(values) != len(used):
+                self.memos[section] = {key: values[key] for key in used if key in values}
+                self._dirty = True
+
+        if not self.cache_path or not self._dirty:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'files': self.files, 'memos': self.memos}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def stats_line(self):
+        """Resumen corto de aciertos/fallos para los prints de los analizadores"""
+        return f"💾 Caché: {self.hits} aciertos, {self.misses} recalculados"
+
+
+def _decode(raw, errors):
+    """Texto con los mismos saltos de línea universales que open() en modo texto"""
+    return raw.decode('utf-8', errors=errors).replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_and_compute(job):
+    """Trabajo por archivo (se ejecuta en otro proceso): leer, hashear y calcular"""
+    file_path, known_hash, compute, errors = job
+    try:
+        stat = os.stat(file_path)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        digest = hashlib.sha1(raw).hexdigest()
+        if digest == known_hash:
+            return digest, (stat.st_mtime_ns, stat.st_size), None, None
+
+        return digest, (stat.st_mtime_ns, stat.st_size), compute(_decode(raw, errors)), None
+    except Exception as e:
+        return None, None, None, e
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Analysis Daemon
+Modo vigilancia: reanaliza solo los .gd modificados y publica el reporte en un archivo y un socket local
+"""
+
+import os
+import sys
+import json
+import time
+import errno
+import select
+import signal
+import struct
+import socket
+import argparse
+import threading
+import socketserver
+from pathlib import Path
+from datetime import datetime
+
+from analysis_cache import AnalysisCache
+from code_analyzer import BarSikCodeAnalyzer
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+WATCH_DIRS = ('scripts', 'singletons', 'ui')
+DEFAULT_OUTPUT_PATH = REPO_ROOT / ".analysis_cache" / "live_report.json"
+DEFAULT_PORT = 8765
+DEBOUNCE_SECONDS = 0.2  # Los editores guardan en varios pasos (temporal + rename)
+
+# Constantes de <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+_WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+               | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT_HEADER = struct.Struct('iIII')
+
+
+def _scan_gd_files(roots):
+    """Archivos .gd bajo las carpetas vigiladas (mismo filtro que BarSikCodeAnalyzer)"""
+    files = []
+    for root in roots:
+        for current, dirs, names in os.walk(root):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d not in ['build', 'builds', 'addons'])
+            files.extend(Path(current) / name for name in sorted(names) if name.endswith('.gd'))
+    return files
+
+
+class PollingWatcher:
+    """Vigilancia por sondeo de mtime/tamaño (funciona en cualquier sistema)"""
+
+    def __init__(self, roots, interval=1.0):
+        self.roots = [Path(root) for root in roots]
+        self.interval = interval
+        self._snapshot = self._take_snapshot()
+
+    def _take_snapshot(self):
+        snapshot = {}
+        for file_path in _scan_gd_files(self.roots):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def files(self):
+        return list(self._snapshot)
+
+    def wait(self, timeout=None):
+        """Esperar cambios; devuelve el conjunto de rutas nuevas, modificadas o borradas"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._take_snapshot()
+            changed = {
+                file_path for file_path in set(snapshot) | set(self._snapshot)
+                if snapshot.get(file_path) != self._snapshot.get(file_path)
+            }
+            self._snapshot = snapshot
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """Vigilancia con inotify (Linux) vía ctypes, sin dependencias externas"""
+
+    def __init__(self, roots):
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falló")
+
+        self.roots = [Path(root) for root in roots]
+        self._watches = {}
+        self._known = set(_scan_gd_files(self.roots))
+        for root in self.roots:
+            self._watch_tree(root)
+
+    def _watch_tree(self, directory):
+        import ctypes
+
+        for current, dirs, _ in os.walk(directory):
+            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['build', 'builds', 'addons']]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(current), _WATCH_MASK)
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch falló en {current}")
+            self._watches[wd] = Path(current)
+
+    def files(self):
+        return sorted(self._known)
+
+    def _read_events(self):
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except OSError as e:
+            if e.errno == errno.EAGAIN:
+                return set(), False
+            raise
+
+        changed = set()
+        overflow = False
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            name = data[offset + _EVENT_HEADER.size:offset + _EVENT_HEADER.size + length].rstrip(b'\0')
+            offset += _EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and path.is_dir():
+                    # Carpeta nueva: vigilarla y contar los .gd que ya traiga
+                    self._watch_tree(path)
+                    changed.update(_scan_gd_files([path]))
+                elif mask & (IN_DELETE | IN_MOVED_FROM):
+                    changed.update(known for known in self._known if path in known.parents)
+            elif path.suffix == '.gd':
+                changed.add(path)
+
+        return changed, overflow
+
+    def wait(self, timeout=None):
+        """Esperar cambios; devuelve el conjunto de rutas nuevas, modificadas o borradas"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed = set()
+        overflow = False
+        # Agrupar la ráfaga de eventos de un mismo guardado
+        while ready:
+            events, lost = self._read_events()
+            changed |= events
+            overflow = overflow or lost
+            ready, _, _ = select.select([self._fd], [], [], DEBOUNCE_SECONDS)
+
+        if overflow:
+            # Cola desbordada: comparar con un escaneo completo
+            current = set(_scan_gd_files(self.roots))
+            changed |= current | self._known
+
+        for file_path in changed:
+            if file_path.exists():
+                self._known.add(file_path)
+            else:
+                self._known.discard(file_path)
+        return changed
+
+    def close(self):
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(roots, force_polling=False, poll_interval=1.0):
+    """inotify si está disponible; si no (Windows, macOS...), sondeo"""
+    if not force_polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError) as e:
+            print(f"⚠️  inotify no disponible ({e}), usando sondeo")
+    return PollingWatcher(roots, poll_interval)
+
+
+class _ReportHandler(socketserver.BaseRequestHandler):
+    """Cada conexión recibe el reporte actual en JSON y se cierra"""
+
+    def handle(self):
+        self.request.sendall(self.server.daemon_ref.report_bytes())
+
+
+class _ReportServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class AnalysisDaemon:
+    """Mantiene en memoria los datos por archivo, el índice de duplicados,
+    las dependencias y las métricas, y los actualiza solo con los archivos
+    que cambian. Publica el reporte en `output_path` (escritura atómica) y,
+    si se indica `port`, en un socket TCP local (127.0.0.1).
+    """
+
+    def __init__(self, project_path, watch_dirs=WATCH_DIRS, output_path=DEFAULT_OUTPUT_PATH,
+                 port=None, cache=None, force_polling=False, poll_interval=1.0):
+        self.project_path = Path(project_path)
+        self.roots = [self.project_path / d for d in watch_dirs if (self.project_path / d).is_dir()]
+        self.output_path = Path(output_path) if output_path else None
+        self.port = port
+        self.analyzer = BarSikCodeAnalyzer(self.project_path, cache=cache)
+        self.watcher = create_watcher(self.roots, force_polling, poll_interval)
+        self.report = {}
+        self._report_bytes = b'{}'
+        self._lock = threading.Lock()
+        self._server = None
+
+    def report_bytes(self):
+        with self._lock:
+            return self._report_bytes
+
+    def start(self):
+        """Análisis inicial completo y arranque del socket"""
+        started = time.perf_counter()
+        self.analyzer.gdscript_files = self.watcher.files()
+        self.analyzer.load_file_facts()
+        self._publish(self.analyzer.refresh_analysis(), [], started)
+        self.analyzer.cache.save()
+        print(f"📁 Vigilando {len(self.analyzer.gdscript_files)} archivos en: "
+              f"{', '.join(str(root) for root in self.roots)} ({type(self.watcher).__name__})")
+
+        if self.port is not None:
+            self._server = _ReportServer(('127.0.0.1', self.port), _ReportHandler)
+            self._server.daemon_ref = self
+            threading.Thread(target=self._server.serve_forever, daemon=True).start()
+            print(f"🔌 Reporte disponible en 127.0.0.1:{self._server.server_address[1]}")
+
+    def refresh(self, changed):
+        """Reanalizar solo los archivos cambiados y republicar el reporte"""
+        started = time.perf_counter()
+        self.analyzer.update_files(sorted(changed))
+        self._publish(self.analyzer.refresh_analysis(), changed, started)
+
+    def _publish(self, report, changed, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        report = dict(report)
+        report['live'] = {
+            'updated_at': datetime.now().isoformat(),
+            'changed_files': sorted(str(file_path) for file_path in changed),
+            'refresh_ms': round(elapsed_ms, 1)
+        }
+        payload = json.dumps(report, ensure_ascii=False).encode('utf-8')
+
+        with self._lock:
+            self.report = report
+            self._report_bytes = payload
+
+        if self.output_path:
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.output_path.with_suffix('.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self.output_path)
+
+        summary = report['summary']
+        label = f"{len(changed)} cambios" if changed else "Análisis inicial"
+        print(f"🔄 {label} → {summary['duplicated_functions']} duplicaciones, "
+              f"{summary['debug_files']} archivos con debug, {summary['complex_files']} complejos "
+              f"({elapsed_ms:.0f} ms)")
+
+    def serve_forever(self):
+        """Bucle principal hasta Ctrl+C"""
+        self.start()
+        try:
+            while True:
+                changed = self.watcher.wait(timeout=None)
+                if changed:
+                    self.refresh(changed)
+        except KeyboardInterrupt:
+            print("\n🛑 Deteniendo vigilancia...")
+        finally:
+            self.stop()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.watcher.close()
+        self.analyzer.cache.save()
+
+
+def fetch_report(port=DEFAULT_PORT, host='127.0.0.1'):
+    """Leer el reporte actual de un daemon en marcha"""
+    chunks = []
+    with socket.create_connection((host, port), timeout=5) as connection:
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return json.loads(b''.join(chunks).decode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK Analysis Daemon")
+    parser.add_argument('--project', default=str(REPO_ROOT / "project"), help="Carpeta del proyecto Godot")
+    parser.add_argument('--output', default=str(DEFAULT_OUTPUT_PATH), help="Archivo JSON con el reporte vivo")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Puerto TCP local (0 = elegir libre)")
+    parser.add_argument('--no-socket', action='store_true', help="Publicar solo en archivo")
+    parser.add_argument('--poll', action='store_true', help="Forzar sondeo en lugar de inotify")
+    parser.add_argument('--interval', type=float, default=1.0, help="Intervalo de sondeo (segundos)")
+    parser.add_argument('--fetch', action='store_true', help="Imprimir el resumen de un daemon en marcha y salir")
+    args = parser.parse_args()
+
+    if args.fetch:
+        report = fetch_report(args.port)
+        print(json.dumps({'summary': report['summary'], 'live': report['live']}, indent=2, ensure_ascii=False))
+        return
+
+    # SIGTERM (p.ej. al cerrar la tarea del editor) también guarda la caché al salir
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    daemon = AnalysisDaemon(
+        args.project,
+        output_path=args.output,
+        port=None if args.no_socket else args.port,
+        force_polling=args.poll,
+        poll_interval=args.interval
+    )
+    daemon.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
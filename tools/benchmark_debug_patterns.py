@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Debug Pattern Benchmark
+Micro-benchmark del detector de código de debug: 9 re.search por línea frente a una búsqueda por patrón sobre el archivo entero
+"""
+
+import re
+import time
+import argparse
+from pathlib import Path
+
+from code_analyzer import DEBUG_PATTERNS, BarSikCodeAnalyzer
+
+DEFAULT_PROJECT_PATH = Path(__file__).resolve().parent.parent / "project"
+
+
+def legacy_find_debug_lines(content):
+    """Implementación original: cada patrón con re.search en cada línea"""
+    debug_lines = []
+    for i, line in enumerate(content.split('\n')):
+        for pattern in DEBUG_PATTERNS:
+            if re.search(pattern, line, re.IGNORECASE):
+                debug_lines.append({
+                    'line_number': i + 1,
+                    'content': line.strip(),
+                    'pattern': pattern
+                })
+
+    return debug_lines
+
+
+def time_detector(detector, contents, repeat):
+    """Mejor tiempo (segundos) de `repeat` pasadas sobre todos los archivos"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in contents:
+            detector(content)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK Debug Pattern Benchmark")
+    parser.add_argument('--project', default=str(DEFAULT_PROJECT_PATH), help="Carpeta con los .gd a medir")
+    parser.add_argument('--repeat', type=int, default=5, help="Pasadas por detector (se toma la mejor)")
+    args = parser.parse_args()
+
+    files = [
+        path for path in sorted(Path(args.project).rglob("*.gd"))
+        if not any(exclude in str(path) for exclude in ['addons', '.godot', 'build'])
+    ]
+    contents = [path.read_text(encoding='utf-8') for path in files]
+    total_lines = sum(len(content.split('\n')) for content in contents)
+
+    print(f"📁 {len(files)} archivos, {total_lines} líneas")
+
+    # Ambos detectores deben dar exactamente el mismo resultado
+    for path, content in zip(files, contents):
+        if legacy_find_debug_lines(content) != BarSikCodeAnalyzer._find_debug_lines(content):
+            print(f"❌ Resultados distintos en {path}")
+            return 1
+
+    legacy = time_detector(legacy_find_debug_lines, contents, args.repeat)
+    per_file = time_detector(BarSikCodeAnalyzer._find_debug_lines, contents, args.repeat)
+
+    print(f"🐢 9 × re.search por línea: {legacy * 1000:.1f} ms ({legacy / total_lines * 1e9:.0f} ns/línea)")
+    print(f"🚀 Búsqueda por archivo:   {per_file * 1000:.1f} ms ({per_file / total_lines * 1e9:.0f} ns/línea)")
+    print(f"📊 Aceleración: {legacy / per_file:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
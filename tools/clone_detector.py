@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Clone Detector
+Detector de código duplicado en proceso (Rabin-Karp sobre tokens GDScript), sustituto de jscpd
+"""
+
+import sys
+import json
+import fnmatch
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+from gdscript_parser import tokenize
+
+DEFAULT_MIN_TOKENS = 50  # Mismos valores por defecto que jscpd
+DEFAULT_MIN_LINES = 5
+DEFAULT_MAX_LINES = 1000
+DEFAULT_CONFIG_PATH = Path(".jscpd.json")
+
+_HASH_MOD = (1 << 61) - 1
+_HASH_BASE = 1000003
+
+
+class CloneDetector:
+    """Clones entre ventanas de `min_tokens` tokens con hash rodante.
+
+    Cada archivo se reduce a su flujo de tokens (sin espacios ni saltos de
+    línea; sin comentarios en modo `weak`, como jscpd). Cada ventana de
+    `min_tokens` tokens se identifica por un hash polinómico que se actualiza
+    en O(1) al avanzar un token. La primera aparición de cada hash queda en
+    el índice; cuando una ventana posterior coincide (verificando los tokens
+    para descartar colisiones) se abre un clon que se extiende mientras las
+    ventanas siguientes sigan coincidiendo en orden. Solo se reportan los
+    clones de entre `min_lines` y `max_lines` líneas.
+    """
+
+    def __init__(self, min_tokens=DEFAULT_MIN_TOKENS, min_lines=DEFAULT_MIN_LINES,
+                 max_lines=DEFAULT_MAX_LINES, mode='mild'):
+        self.min_tokens = min_tokens
+        self.min_lines = min_lines
+        self.max_lines = max_lines
+        self.mode = mode
+        self.sources = []
+        self._token_ids = {}
+
+    def add_source(self, name, content):
+        """Tokenizar un archivo y añadirlo al análisis"""
+        ids = []
+        starts = []
+        ends = []
+        for token in tokenize(content):
+            if token.kind == 'newline' or (token.kind == 'comment' and self.mode == 'weak'):
+                continue
+            ids.append(self._token_ids.setdefault((token.kind, token.value), len(self._token_ids)))
+            starts.append(token.line)
+            ends.append(token.line + token.value.count('\n'))
+
+        self.sources.append({
+            'name': name,
+            'lines': content.split('\n'),
+            'ids': ids,
+            'starts': starts,
+            'ends': ends
+        })
+
+    def detect(self):
+        """Ejecutar la detección; devuelve {'duplicates': [...], 'statistics': {...}} como jscpd"""
+        duplicates = []
+        for origin, origin_start, source, start, windows in self._find_clones():
+            token_count = self.min_tokens + windows - 1
+            first_file = self._location(origin, origin_start, token_count)
+            second_file = self._location(source, start, token_count)
+            lines = second_file['end'] - second_file['start'] + 1
+            if lines < self.min_lines or lines > self.max_lines:
+                continue
+
+            fragment = self.sources[source]['lines'][second_file['start'] - 1:second_file['end']]
+            duplicates.append({
+                'format': 'gdscript',
+                'lines': lines,
+                'tokens': token_count,
+                'fragment': '\n'.join(fragment),
+                'firstFile': first_file,
+                'secondFile': second_file
+            })
+
+        return {'duplicates': duplicates, 'statistics': self._statistics(duplicates)}
+
+    def _find_clones(self):
+        """Tramos duplicados (origen, inicio, archivo, inicio, ventanas) en orden de detección"""
+        window = self.min_tokens
+        high_power = pow(_HASH_BASE, window - 1, _HASH_MOD)
+        index = {}
+        clones = []
+
+        for source_index, source in enumerate(self.sources):
+            ids = source['ids']
+            if len(ids) < window:
+                continue
+
+            current = None  # [origen, inicio en origen, archivo, inicio, ventanas]
+            value = 0
+            for token_id in ids[:window]:
+                value = (value * _HASH_BASE + token_id + 1) % _HASH_MOD
+
+            for position in range(len(ids) - window + 1):
+                if position:
+                    value = ((value - (ids[position - 1] + 1) * high_power) * _HASH_BASE
+                             + ids[position + window - 1] + 1) % _HASH_MOD
+
+                # Extender el clon abierto si la ventana siguiente del origen también coincide
+                if current is not None:
+                    origin_ids = self.sources[current[0]]['ids']
+                    next_origin = current[1] + current[4]
+                    same_file_overlap = current[0] == source_index and next_origin + window > position
+                    if (next_origin + window <= len(origin_ids) and not same_file_overlap
+                            and origin_ids[next_origin + window - 1] == ids[position + window - 1]):
+                        current[4] += 1
+                        continue
+                    clones.append(tuple(current))
+                    current = None
+
+                first = index.get(value)
+                if first is None:
+                    index[value] = (source_index, position)
+                    continue
+
+                origin, origin_start = first
+                if origin == source_index and origin_start + window > position:
+                    continue  # Solapada consigo misma: no es un clon
+                origin_ids = self.sources[origin]['ids']
+                if origin_ids[origin_start:origin_start + window] == ids[position:position + window]:
+                    current = [origin, origin_start, source_index, position, 1]
+
+            if current is not None:
+                clones.append(tuple(current))
+
+        return clones
+
+    def _location(self, source_index, start, token_count):
+        """Archivo y líneas de un tramo de tokens"""
+        source = self.sources[source_index]
+        return {
+            'name': source['name'],
+            'start': source['starts'][start],
+            'end': source['ends'][start + token_count - 1]
+        }
+
+    def _statistics(self, duplicates):
+        """Totales al estilo de jscpd (líneas duplicadas distintas, no sumadas por clon)"""
+        total_lines = sum(len(source['lines']) for source in self.sources)
+        total_tokens = sum(len(source['ids']) for source in self.sources)
+
+        duplicated_lines = {}
+        for duplicate in duplicates:
+            second_file = duplicate['secondFile']
+            duplicated_lines.setdefault(second_file['name'], set()).update(
+                range(second_file['start'], second_file['end'] + 1)
+            )
+        duplicated_line_count = sum(len(lines) for lines in duplicated_lines.values())
+        duplicated_token_count = sum(duplicate['tokens'] for duplicate in duplicates)
+
+        return {
+            'detectionDate': datetime.now().isoformat(),
+            'total': {
+                'sources': len(self.sources),
+                'lines': total_lines,
+                'tokens': total_tokens,
+                'clones': len(duplicates),
+                'duplicatedLines': duplicated_line_count,
+                'duplicatedTokens': duplicated_token_count,
+                'percentage': round(duplicated_line_count / total_lines * 100, 2) if total_lines else 0,
+                'percentageTokens': round(duplicated_token_count / total_tokens * 100, 2) if total_tokens else 0
+            }
+        }
+
+
+def load_config(config_path=DEFAULT_CONFIG_PATH):
+    """Opciones de .jscpd.json (o {} si no existe)"""
+    config_path = Path(config_path)
+    if not config_path.exists():
+        return {}
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def find_sources(paths, exclude=()):
+    """Archivos .gd bajo `paths` que no coinciden con ningún glob de `exclude`"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        candidates = [path] if path.is_file() else sorted(path.rglob("*.gd"))
+        for file_path in candidates:
+            relative = file_path.as_posix()
+            if not any(fnmatch.fnmatch(relative, pattern) or fnmatch.fnmatch('/' + relative, pattern)
+                       for pattern in exclude):
+                files.append(file_path)
+
+    return files
+
+
+def detect_clones(paths, min_tokens=DEFAULT_MIN_TOKENS, min_lines=DEFAULT_MIN_LINES,
+                  max_lines=DEFAULT_MAX_LINES, mode='mild', exclude=()):
+    """Atajo: leer los archivos de `paths` y devolver el reporte de clones"""
+    detector = CloneDetector(min_tokens, min_lines, max_lines, mode)
+    for file_path in find_sources(paths, exclude):
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            detector.add_source(file_path.as_posix(), f.read())
+
+    return detector.detect()
+
+
+def format_summary(report):
+    """Líneas de resumen para consola"""
+    total = report['statistics']['total']
+    return [
+        f"📁 Archivos analizados: {total['sources']}",
+        f"🔄 Clones encontrados: {total['clones']}",
+        f"📏 Líneas duplicadas: {total['duplicatedLines']} de {total['lines']} ({total['percentage']}%)",
+        f"🔤 Tokens duplicados: {total['duplicatedTokens']} de {total['tokens']} ({total['percentageTokens']}%)"
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK Clone Detector (sustituto de jscpd para GDScript)")
+    parser.add_argument('paths', nargs='*', help="Carpetas o archivos .gd (por defecto: project/)")
+    parser.add_argument('--config', default=str(DEFAULT_CONFIG_PATH), help="Configuración estilo jscpd")
+    parser.add_argument('--min-tokens', type=int, help="Tokens mínimos de un clon")
+    parser.add_argument('--min-lines', type=int, help="Líneas mínimas de un clon")
+    parser.add_argument('--max-lines', type=int, help="Líneas máximas de un clon")
+    parser.add_argument('--mode', choices=['strict', 'mild', 'weak'], help="weak ignora los comentarios")
+    parser.add_argument('--threshold', type=float, help="Porcentaje máximo de duplicación (falla si se supera)")
+    parser.add_argument('--ignore', help="Globs a excluir separados por comas")
+    parser.add_argument('--output', help="Carpeta donde guardar jscpd-report.json")
+    parser.add_argument('--silent', action='store_true', help="No listar cada clon")
+    args = parser.parse_args()
+
+    # La línea de comandos tiene prioridad sobre .jscpd.json, como en jscpd
+    config = load_config(args.config)
+    exclude = args.ignore.split(',') if args.ignore else config.get('ignore', config.get('exclude', []))
+    threshold = args.threshold if args.threshold is not None else config.get('threshold')
+
+    report = detect_clones(
+        args.paths or ['project/'],
+        min_tokens=args.min_tokens or config.get('minTokens', DEFAULT_MIN_TOKENS),
+        min_lines=args.min_lines or config.get('minLines', DEFAULT_MIN_LINES),
+        max_lines=args.max_lines or config.get('maxLines', DEFAULT_MAX_LINES),
+        mode=args.mode or config.get('mode', 'mild'),
+        exclude=exclude
+    )
+
+    if not args.silent:
+        for duplicate in report['duplicates']:
+            first, second = duplicate['firstFile'], duplicate['secondFile']
+            print(f"🔁 Clon ({duplicate['lines']} líneas, {duplicate['tokens']} tokens):")
+            print(f"   - {first['name']} [{first['start']}:{first['end']}]")
+            print(f"     {second['name']} [{second['start']}:{second['end']}]")
+
+    for line in format_summary(report):
+        print(line)
+
+    if args.output:
+        output_path = Path(args.output) / "jscpd-report.json"
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"📄 Reporte JSON: {output_path}")
+
+    percentage = report['statistics']['total']['percentage']
+    if threshold is not None and percentage > threshold:
+        print(f"❌ Duplicación {percentage}% por encima del umbral ({threshold}%)")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
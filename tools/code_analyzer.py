@@ -7,14 +7,62 @@ Análisis personalizado de duplicación y calidad de código para proyectos Godo
 import os
 import re
 import json
+import hashlib
+import argparse
 from pathlib import Path
 from collections import defaultdict, Counter
+from concurrent.futures import ProcessPoolExecutor
 from difflib import SequenceMatcher
 
+from analysis_cache import AnalysisCache
+from similarity_index import MinHashLSHIndex, exact_similarity
+from gdscript_parser import parse_script
+from dependency_graph import DependencyGraph
+
+SIMILARITY_THRESHOLD = 0.7  # Umbral de similaridad entre funciones
+
+DEBUG_PATTERNS = [
+    r'print\s*\(',
+    r'push_warning\s*\(',
+    r'#.*DEBUG',
+    r'#.*TEST',
+    r'#.*TEMP',
+    r'extends.*Test',
+    r'class_name.*Test',
+    r'func.*test_',
+    r'func.*debug_'
+]
+
+# Patrones precompilados sobre el texto ya en minúsculas: sin IGNORECASE el
+# motor de re salta directamente al literal inicial de cada patrón (print,
+# #, func...), así que cada uno recorre el archivo entero en una sola
+# búsqueda. DEBUG_PATTERNS no usa escapes en mayúscula (\S, \W...), por lo que
+# pasarlos a minúsculas no cambia su significado.
+_DEBUG_REGEXES = [re.compile(pattern.lower()) for pattern in DEBUG_PATTERNS]
+
+# Equivalencias de IGNORECASE que str.lower() no aplica
+_CASE_FOLDS = (('\u0130', 'i'), ('\u0131', 'i'), ('\u017f', 's'), ('\u212a', 'k'))
+
+SINGLETON_NAMES = ('GameEvents', 'SaveSystem', 'Router', 'AppConfig', 'StockManager')
+
+# Datos por archivo que se extraen en la pasada única (y se cachean)
+FILE_NAMESPACES = ('functions', 'debug_lines', 'complexity', 'dependencies')
+
+def _text_hash(text):
+    """Clave de memoización estable para un texto"""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
 class BarSikCodeAnalyzer:
-    def __init__(self, project_path):
+    def __init__(self, project_path, cache=None, jobs=1):
         self.project_path = Path(project_path)
         self.gdscript_files = []
+        self.cache = cache if cache is not None else AnalysisCache()
+        self.jobs = jobs
+        self.file_facts = None
+        # Índice de similitud vivo entre análisis (modo vigilancia)
+        self._similarity_index = None
+        self._indexed_files = {}
+        self._candidate_pairs = set()
         self.analysis_results = {
             'duplicated_functions': [],
             'similar_patterns': [],
@@ -39,208 +87,316 @@ class BarSikCodeAnalyzer:
 
         print(f"📁 Encontrados {len(self.gdscript_files)} archivos GDScript")
 
-    def extract_functions(self, content):
-        """Extraer funciones de un archivo GDScript"""
-        functions = []
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines):
-            # Detectar definiciones de funciones
-            func_match = re.match(r'^\s*func\s+(\w+)\s*\([^)]*\)', line.strip())
-            if func_match:
-                func_name = func_match.group(1)
-                # Extraer cuerpo de la función (simplificado)
-                func_body = []
-                j = i + 1
-                indent_level = len(line) - len(line.lstrip())
-
-                while j < len(lines):
-                    current_line = lines[j]
-                    if current_line.strip() == '':
-                        j += 1
-                        continue
-
-                    current_indent = len(current_line) - len(current_line.lstrip())
-                    if current_indent <= indent_level and current_line.strip():
-                        break
-
-                    func_body.append(current_line.strip())
-                    j += 1
-
-                functions.append({
-                    'name': func_name,
-                    'line': i + 1,
-                    'body': '\n'.join(func_body),
-                    'signature': line.strip()
-                })
+    def load_file_facts(self):
+        """Leer cada archivo una sola vez y extraer todos sus datos (en paralelo si jobs > 1)"""
+        if self.jobs > 1:
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                facts, errors = self.cache.get_many(self.gdscript_files, FILE_NAMESPACES, analyze_file_content, executor)
+        else:
+            facts, errors = self.cache.get_many(self.gdscript_files, FILE_NAMESPACES, analyze_file_content)
+
+        for file_path, error in errors.items():
+            print(f"⚠️  Error leyendo {file_path}: {error}")
+
+        self.file_facts = facts
+        return facts
+
+    def _get_file_facts(self):
+        if self.file_facts is None:
+            self.load_file_facts()
+        return self.file_facts
+
+    def update_files(self, file_paths):
+        """Releer solo los archivos indicados (nuevos, modificados o borrados)"""
+        facts = self._get_file_facts()
+        file_paths = [Path(file_path) for file_path in file_paths]
+        removed = {file_path for file_path in file_paths if not file_path.exists()}
+        changed = [file_path for file_path in file_paths if file_path not in removed]
+
+        known = set(self.gdscript_files)
+        self.gdscript_files = [file_path for file_path in self.gdscript_files if file_path not in removed]
+        self.gdscript_files.extend(file_path for file_path in changed if file_path not in known)
+
+        new_facts, errors = self.cache.get_many(changed, FILE_NAMESPACES, analyze_file_content)
+        for file_path, error in errors.items():
+            print(f"⚠️  Error leyendo {file_path}: {error}")
+
+        facts.update(new_facts)
+        self.file_facts = {file_path: facts[file_path] for file_path in self.gdscript_files if file_path in facts}
+
+    def refresh_analysis(self):
+        """Recalcular los resultados a partir de los datos por archivo ya cargados"""
+        self.analyze_function_similarity()
+        self.detect_debug_code()
+        self.analyze_complexity()
+        self.analyze_dependencies()
+        return self.generate_report()
 
-        return functions
+    @staticmethod
+    def extract_functions(content):
+        """Extraer funciones de un archivo GDScript (desde el AST compartido)"""
+        return [
+            {
+                'name': func['name'],
+                'line': func['line'],
+                'body': func['body'],
+                'signature': func['signature']
+            }
+            for func in parse_script(content)['functions']
+        ]
 
     def analyze_function_similarity(self):
         """Analizar similaridad entre funciones"""
         all_functions = {}
-
-        for file_path in self.gdscript_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    functions = self.extract_functions(content)
-                    all_functions[str(file_path)] = functions
-            except Exception as e:
-                print(f"⚠️  Error leyendo {file_path}: {e}")
+        file_hashes = []
+
+        for file_path, facts in self._get_file_facts().items():
+            all_functions[str(file_path)] = facts['functions']
+            file_hashes.append((str(file_path), self.cache.content_hash(file_path)))
+
+        # Sin cambios desde la última ejecución: el reporte completo está en caché
+        fingerprint = hashlib.sha1(json.dumps([SIMILARITY_THRESHOLD, file_hashes]).encode('utf-8')).hexdigest()
+        self.analysis_results['duplicated_functions'] = self.cache.memo(
+            'duplicated_functions', fingerprint, lambda: self._find_duplicated_functions(all_functions, dict(file_hashes))
+        )
+
+    def _sync_similarity_index(self, all_functions, file_hashes):
+        """Pares candidatos ((ruta, índice), (ruta, índice)) del índice MinHash/LSH.
+
+        El índice y los candidatos se conservan entre llamadas: solo se
+        reindexan los archivos cuyo hash cambió (o que aparecen/desaparecen).
+        """
+        if self._similarity_index is None:
+            self._similarity_index = MinHashLSHIndex()
+        index = self._similarity_index
+        first_build = not self._indexed_files
+
+        stale = {
+            file_path for file_path, indexed in self._indexed_files.items()
+            if file_hashes.get(file_path) != indexed[0]
+        }
+        for file_path in stale:
+            for func_index in range(self._indexed_files.pop(file_path)[1]):
+                index.remove((file_path, func_index))
+        if stale:
+            self._candidate_pairs = {
+                pair for pair in self._candidate_pairs
+                if pair[0][0] not in stale and pair[1][0] not in stale
+            }
+
+        signature_section = f"minhash:{index.config_key}"
+        new_keys = []
+        for file_path, functions in all_functions.items():
+            if file_path in self._indexed_files:
                 continue
-
-        # Comparar funciones entre archivos
+            for func_index, func in enumerate(functions):
+                body = func['body']
+                signature = self.cache.memo(signature_section, _text_hash(body), lambda: index.signature(body))
+                if index.add((file_path, func_index), body, signature):
+                    new_keys.append((file_path, func_index))
+            self._indexed_files[file_path] = (file_hashes[file_path], len(functions))
+
+        if first_build:
+            self._candidate_pairs = set(index.candidate_pairs())
+        else:
+            for key in new_keys:
+                self._candidate_pairs.update(tuple(sorted((key, other))) for other in index.candidates(key))
+
+        return self._candidate_pairs
+
+    def _find_duplicated_functions(self, all_functions, file_hashes):
+        """Pares de funciones similares entre archivos distintos"""
+        # Comparar solo los candidatos del índice MinHash/LSH
+        file_order = {file_path: index for index, file_path in enumerate(all_functions)}
+        candidates = set()
+        for key1, key2 in self._sync_similarity_index(all_functions, file_hashes):
+            if key1[0] == key2[0]:
+                continue  # Solo interesan duplicaciones entre archivos distintos
+            # Mismo orden que la comparación por pares: file1 < file2 (por ruta)
+            if key1[0] > key2[0]:
+                key1, key2 = key2, key1
+            if len(all_functions[key1[0]][key1[1]]['body']) > 20:
+                candidates.add((file_order[key1[0]], key1[1], file_order[key2[0]], key2[1]))
+
+        files = list(all_functions)
+        matcher = SequenceMatcher(None)
         duplicated = []
 
-        for file1, functions1 in all_functions.items():
-            for func1 in functions1:
-                for file2, functions2 in all_functions.items():
-                    if file1 >= file2:  # Evitar comparaciones duplicadas
-                        continue
-
-                    for func2 in functions2:
-                        # Comparar cuerpos de funciones
-                        similarity = SequenceMatcher(None, func1['body'], func2['body']).ratio()
-
-                        if similarity > 0.7 and len(func1['body']) > 20:  # Umbral de similaridad
-                            duplicated.append({
-                                'similarity': similarity,
-                                'function1': {
-                                    'file': file1,
-                                    'name': func1['name'],
-                                    'line': func1['line'],
-                                    'signature': func1['signature']
-                                },
-                                'function2': {
-                                    'file': file2,
-                                    'name': func2['name'],
-                                    'line': func2['line'],
-                                    'signature': func2['signature']
-                                }
-                            })
-
-        self.analysis_results['duplicated_functions'] = sorted(duplicated, key=lambda x: x['similarity'], reverse=True)
+        # Agrupar por func2 para que el matcher reutilice su índice de la segunda secuencia
+        for order_key in sorted(candidates, key=lambda x: (x[2], x[3], x[0], x[1])):
+            file1, file2 = files[order_key[0]], files[order_key[2]]
+            func1 = all_functions[file1][order_key[1]]
+            func2 = all_functions[file2][order_key[3]]
+
+            # Comparar cuerpos de funciones (memorizado por contenido de ambos cuerpos)
+            pair_key = _text_hash(func1['body'] + '\0' + func2['body'])
+            similarity = self.cache.memo(
+                'function_similarity', pair_key,
+                lambda: exact_similarity(func1['body'], func2['body'], SIMILARITY_THRESHOLD, matcher)
+            )
+            if similarity is None:
+                continue
+
+            duplicated.append((order_key, {
+                'similarity': similarity,
+                'function1': {
+                    'file': file1,
+                    'name': func1['name'],
+                    'line': func1['line'],
+                    'signature': func1['signature']
+                },
+                'function2': {
+                    'file': file2,
+                    'name': func2['name'],
+                    'line': func2['line'],
+                    'signature': func2['signature']
+                }
+            }))
+
+        # Orden estable idéntico al del recorrido por pares original
+        duplicated = [entry for _, entry in sorted(duplicated, key=lambda x: x[0])]
+        return sorted(duplicated, key=lambda x: x['similarity'], reverse=True)
 
     def detect_debug_code(self):
         """Detectar código de debug en archivos de producción"""
-        debug_patterns = [
-            r'print\s*\(',
-            r'push_warning\s*\(',
-            r'#.*DEBUG',
-            r'#.*TEST',
-            r'#.*TEMP',
-            r'extends.*Test',
-            r'class_name.*Test',
-            r'func.*test_',
-            r'func.*debug_'
-        ]
-
         debug_files = []
 
-        for file_path in self.gdscript_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                    debug_lines = []
-                    for i, line in enumerate(lines):
-                        for pattern in debug_patterns:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                debug_lines.append({
-                                    'line_number': i + 1,
-                                    'content': line.strip(),
-                                    'pattern': pattern
-                                })
-
-                    if debug_lines:
-                        debug_files.append({
-                            'file': str(file_path),
-                            'debug_lines': debug_lines,
-                            'total_debug_lines': len(debug_lines)
-                        })
-            except Exception as e:
-                continue
+        for file_path, facts in self._get_file_facts().items():
+            debug_lines = facts['debug_lines']
+            if debug_lines:
+                debug_files.append({
+                    'file': str(file_path),
+                    'debug_lines': debug_lines,
+                    'total_debug_lines': len(debug_lines)
+                })
 
         self.analysis_results['debug_code'] = sorted(debug_files, key=lambda x: x['total_debug_lines'], reverse=True)
 
+    @staticmethod
+    def _find_debug_lines(content):
+        """Líneas de debug de un archivo (una entrada por cada patrón que coincide)"""
+        lines = content.split('\n')
+        folded = content
+        for char, replacement in _CASE_FOLDS:
+            if char in folded:
+                folded = folded.replace(char, replacement)
+        folded = folded.lower()
+        hits = []
+
+        for index, regex in enumerate(_DEBUG_REGEXES):
+            line_number = 0
+            position = 0
+            match = regex.search(folded)
+            while match:
+                line_number += folded.count('\n', position, match.start())
+                hits.append((line_number, index))
+
+                # Un acierto por línea y patrón: seguir en la línea siguiente
+                position = folded.find('\n', match.start())
+                if position == -1:
+                    break
+                match = regex.search(folded, position)
+
+        return [
+            {
+                'line_number': line_number + 1,
+                'content': lines[line_number].strip(),
+                'pattern': DEBUG_PATTERNS[index]
+            }
+            for line_number, index in sorted(hits)
+        ]
+
     def analyze_complexity(self):
         """Analizar complejidad de archivos"""
         complex_files = []
 
-        for file_path in self.gdscript_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    lines = content.split('\n')
-
-                    metrics = {
-                        'total_lines': len(lines),
-                        'code_lines': len([l for l in lines if l.strip() and not l.strip().startswith('#')]),
-                        'functions': len(self.extract_functions(content)),
-                        'classes': len(re.findall(r'class\s+\w+', content)),
-                        'signals': len(re.findall(r'signal\s+\w+', content)),
-                        'properties': len(re.findall(r'@export\s+var\s+\w+', content)),
-                        'complexity_score': 0
-                    }
-
-                    # Calcular puntuación de complejidad
-                    metrics['complexity_score'] = (
-                        metrics['code_lines'] * 0.1 +
-                        metrics['functions'] * 2 +
-                        metrics['classes'] * 5 +
-                        metrics['signals'] * 1
-                    )
-
-                    if metrics['complexity_score'] > 50:
-                        complex_files.append({
-                            'file': str(file_path),
-                            'metrics': metrics
-                        })
-            except Exception as e:
-                continue
+        for file_path, facts in self._get_file_facts().items():
+            metrics = facts['complexity']
+            if metrics['complexity_score'] > 50:
+                complex_files.append({
+                    'file': str(file_path),
+                    'metrics': metrics
+                })
 
         self.analysis_results['complex_files'] = sorted(complex_files, key=lambda x: x['metrics']['complexity_score'], reverse=True)
 
+    @staticmethod
+    def _complexity_metrics(content, functions=None):
+        """Métricas de complejidad de un archivo"""
+        lines = content.split('\n')
+        script = parse_script(content)
+        if functions is None:
+            functions = script['functions']
+
+        metrics = {
+            'total_lines': len(lines),
+            'code_lines': len([l for l in lines if l.strip() and not l.strip().startswith('#')]),
+            'functions': len(functions),
+            'classes': len(script['classes']),
+            'signals': len(script['signals']),
+            'properties': len(script['exports']),
+            'complexity_score': 0
+        }
+
+        # Calcular puntuación de complejidad
+        metrics['complexity_score'] = (
+            metrics['code_lines'] * 0.1 +
+            metrics['functions'] * 2 +
+            metrics['classes'] * 5 +
+            metrics['signals'] * 1
+        )
+
+        return metrics
+
     def analyze_dependencies(self):
         """Analizar dependencias entre archivos"""
         dependencies = defaultdict(list)
 
-        for file_path in self.gdscript_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                    # Buscar preloads
-                    preload_matches = re.findall(r'preload\s*\(\s*["\']([^"\']+)["\']', content)
-                    for match in preload_matches:
-                        dependencies[str(file_path)].append({
-                            'type': 'preload',
-                            'path': match
-                        })
-
-                    # Buscar extensiones de clases
-                    extends_matches = re.findall(r'extends\s+(\w+)', content)
-                    for match in extends_matches:
-                        dependencies[str(file_path)].append({
-                            'type': 'extends',
-                            'class': match
-                        })
-
-                    # Buscar referencias a singletons
-                    singleton_refs = re.findall(r'\b(GameEvents|SaveSystem|Router|AppConfig|StockManager)\b', content)
-                    for ref in set(singleton_refs):
-                        dependencies[str(file_path)].append({
-                            'type': 'singleton',
-                            'name': ref
-                        })
-
-            except Exception as e:
-                continue
+        for file_path, facts in self._get_file_facts().items():
+            edges = facts['dependencies']
+            if edges:
+                dependencies[str(file_path)].extend(edges)
 
         self.analysis_results['dependencies'] = dict(dependencies)
 
+        # Grafo del proyecto completo (autoloads, class_name, escenas): ciclos y fan-in
+        if (self.project_path / "project.godot").exists():
+            graph = DependencyGraph(self.project_path, self.cache).build()
+            self.analysis_results['dependency_graph'] = graph.summary()
+
+    @staticmethod
+    def _file_dependencies(content):
+        """Aristas de dependencia (preloads, extends, singletons) de un archivo"""
+        edges = []
+        script = parse_script(content)
+
+        # Preloads con ruta literal
+        for preload in script['preloads']:
+            if preload['kind'] == 'preload':
+                edges.append({
+                    'type': 'preload',
+                    'path': preload['path']
+                })
+
+        # Extensiones de clases (script y clases internas)
+        extends_targets = [script['extends']] + [inner['extends'] for inner in script['classes']]
+        for target in extends_targets:
+            if target:
+                edges.append({
+                    'type': 'extends',
+                    'class': target
+                })
+
+        # Referencias a singletons (orden de primera aparición)
+        for ref in script['global_refs']:
+            if ref in SINGLETON_NAMES:
+                edges.append({
+                    'type': 'singleton',
+                    'name': ref
+                })
+
+        return edges
+
     def generate_report(self):
         """Generar reporte completo"""
         report = {
@@ -260,6 +416,8 @@ class BarSikCodeAnalyzer:
         print("🔍 Iniciando análisis de código BAR-SIK...")
 
         self.scan_gdscript_files()
+        print(f"📖 Leyendo archivos (jobs: {self.jobs})...")
+        self.load_file_facts()
         print("📋 Analizando duplicación de funciones...")
         self.analyze_function_similarity()
         print("🐛 Detectando código de debug...")
@@ -269,11 +427,28 @@ class BarSikCodeAnalyzer:
         print("🔗 Analizando dependencias...")
         self.analyze_dependencies()
 
+        self.cache.save()
+        print(self.cache.stats_line())
         print("✅ Análisis completado")
         return self.generate_report()
 
+def analyze_file_content(content):
+    """Todos los datos por archivo en una sola pasada (picklable para ProcessPoolExecutor)"""
+    functions = BarSikCodeAnalyzer.extract_functions(content)
+    return {
+        'functions': functions,
+        'debug_lines': BarSikCodeAnalyzer._find_debug_lines(content),
+        'complexity': BarSikCodeAnalyzer._complexity_metrics(content, functions),
+        'dependencies': BarSikCodeAnalyzer._file_dependencies(content)
+    }
+
 def main():
-    analyzer = BarSikCodeAnalyzer("E:/GitHub/bar-sik/project")
+    parser = argparse.ArgumentParser(description="BAR-SIK Code Analysis Tool")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Procesos para el escaneo de archivos (1 = serie)")
+    args = parser.parse_args()
+
+    analyzer = BarSikCodeAnalyzer("E:/GitHub/bar-sik/project", jobs=max(1, args.jobs))
     report = analyzer.run_analysis()
 
     # Guardar reporte
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Dependency Graph
+Índice de dependencias del proyecto (autoloads, class_name, preload/load, extends y recursos de .tscn/.tres) con consultas de dependientes, ciclos y fan-in
+"""
+
+import os
+import re
+import json
+import time
+import argparse
+from pathlib import Path
+from collections import deque
+
+from analysis_cache import AnalysisCache
+from gdscript_parser import parse_script
+
+DEFAULT_PROJECT_PATH = Path(__file__).resolve().parent.parent / "project"
+EXCLUDED_DIRS = ('build', 'builds', 'addons')
+RESOURCE_SUFFIXES = ('.gd', '.tscn', '.tres')
+
+# Tipos de arista: 'preload' y 'load' (rutas literales), 'extends' (ruta o
+# class_name), 'class_name' (uso de una clase global), 'autoload' (uso de un
+# singleton), 'script' (script adjunto en .tscn/.tres) y 'resource' (resto
+# de ext_resource: escenas instanciadas, texturas, temas...)
+EDGE_KINDS = ('preload', 'load', 'extends', 'class_name', 'autoload', 'script', 'resource')
+
+_SECTION = re.compile(r'^\[(\w+)\]\s*$')
+_AUTOLOAD = re.compile(r'^(\w+)="\*?([^"]+)"')
+_MAIN_SCENE = re.compile(r'^run/main_scene="([^"]+)"')
+_EXT_RESOURCE = re.compile(r'^\[ext_resource\b([^\]]*)\]', re.MULTILINE)
+_HEADER_UID = re.compile(r'^\[gd_(?:scene|resource)\b[^\]]*\buid="([^"]+)"')
+_ATTRIBUTE = re.compile(r'(\w+)="([^"]*)"')
+
+
+def script_references(content):
+    """Referencias de un .gd a otros recursos (independiente de la ruta, cacheable)"""
+    script = parse_script(content)
+    return {
+        'class_name': script['class_name'],
+        'extends': [target for target in [script['extends']] + [inner['extends'] for inner in script['classes']]
+                    if target],
+        'loads': [{'kind': preload['kind'], 'path': preload['path'], 'line': preload['line']}
+                  for preload in script['preloads']],
+        'global_refs': script['global_refs']
+    }
+
+
+def resource_references(content):
+    """ext_resource de un .tscn/.tres y su uid propio"""
+    header = _HEADER_UID.match(content)
+    resources = []
+    for match in _EXT_RESOURCE.finditer(content):
+        attributes = dict(_ATTRIBUTE.findall(match.group(1)))
+        resources.append({
+            'type': attributes.get('type', ''),
+            'path': attributes.get('path', ''),
+            'uid': attributes.get('uid', '')
+        })
+
+    return {'uid': header.group(1) if header else '', 'ext_resources': resources}
+
+
+def read_project_settings(project_file):
+    """Autoloads ({nombre: ruta res://}, en orden) y escena principal de project.godot"""
+    autoloads = {}
+    main_scene = None
+    section = None
+
+    with open(project_file, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            header = _SECTION.match(line)
+            if header:
+                section = header.group(1)
+            elif section == 'autoload':
+                match = _AUTOLOAD.match(line)
+                if match:
+                    autoloads[match.group(1)] = match.group(2)
+            elif section == 'application':
+                match = _MAIN_SCENE.match(line)
+                if match:
+                    main_scene = match.group(1)
+
+    return autoloads, main_scene
+
+
+class DependencyGraph:
+    """Grafo dirigido recurso -> recurso del que depende, con rutas res:// como nodos.
+
+    Las referencias por archivo salen de AnalysisCache (solo se reparsean los
+    archivos modificados). Al construir se resuelven class_name, autoloads,
+    uid:// y rutas relativas, y se guardan las aristas en ambos sentidos, de
+    modo que dependencias y dependientes directos son búsquedas en diccionario.
+    Las componentes fuertemente conexas (Tarjan) se calculan una vez y sirven
+    para ciclos y orden de carga.
+    """
+
+    def __init__(self, project_path=DEFAULT_PROJECT_PATH, cache=None, exclude_dirs=EXCLUDED_DIRS):
+        self.project_path = Path(project_path)
+        self.cache = cache if cache is not None else AnalysisCache()
+        self.exclude_dirs = tuple(exclude_dirs)
+        self.autoloads = {}
+        self.main_scene = None
+        self.class_names = {}
+        self.edges = {}      # {nodo: {dependencia: [tipos]}}
+        self.reverse = {}    # {nodo: {dependiente: [tipos]}}
+        self.load_sites = {}  # {nodo: [(tipo, recurso, línea)]} de sus preload/load
+        self._components = None
+
+    def build(self):
+        """(Re)construir el índice completo"""
+        project_file = self.project_path / "project.godot"
+        if project_file.exists():
+            self.autoloads, self.main_scene = read_project_settings(project_file)
+
+        references = {}
+        uids = {}
+        for file_path in self._scan_files():
+            node = self.to_res_path(file_path)
+            if file_path.suffix == '.gd':
+                references[node] = self.cache.get(file_path, 'dependency_refs', script_references, errors='ignore')
+                uid_file = file_path.with_name(file_path.name + '.uid')
+                if uid_file.exists():
+                    uids[uid_file.read_text(encoding='utf-8').strip()] = node
+            else:
+                references[node] = self.cache.get(file_path, 'resource_refs', resource_references, errors='ignore')
+                if references[node]['uid']:
+                    uids[references[node]['uid']] = node
+
+        self.class_names = {
+            refs['class_name']: node for node, refs in references.items()
+            if node.endswith('.gd') and refs['class_name']
+        }
+        self.edges = {node: {} for node in references}
+        self.reverse = {node: {} for node in references}
+        self.load_sites = {}
+        self._components = None
+
+        for node, refs in references.items():
+            if node.endswith('.gd'):
+                self._add_script_edges(node, refs, uids)
+            else:
+                for resource in refs['ext_resources']:
+                    target = self._resolve_path(node, resource['path'], uids, resource['uid'])
+                    self._add_edge(node, target, 'script' if resource['type'] == 'Script' else 'resource')
+
+        return self
+
+    def _scan_files(self):
+        files = []
+        for root, dirs, names in os.walk(self.project_path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d not in self.exclude_dirs)
+            files.extend(Path(root) / name for name in sorted(names) if name.endswith(RESOURCE_SUFFIXES))
+
+        return files
+
+    def _add_script_edges(self, node, refs, uids):
+        for load in refs['loads']:
+            target = self._resolve_path(node, load['path'], uids)
+            self._add_edge(node, target, load['kind'])
+            self.load_sites.setdefault(node, []).append((load['kind'], target, load['line']))
+
+        for target in refs['extends']:
+            if target in self.class_names:
+                self._add_edge(node, self.class_names[target], 'extends')
+            elif '/' in target or target.endswith('.gd'):
+                self._add_edge(node, self._resolve_path(node, target, uids), 'extends')
+
+        for name in refs['global_refs']:
+            if name in self.autoloads:
+                self._add_edge(node, self.autoloads[name], 'autoload')
+            elif name in self.class_names and name not in refs['extends']:
+                self._add_edge(node, self.class_names[name], 'class_name')
+
+    def _add_edge(self, source, target, kind):
+        if not target or target == source:
+            return
+
+        kinds = self.edges[source].setdefault(target, [])
+        if kind not in kinds:
+            kinds.append(kind)
+        self.edges.setdefault(target, {})
+        self.reverse.setdefault(target, {})[source] = kinds
+
+    def _resolve_path(self, node, path, uids, uid=''):
+        """Ruta res:// de una referencia (absoluta, relativa al archivo o uid://)"""
+        if uid in uids and (not path or path not in self.edges):
+            return uids[uid]
+        if path.startswith('uid://'):
+            return uids.get(path)
+        if not path or path.startswith('res://'):
+            return path or None
+
+        base = node[len('res://'):].rsplit('/', 1)[0] if '/' in node[len('res://'):] else ''
+        return 'res://' + os.path.normpath(os.path.join(base, path)).replace(os.sep, '/')
+
+    def to_res_path(self, file_path):
+        """Ruta de disco -> res://"""
+        relative = Path(file_path).resolve().relative_to(self.project_path.resolve())
+        return 'res://' + relative.as_posix()
+
+    def to_file_path(self, node):
+        """res:// -> ruta de disco"""
+        return self.project_path / node[len('res://'):]
+
+    def resolve(self, name):
+        """Nodo a partir de ruta res://, ruta relativa al proyecto, autoload o class_name"""
+        if name in self.edges:
+            return name
+        if name in self.autoloads:
+            return self.autoloads[name]
+        if name in self.class_names:
+            return self.class_names[name]
+        candidate = 'res://' + name.replace('\\', '/').lstrip('./')
+        return candidate if candidate in self.edges else None
+
+    def dependencies(self, node, transitive=False, kinds=None):
+        """Recursos de los que depende `node` (directos o todo el cierre)"""
+        return self._walk(self.edges, node, transitive, kinds)
+
+    def dependents(self, node, transitive=True, kinds=None):
+        """Recursos afectados si cambia `node` (por defecto, todo el cierre inverso)"""
+        return self._walk(self.reverse, node, transitive, kinds)
+
+    @staticmethod
+    def _walk(adjacency, node, transitive, kinds):
+        """Recorrido en anchura; devuelve los nodos alcanzados en orden de distancia"""
+        seen = {node}
+        order = []
+        queue = deque([node])
+        while queue:
+            current = queue.popleft()
+            for neighbour, edge_kinds in adjacency.get(current, {}).items():
+                if neighbour in seen or (kinds and not any(kind in kinds for kind in edge_kinds)):
+                    continue
+                seen.add(neighbour)
+                order.append(neighbour)
+                if transitive:
+                    queue.append(neighbour)
+
+        return order
+
+    def components(self):
+        """Componentes fuertemente conexas (Tarjan iterativo) en orden inverso topológico:
+        cada componente aparece después de todas aquellas de las que depende"""
+        if self._components is not None:
+            return self._components
+
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        counter = 0
+
+        for root in self.edges:
+            if root in index:
+                continue
+            work = [(root, iter(self.edges[root]))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+
+            while work:
+                node, neighbours = work[-1]
+                advanced = False
+                for neighbour in neighbours:
+                    if neighbour not in index:
+                        index[neighbour] = lowlink[neighbour] = counter
+                        counter += 1
+                        stack.append(neighbour)
+                        on_stack.add(neighbour)
+                        work.append((neighbour, iter(self.edges[neighbour])))
+                        advanced = True
+                        break
+                    if neighbour in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbour])
+                if advanced:
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(sorted(component))
+
+        self._components = components
+        return components
+
+    def cycles(self, kinds=None):
+        """Grupos de recursos con dependencias circulares.
+
+        Sin `kinds` usa todas las aristas; con p.ej. ('preload', 'extends',
+        'class_name') se limita a los ciclos que Godot resuelve al cargar.
+        """
+        if not kinds:
+            return [component for component in self.components() if len(component) > 1]
+
+        subgraph = DependencyGraph(self.project_path, self.cache, self.exclude_dirs)
+        subgraph.edges = {
+            node: {target: edge_kinds for target, edge_kinds in targets.items()
+                   if any(kind in kinds for kind in edge_kinds)}
+            for node, targets in self.edges.items()
+        }
+        return subgraph.cycles()
+
+    def fan_in(self, top=10):
+        """Nodos con más dependientes directos: [(nodo, directos, transitivos)]"""
+        ranked = sorted(self.reverse, key=lambda node: (-len(self.reverse[node]), node))[:top]
+        return [(node, len(self.reverse[node]), len(self.dependents(node))) for node in ranked]
+
+    def load_order(self, roots=None):
+        """Orden de carga con las dependencias primero (ciclos agrupados) desde `roots`.
+
+        Sin `roots` parte de los autoloads en el orden de project.godot y de la
+        escena principal.
+        """
+        if roots is None:
+            roots = list(self.autoloads.values()) + ([self.main_scene] if self.main_scene else [])
+        reachable = set()
+        for root in roots:
+            if root in self.edges:
+                reachable.add(root)
+                reachable.update(self.dependencies(root, transitive=True))
+
+        return [component for component in self.components() if component[0] in reachable]
+
+    def summary(self, top=10):
+        """Resumen serializable a JSON para reportes"""
+        return {
+            'nodes': len(self.edges),
+            'edges': sum(len(targets) for targets in self.edges.values()),
+            'autoloads': self.autoloads,
+            'class_names': len(self.class_names),
+            'cycles': self.cycles(),
+            'fan_in': [
+                {'node': node, 'direct_dependents': direct, 'transitive_dependents': transitive}
+                for node, direct, transitive in self.fan_in(top)
+            ]
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK Dependency Graph")
+    parser.add_argument('--project', default=str(DEFAULT_PROJECT_PATH), help="Carpeta con project.godot")
+    parser.add_argument('--exclude', nargs='*', default=[], help="Carpetas adicionales a ignorar (p.ej. tests)")
+    parser.add_argument('--dependents', metavar='RECURSO', help="Dependientes transitivos de un recurso, autoload o class_name")
+    parser.add_argument('--dependencies', metavar='RECURSO', help="Dependencias transitivas de un recurso")
+    parser.add_argument('--cycles', action='store_true', help="Listar dependencias circulares")
+    parser.add_argument('--kinds', nargs='*', choices=EDGE_KINDS, help="Limitar --cycles a estos tipos de arista")
+    parser.add_argument('--load-order', action='store_true', help="Orden de carga desde autoloads y escena principal")
+    parser.add_argument('--top', type=int, default=10, help="Nodos con más fan-in a mostrar")
+    parser.add_argument('--json', help="Guardar el resumen en este archivo")
+    args = parser.parse_args()
+
+    cache = AnalysisCache()
+    start = time.perf_counter()
+    graph = DependencyGraph(args.project, cache, EXCLUDED_DIRS + tuple(args.exclude)).build()
+    cache.save()
+    edge_count = sum(len(targets) for targets in graph.edges.values())
+    print(f"🔗 Grafo: {len(graph.edges)} recursos, {edge_count} aristas, {len(graph.autoloads)} autoloads, "
+          f"{len(graph.class_names)} class_name ({(time.perf_counter() - start) * 1000:.0f} ms)")
+    print(cache.stats_line())
+
+    for option, walk in ((args.dependents, graph.dependents), (args.dependencies, graph.dependencies)):
+        if not option:
+            continue
+        node = graph.resolve(option)
+        if node is None:
+            print(f"❌ Recurso desconocido: {option}")
+            return 1
+        start = time.perf_counter()
+        found = walk(node, transitive=True)
+        elapsed = (time.perf_counter() - start) * 1000
+        label = 'Dependientes' if walk == graph.dependents else 'Dependencias'
+        print(f"\n📋 {label} de {node}: {len(found)} ({elapsed:.3f} ms)")
+        for other in found:
+            print(f"   • {other}")
+
+    if args.cycles:
+        cycles = graph.cycles(args.kinds)
+        print(f"\n🔄 Dependencias circulares: {len(cycles)}")
+        for component in cycles:
+            print(f"   • {' ↔ '.join(component)}")
+
+    if args.load_order:
+        print("\n🚀 Orden de carga (dependencias primero):")
+        for position, component in enumerate(graph.load_order(), 1):
+            print(f"   {position:3}. {' + '.join(component)}")
+
+    print(f"\n🔥 Top {args.top} fan-in (directos / transitivos):")
+    for node, direct, transitive in graph.fan_in(args.top):
+        print(f"   • {node}: {direct} / {transitive}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(graph.summary(args.top), f, indent=2, ensure_ascii=False)
+        print(f"📄 Resumen guardado en: {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Economy Simulator
+Simulación headless y vectorizada (NumPy) de miles de estrategias de jugador durante semanas de juego, con los balances leídos directamente de los scripts del proyecto
+"""
+
+import json
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+from dependency_graph import DEFAULT_PROJECT_PATH
+from gdscript_parser import constant_values
+
+# Scripts de los que se leen los balances (relativos a la carpeta del proyecto)
+BALANCE_SCRIPTS = {
+    'config': 'scripts/core/GameConfig.gd',
+    'balance': 'scripts/managers/MathematicalBalanceManager.gd',
+    'utils': 'scripts/core/GameUtils.gd',
+    'prestige': 'scripts/core/PrestigeManager.gd',
+    'automation': 'scripts/managers/AutomationManager.gd'
+}
+
+# Umbrales escritos como literales en MathematicalBalanceManager._determine_game_phase
+# y _apply_soft_caps (no son constantes, así que no se pueden leer del script)
+EARLY_PHASE_MAX_MONEY = 10000.0
+LATE_PHASE_MIN_MONEY = 500000.0
+LATE_PHASE_MAX_GENERATOR_LEVEL = 40
+GENERATOR_SOFT_CAP_LEVEL = 75
+SOFT_CAP_STEP = 0.01
+
+# Precios de venta manual de ingredientes (match de GameUtils.get_ingredient_price);
+# el agua no aparece en StockManager.get_sellable_stock
+INGREDIENT_PRICES = {'barley': 0.5, 'hops': 0.8, 'yeast': 1.0}
+
+COST_MODELS = ('curves', 'balance')
+MAX_PURCHASES_PER_STEP = 8
+WALLS_REPORTED = 10
+
+
+def load_balance(project_path):
+    """Constantes de cada script de BALANCE_SCRIPTS: {clave: {NOMBRE: valor}}"""
+    project_path = Path(project_path)
+    balance = {}
+    for key, relative_path in BALANCE_SCRIPTS.items():
+        content = (project_path / relative_path).read_text(encoding='utf-8')
+        balance[key] = constant_values(content, include_variables=(key == 'automation'))
+    return balance
+
+
+class Economy:
+    """Tablas densas de la cadena generador → estación → producto desde GameConfig"""
+
+    def __init__(self, balance):
+        config = balance['config']
+        self.resource_ids = list(config['RESOURCE_DATA'])
+        self.product_ids = list(config['PRODUCT_DATA'])
+        self.generator_ids = list(config['GENERATOR_DATA'])
+        self.station_ids = list(config['STATION_DATA'])
+
+        resource_index = {resource_id: i for i, resource_id in enumerate(self.resource_ids)}
+        product_index = {product_id: i for i, product_id in enumerate(self.product_ids)}
+
+        self.resource_caps = np.array(
+            [config['RESOURCE_DATA'][r].get('max_storage', np.inf) for r in self.resource_ids], dtype=float)
+        self.product_prices = np.array(
+            [config['PRODUCT_DATA'][p].get('base_price', 0.0) for p in self.product_ids], dtype=float)
+        self.resource_prices = np.array([INGREDIENT_PRICES.get(r, 0.0) for r in self.resource_ids])
+
+        # Unidades por segundo de cada generador hacia cada recurso
+        interval = config['RESOURCE_GENERATION_INTERVAL']
+        self.generator_prices = np.zeros(len(self.generator_ids))
+        self.generator_output = np.zeros((len(self.generator_ids), len(self.resource_ids)))
+        for g, generator_id in enumerate(self.generator_ids):
+            data = config['GENERATOR_DATA'][generator_id]
+            self.generator_prices[g] = data.get('base_price', 0.0)
+            resource = resource_index.get(data.get('resource_type'))
+            if resource is not None:
+                self.generator_output[g, resource] = data.get('production_rate', 1.0) / interval
+
+        self.station_prices = np.zeros(len(self.station_ids))
+        self.station_recipes = np.zeros((len(self.station_ids), len(self.resource_ids)))
+        self.station_products = np.full(len(self.station_ids), -1)
+        for s, station_id in enumerate(self.station_ids):
+            data = config['STATION_DATA'][station_id]
+            self.station_prices[s] = data.get('base_price', 0.0)
+            self.station_products[s] = product_index.get(data.get('produces'), -1)
+            for resource_id, amount in data.get('recipe', {}).items():
+                if resource_id in resource_index:
+                    self.station_recipes[s, resource_index[resource_id]] = amount
+
+        # Generadores que hacen falta para que cada estación pueda producir algo
+        generated = self.generator_output.sum(axis=0) > 0
+        self.station_feasible = np.all(generated | (self.station_recipes == 0), axis=1)
+        self.station_feeders = [
+            np.flatnonzero(self.generator_output[:, self.station_recipes[s] > 0].sum(axis=1) > 0)
+            for s in range(len(self.station_ids))
+        ]
+
+
+class EconomySimulator:
+    """N jugadores en paralelo: un array por variable de estado, una fila por jugador.
+
+    Cada jugador sigue una estrategia muestreada al azar: horas de juego y
+    sesiones por día (fuera de sesión la cadena avanza con la eficiencia idle
+    de MathematicalBalanceManager), preferencia entre generadores, si compra
+    estaciones y si usa clientes automáticos. Durante la sesión vende a mano
+    todo lo producido y los ingredientes que ninguna estación suya consume (o
+    que ya llenaron el almacén), y compra con avidez lo mejor puntuado que
+    pueda pagar.
+    """
+
+    def __init__(self, balance, players=2000, seed=0, cost_model='curves'):
+        if cost_model not in COST_MODELS:
+            raise ValueError(f"Modelo de costos desconocido: {cost_model}")
+        self.balance = balance
+        self.economy = Economy(balance)
+        self.players = players
+        self.cost_model = cost_model
+
+        config = balance['config']
+        prestige = balance['prestige']
+        self.customer_interval = config['BASE_CUSTOMER_INTERVAL']
+        self.production_interval = balance['automation'].get('production_check_interval', 2.0)
+        # Sin al menos una star no hay prestigio (perform_prestige falla con 0)
+        self.prestige_cash = max(prestige['MIN_CASH_REQUIREMENT'], prestige['CASH_TO_STARS_RATIO'])
+
+        rng = np.random.default_rng(seed)
+        generators = len(self.economy.generator_ids)
+        self.strategies = {
+            'online_hours': rng.uniform(0.5, 8.0, players),
+            'sessions_per_day': rng.integers(1, 9, players),
+            'generator_weights': rng.dirichlet(np.ones(generators), players),
+            'buys_stations': rng.random(players) < 0.8,
+            'uses_customers': rng.random(players) < 0.5
+        }
+        self.cycle_seconds = 86400.0 / self.strategies['sessions_per_day']
+        self.online_seconds = self.strategies['online_hours'] * 3600.0 / self.strategies['sessions_per_day']
+        self.offline_efficiency = self.idle_efficiency(self.cycle_seconds - self.online_seconds)
+
+        economy = self.economy
+        self.money = np.full(players, float(config['STARTING_MONEY']))
+        self.total_earnings = np.zeros(players)
+        self.generators = np.zeros((players, generators), dtype=np.int64)
+        self.stations = np.zeros((players, len(economy.station_ids)), dtype=np.int64)
+        self.resources = np.zeros((players, len(economy.resource_ids)))
+        self.products = np.zeros((players, len(economy.product_ids)))
+        self.next_costs = np.tile(self.generator_costs(np.ones(generators, dtype=np.int64)), (players, 1))
+        # Derivados que solo cambian al comprar: generación por segundo y recursos con consumidor
+        self.generation = np.zeros_like(self.resources)
+        self.consumed = np.zeros(self.resources.shape, dtype=bool)
+
+        # Las esperas se miden en tiempo jugado: una noche offline no es un muro
+        self.played = np.zeros(players)
+        self.last_purchase = np.zeros(players)
+        self.prestige_time = np.full(players, np.inf)
+        self._events = []  # (jugadores, espera jugada, nivel) por iteración de compra
+
+    # --- Fórmulas del juego -------------------------------------------------
+
+    def idle_efficiency(self, offline_seconds):
+        """MathematicalBalanceManager.get_idle_efficiency vectorizada (sin premium)"""
+        b = self.balance['balance']
+        perfect, good, decent = (b['IDLE_EFFICIENCY_PERFECT_TIME'], b['IDLE_EFFICIENCY_GOOD_TIME'],
+                                 b['IDLE_EFFICIENCY_DECENT_TIME'])
+        seconds = np.asarray(offline_seconds, dtype=float)
+        return np.select(
+            [seconds <= perfect, seconds <= good, seconds <= decent],
+            [0.8 + 0.2 * (perfect - seconds) / perfect,
+             0.8 - 0.2 * (seconds - perfect) / (good - perfect),
+             0.6 - 0.2 * (seconds - good) / (decent - good)],
+            default=b['IDLE_EFFICIENCY_MIN'])
+
+    def generator_costs(self, levels, max_levels=None, money=None):
+        """Costo del nivel `levels` de cada generador según el modelo elegido.
+
+        `curves`: GameUtils.get_scaled_cost con COST_CURVES['generator'] (lo que
+        cobra GeneratorManager). `balance`: MathematicalBalanceManager.get_optimized_cost
+        sin prestigios, con fase por nivel, dinero y nivel máximo de generador.
+        """
+        levels = np.asarray(levels)
+        base = self.economy.generator_prices
+
+        if self.cost_model == 'curves':
+            curve = self.balance['utils']['COST_CURVES']['generator']
+            conditions = [levels <= last_level for last_level, _ in curve]
+            multiplier = np.select(conditions, [m for _, m in curve], default=curve[-1][1])
+            return base * multiplier ** (levels - 1)
+
+        b = self.balance['balance']
+        money = np.zeros(levels.shape[0]) if money is None else money
+        max_levels = levels if max_levels is None else max_levels
+        money = money.reshape(-1, 1) if levels.ndim == 2 else money
+        max_levels = max_levels.reshape(-1, 1) if levels.ndim == 2 else max_levels
+        early = (levels <= b['EARLY_GAME_MAX_LEVEL']) & (money < EARLY_PHASE_MAX_MONEY)
+        late = ((levels > b['MID_GAME_MAX_LEVEL']) | (money > LATE_PHASE_MIN_MONEY)
+                | (max_levels > LATE_PHASE_MAX_GENERATOR_LEVEL))
+        multiplier = np.select([early, late], [b['EARLY_GAME_GROWTH_RATE'], b['LATE_GAME_GROWTH_RATE']],
+                               default=b['MID_GAME_GROWTH_RATE'])
+        cost = base * multiplier ** (levels - 1)
+
+        soft_start = GENERATOR_SOFT_CAP_LEVEL * b['SOFT_CAP_THRESHOLD']
+        cap_factor = np.maximum(1.0 - (levels - soft_start) * SOFT_CAP_STEP, b['SOFT_CAP_REDUCTION'])
+        return np.where(levels > soft_start, cost * cap_factor, cost)
+
+    # --- Simulación ---------------------------------------------------------
+
+    def run(self, days=14.0, step_seconds=60.0):
+        """Avanzar todos los jugadores `days` días en pasos de `step_seconds`"""
+        steps = int(days * 86400.0 / step_seconds)
+        start = time.perf_counter()
+        for step in range(1, steps + 1):
+            self._step(step * step_seconds, step_seconds)
+        elapsed = time.perf_counter() - start
+        return self.report(days, step_seconds, steps, elapsed)
+
+    def _step(self, now, dt):
+        economy = self.economy
+        online = (now % self.cycle_seconds) < self.online_seconds
+        speed = np.where(online, 1.0, self.offline_efficiency) * dt
+        self.played += online * dt
+
+        # Generación y producción concurrentes: el tope se aplica a lo que sobra
+        available = self.resources + self.generation * speed[:, None]
+        for s in range(len(economy.station_ids)):
+            recipe = economy.station_recipes[s]
+            needed = recipe > 0
+            if economy.station_products[s] < 0 or not needed.any():
+                continue
+            craftable = np.min(available[:, needed] / recipe[needed], axis=1)
+            units = np.where(self.stations[:, s] > 0, np.minimum(craftable, speed / self.production_interval), 0.0)
+            available -= units[:, None] * recipe
+            self.products[:, economy.station_products[s]] += units
+        self.resources = np.minimum(available, economy.resource_caps)
+
+        # Clientes automáticos: compran del stock en proporción a lo disponible
+        stock = self.products.sum(axis=1)
+        demand = np.where(self.strategies['uses_customers'], speed / self.customer_interval, 0.0)
+        share = np.divide(np.minimum(demand, stock), stock, out=np.zeros_like(stock), where=stock > 0)
+        sold = self.products * share[:, None]
+        # En sesión el jugador vende a mano todo lo que queda
+        sold += np.where(online[:, None], self.products - sold, 0.0)
+        self.products -= sold
+        income = sold @ economy.product_prices
+
+        # ... y los ingredientes sin estación que los use o con el almacén lleno
+        full = self.resources >= economy.resource_caps
+        sold_resources = np.where(online[:, None] & (~self.consumed | full), self.resources, 0.0)
+        self.resources -= sold_resources
+        income += sold_resources @ economy.resource_prices
+        self.money += income
+        self.total_earnings += income
+
+        reached = np.isinf(self.prestige_time) & (self.total_earnings >= self.prestige_cash)
+        self.prestige_time[reached] = now
+
+        self._buy(online)
+
+    def _buy(self, online):
+        economy = self.economy
+
+        # Estaciones: precio fijo (ProductionManager.purchase_station), una de cada una basta
+        # y solo cuando ya se tienen generadores para toda su receta
+        wants = online & self.strategies['buys_stations']
+        for s in range(len(economy.station_ids)):
+            if not economy.station_feasible[s]:
+                continue
+            candidates = np.flatnonzero(
+                wants & (self.stations[:, s] == 0) & (self.money >= economy.station_prices[s]))
+            fed = np.all(self.generators[candidates][:, economy.station_feeders[s]] > 0, axis=1)
+            buyers = candidates[fed]
+            if buyers.size:
+                self.money[buyers] -= economy.station_prices[s]
+                self.stations[buyers, s] += 1
+                self.consumed[buyers] |= economy.station_recipes[s] > 0
+                self.last_purchase[buyers] = self.played[buyers]
+
+        # Generadores: el mejor costo / preferencia, mientras alcance el dinero.
+        # Solo se evalúan los jugadores en sesión que pueden pagar algo
+        scores = self.next_costs / self.strategies['generator_weights']
+        buyers = np.flatnonzero(online & (self.money >= self.next_costs.min(axis=1)))
+        for _ in range(MAX_PURCHASES_PER_STEP):
+            if not buyers.size:
+                break
+            chosen = np.argmin(scores[buyers], axis=1)
+            cost = self.next_costs[buyers, chosen]
+            affordable = self.money[buyers] >= cost
+            buyers, chosen, cost = buyers[affordable], chosen[affordable], cost[affordable]
+            if not buyers.size:
+                break
+
+            self.money[buyers] -= cost
+            self.generators[buyers, chosen] += 1
+            self.generation[buyers] += economy.generator_output[chosen]
+            self._record(buyers, self.generators[buyers, chosen])
+
+            owned = self.generators[buyers]
+            self.next_costs[buyers] = self.generator_costs(owned + 1, owned.max(axis=1), self.money[buyers])
+            scores[buyers] = self.next_costs[buyers] / self.strategies['generator_weights'][buyers]
+
+    def _record(self, buyers, levels):
+        """Registrar compras de generador; las estaciones solo reinician la espera"""
+        played = self.played[buyers]
+        self._events.append((buyers, played - self.last_purchase[buyers], levels))
+        self.last_purchase[buyers] = played
+
+    # --- Reporte ------------------------------------------------------------
+
+    def report(self, days, step_seconds, steps, elapsed):
+        b = self.balance['balance']
+        columns = [np.concatenate(column) for column in zip(*self._events)]
+        buyers, waits, levels = columns or [np.array([], dtype=int)] * 3
+
+        reached = np.isfinite(self.prestige_time)
+        prestige_hours = self.prestige_time[reached] / 3600.0
+
+        phases = {
+            'early': levels <= b['EARLY_GAME_MAX_LEVEL'],
+            'mid': (levels > b['EARLY_GAME_MAX_LEVEL']) & (levels <= b['MID_GAME_MAX_LEVEL']),
+            'late': levels > b['MID_GAME_MAX_LEVEL']
+        }
+        intervals = {}
+        for phase, mask in phases.items():
+            phase_waits = waits[mask]
+            intervals[phase] = {
+                'purchases': int(mask.sum()),
+                'median_seconds': float(np.median(phase_waits)) if phase_waits.size else None,
+                'p90_seconds': float(np.percentile(phase_waits, 90)) if phase_waits.size else None
+            }
+
+        # Muros: compras precedidas de una espera mayor que MID_GAME_WALL_INTERVAL
+        wall = waits > b['MID_GAME_WALL_INTERVAL']
+        walls = []
+        for level in np.unique(levels[wall]):
+            at_level = wall & (levels == level)
+            walls.append({
+                'level': int(level),
+                'players': int(np.unique(buyers[at_level]).size),
+                'median_wait_seconds': float(np.median(waits[at_level]))
+            })
+        walls.sort(key=lambda entry: -entry['players'])
+
+        # Estrategias del decil más rápido frente a la media
+        fastest = {}
+        if reached.any():
+            cutoff = np.percentile(self.prestige_time[reached], 10)
+            top = reached & (self.prestige_time <= cutoff)
+            for name in ('online_hours', 'sessions_per_day', 'buys_stations', 'uses_customers'):
+                values = self.strategies[name].astype(float)
+                fastest[name] = {'fastest_decile': float(values[top].mean()), 'all': float(values.mean())}
+
+        def percentiles(values):
+            if not values.size:
+                return None
+            return {f'p{q}': float(np.percentile(values, q)) for q in (10, 50, 90)}
+
+        return {
+            'players': self.players,
+            'cost_model': self.cost_model,
+            'days': days,
+            'step_seconds': step_seconds,
+            'prestige_cash': self.prestige_cash,
+            'first_prestige': {
+                'reached': int(reached.sum()),
+                'reached_ratio': float(reached.mean()),
+                'hours': percentiles(prestige_hours)
+            },
+            'progress_intervals': intervals,
+            'targets': {
+                'early_progress_interval': b['EARLY_GAME_PROGRESS_INTERVAL'],
+                'mid_wall_interval': b['MID_GAME_WALL_INTERVAL']
+            },
+            'walls': walls[:WALLS_REPORTED],
+            'final_state': {
+                'money': percentiles(self.money),
+                'total_earnings': percentiles(self.total_earnings),
+                'generators_owned': percentiles(self.generators.sum(axis=1).astype(float))
+            },
+            'fastest_strategies': fastest,
+            'benchmark': {
+                'steps': steps,
+                'seconds': elapsed,
+                'player_days_per_second': self.players * days / elapsed if elapsed > 0 else None
+            }
+        }
+
+
+def format_seconds(seconds):
+    if seconds is None:
+        return "-"
+    if seconds >= 3600:
+        return f"{seconds / 3600:.1f} h"
+    if seconds >= 60:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds:.0f} s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK Economy Simulator")
+    parser.add_argument('--project', default=str(DEFAULT_PROJECT_PATH), help="Carpeta con project.godot")
+    parser.add_argument('--players', type=int, default=2000, help="Estrategias simuladas en paralelo")
+    parser.add_argument('--days', type=float, default=14.0, help="Días de juego simulados")
+    parser.add_argument('--step', type=float, default=60.0, help="Segundos simulados por paso")
+    parser.add_argument('--seed', type=int, default=0, help="Semilla de las estrategias")
+    parser.add_argument('--cost-model', choices=COST_MODELS, default='curves',
+                        help="curves: GameUtils.COST_CURVES (en uso); balance: MathematicalBalanceManager")
+    parser.add_argument('--json', help="Guardar el reporte en este archivo")
+    args = parser.parse_args()
+
+    balance = load_balance(args.project)
+    simulator = EconomySimulator(balance, args.players, args.seed, args.cost_model)
+    report = simulator.run(args.days, args.step)
+
+    print("📈 === SIMULACIÓN DE ECONOMÍA ===")
+    print(f"👥 {report['players']} estrategias × {report['days']:.0f} días "
+          f"(paso {report['step_seconds']:.0f} s, costos: {report['cost_model']})")
+
+    prestige = report['first_prestige']
+    print(f"\n⭐ Primer prestigio (${report['prestige_cash']:,.0f} ganados): "
+          f"{prestige['reached']}/{report['players']} jugadores ({prestige['reached_ratio']:.0%})")
+    if prestige['hours']:
+        hours = prestige['hours']
+        print(f"   • p10 {hours['p10']:.1f} h · p50 {hours['p50']:.1f} h · p90 {hours['p90']:.1f} h")
+
+    targets = report['targets']
+    print(f"\n⏱️ Tiempo jugado entre compras (objetivo early {format_seconds(targets['early_progress_interval'])}, "
+          f"muro > {format_seconds(targets['mid_wall_interval'])}):")
+    for phase, stats in report['progress_intervals'].items():
+        print(f"   • {phase}: {stats['purchases']} compras, mediana {format_seconds(stats['median_seconds'])}, "
+              f"p90 {format_seconds(stats['p90_seconds'])}")
+
+    print("\n🧱 Muros más frecuentes (nivel del generador comprado tras la espera):")
+    for wall in report['walls']:
+        print(f"   • nivel {wall['level']}: {wall['players']} jugadores, "
+              f"espera mediana {format_seconds(wall['median_wait_seconds'])}")
+
+    if report['fastest_strategies']:
+        print("\n🏃 Decil más rápido al prestigio vs media:")
+        for name, stats in report['fastest_strategies'].items():
+            print(f"   • {name}: {stats['fastest_decile']:.2f} vs {stats['all']:.2f}")
+
+    benchmark = report['benchmark']
+    print(f"\n⚡ {benchmark['steps']} pasos en {benchmark['seconds']:.2f} s "
+          f"({benchmark['player_days_per_second']:,.0f} días-jugador/s)")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📄 Reporte guardado en: {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
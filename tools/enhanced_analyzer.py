@@ -1,19 +1,22 @@
 #!/usr/bin/env python3
 """
-BAR-SIK Enhanced Code Analyzer with jscpd Integration
-Análisis híbrido: jscpd (GDScript como Python) + análisis personalizado
+BAR-SIK Enhanced Code Analyzer with Clone Detection
+Análisis híbrido: detección de clones por tokens + análisis personalizado
 """
 
 import os
 import json
-import subprocess
-import tempfile
 from pathlib import Path
 from collections import defaultdict
 
+from analysis_cache import AnalysisCache
+from gdscript_parser import parse_script
+from clone_detector import DEFAULT_MAX_LINES, detect_clones, format_summary, load_config
+
 class EnhancedBarSikAnalyzer:
-    def __init__(self, project_path):
+    def __init__(self, project_path, cache=None):
         self.project_path = Path(project_path)
+        self.cache = cache if cache is not None else AnalysisCache()
         self.results = {
             'jscpd_clones': [],
             'gdscript_analysis': {},
@@ -22,103 +25,25 @@ class EnhancedBarSikAnalyzer:
         }
 
     def run_jscpd_analysis(self):
-        """Ejecutar jscpd con configuración optimizada para GDScript"""
-        print("🔍 Ejecutando análisis jscpd (GDScript como Python)...")
-
-        try:
-            # MÉTODO EXITOSO: Usar --formats-exts para tratar .gd como Python
-            print("📋 Ejecutando: jscpd --formats-exts 'python:gd' --reporters console,html,json --output reports/ project/")
-
-            result = subprocess.run([
-                "jscpd",
-                "--formats-exts", "python:gd",
-                "--reporters", "console,html,json",
-                "--output", "reports/",
-                "--min-lines", "3",
-                "--min-tokens", "25",
-                "--threshold", "10",
-                "project/"
-            ],
-            cwd=str(self.project_path),
-            capture_output=True,
-            text=True,
-            timeout=120,
-            check=False,  # No fallar si encuentra duplicaciones
-            shell=True,  # CRÍTICO: Necesario en Windows para ejecutar scripts npm
-            encoding='utf-8',  # FIX: Manejo explicito de encoding
-            errors='ignore'  # FIX: Ignorar errores de encoding Unicode
-            )            # Leer resultados JSON
-            json_report = self.project_path / "reports" / "jscpd-report.json"
-            if json_report.exists():
-                with open(json_report, 'r', encoding='utf-8') as f:
-                    jscpd_data = json.load(f)
-                    self.results['jscpd_clones'] = jscpd_data.get('duplicates', [])
-                    self.results['jscpd_statistics'] = jscpd_data.get('statistics', {})
-
-            # Parsear estadísticas de salida
-            self._parse_jscpd_statistics(result.stdout)
-
-            clone_count = len(self.results['jscpd_clones'])
-            print(f"✅ jscpd completado - {clone_count} clones encontrados")
-
-            # Mostrar reporte HTML disponible
-            html_report = self.project_path / "reports" / "html" / "index.html"
-            if html_report.exists():
-                print(f"📄 Reporte HTML: file:///{html_report}")
-
-        except subprocess.TimeoutExpired:
-            print("⏰ jscpd timeout - continuando con análisis propio")
-        except FileNotFoundError:
-            print("⚠️  jscpd no encontrado - usando solo análisis propio")
-            except subprocess.TimeoutExpired:
-                logging.error("❌ Timeout ejecutando jscpd (120 segundos)")
-                return False
-            except subprocess.CalledProcessError as e:
-                logging.error(f"❌ Error ejecutando jscpd: {e}")
-                return False
-            except FileNotFoundError:
-                logging.error("❌ jscpd no encontrado - instálelo: npm install -g jscpd")
-                return False    def _parse_jscpd_statistics(self, output):
-        """Parsear estadísticas de jscpd desde salida de consola"""
-        if not output:
-            return
-
-        lines = output.split('\n')
-        for line in lines:
-            if 'Found' in line and 'clones' in line:
-                # Ejemplo: "Found 62 clones."
-                try:
-                    clone_count = int(line.split()[1])
-                    self.results['jscpd_console_clones'] = clone_count
-                except (IndexError, ValueError):
-                    pass
-            elif 'Detection time::' in line:
-                # Ejemplo: "Detection time:: 938.888ms"
-                try:
-                    time_str = line.split('::')[1].strip()
-                    self.results['jscpd_detection_time'] = time_str
-                except IndexError:
-                    pass
-
-    def _parse_console_output(self, output):
-        """Parsear salida de consola de jscpd para extraer clones"""
-        lines = output.split('\n')
-        current_clone = None
-
-        for line in lines:
-            if "Clone found" in line:
-                # Parsear líneas de clone found
-                if " - " in line and " [" in line:
-                    parts = line.split(" - ")
-                    if len(parts) >= 2:
-                        file_info = parts[1].strip()
-                        if "[" in file_info:
-                            file_path = file_info.split("[")[0].strip()
-                            self.results['jscpd_clones'].append({
-                                'source': file_path,
-                                'type': 'console_parsed',
-                                'confidence': 'high'
-                            })
+        """Detectar código duplicado en proceso (mismas opciones que usábamos con jscpd)"""
+        print("🔍 Ejecutando detección de clones (Rabin-Karp sobre tokens GDScript)...")
+
+        config = load_config(self.project_path / ".jscpd.json")
+        report = detect_clones(
+            [self.project_path / "project"],
+            min_tokens=25,
+            min_lines=3,
+            max_lines=config.get('maxLines', DEFAULT_MAX_LINES),
+            mode=config.get('mode', 'mild'),
+            exclude=config.get('ignore', config.get('exclude', []))
+        )
+
+        self.results['jscpd_clones'] = report['duplicates']
+        self.results['jscpd_statistics'] = report['statistics']
+
+        for line in format_summary(report):
+            print(line)
+        print(f"✅ Detección completada - {len(self.results['jscpd_clones'])} clones encontrados")
 
     def analyze_gdscript_patterns(self):
         """Análisis personalizado de patrones GDScript"""
@@ -138,69 +63,64 @@ class EnhancedBarSikAnalyzer:
                 continue
 
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    self._analyze_file_patterns(file_path, content, patterns)
+                file_patterns = self.cache.get(file_path, 'enhanced_patterns', self._analyze_file_patterns)
             except Exception as e:
                 continue
 
-        self.results['gdscript_analysis'] = patterns
+            for pattern_name, entries in file_patterns.items():
+                patterns[pattern_name].extend({'file': str(file_path), **entry} for entry in entries)
 
-    def _analyze_file_patterns(self, file_path, content, patterns):
-        """Analizar patrones específicos en un archivo"""
-        lines = content.split('\n')
+        self.results['gdscript_analysis'] = patterns
 
-        for i, line in enumerate(lines):
-            line_strip = line.strip()
+    def _analyze_file_patterns(self, content):
+        """Analizar patrones específicos en un archivo (sin la ruta, para poder cachearlo)"""
+        script = parse_script(content)
+        patterns = {
+            'ready_functions': [],
+            'signal_connections': [],
+            'input_handlers': [],
+            'validation_patterns': []
+        }
 
+        for func in script['functions']:
             # Patrones de función _ready duplicadas
-            if line_strip.startswith('func _ready('):
-                context = self._get_function_context(lines, i, 10)
+            if func['name'] == '_ready':
                 patterns['ready_functions'].append({
-                    'file': str(file_path),
-                    'line': i + 1,
-                    'context': context,
-                    'signature': line_strip
+                    'line': func['line'],
+                    'context': self._get_function_context(func, 10),
+                    'signature': func['signature']
                 })
 
             # Handlers de input duplicados
-            if 'func _input(' in line_strip:
-                context = self._get_function_context(lines, i, 5)
+            if func['name'] == '_input':
                 patterns['input_handlers'].append({
-                    'file': str(file_path),
-                    'line': i + 1,
-                    'context': context
+                    'line': func['line'],
+                    'context': self._get_function_context(func, 5)
                 })
 
-            # Patrones de validación
+        # Conexiones de señales
+        for connection in script['connects']:
+            patterns['signal_connections'].append({
+                'line': connection['line'],
+                'connection': connection['text']
+            })
+
+        # Patrones de validación
+        for i, line in enumerate(content.split('\n')):
+            line_strip = line.strip()
             if any(pattern in line_strip for pattern in ['if not', 'is_instance_valid', 'is_valid']):
                 patterns['validation_patterns'].append({
-                    'file': str(file_path),
                     'line': i + 1,
                     'pattern': line_strip
                 })
 
-            # Conexiones de señales
-            if '.connect(' in line_strip:
-                patterns['signal_connections'].append({
-                    'file': str(file_path),
-                    'line': i + 1,
-                    'connection': line_strip
-                })
-
-    def _get_function_context(self, lines, start_line, max_lines=10):
-        """Extraer contexto de una función"""
-        context = []
-        i = start_line
+        return patterns
 
-        while i < len(lines) and len(context) < max_lines:
-            line = lines[i].strip()
-            if line:
-                context.append(line)
-                # Si encontramos otra función, parar
-                if i > start_line and line.startswith('func '):
-                    break
-            i += 1
+    def _get_function_context(self, func, max_lines=10):
+        """Extraer contexto de una función: firma y primeras líneas del cuerpo"""
+        context = [func['signature']]
+        if func['body']:
+            context.extend(func['body'].split('\n'))
 
         return context[:max_lines]
 
@@ -233,13 +153,13 @@ class EnhancedBarSikAnalyzer:
                 'priority': 'medium'
             })
 
-        # Análisis de jscpd clones
+        # Análisis de clones
         jscpd_clones = len(self.results['jscpd_clones'])
         if jscpd_clones > 10:
             recommendations.append({
                 'type': 'critical',
                 'title': 'Código Duplicado Masivo',
-                'description': f'jscpd detectó {jscpd_clones} bloques de código duplicado',
+                'description': f'Detectados {jscpd_clones} bloques de código duplicado',
                 'suggestion': 'Refactorizar inmediatamente para eliminar duplicación',
                 'priority': 'critical'
             })
@@ -303,7 +223,7 @@ class EnhancedBarSikAnalyzer:
         """Ejecutar análisis completo híbrido"""
         print("🚀 Iniciando análisis híbrido BAR-SIK...")
 
-        # Paso 1: jscpd analysis
+        # Paso 1: detección de clones
         self.run_jscpd_analysis()
 
         # Paso 2: GDScript patterns analysis
@@ -313,6 +233,8 @@ class EnhancedBarSikAnalyzer:
         self.generate_recommendations()
 
         # Paso 4: Generate final report
+        self.cache.save()
+        print(self.cache.stats_line())
         return self.generate_report()
 
 def main():
@@ -332,7 +254,7 @@ def main():
     print("="*80)
 
     summary = results['summary']
-    print(f"🔄 jscpd clones detectados: {summary['jscpd_clones_count']}")
+    print(f"🔄 Clones detectados: {summary['jscpd_clones_count']}")
     print(f"📋 Funciones _ready() encontradas: {summary['ready_functions_count']}")
     print(f"🎮 Handlers _input() encontrados: {summary['input_handlers_count']}")
     print(f"✅ Patrones de validación: {summary['validation_patterns_count']}")
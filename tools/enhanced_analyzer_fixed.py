@@ -1,22 +1,26 @@
 #!/usr/bin/env python3
 """
-BAR-SIK Enhanced Code Analyzer with jscpd Integration
-Análisis híbrido: jscpd (GDScript como Python) + análisis personalizado
+BAR-SIK Enhanced Code Analyzer with Clone Detection
+Análisis híbrido: detección de clones por tokens + análisis personalizado
 """
 
 import os
 import json
-import subprocess
 import logging
 from pathlib import Path
 from collections import defaultdict
 
+from analysis_cache import AnalysisCache
+from gdscript_parser import parse_script
+from clone_detector import DEFAULT_MAX_LINES, detect_clones, format_summary, load_config
+
 # Configurar logging
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
 class EnhancedBarSikAnalyzer:
-    def __init__(self, project_path):
+    def __init__(self, project_path, cache=None):
         self.project_path = Path(project_path)
+        self.cache = cache if cache is not None else AnalysisCache()
         self.results = {
             'jscpd_clones': [],
             'gdscript_analysis': {},
@@ -25,104 +29,41 @@ class EnhancedBarSikAnalyzer:
         }
 
     def run_jscpd_analysis(self):
-        """Ejecutar jscpd con configuración optimizada para GDScript"""
-        print("🔍 Ejecutando análisis jscpd (GDScript como Python)...")
+        """Detectar código duplicado en proceso con la configuración de .jscpd.json"""
+        print("🔍 Ejecutando detección de clones (Rabin-Karp sobre tokens GDScript)...")
 
         try:
-            # MÉTODO EXITOSO: Usar --formats-exts para tratar .gd como Python
-            print("📋 Ejecutando: jscpd --formats-exts 'python:gd' --reporters console,html,json --output reports/ project/")
-
-            result = subprocess.run([
-                "jscpd",
-                "--formats-exts", "python:gd",
-                "--reporters", "console,html,json",
-                "--output", "reports/",
-                "--min-lines", "3",
-                "--min-tokens", "25",
-                "--threshold", "10",
-                "project/"
-            ],
-            cwd=str(self.project_path),
-            capture_output=True,
-            text=True,
-            timeout=120,
-            check=False,  # No fallar si encuentra duplicaciones
-            shell=True,  # CRÍTICO: Necesario en Windows para ejecutar scripts npm
-            encoding='utf-8',  # FIX: Manejo explicito de encoding
-            errors='ignore'  # FIX: Ignorar errores de encoding Unicode
+            config = load_config(self.project_path / ".jscpd.json")
+            report = detect_clones(
+                [self.project_path / "project"],
+                min_tokens=25,
+                min_lines=3,
+                max_lines=config.get('maxLines', DEFAULT_MAX_LINES),
+                mode=config.get('mode', 'mild'),
+                exclude=config.get('ignore', config.get('exclude', []))
             )
-
-            # Procesar output con manejo de errores de encoding
-            if result.stdout:
-                print("✅ jscpd Output:")
-                try:
-                    print(result.stdout)
-                except UnicodeError:
-                    print("📋 Output contiene caracteres Unicode - análisis completado")
-
-            if result.stderr:
-                print("⚠️ jscpd Warnings/Errors:")
-                try:
-                    print(result.stderr)
-                except UnicodeError:
-                    print("📋 Stderr contiene caracteres Unicode")
-
-            # Parsear estadísticas de la salida
-            self._parse_jscpd_statistics(result.stdout if result.stdout else "")
-
-            # Leer resultados JSON
-            json_path = self.project_path / "reports" / "jscpd-report.json"
-            if json_path.exists():
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    jscpd_data = json.load(f)
-                    self.results['jscpd_clones'] = jscpd_data.get('duplicates', [])
-                    print(f"✅ Cargados {len(self.results['jscpd_clones'])} clones desde JSON")
-            else:
-                print("⚠️ No se encontró jscpd-report.json")
-
-            return True
-
-        except subprocess.TimeoutExpired:
-            logging.error("❌ Timeout ejecutando jscpd (120 segundos)")
-            return False
-        except subprocess.CalledProcessError as e:
-            logging.error(f"❌ Error ejecutando jscpd: {e}")
-            return False
-        except FileNotFoundError:
-            logging.error("❌ jscpd no encontrado - instálelo: npm install -g jscpd")
-            return False
         except Exception as e:
-            logging.error(f"❌ Error inesperado ejecutando jscpd: {e}")
+            logging.error(f"❌ Error inesperado detectando clones: {e}")
             return False
 
-    def _parse_jscpd_statistics(self, output):
-        """Parsear estadísticas de jscpd desde salida de consola"""
-        if not output:
-            return
-
-        lines = output.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if 'clones found' in line:
-                try:
-                    clones = int(line.split()[0])
-                    self.results['summary']['total_clones'] = clones
-                    print(f"📊 Total clones encontrados: {clones}")
-                except (ValueError, IndexError):
-                    pass
-            elif 'duplicated lines out of' in line:
-                try:
-                    parts = line.split()
-                    duplicated = int(parts[0])
-                    total = int(parts[4])
-                    percentage = round((duplicated / total) * 100, 2)
-                    self.results['summary']['duplicated_lines'] = duplicated
-                    self.results['summary']['total_lines'] = total
-                    self.results['summary']['duplication_percentage'] = percentage
-                    print(f"📊 Líneas duplicadas: {duplicated}/{total} ({percentage}%)")
-                except (ValueError, IndexError):
-                    pass
+        total = report['statistics']['total']
+        self.results['jscpd_clones'] = report['duplicates']
+        self.results['summary']['total_clones'] = total['clones']
+        self.results['summary']['duplicated_lines'] = total['duplicatedLines']
+        self.results['summary']['total_lines'] = total['lines']
+        self.results['summary']['duplication_percentage'] = total['percentage']
+
+        for line in format_summary(report):
+            print(line)
+
+        # Mismo JSON que generaba el reporter de jscpd
+        json_path = self.project_path / "reports" / "jscpd-report.json"
+        json_path.parent.mkdir(exist_ok=True)
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✅ Guardados {len(self.results['jscpd_clones'])} clones en {json_path}")
+
+        return True
 
     def analyze_gdscript_patterns(self):
         """Análisis específico de patrones GDScript"""
@@ -143,47 +84,46 @@ class EnhancedBarSikAnalyzer:
                 continue
 
             try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    self._analyze_file_patterns(file_path, content, analysis)
+                file_patterns = self.cache.get(file_path, 'pattern_counts', self._analyze_file_patterns, errors='ignore')
             except Exception as e:
                 print(f"⚠️ Error leyendo {file_path}: {e}")
+                continue
+
+            relative_path = str(file_path.relative_to(self.project_path))
+            for pattern_name, count in file_patterns['patterns'].items():
+                analysis['patterns'][pattern_name].append({
+                    'file': relative_path,
+                    'count': count
+                })
+            for func_name in file_patterns['functions']:
+                analysis['duplicate_functions'][func_name].append(relative_path)
 
         self.results['gdscript_analysis'] = analysis
         return analysis
 
-    def _analyze_file_patterns(self, file_path, content, analysis):
-        """Analizar patrones en un archivo específico"""
-        lines = content.split('\n')
-        relative_path = file_path.relative_to(self.project_path)
-
-        # Patrones comunes a buscar
-        patterns = {
-            '_ready()': r'func _ready\(\):',
-            '_process()': r'func _process\(',
-            '_input()': r'func _input\(',
-            'get_node()': r'get_node\(',
-            '$': r'\$',
-            'connect()': r'\.connect\(',
-            'signal': r'signal ',
-            'export': r'export ',
-            'onready': r'onready ',
+    def _analyze_file_patterns(self, content):
+        """Analizar patrones en un archivo específico (sin la ruta, para poder cachearlo)"""
+        import re
+
+        script = parse_script(content)
+        functions = [func['name'] for func in script['functions']]
+
+        # Patrones comunes a buscar (estructurales desde el AST, el resto sobre el texto)
+        counts = {
+            '_ready()': functions.count('_ready'),
+            '_process()': functions.count('_process'),
+            '_input()': functions.count('_input'),
+            'get_node()': len(re.findall(r'get_node\(', content)),
+            '$': len(re.findall(r'\$', content)),
+            'connect()': len(script['connects']),
+            'signal': len(script['signals']),
+            'export': len(script['exports']),
+            'onready': len(script['onready_vars']),
         }
-
-        for pattern_name, pattern in patterns.items():
-            import re
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                analysis['patterns'][pattern_name].append({
-                    'file': str(relative_path),
-                    'count': len(matches)
-                })
+        counts = {pattern_name: count for pattern_name, count in counts.items() if count}
 
         # Detectar funciones duplicadas por nombre
-        func_pattern = r'func\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\('
-        functions = re.findall(func_pattern, content)
-        for func_name in functions:
-            analysis['duplicate_functions'][func_name].append(str(relative_path))
+        return {'patterns': counts, 'functions': functions}
 
     def generate_comprehensive_report(self):
         """Generar reporte comprehensivo"""
@@ -223,23 +163,20 @@ class EnhancedBarSikAnalyzer:
 
             sorted_clones = sorted(
                 self.results['jscpd_clones'],
-                key=lambda x: x.get('linesCount', 0),
+                key=lambda x: x.get('lines', 0),
                 reverse=True
             )[:10]
 
             for i, clone in enumerate(sorted_clones, 1):
-                lines_count = clone.get('linesCount', 0)
-                tokens_count = clone.get('tokensCount', 0)
+                lines_count = clone.get('lines', 0)
+                tokens_count = clone.get('tokens', 0)
                 fragment = clone.get('fragment', '')[:100] + "..." if len(clone.get('fragment', '')) > 100 else clone.get('fragment', '')
 
                 report.append(f"{i}. {lines_count} líneas, {tokens_count} tokens")
                 report.append(f"   📄 Fragmento: {fragment}")
 
-                if 'duplicationMap' in clone:
-                    for dup in clone['duplicationMap'][:2]:  # Solo primeros 2
-                        source_file = dup.get('sourceId', 'Unknown')
-                        start_line = dup.get('start', {}).get('line', 0)
-                        report.append(f"   📍 {source_file}:{start_line}")
+                for location in (clone['firstFile'], clone['secondFile']):
+                    report.append(f"   📍 {location['name']}:{location['start']}")
                 report.append("")
 
         # Patrones GDScript
@@ -309,14 +246,16 @@ class EnhancedBarSikAnalyzer:
         """Ejecutar análisis completo"""
         print("🚀 Iniciando análisis completo de BAR-SIK...")
 
-        # 1. Análisis jscpd
+        # 1. Detección de clones
         if not self.run_jscpd_analysis():
-            print("❌ Error en análisis jscpd, continuando con análisis GDScript...")
+            print("❌ Error en detección de clones, continuando con análisis GDScript...")
 
         # 2. Análisis específico GDScript
         self.analyze_gdscript_patterns()
 
         # 3. Generar reporte
+        self.cache.save()
+        print(self.cache.stats_line())
         self.generate_comprehensive_report()
 
         return self.results
@@ -326,14 +265,14 @@ def main():
     project_path = Path(__file__).parent.parent  # Directorio del proyecto (bar-sik)
 
     print(f"📁 Analizando proyecto en: {project_path}")
-    print("🔧 Versión: Enhanced Analyzer v2.0 con jscpd integration")
+    print("🔧 Versión: Enhanced Analyzer v2.1 con detección de clones integrada")
 
     analyzer = EnhancedBarSikAnalyzer(project_path)
     results = analyzer.run_full_analysis()
 
     print("\n🎉 ¡Análisis completado!")
     print("📄 Revisa los reportes en la carpeta 'reports/'")
-    print("🌐 HTML Report: reports/jscpd-report.html")
+    print("📊 JSON Report: reports/jscpd-report.json")
     print("📋 Text Report: reports/enhanced_analysis_report.txt")
 
 if __name__ == "__main__":
@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK GDScript Parser
+Tokenizador en streaming y AST ligero de GDScript compartido por los analizadores de tools/
+"""
+
+import re
+import ast
+import hashlib
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind value line pos')
+
+_TOKEN_RE = re.compile(r'''
+    (?P<newline>\n)
+  | (?P<ws>[ \t\f\r]+)
+  | (?P<continuation>\\[ \t]*\r?\n)
+  | (?P<comment>\#[^\n]*)
+  | (?P<string>[rR&^]?(?:"""[\s\S]*?"""|\'\'\'[\s\S]*?\'\'\'|"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'))
+  | (?P<number>0[xX][0-9a-fA-F_]+|0[bB][01_]+|(?:\d[\d_]*(?:\.(?![^\W\d])[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?)
+  | (?P<annotation>@[^\W\d]\w*)
+  | (?P<nodepath>\$(?:"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|[\w/%]+))
+  | (?P<name>[^\W\d]\w*)
+  | (?P<op>\*\*=|<<=|>>=|\*\*|<<|>>|==|!=|<=|>=|&&|\|\||\+=|-=|\*=|/=|%=|&=|\|=|\^=|->|:=|\.\.|[-+*/%=<>!&|^~.,:;()\[\]{}?])
+  | (?P<error>.)
+''', re.VERBOSE)
+
+_OPEN_BRACKETS = {'(': ')', '[': ']', '{': '}'}
+_CLOSE_BRACKETS = {')', ']', '}'}
+
+# Memo en proceso: el mismo contenido nunca se parsea dos veces
+_PARSE_MEMO = {}
+_PARSE_MEMO_SIZE = 512
+
+
+def tokenize(content):
+    """Generar los tokens de un script en una sola pasada lineal.
+
+    Emite tokens `name`, `number`, `string`, `op`, `annotation`, `nodepath`
+    ($Ruta), `comment` y `newline`. Solo se emite `newline` al final de una
+    línea lógica: los saltos dentro de paréntesis o tras `\\` se ignoran.
+    """
+    line = 1
+    depth = 0
+    pending_newline = False
+
+    for match in _TOKEN_RE.finditer(content):
+        kind = match.lastgroup
+        value = match.group()
+
+        if kind == 'newline':
+            if depth == 0 and pending_newline:
+                yield Token('newline', value, line, match.start())
+                pending_newline = False
+            line += 1
+            continue
+        if kind == 'continuation':
+            line += 1
+            continue
+        if kind == 'ws':
+            continue
+
+        if kind == 'op':
+            if value in _OPEN_BRACKETS:
+                depth += 1
+            elif value in _CLOSE_BRACKETS and depth > 0:
+                depth -= 1
+
+        yield Token(kind, value, line, match.start())
+        if kind != 'comment':
+            pending_newline = True
+        line += value.count('\n')
+
+    if pending_newline:
+        yield Token('newline', '', line, len(content))
+
+
+def logical_lines(tokens):
+    """Agrupar tokens en líneas lógicas (sin comentarios ni saltos)"""
+    current = []
+    for token in tokens:
+        if token.kind == 'newline':
+            if current:
+                yield current
+            current = []
+        elif token.kind != 'comment':
+            current.append(token)
+
+    if current:
+        yield current
+
+
+def string_value(token):
+    """Contenido de un token `string` sin prefijo ni comillas"""
+    text = token.value.lstrip('rR&^')
+    quote = 3 if text[:3] in ('"""', "'''") else 1
+    return text[quote:-quote]
+
+
+def parse_script(content):
+    """AST ligero de un script (memorizado por hash de contenido).
+
+    Devuelve un diccionario serializable a JSON con: `extends`, `class_name`,
+    `classes`, `functions`, `signals`, `variables`, `onready_vars`,
+    `exports`, `consts`, `preloads` (preload/load con ruta literal),
+    `connects`, `node_paths` y `global_refs` (identificadores en mayúscula
+    que no siguen a un punto, en orden de aparición).
+    """
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+    cached = _PARSE_MEMO.get(digest)
+    if cached is not None:
+        return cached
+
+    result = _ScriptParser(content).parse()
+    if len(_PARSE_MEMO) >= _PARSE_MEMO_SIZE:
+        _PARSE_MEMO.pop(next(iter(_PARSE_MEMO)))
+    _PARSE_MEMO[digest] = result
+    return result
+
+
+def load_script(file_path, cache=None):
+    """AST de un archivo, usando la caché de análisis en disco si se indica"""
+    if cache is not None:
+        return cache.get(file_path, 'gdscript_ast', parse_script)
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return parse_script(f.read())
+
+
+def constant_values(content, known=None, include_variables=False):
+    """Valores Python de las constantes literales de un script.
+
+    Evalúa números, strings, true/false/null, arrays, diccionarios, aritmética
+    básica y referencias a constantes ya conocidas (`known` o anteriores del
+    mismo script). Se omiten las que usan llamadas, atributos u otras
+    expresiones. Con `include_variables` también evalúa los `var` del script.
+    """
+    info = parse_script(content)
+    declarations = info['consts'] + (info['variables'] if include_variables else [])
+    declarations.sort(key=lambda declaration: declaration['line'])
+
+    scope = dict(known or {})
+    values = {}
+    for declaration in declarations:
+        if declaration['class'] is not None or not declaration['value']:
+            continue
+        try:
+            value = literal_value(declaration['value'], scope)
+        except ValueError:
+            continue
+        scope[declaration['name']] = value
+        values[declaration['name']] = value
+    return values
+
+
+def literal_value(source, scope=None):
+    """Evaluar una expresión literal de GDScript (ValueError si no lo es)"""
+    parts = []
+    for token in tokenize(source):
+        if token.kind in ('comment', 'newline'):
+            continue
+        if token.kind == 'string':
+            parts.append(repr(string_value(token)))
+        elif token.kind == 'number':
+            parts.append(token.value.replace('_', ''))
+        elif token.kind == 'name':
+            parts.append(_GDSCRIPT_LITERAL_NAMES.get(token.value, token.value))
+        elif token.kind == 'op' and token.value in _LITERAL_OPS:
+            parts.append(token.value)
+        else:
+            raise ValueError(f"Expresión no literal: {source!r}")
+
+    try:
+        tree = ast.parse(' '.join(parts), mode='eval')
+    except SyntaxError as error:
+        raise ValueError(f"Expresión no literal: {source!r}") from error
+    return _evaluate_literal(tree.body, scope or {})
+
+
+_GDSCRIPT_LITERAL_NAMES = {'true': 'True', 'false': 'False', 'null': 'None'}
+_LITERAL_OPS = {'+', '-', '*', '/', '%', '(', ')', '[', ']', '{', '}', ',', ':'}
+
+
+def _evaluate_literal(node, scope):
+    if isinstance(node, ast.Constant):
+        return node.value
+    if isinstance(node, ast.Name):
+        if node.id in scope:
+            return scope[node.id]
+        raise ValueError(f"Constante desconocida: {node.id}")
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [_evaluate_literal(element, scope) for element in node.elts]
+    if isinstance(node, ast.Dict):
+        return {
+            _evaluate_literal(key, scope): _evaluate_literal(value, scope)
+            for key, value in zip(node.keys, node.values)
+        }
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        operand = _evaluate_literal(node.operand, scope)
+        return -operand if isinstance(node.op, ast.USub) else operand
+    if isinstance(node, ast.BinOp):
+        left = _evaluate_literal(node.left, scope)
+        right = _evaluate_literal(node.right, scope)
+        if isinstance(node.op, ast.Add):
+            return left + right
+        if isinstance(node.op, ast.Sub):
+            return left - right
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, ast.Div):
+            # Entre enteros GDScript trunca hacia cero
+            if isinstance(left, int) and isinstance(right, int):
+                return int(left / right)
+            return left / right
+        if isinstance(node.op, ast.Mod):
+            return left % right
+    raise ValueError(f"Nodo no literal: {ast.dump(node)}")
+
+
+class _ScriptParser:
+    """Recorrido único de las líneas lógicas construyendo el AST"""
+
+    def __init__(self, content):
+        self.content = content
+        self.lines = content.split('\n')
+        self.info = {
+            'extends': None,
+            'class_name': None,
+            'classes': [],
+            'functions': [],
+            'signals': [],
+            'variables': [],
+            'onready_vars': [],
+            'exports': [],
+            'consts': [],
+            'preloads': [],
+            'connects': [],
+            'node_paths': [],
+            'global_refs': []
+        }
+        self._refs = {}
+        self._stack = []
+        self._pending_annotations = []
+
+    def parse(self):
+        for tokens in logical_lines(tokenize(self.content)):
+            self._visit(tokens)
+
+        while self._stack:
+            self._close(self._stack.pop(), len(self.lines) + 1)
+
+        self.info['global_refs'] = list(self._refs)
+        return self.info
+
+    # --- Utilidades ---------------------------------------------------------
+
+    def _source(self, first, last):
+        """Texto fuente entre dos tokens (ambos incluidos)"""
+        return self.content[first.pos:last.pos + len(last.value)]
+
+    def _end_line(self, tokens):
+        last = tokens[-1]
+        return last.line + last.value.count('\n')
+
+    def _indent(self, line_number):
+        line = self.lines[line_number - 1]
+        return len(line) - len(line.lstrip())
+
+    @staticmethod
+    def _matching(tokens, start):
+        """Índice del cierre del bracket abierto en `start`"""
+        depth = 0
+        for i in range(start, len(tokens)):
+            value = tokens[i].value if tokens[i].kind == 'op' else None
+            if value in _OPEN_BRACKETS:
+                depth += 1
+            elif value in _CLOSE_BRACKETS:
+                depth -= 1
+                if depth == 0:
+                    return i
+        return len(tokens) - 1
+
+    @staticmethod
+    def _is(token, kind, value=None):
+        return token.kind == kind and (value is None or token.value == value)
+
+    def _param_names(self, tokens, open_index):
+        """Nombres de parámetros entre paréntesis (primer nombre de cada grupo)"""
+        close_index = self._matching(tokens, open_index)
+        names = []
+        expect_name = True
+        depth = 0
+        for token in tokens[open_index + 1:close_index]:
+            if token.kind == 'op' and token.value in _OPEN_BRACKETS:
+                depth += 1
+            elif token.kind == 'op' and token.value in _CLOSE_BRACKETS:
+                depth -= 1
+            elif depth == 0 and self._is(token, 'op', ','):
+                expect_name = True
+            elif expect_name and token.kind == 'name':
+                names.append(token.value)
+                expect_name = False
+        return names, close_index
+
+    # --- Bloques ------------------------------------------------------------
+
+    def _owner_class(self):
+        for entry in reversed(self._stack):
+            if entry['kind'] == 'class':
+                return entry['record']['name']
+        return None
+
+    def _close(self, entry, next_line):
+        """Cerrar un bloque antes de la línea `next_line`.
+
+        Los comentarios más indentados que el bloque justo tras su última
+        sentencia siguen perteneciendo a él.
+        """
+        for line_number in range(entry['last_line'] + 1, next_line):
+            line = self.lines[line_number - 1]
+            if not line.strip():
+                continue
+            if not line.lstrip().startswith('#') or self._indent(line_number) <= entry['indent']:
+                break
+            entry['last_line'] = line_number
+
+        record = entry['record']
+        record['end_line'] = entry['last_line']
+        if entry['kind'] == 'func' and record.get('body') is None:
+            body_lines = self.lines[entry['header_end']:entry['last_line']]
+            record['body'] = '\n'.join(line.strip() for line in body_lines if line.strip())
+
+    def _visit(self, tokens):
+        start_line = tokens[0].line
+        end_line = self._end_line(tokens)
+        indent = self._indent(start_line)
+
+        while self._stack and indent <= self._stack[-1]['indent']:
+            self._close(self._stack.pop(), start_line)
+        for entry in self._stack:
+            entry['last_line'] = end_line
+
+        self._scan_expressions(tokens)
+
+        in_function = any(entry['kind'] == 'func' for entry in self._stack)
+        if in_function:
+            return
+
+        # Anotaciones iniciales (@onready, @export_range(...), ...)
+        annotations = self._pending_annotations
+        self._pending_annotations = []
+        i = 0
+        while i < len(tokens) and tokens[i].kind == 'annotation':
+            annotations.append(tokens[i].value[1:])
+            if i + 1 < len(tokens) and self._is(tokens[i + 1], 'op', '('):
+                i = self._matching(tokens, i + 1)
+            i += 1
+
+        if i >= len(tokens):
+            self._pending_annotations = annotations
+            return
+
+        static = False
+        # Palabras clave de GDScript 3 (onready var / export var)
+        while i < len(tokens) and tokens[i].kind == 'name' and tokens[i].value in ('static', 'onready', 'export'):
+            if tokens[i].value == 'static':
+                static = True
+            else:
+                annotations.append(tokens[i].value)
+                if tokens[i].value == 'export' and i + 1 < len(tokens) and self._is(tokens[i + 1], 'op', '('):
+                    i = self._matching(tokens, i + 1)
+            i += 1
+        if i >= len(tokens):
+            return
+
+        keyword = tokens[i].value if tokens[i].kind == 'name' else None
+        rest = tokens[i:]
+
+        if keyword == 'func':
+            self._visit_func(rest, indent, static, annotations)
+        elif keyword == 'class' and len(rest) > 1 and rest[1].kind == 'name':
+            self._visit_class(rest, indent)
+        elif keyword == 'signal' and len(rest) > 1:
+            self._visit_signal(rest)
+        elif keyword == 'var' and len(rest) > 1:
+            self._visit_var(rest, static, annotations)
+        elif keyword == 'const' and len(rest) > 1:
+            self._visit_const(rest)
+        elif keyword in ('extends', 'class_name'):
+            self._visit_header(rest)
+
+    def _visit_func(self, tokens, indent, static, annotations):
+        if len(tokens) < 2 or tokens[1].kind != 'name':
+            return
+
+        params = []
+        header_end = 1
+        if len(tokens) > 2 and self._is(tokens[2], 'op', '('):
+            params, header_end = self._param_names(tokens, 2)
+
+        # Dos puntos que cierran la cabecera (tras un posible "-> Tipo")
+        colon = None
+        for j in range(header_end, len(tokens)):
+            if self._is(tokens[j], 'op', ':'):
+                colon = j
+                break
+        colon = colon if colon is not None else len(tokens) - 1
+
+        signature = re.sub(r'\s*\n\s*', ' ', self._source(tokens[0], tokens[colon]))
+        signature = re.sub(r'\(\s+', '(', re.sub(r',?\s+\)', ')', signature))
+        record = {
+            'name': tokens[1].value,
+            'line': tokens[0].line,
+            'end_line': None,
+            'params': params,
+            'signature': ('static ' if static else '') + signature,
+            'static': static,
+            'class': self._owner_class(),
+            'annotations': annotations,
+            'body': None
+        }
+
+        # Cuerpo en la misma línea: func f(): return 1
+        if colon + 1 < len(tokens):
+            record['body'] = self._source(tokens[colon + 1], tokens[-1]).strip()
+
+        self.info['functions'].append(record)
+        self._stack.append({
+            'kind': 'func',
+            'indent': indent,
+            'record': record,
+            'header_end': self._end_line(tokens[:colon + 1]),
+            'last_line': self._end_line(tokens)
+        })
+
+    def _visit_class(self, tokens, indent):
+        extends = None
+        for j, token in enumerate(tokens):
+            if self._is(token, 'name', 'extends') and j + 1 < len(tokens):
+                extends = self._extends_target(tokens[j + 1])
+                break
+
+        record = {
+            'name': tokens[1].value,
+            'line': tokens[0].line,
+            'end_line': None,
+            'extends': extends,
+            'class': self._owner_class()
+        }
+        self.info['classes'].append(record)
+        self._stack.append({
+            'kind': 'class',
+            'indent': indent,
+            'record': record,
+            'last_line': self._end_line(tokens)
+        })
+
+    def _visit_signal(self, tokens):
+        if tokens[1].kind != 'name':
+            return
+
+        params = []
+        if len(tokens) > 2 and self._is(tokens[2], 'op', '('):
+            params, _ = self._param_names(tokens, 2)
+        self.info['signals'].append({
+            'name': tokens[1].value,
+            'line': tokens[0].line,
+            'params': params,
+            'class': self._owner_class()
+        })
+
+    def _assigned_value(self, tokens):
+        for j, token in enumerate(tokens):
+            if token.kind == 'op' and token.value in ('=', ':='):
+                if j + 1 < len(tokens):
+                    return self._source(tokens[j + 1], tokens[-1])
+                return ''
+        return None
+
+    def _visit_var(self, tokens, static, annotations):
+        if tokens[1].kind != 'name':
+            return
+
+        record = {
+            'name': tokens[1].value,
+            'line': tokens[0].line,
+            'value': self._assigned_value(tokens),
+            'annotations': annotations,
+            'static': static,
+            'class': self._owner_class()
+        }
+        self.info['variables'].append(record)
+        if 'onready' in annotations:
+            self.info['onready_vars'].append(record)
+        if any(annotation.startswith('export') for annotation in annotations):
+            self.info['exports'].append(record)
+
+    def _visit_const(self, tokens):
+        if tokens[1].kind != 'name':
+            return
+
+        self.info['consts'].append({
+            'name': tokens[1].value,
+            'line': tokens[0].line,
+            'value': self._assigned_value(tokens),
+            'class': self._owner_class()
+        })
+
+    @staticmethod
+    def _extends_target(token):
+        return string_value(token) if token.kind == 'string' else token.value
+
+    def _visit_header(self, tokens):
+        """`extends X`, `class_name X` o ambos en la misma línea"""
+        if self._stack:
+            return
+
+        for j, token in enumerate(tokens[:-1]):
+            if self._is(token, 'name', 'extends'):
+                self.info['extends'] = self._extends_target(tokens[j + 1])
+            elif self._is(token, 'name', 'class_name') and tokens[j + 1].kind == 'name':
+                self.info['class_name'] = tokens[j + 1].value
+
+    # --- Expresiones (cualquier ámbito) -------------------------------------
+
+    def _receiver_start(self, tokens, dot_index):
+        """Primer token de la cadena `a.b[0].c` que precede al punto"""
+        j = dot_index - 1
+        while j >= 0:
+            token = tokens[j]
+            if token.kind in ('name', 'nodepath'):
+                if j > 0 and self._is(tokens[j - 1], 'op', '.'):
+                    j -= 2
+                    continue
+                return j
+            if token.kind == 'op' and token.value in _CLOSE_BRACKETS:
+                depth = 0
+                while j >= 0:
+                    value = tokens[j].value if tokens[j].kind == 'op' else None
+                    if value in _CLOSE_BRACKETS:
+                        depth += 1
+                    elif value in _OPEN_BRACKETS:
+                        depth -= 1
+                        if depth == 0:
+                            break
+                    j -= 1
+                j -= 1  # Nombre llamado/indexado antes del bracket
+                continue
+            return j + 1
+        return 0
+
+    def _scan_expressions(self, tokens):
+        count = len(tokens)
+        for idx, token in enumerate(tokens):
+            after_dot = idx > 0 and self._is(tokens[idx - 1], 'op', '.')
+
+            if token.kind == 'nodepath':
+                path = token.value[1:]
+                if path[:1] in ('"', "'"):
+                    path = path[1:-1]
+                self.info['node_paths'].append({'path': path, 'line': token.line})
+                continue
+
+            if token.kind != 'name':
+                continue
+
+            if not after_dot and token.value[:1].isupper() and token.value not in self._refs:
+                self._refs[token.value] = True
+
+            calls = idx + 1 < count and self._is(tokens[idx + 1], 'op', '(')
+            if not calls:
+                continue
+
+            first_arg = tokens[idx + 2] if idx + 2 < count else None
+            literal = first_arg is not None and first_arg.kind == 'string'
+
+            if token.value in ('preload', 'load') and literal:
+                receiver = tokens[idx - 2].value if after_dot and idx >= 2 else None
+                if token.value == 'preload' or receiver in (None, 'ResourceLoader'):
+                    self.info['preloads'].append({
+                        'kind': token.value,
+                        'path': string_value(first_arg),
+                        'line': token.line
+                    })
+            elif token.value == 'get_node' and literal:
+                self.info['node_paths'].append({'path': string_value(first_arg), 'line': token.line})
+            elif token.value == 'connect':
+                self._record_connect(tokens, idx, after_dot)
+
+    def _record_connect(self, tokens, idx, after_dot):
+        close_index = self._matching(tokens, idx + 1)
+        args = self._source(tokens[idx + 2], tokens[close_index - 1]) if close_index > idx + 2 else ''
+        first_arg = tokens[idx + 2] if idx + 2 < close_index else None
+
+        receiver = ''
+        if after_dot:
+            start = self._receiver_start(tokens, idx - 1)
+            receiver = self._source(tokens[start], tokens[idx - 2])
+
+        if first_arg is not None and first_arg.kind == 'string':
+            # obj.connect("senal", callable) / connect("senal", obj, "metodo")
+            signal = string_value(first_arg)
+            emitter = receiver
+        else:
+            # obj.senal.connect(callable)
+            emitter, _, signal = receiver.rpartition('.')
+
+        self.info['connects'].append({
+            'line': tokens[idx].line,
+            'emitter': emitter,
+            'signal': signal,
+            'args': args,
+            'text': self._source(tokens[0], tokens[-1]).strip()
+        })
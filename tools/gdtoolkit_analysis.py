@@ -4,54 +4,147 @@ BAR-SIK GDToolkit Analysis Report
 Análisis completo del estado del código con gdtoolkit
 """
 
-import subprocess
+import os
 import sys
+import time
+import shutil
+import asyncio
+import argparse
 from pathlib import Path
 from datetime import datetime
 
-def run_command_with_output(command, description):
-    """Ejecutar comando y capturar salida"""
-    print(f"🔄 {description}...")
+from clone_detector import DEFAULT_MAX_LINES, detect_clones, load_config
+
+LINT_DIRS = ["project/scripts/", "project/singletons/"]
+
+GDLINT_ERROR_TYPES = (
+    'class-definitions-order',
+    'max-line-length',
+    'unused-argument',
+    'unnecessary-pass',
+    'no-elif-return',
+    'no-else-return',
+    'trailing-whitespace',
+    'max-returns'
+)
+
+async def run_tool(argv, on_stderr_line=None):
+    """Ejecutar una herramienta sin shell y capturar salida.
+
+    stdout y stderr se leen a la vez; cada línea de stderr se entrega a
+    `on_stderr_line` en cuanto llega. El ejecutable se resuelve con
+    shutil.which para que los scripts .cmd de pip/npm funcionen en Windows.
+    """
+    executable = shutil.which(argv[0]) or argv[0]
     try:
-        result = subprocess.run(command, shell=True, check=False,
-                              capture_output=True, text=True,
-                              encoding='utf-8', errors='ignore')
-        return result.stdout, result.stderr, result.returncode
+        process = await asyncio.create_subprocess_exec(
+            executable, *argv[1:],
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
     except Exception as e:
         return "", f"Error: {e}", 1
 
+    async def read_stdout():
+        return (await process.stdout.read()).decode('utf-8', errors='ignore')
+
+    async def read_stderr():
+        lines = []
+        async for raw_line in process.stderr:
+            line = raw_line.decode('utf-8', errors='ignore')
+            lines.append(line)
+            if on_stderr_line:
+                on_stderr_line(line)
+        return ''.join(lines)
+
+    stdout, stderr = await asyncio.gather(read_stdout(), read_stderr())
+    return stdout, stderr, await process.wait()
+
+def categorize_gdlint_line(line, errors):
+    """Contar una línea de gdlint en `errors`; devuelve 1 si es un error"""
+    if 'Error:' not in line:
+        return 0
+
+    # Extraer tipo de error
+    error_type = next((name for name in GDLINT_ERROR_TYPES if f'({name})' in line), 'other')
+    errors[error_type] = errors.get(error_type, 0) + 1
+    return 1
+
 def analyze_gdlint_output(output):
     """Analizar salida de gdlint y categorizar errores"""
-    lines = output.split('\n')
     errors = {}
     total_errors = 0
 
-    for line in lines:
-        if 'Error:' in line:
-            total_errors += 1
-            # Extraer tipo de error
-            if '(class-definitions-order)' in line:
-                errors['class-definitions-order'] = errors.get('class-definitions-order', 0) + 1
-            elif '(max-line-length)' in line:
-                errors['max-line-length'] = errors.get('max-line-length', 0) + 1
-            elif '(unused-argument)' in line:
-                errors['unused-argument'] = errors.get('unused-argument', 0) + 1
-            elif '(unnecessary-pass)' in line:
-                errors['unnecessary-pass'] = errors.get('unnecessary-pass', 0) + 1
-            elif '(no-elif-return)' in line:
-                errors['no-elif-return'] = errors.get('no-elif-return', 0) + 1
-            elif '(no-else-return)' in line:
-                errors['no-else-return'] = errors.get('no-else-return', 0) + 1
-            elif '(trailing-whitespace)' in line:
-                errors['trailing-whitespace'] = errors.get('trailing-whitespace', 0) + 1
-            elif '(max-returns)' in line:
-                errors['max-returns'] = errors.get('max-returns', 0) + 1
-            else:
-                errors['other'] = errors.get('other', 0) + 1
+    for line in output.split('\n'):
+        total_errors += categorize_gdlint_line(line, errors)
 
     return errors, total_errors
 
+def shard_files(files, shards):
+    """Repartir archivos en `shards` grupos de tamaño parecido (mayor primero al grupo más ligero)"""
+    groups = [[] for _ in range(max(1, shards))]
+    weights = [0] * len(groups)
+    for file_path in sorted(files, key=lambda path: path.stat().st_size, reverse=True):
+        lightest = weights.index(min(weights))
+        groups[lightest].append(file_path.as_posix())
+        weights[lightest] += file_path.stat().st_size
+
+    return [group for group in groups if group]
+
+async def run_all_checks(jobs):
+    """gdformat, gdlint (un proceso por shard) y detector de clones a la vez.
+
+    Las líneas de error de gdlint se categorizan según llegan por stderr, así
+    que al terminar el último shard el desglose ya está calculado.
+    """
+    started = time.perf_counter()
+    lint_files = [path for folder in LINT_DIRS for path in sorted(Path(folder).rglob("*.gd"))]
+    shards = shard_files(lint_files, jobs)
+    lint = {'errors': {}, 'total': 0}
+
+    def on_lint_line(line):
+        lint['total'] += categorize_gdlint_line(line, lint['errors'])
+
+    async def timed(name, awaitable):
+        result = await awaitable
+        print(f"✅ {name} terminado ({time.perf_counter() - started:.1f}s)")
+        return result
+
+    config = load_config()
+    clones_job = asyncio.to_thread(
+        detect_clones,
+        ["project/"],
+        min_tokens=35,
+        min_lines=3,
+        max_lines=config.get('maxLines', DEFAULT_MAX_LINES),
+        mode=config.get('mode', 'mild'),
+        exclude=config.get('ignore', config.get('exclude', []))
+    )
+
+    print(f"🔄 Verificando formato con gdformat...")
+    print(f"🔄 Analizando estilo con gdlint ({len(shards)} procesos, {len(lint_files)} archivos)...")
+    print(f"🔄 Analizando duplicación por tokens...")
+    format_result, clones_report, *_ = await asyncio.gather(
+        timed("gdformat", run_tool(["gdformat", "--check", *LINT_DIRS])),
+        timed("clones", clones_job),
+        *[timed(f"gdlint [{index + 1}/{len(shards)}]", run_tool(["gdlint", *shard], on_lint_line))
+          for index, shard in enumerate(shards)]
+    )
+
+    print(f"⏱️ Tiempo total de análisis: {time.perf_counter() - started:.1f}s")
+    return {
+        'format': format_result,
+        'lint_errors': lint['errors'],
+        'lint_total': lint['total'],
+        'clones': clones_report
+    }
+
 def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK GDToolkit Analysis")
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help="Procesos de gdlint en paralelo (por defecto: uno por CPU)")
+    args = parser.parse_args()
+
     print("🎯" * 60)
     print("📊 BAR-SIK - ANÁLISIS COMPLETO CON GDTOOLKIT")
     print("🎯" * 60)
@@ -62,12 +155,13 @@ def main():
     report.append(f"**Herramientas:** gdformat + gdlint (modo estricto)")
     report.append("")
 
+    # Las tres herramientas se ejecutan a la vez; las secciones se redactan después en orden
+    print("\n⚡ === EJECUCIÓN EN PARALELO ===")
+    results = asyncio.run(run_all_checks(args.jobs))
+
     # 1. Análisis de formato con gdformat
     print("\n📝 === ANÁLISIS DE FORMATO (gdformat) ===")
-    stdout, stderr, code = run_command_with_output(
-        "gdformat --check project/scripts/ project/singletons/",
-        "Verificando formato con gdformat"
-    )
+    stdout, stderr, code = results['format']
 
     if "would be left unchanged" in stdout:
         files_ok = stdout.split()[0]
@@ -86,12 +180,7 @@ def main():
 
     # 2. Análisis de estilo con gdlint
     print("\n🔍 === ANÁLISIS DE ESTILO (gdlint) ===")
-    stdout, stderr, code = run_command_with_output(
-        "gdlint project/scripts/ project/singletons/",
-        "Analizando estilo con gdlint"
-    )
-
-    errors, total_errors = analyze_gdlint_output(stderr)
+    errors, total_errors = results['lint_errors'], results['lint_total']
 
     print(f"📊 Total de problemas encontrados: {total_errors}")
     report.append(f"## 📊 Estilo (gdlint)")
@@ -107,43 +196,28 @@ def main():
             report.append(f"- **{error_type}:** {count} errores ({percentage:.1f}%)")
         report.append("")
 
-    # 3. Análisis de duplicación (jscpd)
-    print("\n🔄 === ANÁLISIS DE DUPLICACIÓN (jscpd) ===")
-    stdout, stderr, code = run_command_with_output(
-        'jscpd --formats-exts "python:gd" --min-tokens 35 --min-lines 3 project/ --reporters console',
-        "Analizando duplicación con jscpd"
-    )
+    # 3. Análisis de duplicación (detector de clones en proceso, mismas opciones que jscpd)
+    print("\n🔄 === ANÁLISIS DE DUPLICACIÓN (clones) ===")
+    clones_report = results['clones']
+    totals = clones_report['statistics']['total']
+    percentage = totals['percentage']
+    duplicated = f"{totals['duplicatedLines']} ({percentage}%)"
 
-    if "Total:" in stdout:
-        lines = stdout.split('\n')
-        for line in lines:
-            if "│ Total:" in line:
-                parts = line.split('│')
-                if len(parts) >= 6:
-                    files = parts[2].strip()
-                    total_lines = parts[3].strip()
-                    clones = parts[5].strip()
-                    duplicated = parts[6].strip() if len(parts) > 6 else "N/A"
-
-                    print(f"📊 Duplicación: {duplicated}")
-                    report.append(f"## 🎯 Duplicación (jscpd)")
-                    report.append(f"- **Archivos analizados:** {files}")
-                    report.append(f"- **Líneas totales:** {total_lines}")
-                    report.append(f"- **Clones encontrados:** {clones}")
-                    report.append(f"- **Duplicación:** {duplicated}")
-
-                    # Evaluar calidad
-                    if "%" in duplicated:
-                        percentage = float(duplicated.replace('(', '').replace('%)', '').split('(')[1] if '(' in duplicated else "0")
-                        if percentage < 5:
-                            report.append(f"- **Calidad:** ✅ EXCELENTE (<5%)")
-                        elif percentage < 10:
-                            report.append(f"- **Calidad:** ⚠️ ACEPTABLE (<10%)")
-                        else:
-                            report.append(f"- **Calidad:** ❌ NECESITA MEJORA (>10%)")
-
-                    break
-        report.append("")
+    print(f"📊 Duplicación: {duplicated}")
+    report.append(f"## 🎯 Duplicación (clones)")
+    report.append(f"- **Archivos analizados:** {totals['sources']}")
+    report.append(f"- **Líneas totales:** {totals['lines']}")
+    report.append(f"- **Clones encontrados:** {totals['clones']}")
+    report.append(f"- **Duplicación:** {duplicated}")
+
+    # Evaluar calidad
+    if percentage < 5:
+        report.append(f"- **Calidad:** ✅ EXCELENTE (<5%)")
+    elif percentage < 10:
+        report.append(f"- **Calidad:** ⚠️ ACEPTABLE (<10%)")
+    else:
+        report.append(f"- **Calidad:** ❌ NECESITA MEJORA (>10%)")
+    report.append("")
 
     # 4. Resumen y recomendaciones
     print("\n🎯 === RESUMEN EJECUTIVO ===")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Similarity Index
+Índice MinHash + LSH para detectar funciones casi duplicadas sin comparar todos los pares
+"""
+
+import random
+import hashlib
+from operator import eq
+from collections import defaultdict
+from difflib import SequenceMatcher
+
+_HASH_BITS = 64
+
+
+class MinHashLSHIndex:
+    """Índice de casi-duplicados basado en MinHash con bandas LSH.
+
+    Cada documento se reduce a un conjunto de shingles de caracteres, se firma
+    con `num_perm` minhashes y la firma se parte en `bands` bandas. Solo los
+    documentos que coinciden en al menos una banda (y cuya similitud estimada
+    supera `min_estimate`) se consideran candidatos, así que el coste crece de
+    forma casi lineal con el número de funciones.
+
+    Los valores por defecto están calibrados contra la comparación exhaustiva
+    sobre project/: todos los pares con ratio de SequenceMatcher > 0.7 tienen
+    una similitud Jaccard de 4-gramas estimada por encima de 0.15.
+    """
+
+    def __init__(self, num_perm=64, bands=32, shingle_size=4, min_estimate=0.15, seed=1):
+        if num_perm % bands != 0:
+            raise ValueError("num_perm debe ser múltiplo de bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.min_estimate = min_estimate
+
+        # Permutación determinista: mismo índice en cada ejecución
+        self._mask = random.Random(seed).getrandbits(_HASH_BITS)
+        self._buckets = [defaultdict(list) for _ in range(bands)]
+        self._keys = []
+        self._signatures = []
+        self._ids = {}
+
+    def shingles(self, text):
+        """Conjunto de hashes de los k-gramas de caracteres del texto"""
+        k = self.shingle_size
+        if len(text) < k:
+            return {_stable_hash(text)} if text else set()
+
+        return {_stable_hash(gram) for gram in {text[i:i + k] for i in range(len(text) - k + 1)}}
+
+    def signature(self, text):
+        """Firma MinHash del texto (tupla de `num_perm` valores).
+
+        Usa one-permutation hashing: un único hash por shingle repartido en
+        `num_perm` cubetas, quedándose con el mínimo de cada una. Las cubetas
+        vacías se rellenan rotando desde la siguiente ocupada (densificación),
+        así el coste es lineal en el número de shingles y no en shingles × num_perm.
+        """
+        hashes = self.shingles(text)
+        if not hashes:
+            return None
+
+        bins = self.num_perm
+        mins = [None] * bins
+        for h in hashes:
+            h ^= self._mask
+            slot = h % bins
+            value = h // bins
+            current = mins[slot]
+            if current is None or value < current:
+                mins[slot] = value
+
+        # Densificación por rotación: bin vacío -> siguiente bin ocupado + desplazamiento
+        signature = list(mins)
+        for slot in range(bins):
+            if mins[slot] is None:
+                offset = 1
+                while mins[(slot + offset) % bins] is None:
+                    offset += 1
+                signature[slot] = (offset, mins[(slot + offset) % bins])
+
+        return tuple(signature)
+
+    @property
+    def config_key(self):
+        """Identifica los parámetros de firma (para cachear firmas entre ejecuciones)"""
+        return f"{self.num_perm}-{self.shingle_size}-{self._mask:x}"
+
+    def add(self, key, text, signature=None):
+        """Añadir un documento al índice; devuelve False si está vacío.
+
+        Acepta una firma precalculada (p.ej. leída de la caché de análisis,
+        donde las tuplas vuelven como listas JSON).
+        """
+        if signature is None:
+            signature = self.signature(text)
+        if signature is None:
+            return False
+
+        signature = tuple(tuple(value) if isinstance(value, list) else value for value in signature)
+
+        doc_id = len(self._keys)
+        self._keys.append(key)
+        self._signatures.append(signature)
+        self._ids[key] = doc_id
+        for band in range(self.bands):
+            start = band * self.rows
+            self._buckets[band][signature[start:start + self.rows]].append(doc_id)
+        return True
+
+    def remove(self, key):
+        """Quitar un documento del índice (p.ej. al cambiar su archivo)"""
+        doc_id = self._ids.pop(key, None)
+        if doc_id is None:
+            return False
+
+        signature = self._signatures[doc_id]
+        for band in range(self.bands):
+            start = band * self.rows
+            band_key = signature[start:start + self.rows]
+            bucket = self._buckets[band][band_key]
+            bucket.remove(doc_id)
+            if not bucket:
+                del self._buckets[band][band_key]
+
+        self._keys[doc_id] = None
+        self._signatures[doc_id] = None
+        return True
+
+    def estimate(self, doc1, doc2):
+        """Similitud Jaccard estimada a partir de las firmas"""
+        return sum(map(eq, self._signatures[doc1], self._signatures[doc2])) / self.num_perm
+
+    def candidate_pairs(self):
+        """Pares (key1, key2) que comparten banda y superan `min_estimate`"""
+        pairs = set()
+        for buckets in self._buckets:
+            for doc_ids in buckets.values():
+                if len(doc_ids) < 2:
+                    continue
+                for i, first in enumerate(doc_ids):
+                    for second in doc_ids[i + 1:]:
+                        pairs.add((first, second))
+
+        return [
+            (self._keys[first], self._keys[second])
+            for first, second in sorted(pairs)
+            if self.estimate(first, second) >= self.min_estimate
+        ]
+
+    def candidates(self, key):
+        """Claves que comparten banda con `key` y superan `min_estimate`"""
+        doc_id = self._ids.get(key)
+        if doc_id is None:
+            return []
+
+        signature = self._signatures[doc_id]
+        others = set()
+        for band in range(self.bands):
+            start = band * self.rows
+            others.update(self._buckets[band].get(signature[start:start + self.rows], ()))
+        others.discard(doc_id)
+
+        return [
+            self._keys[other]
+            for other in sorted(others)
+            if self.estimate(doc_id, other) >= self.min_estimate
+        ]
+
+
+def _stable_hash(shingle):
+    """Hash de 64 bits estable entre procesos (hash() de Python no lo es)"""
+    return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def exact_similarity(text1, text2, threshold, matcher=None):
+    """Ratio de SequenceMatcher, o None si no supera el umbral.
+
+    Usa las cotas superiores baratas de difflib antes del cálculo completo,
+    por lo que el resultado es idéntico a `SequenceMatcher(...).ratio()`.
+    Reutilizar `matcher` con el mismo `text2` evita reindexar la secuencia.
+    """
+    len1, len2 = len(text1), len(text2)
+    if not len1 + len2 or 2.0 * min(len1, len2) / (len1 + len2) <= threshold:
+        return None
+
+    if matcher is None:
+        matcher = SequenceMatcher(None)
+    matcher.set_seqs(text1, text2)
+    if matcher.quick_ratio() <= threshold:
+        return None
+
+    ratio = matcher.ratio()
+    return ratio if ratio > threshold else None
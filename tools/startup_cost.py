@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+BAR-SIK Startup Cost Analyzer
+Recursos cargados al arrancar (autoloads + escenas iniciales), su tamaño en disco y qué preloads podrían diferirse al primer uso
+"""
+
+import json
+import argparse
+from pathlib import Path
+from collections import deque
+
+from analysis_cache import AnalysisCache
+from dependency_graph import DEFAULT_PROJECT_PATH, EXCLUDED_DIRS, DependencyGraph
+
+DEFAULT_SCENES = ("res://scenes/GameScene.tscn",)
+
+# Aristas que Godot resuelve al cargar el recurso que las contiene. load()
+# con ruta literal no cuenta: se ejecuta cuando corre ese código.
+EAGER_KINDS = ('preload', 'extends', 'class_name', 'autoload', 'script', 'resource')
+
+
+class StartupCostAnalyzer:
+    """Cierre de carga anticipada desde las raíces de arranque.
+
+    El conjunto eager es todo lo alcanzable desde los autoloads y las escenas
+    iniciales siguiendo EAGER_KINDS. Un preload es diferible si quitarlo
+    (cambiándolo por load() en el primer uso) saca recursos de ese conjunto;
+    el ahorro es lo que solo era alcanzable a través de él.
+    """
+
+    def __init__(self, graph, scenes=DEFAULT_SCENES, include_main_scene=True):
+        self.graph = graph
+        self.roots = list(graph.autoloads.values())
+        if include_main_scene and graph.main_scene:
+            self.roots.append(graph.main_scene)
+        self.roots.extend(scene for scene in scenes if scene not in self.roots)
+        self._sizes = {}
+
+    def size(self, node):
+        """Bytes en disco del recurso (0 si no existe o está fuera del proyecto)"""
+        if node not in self._sizes:
+            file_path = self.graph.to_file_path(node)
+            self._sizes[node] = file_path.stat().st_size if file_path.is_file() else 0
+        return self._sizes[node]
+
+    def eager_closure(self, skip_edge=None):
+        """Recursos cargados al arrancar, en orden de descubrimiento desde las raíces"""
+        seen = set()
+        order = []
+        queue = deque()
+        for root in self.roots:
+            if root not in seen:
+                seen.add(root)
+                order.append(root)
+                queue.append(root)
+
+        while queue:
+            node = queue.popleft()
+            for target, kinds in self.graph.edges.get(node, {}).items():
+                if target in seen or not any(kind in EAGER_KINDS for kind in kinds):
+                    continue
+                if (node, target) == skip_edge and kinds == ['preload']:
+                    continue
+                seen.add(target)
+                order.append(target)
+                queue.append(target)
+
+        return order
+
+    def deferrable_preloads(self, eager):
+        """preloads dentro del arranque cuyo cambio a carga diferida ahorra bytes"""
+        eager_set = set(eager)
+        candidates = []
+
+        for source in eager:
+            for kind, target, line in self.graph.load_sites.get(source, []):
+                if kind != 'preload' or target not in eager_set or target in self.roots:
+                    continue
+                remaining = set(self.eager_closure(skip_edge=(source, target)))
+                saved = [node for node in eager if node not in remaining]
+                if not saved:
+                    continue
+                candidates.append({
+                    'source': source,
+                    'line': line,
+                    'target': target,
+                    'deferred_resources': len(saved),
+                    'deferred_bytes': sum(self.size(node) for node in saved),
+                    'resources': saved
+                })
+
+        candidates.sort(key=lambda candidate: (-candidate['deferred_bytes'], candidate['source'], candidate['line']))
+        return candidates
+
+    def lazy_loads(self, eager):
+        """load() con ruta literal en scripts del arranque (ya diferidos)"""
+        return [
+            {'source': source, 'line': line, 'target': target}
+            for source in eager
+            for kind, target, line in self.graph.load_sites.get(source, [])
+            if kind == 'load'
+        ]
+
+    def analyze(self):
+        """Reporte completo serializable a JSON"""
+        eager = self.eager_closure()
+        by_type = {}
+        for node in eager:
+            suffix = Path(node).suffix or '(sin extensión)'
+            stats = by_type.setdefault(suffix, {'count': 0, 'bytes': 0})
+            stats['count'] += 1
+            stats['bytes'] += self.size(node)
+
+        return {
+            'roots': self.roots,
+            'eager_resources': len(eager),
+            'eager_bytes': sum(self.size(node) for node in eager),
+            'by_type': by_type,
+            'resources': [{'path': node, 'bytes': self.size(node)} for node in eager],
+            'deferrable_preloads': self.deferrable_preloads(eager),
+            'lazy_loads': self.lazy_loads(eager)
+        }
+
+
+def format_bytes(size):
+    return f"{size / 1024:.1f} KB" if size >= 1024 else f"{size} B"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BAR-SIK Startup Cost Analyzer")
+    parser.add_argument('--project', default=str(DEFAULT_PROJECT_PATH), help="Carpeta con project.godot")
+    parser.add_argument('--scenes', nargs='*', default=list(DEFAULT_SCENES),
+                        help="Escenas cargadas al arrancar además de autoloads y escena principal")
+    parser.add_argument('--no-main-scene', action='store_true', help="No incluir run/main_scene como raíz")
+    parser.add_argument('--top', type=int, default=10, help="Recursos más pesados a mostrar")
+    parser.add_argument('--json', help="Guardar el reporte en este archivo")
+    args = parser.parse_args()
+
+    cache = AnalysisCache()
+    graph = DependencyGraph(args.project, cache, EXCLUDED_DIRS).build()
+    cache.save()
+
+    analyzer = StartupCostAnalyzer(graph, args.scenes, include_main_scene=not args.no_main_scene)
+    report = analyzer.analyze()
+
+    print("🚀 === COSTE DE ARRANQUE ===")
+    print(f"🌱 Raíces: {len(report['roots'])} ({len(graph.autoloads)} autoloads + escenas)")
+    print(f"📦 Recursos cargados al arrancar: {report['eager_resources']} ({format_bytes(report['eager_bytes'])})")
+    for suffix, stats in sorted(report['by_type'].items(), key=lambda item: -item[1]['bytes']):
+        print(f"   • {suffix}: {stats['count']} archivos, {format_bytes(stats['bytes'])}")
+
+    print(f"\n🏋️ Top {args.top} recursos más pesados:")
+    for resource in sorted(report['resources'], key=lambda resource: -resource['bytes'])[:args.top]:
+        print(f"   • {resource['path']}: {format_bytes(resource['bytes'])}")
+
+    print(f"\n⏳ preloads diferibles al primer uso: {len(report['deferrable_preloads'])}")
+    for candidate in report['deferrable_preloads']:
+        print(f"   • {candidate['source']}:{candidate['line']} → {candidate['target']} "
+              f"(-{candidate['deferred_resources']} recursos, -{format_bytes(candidate['deferred_bytes'])})")
+
+    if report['lazy_loads']:
+        print(f"\n💤 load() ya diferidos en scripts de arranque: {len(report['lazy_loads'])}")
+        for lazy in report['lazy_loads']:
+            print(f"   • {lazy['source']}:{lazy['line']} → {lazy['target']}")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📄 Reporte guardado en: {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests del análisis de similitud de BarSikCodeAnalyzer
+El índice MinHash/LSH debe dar los mismos pares, en el mismo orden, que la comparación exhaustiva
+"""
+
+import sys
+from difflib import SequenceMatcher
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from analysis_cache import AnalysisCache  # noqa: E402
+from code_analyzer import BarSikCodeAnalyzer, SIMILARITY_THRESHOLD  # noqa: E402
+
+# Nombres elegidos para que el orden de escaneo (abajo) no coincida con el alfabético
+FIXTURE_FILES = {
+    "zeta_panel.gd": '''extends Control
+
+func _setup_update_timer():
+	var timer = Timer.new()
+	timer.wait_time = 1.0
+	timer.timeout.connect(_refresh)
+	add_child(timer)
+	timer.start()
+
+func ok():
+	return 1
+''',
+    "alpha_panel.gd": '''extends Control
+
+func _setup_update_timer():
+	var timer = Timer.new()
+	timer.wait_time = 2.0
+	timer.timeout.connect(_refresh_all)
+	add_child(timer)
+	timer.start()
+
+func ok():
+	return 2
+''',
+    "middle_manager.gd": '''extends Node
+
+func _setup_refresh_timer():
+	var refresh_timer = Timer.new()
+	refresh_timer.wait_time = 0.5
+	refresh_timer.timeout.connect(_refresh)
+	add_child(refresh_timer)
+	refresh_timer.start()
+
+func set_game_data(data):
+	game_data = data
+	print("Manager conectado")
+''',
+}
+
+
+def _pair_ids(entries):
+    return [
+        (entry['function1']['file'], entry['function1']['name'],
+         entry['function2']['file'], entry['function2']['name'])
+        for entry in entries
+    ]
+
+
+def _exhaustive_pairs(all_functions):
+    """Comparación por pares original: recorrido en orden de escaneo, file1 < file2 por ruta"""
+    duplicated = []
+    for file1, functions1 in all_functions.items():
+        for func1 in functions1:
+            for file2, functions2 in all_functions.items():
+                if file1 >= file2:  # Evitar comparaciones duplicadas
+                    continue
+
+                for func2 in functions2:
+                    similarity = SequenceMatcher(None, func1['body'], func2['body']).ratio()
+                    if similarity > SIMILARITY_THRESHOLD and len(func1['body']) > 20:
+                        duplicated.append({
+                            'similarity': similarity,
+                            'function1': {'file': file1, 'name': func1['name']},
+                            'function2': {'file': file2, 'name': func2['name']},
+                        })
+    return sorted(duplicated, key=lambda x: x['similarity'], reverse=True)
+
+
+def test_lsh_pairs_match_exhaustive_scan(tmp_path):
+    """Test: Los pares del índice LSH son los de la comparación exhaustiva, con function1 en la ruta menor"""
+    for name, content in FIXTURE_FILES.items():
+        (tmp_path / name).write_text(content, encoding='utf-8')
+
+    analyzer = BarSikCodeAnalyzer(tmp_path, cache=AnalysisCache(cache_path=None))
+    analyzer.gdscript_files = [tmp_path / name for name in FIXTURE_FILES]
+    analyzer.analyze_function_similarity()
+
+    all_functions = {str(path): facts['functions'] for path, facts in analyzer.file_facts.items()}
+    expected = _pair_ids(_exhaustive_pairs(all_functions))
+
+    assert expected, "La fixture debe producir pares duplicados"
+    assert _pair_ids(analyzer.analysis_results['duplicated_functions']) == expected